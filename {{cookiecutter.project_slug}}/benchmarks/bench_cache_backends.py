@@ -0,0 +1,152 @@
+r"""Compare the Redis and Tarantool cache backends on realistic artifact payloads.
+
+Runs the same workload (single gets, batched gets and batched sets of entries
+wrapped in the freshness envelope) against every reachable backend and reports
+throughput and p50/p99 latency per operation. Backends that are not installed
+or not reachable are skipped, so start the ones to compare first, e.g.
+``docker compose up -d redis`` and ``make tarantool-local``.
+
+Usage:
+    poetry run python benchmarks/bench_cache_backends.py \
+        [--count 2000] [--batch 50] [--redis-url redis://localhost:6379/0] \
+        [--tarantool-host localhost] [--tarantool-port 3301]
+"""
+
+import argparse
+import asyncio
+from collections.abc import AsyncIterator, Awaitable, Callable
+import contextlib
+import statistics
+import time
+from typing import Any
+
+from bench_cache_codecs import build_payloads
+import redis.asyncio as redis
+
+from {{cookiecutter.project_slug}}.application.cache_policy import CacheFreshnessPolicy
+from {{cookiecutter.project_slug}}.application.interfaces.cache import CacheProtocol
+from {{cookiecutter.project_slug}}.infrastructures.cache.codec import CachePayloadSerializer, get_codec
+from {{cookiecutter.project_slug}}.infrastructures.cache.redis_client import RedisCacheClient
+from {{cookiecutter.project_slug}}.infrastructures.cache.tarantool_client import TarantoolCacheClient
+
+_PREFIX = "bench:backends:"
+
+
+@contextlib.asynccontextmanager
+async def connect_redis(url: str) -> AsyncIterator[CacheProtocol]:
+    client = redis.from_url(url, decode_responses=False, socket_connect_timeout=2)
+    try:
+        await client.ping()
+        yield RedisCacheClient(
+            client=client,
+            ttl=600,
+            serializer=CachePayloadSerializer(codec=get_codec("msgpack")),
+        )
+    finally:
+        await client.close()
+
+
+@contextlib.asynccontextmanager
+async def connect_tarantool(host: str, port: int) -> AsyncIterator[CacheProtocol]:
+    cache = TarantoolCacheClient.create(
+        host=host, port=port, request_timeout=5.0, ttl=600
+    )
+    try:
+        await cache.connection.connect()
+        yield cache
+    finally:
+        await cache.close()
+
+
+async def measure(
+    operations: list[Callable[[], Awaitable[Any]]], items_per_operation: int
+) -> tuple[float, float, float]:
+    latencies = []
+    started_at = time.perf_counter()
+    for operation in operations:
+        operation_started_at = time.perf_counter()
+        await operation()
+        latencies.append(time.perf_counter() - operation_started_at)
+    elapsed = time.perf_counter() - started_at
+    percentiles = statistics.quantiles(latencies, n=100)
+    return (
+        len(operations) * items_per_operation / elapsed,
+        percentiles[49] * 1e3,
+        percentiles[98] * 1e3,
+    )
+
+
+async def bench_backend(
+    cache: CacheProtocol, payloads: list[dict[str, Any]], batch: int
+) -> dict[str, tuple[float, float, float]]:
+    keys = [f"{_PREFIX}{index}" for index in range(len(payloads))]
+    batches = [
+        (keys[start : start + batch], payloads[start : start + batch])
+        for start in range(0, len(keys), batch)
+    ]
+    results = {
+        "set_many": await measure(
+            [
+                lambda batch_keys=batch_keys, values=values: cache.set_many(
+                    dict(zip(batch_keys, values, strict=True))
+                )
+                for batch_keys, values in batches
+            ],
+            batch,
+        ),
+        "get": await measure([lambda key=key: cache.get(key) for key in keys], 1),
+        "get_many": await measure(
+            [
+                lambda batch_keys=batch_keys: cache.get_many(batch_keys)
+                for batch_keys, _ in batches
+            ],
+            batch,
+        ),
+    }
+    await cache.clear(f"{_PREFIX}*")
+    return results
+
+
+async def run(args: argparse.Namespace) -> None:
+    # Entries are stored inside the freshness envelope, so measure that shape.
+    policy = CacheFreshnessPolicy(soft_ttl=3000, hard_ttl=3600)
+    payloads = [policy.wrap(p) for p in build_payloads(args.count, args.seed)]
+
+    backends: list[
+        tuple[str, Callable[[], contextlib.AbstractAsyncContextManager[CacheProtocol]]]
+    ] = [
+        ("redis", lambda: connect_redis(args.redis_url)),
+        (
+            "tarantool",
+            lambda: connect_tarantool(args.tarantool_host, args.tarantool_port),
+        ),
+    ]
+    print(f"{args.count} artifact payloads, batches of {args.batch}")
+    print(f"{'backend':<11}{'operation':<10}{'items/s':>12}{'p50 ms':>9}{'p99 ms':>9}")
+    for name, connect in backends:
+        async with contextlib.AsyncExitStack() as stack:
+            try:
+                cache = await stack.enter_async_context(connect())
+            except Exception as e:  # noqa: BLE001 - any failure means the backend is unavailable
+                print(f"{name:<11}skipped: {e}")
+                continue
+            results = await bench_backend(cache, payloads, args.batch)
+        for operation, (throughput, p50, p99) in results.items():
+            print(
+                f"{name:<11}{operation:<10}{throughput:>12,.0f}{p50:>9.3f}{p99:>9.3f}"
+            )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--count", type=int, default=2000)
+    parser.add_argument("--batch", type=int, default=50)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--redis-url", default="redis://localhost:6379/0")
+    parser.add_argument("--tarantool-host", default="localhost")
+    parser.add_argument("--tarantool-port", type=int, default=3301)
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
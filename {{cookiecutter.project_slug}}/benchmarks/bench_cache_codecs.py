@@ -0,0 +1,107 @@
+"""Compare cache payload codecs on realistic artifact payloads.
+
+Measures encode/decode throughput and payload size of every installed codec
+for the dictionaries the cache actually stores (``InfrastructureArtifactMapper.to_dict``).
+
+Usage:
+    poetry run python benchmarks/bench_cache_codecs.py [--count 1000] [--repeat 5]
+"""
+
+import argparse
+from datetime import UTC, datetime, timedelta
+import random
+import statistics
+import time
+from typing import Any, get_args
+from uuid import uuid4
+
+from {{cookiecutter.project_slug}}.application.dtos.artifact import ArtifactDTO, EraDTO, MaterialDTO
+from {{cookiecutter.project_slug}}.infrastructures.cache.codec import (
+    CachePayloadSerializer,
+    CodecName,
+    get_codec,
+)
+from {{cookiecutter.project_slug}}.infrastructures.cache.exceptions import CacheCodecError
+from {{cookiecutter.project_slug}}.infrastructures.mappers.artifact import InfrastructureArtifactMapper
+
+_WORDS = (
+    "amphora",
+    "bronze",
+    "fibula",
+    "mosaic",
+    "votive",
+    "ritual",
+    "hoard",
+    "inscription",
+    "funerary",
+    "glazed",
+    "carved",
+    "fragment",
+    "workshop",
+)
+
+
+def build_payloads(count: int, seed: int) -> list[dict[str, Any]]:
+    rng = random.Random(seed)
+    mapper = InfrastructureArtifactMapper()
+    eras = get_args(EraDTO.__annotations__["value"])
+    materials = get_args(MaterialDTO.__annotations__["value"])
+    now = datetime.now(UTC)
+    payloads = []
+    for _ in range(count):
+        description = " ".join(rng.choices(_WORDS, k=rng.randint(0, 60)))
+        dto = ArtifactDTO(
+            inventory_id=uuid4(),
+            acquisition_date=now - timedelta(days=rng.randint(0, 20_000)),
+            name=" ".join(rng.choices(_WORDS, k=3)).title(),
+            department=rng.choice(("Antiquities", "Numismatics", "Ceramics")),
+            era=EraDTO(value=rng.choice(eras)),
+            material=MaterialDTO(value=rng.choice(materials)),
+            description=description or None,
+        )
+        payloads.append(mapper.to_dict(dto))
+    return payloads
+
+
+def bench(
+    serializer: CachePayloadSerializer, payloads: list[dict[str, Any]], repeat: int
+) -> tuple[float, float, float]:
+    encode_runs, decode_runs = [], []
+    encoded: list[bytes] = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        encoded = [serializer.dumps(payload) for payload in payloads]
+        encode_runs.append(time.perf_counter() - started)
+        started = time.perf_counter()
+        for data in encoded:
+            serializer.loads(data)
+        decode_runs.append(time.perf_counter() - started)
+    mean_size = statistics.fmean(len(data) for data in encoded)
+    return min(encode_runs), min(decode_runs), mean_size
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--count", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    payloads = build_payloads(args.count, args.seed)
+    print(f"{args.count} artifact payloads, best of {args.repeat} runs")
+    print(f"{'codec':<10}{'encode/s':>12}{'decode/s':>12}{'avg bytes':>12}")
+    for name in get_args(CodecName):
+        try:
+            serializer = CachePayloadSerializer(codec=get_codec(name))
+        except CacheCodecError as e:
+            print(f"{name:<10}skipped: {e}")
+            continue
+        encode_time, decode_time, size = bench(serializer, payloads, args.repeat)
+        print(
+            f"{name:<10}{args.count / encode_time:>12,.0f}"
+            f"{args.count / decode_time:>12,.0f}{size:>12,.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
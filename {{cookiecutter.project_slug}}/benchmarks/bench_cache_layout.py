@@ -0,0 +1,113 @@
+r"""Compare the Redis memory footprint of the string and hash cache layouts.
+
+Writes the same artifact payloads (wrapped in the freshness envelope, keyed by
+inventory ID like the application does) once per layout and reports the growth
+of ``used_memory`` per entry, the number of top-level keys and how many buckets
+kept the compact listpack encoding. Requires Redis 7.4 or later for hash-field
+TTLs; use a scratch database, every layout is cleared after being measured.
+
+Buckets only stay listpacks while their fields fit ``hash-max-listpack-value``
+(64 bytes by default), so pass ``--listpack-value`` to raise it for the run.
+
+Usage:
+    poetry run python benchmarks/bench_cache_layout.py \
+        [--count 100000] [--prefix-length 3] [--codec msgpack] \
+        [--listpack-value 1024] [--redis-url redis://localhost:6379/15]
+"""
+
+import argparse
+import asyncio
+from collections import Counter
+from typing import Any
+
+from bench_cache_codecs import build_payloads
+import redis.asyncio as redis
+
+from {{cookiecutter.project_slug}}.application.cache_policy import CacheFreshnessPolicy
+from {{cookiecutter.project_slug}}.infrastructures.cache.codec import CachePayloadSerializer, get_codec
+from {{cookiecutter.project_slug}}.infrastructures.cache.hash_layout import HashBucketLayout
+from {{cookiecutter.project_slug}}.infrastructures.cache.redis_client import RedisCacheClient
+
+_PREFIX = "bench:layout:artifact:v1:g0:"
+_BATCH = 500
+
+
+def text(value: bytes | str) -> str:
+    return value.decode() if isinstance(value, bytes) else value
+
+
+async def used_memory(client: redis.Redis) -> int:
+    return int((await client.info("memory"))["used_memory"])
+
+
+async def bench_layout(
+    client: redis.Redis,
+    cache: RedisCacheClient,
+    items: dict[str, dict[str, Any]],
+) -> tuple[float, int, Counter[str]]:
+    keys_before = await client.dbsize()
+    memory_before = await used_memory(client)
+    entries = list(items.items())
+    for start in range(0, len(entries), _BATCH):
+        await cache.set_many(dict(entries[start : start + _BATCH]))
+    memory_per_entry = (await used_memory(client) - memory_before) / len(items)
+    top_level_keys = await client.dbsize() - keys_before
+
+    encodings: Counter[str] = Counter()
+    async for key in client.scan_iter(match=f"{_PREFIX}#*", count=1000):
+        encodings[text(await client.object("encoding", key))] += 1
+    await cache.clear(f"{_PREFIX}*")
+    return memory_per_entry, top_level_keys, encodings
+
+
+async def run(args: argparse.Namespace) -> None:
+    client = redis.from_url(args.redis_url, decode_responses=False)
+    if args.listpack_value:
+        await client.config_set("hash-max-listpack-value", args.listpack_value)
+    policy = CacheFreshnessPolicy(soft_ttl=3000, hard_ttl=3600)
+    items = {
+        f"{_PREFIX}{payload['inventory_id']}": policy.wrap(payload)
+        for payload in build_payloads(args.count, args.seed)
+    }
+    serializer = CachePayloadSerializer(codec=get_codec(args.codec))
+    config = await client.config_get("hash-max-listpack-*")
+    print(
+        f"{args.count} artifact payloads, codec {args.codec}, "
+        + ", ".join(f"{text(name)}={text(value)}" for name, value in config.items())
+    )
+    print(f"{'layout':<8}{'bytes/entry':>13}{'keys':>10}  bucket encodings")
+    layouts = {
+        "string": None,
+        "hash": HashBucketLayout(prefix_length=args.prefix_length),
+    }
+    try:
+        for name, layout in layouts.items():
+            cache = RedisCacheClient(
+                client=client, ttl=3600, serializer=serializer, hash_layout=layout
+            )
+            memory_per_entry, keys, encodings = await bench_layout(client, cache, items)
+            encoding_summary = ", ".join(
+                f"{encoding}={count}" for encoding, count in encodings.items()
+            )
+            print(
+                f"{name:<8}{memory_per_entry:>13,.1f}{keys:>10,}  {encoding_summary or '-'}"
+            )
+    finally:
+        await client.close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--count", type=int, default=100_000)
+    parser.add_argument("--prefix-length", type=int, default=3)
+    parser.add_argument(
+        "--codec", default="msgpack", choices=("json", "orjson", "msgpack")
+    )
+    parser.add_argument("--listpack-value", type=int, default=None)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--redis-url", default="redis://localhost:6379/15")
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+"""Measure the per-request cost of resolving the artifact pipeline from the container.
+
+Opens a request scope, resolves ``ProcessArtifactUseCase`` and closes the scope,
+as every ``GET /v1/artifacts/{inventory_id}`` does, and reports the resolution
+time per request. The ``miss`` scenario also resolves what a cache miss needs
+(repository, museum API and publishing use cases), i.e. the whole graph.
+
+Nothing is connected: the container is built from the application providers
+and settings, so the usual environment (``.env``) must be present, but the
+database, cache and broker need not be running.
+
+Usage:
+    poetry run python benchmarks/bench_request_graph.py [--count 20000]
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+
+from dishka import AsyncContainer, make_async_container
+
+from {{cookiecutter.project_slug}}.application.use_cases.fetch_artifact_from_museum_api import (
+    FetchArtifactFromMuseumAPIUseCase,
+)
+from {{cookiecutter.project_slug}}.application.use_cases.get_artifact_from_repo import (
+    GetArtifactFromRepoUseCase,
+)
+from {{cookiecutter.project_slug}}.application.use_cases.process_artifact import ProcessArtifactUseCase
+from {{cookiecutter.project_slug}}.application.use_cases.publish_artifact_to_broker import (
+    PublishArtifactToBrokerUseCase,
+)
+from {{cookiecutter.project_slug}}.application.use_cases.publish_artifact_to_catalog import (
+    PublishArtifactToCatalogUseCase,
+)
+from {{cookiecutter.project_slug}}.application.use_cases.save_artifact_to_repo import (
+    SaveArtifactToRepoUseCase,
+)
+from {{cookiecutter.project_slug}}.config.ioc.di import get_providers
+
+_MISS_PATH = (
+    GetArtifactFromRepoUseCase,
+    FetchArtifactFromMuseumAPIUseCase,
+    SaveArtifactToRepoUseCase,
+    PublishArtifactToBrokerUseCase,
+    PublishArtifactToCatalogUseCase,
+)
+
+
+async def resolve(container: AsyncContainer, miss: bool) -> None:
+    async with container() as request_container:
+        await request_container.get(ProcessArtifactUseCase)
+        if miss:
+            for dependency in _MISS_PATH:
+                await request_container.get(dependency)
+
+
+async def measure(
+    container: AsyncContainer, count: int, miss: bool
+) -> tuple[float, float, float]:
+    for _ in range(min(count, 1000)):
+        await resolve(container, miss)
+    latencies = []
+    started_at = time.perf_counter()
+    for _ in range(count):
+        request_started_at = time.perf_counter()
+        await resolve(container, miss)
+        latencies.append(time.perf_counter() - request_started_at)
+    elapsed = time.perf_counter() - started_at
+    percentiles = statistics.quantiles(latencies, n=100)
+    return count / elapsed, percentiles[49] * 1e6, percentiles[98] * 1e6
+
+
+async def run(args: argparse.Namespace) -> None:
+    container = make_async_container(*get_providers())
+    try:
+        print(f"{args.count} request scopes")
+        print(f"{'scenario':<10}{'requests/s':>12}{'p50 us':>9}{'p99 us':>9}")
+        for scenario, miss in (("hit", False), ("miss", True)):
+            throughput, p50, p99 = await measure(container, args.count, miss)
+            print(f"{scenario:<10}{throughput:>12,.0f}{p50:>9.1f}{p99:>9.1f}")
+    finally:
+        await container.close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--count", type=int, default=20_000)
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
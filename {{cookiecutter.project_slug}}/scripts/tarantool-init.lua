@@ -0,0 +1,166 @@
+-- Tarantool initialization script for {{ cookiecutter.project_name }}
+-- Creates the memtx cache space and the stored functions used by TarantoolCacheClient.
+--
+-- Run a local instance with:
+--   tarantool scripts/tarantool-init.lua
+
+local fiber = require('fiber')
+local log = require('log')
+
+-- Expired entries removed per expiration pass
+local EXPIRATION_BATCH = 1000
+-- Seconds between expiration passes when there is nothing left to expire
+local EXPIRATION_INTERVAL = 1
+
+if type(box.cfg) == 'function' then
+    box.cfg({
+        listen = os.getenv('TARANTOOL_PORT') or 3301,
+        memtx_memory = tonumber(os.getenv('TARANTOOL_MEMTX_MEMORY')) or 256 * 1024 * 1024,
+        -- Cache contents are disposable: skip the write-ahead log
+        wal_mode = 'none',
+    })
+end
+
+box.once('{{ cookiecutter.project_slug }}-cache-v1', function()
+    local space = box.schema.space.create('cache', {
+        engine = 'memtx',
+        format = {
+            { name = 'key', type = 'string' },
+            -- Stored as native MessagePack, so entries can be inspected from Lua
+            { name = 'value', type = 'any' },
+            -- Unix time after which the entry is gone, 0 for entries without TTL
+            { name = 'expires_at', type = 'number' },
+        },
+    })
+    -- A tree index also serves prefix scans for pattern invalidation
+    space:create_index('primary', { type = 'tree', parts = { 'key' } })
+    space:create_index('expires_at', { type = 'tree', parts = { 'expires_at' }, unique = false })
+
+    local user = os.getenv('TARANTOOL_USER_NAME') or os.getenv('TARANTOOL_USER')
+    local password = os.getenv('TARANTOOL_USER_PASSWORD') or os.getenv('TARANTOOL_PASSWORD')
+    if user ~= nil and user ~= 'guest' then
+        box.schema.user.create(user, { password = password, if_not_exists = true })
+        box.schema.user.grant(user, 'read,write,execute', 'universe', nil, { if_not_exists = true })
+    else
+        box.schema.user.grant('guest', 'read,write,execute', 'universe', nil, { if_not_exists = true })
+    end
+end)
+
+local function is_alive(tuple, now)
+    return tuple ~= nil and (tuple.expires_at == 0 or tuple.expires_at > now)
+end
+
+local function expires_at(ttl)
+    if ttl == nil or ttl == box.NULL then
+        return 0
+    end
+    return fiber.time() + ttl
+end
+
+-- Returns the values of `keys` in order, NULL for missing or expired keys.
+function cache_get_many(keys)
+    local now = fiber.time()
+    local values = {}
+    for i, key in ipairs(keys) do
+        local tuple = box.space.cache:get(key)
+        values[i] = is_alive(tuple, now) and tuple.value or box.NULL
+    end
+    return values
+end
+
+-- Stores {key, value} pairs with one TTL in a single transaction.
+function cache_set_many(items, ttl)
+    local at = expires_at(ttl)
+    box.begin()
+    for _, item in ipairs(items) do
+        box.space.cache:replace({ item[1], item[2], at })
+    end
+    box.commit()
+    return #items
+end
+
+-- Deletes `keys`, returning for each whether a live entry was removed.
+function cache_delete_many(keys)
+    local now = fiber.time()
+    local deleted = {}
+    for i, key in ipairs(keys) do
+        deleted[i] = is_alive(box.space.cache:delete(key), now)
+    end
+    return deleted
+end
+
+-- Deletes up to `limit` keys that start with `prefix` and match the Lua `pattern`,
+-- scanning after `cursor`. Returns the number of deleted keys and the cursor to
+-- resume from, NULL once the prefix range is exhausted.
+function cache_clear_batch(prefix, pattern, cursor, limit)
+    local keys = {}
+    local last = box.NULL
+    local start, iterator = prefix, 'GE'
+    if cursor ~= nil and cursor ~= box.NULL then
+        start, iterator = cursor, 'GT'
+    end
+    for _, tuple in box.space.cache.index.primary:pairs(start, { iterator = iterator }) do
+        if tuple.key:sub(1, #prefix) ~= prefix then
+            last = box.NULL
+            break
+        end
+        last = tuple.key
+        if tuple.key:match(pattern) then
+            table.insert(keys, tuple.key)
+            if #keys >= limit then
+                break
+            end
+        end
+    end
+    if #keys < limit then
+        last = box.NULL
+    end
+    for _, key in ipairs(keys) do
+        box.space.cache:delete(key)
+    end
+    return #keys, last
+end
+
+-- Atomically increments a counter stored without TTL and returns the new value.
+function cache_incr(key)
+    local tuple = box.space.cache:get(key)
+    local value = (tuple ~= nil and tonumber(tuple.value) or 0) + 1
+    box.space.cache:replace({ key, value, 0 })
+    return value
+end
+
+-- Removes expired entries in the background, EXPIRATION_BATCH at a time.
+local function expiration_loop()
+    fiber.name('cache-expiration')
+    while true do
+        local ok, result = pcall(function()
+            local now = fiber.time()
+            local expired = {}
+            for _, tuple in box.space.cache.index.expires_at:pairs(0, { iterator = 'GT' }) do
+                if tuple.expires_at > now or #expired >= EXPIRATION_BATCH then
+                    break
+                end
+                table.insert(expired, tuple.key)
+            end
+            for _, key in ipairs(expired) do
+                local tuple = box.space.cache:get(key)
+                -- The entry may have been rewritten with a new TTL meanwhile
+                if tuple ~= nil and not is_alive(tuple, now) then
+                    box.space.cache:delete(key)
+                end
+            end
+            return #expired
+        end)
+        if not ok then
+            log.error('cache expiration failed: %s', result)
+            fiber.sleep(EXPIRATION_INTERVAL)
+        elseif result < EXPIRATION_BATCH then
+            fiber.sleep(EXPIRATION_INTERVAL)
+        else
+            fiber.yield()
+        end
+    end
+end
+
+fiber.create(expiration_loop)
+log.info('cache space ready')
@@ -0,0 +1,149 @@
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from enum import StrEnum
+import math
+import random
+import time
+from typing import Any, final
+
+_PAYLOAD_KEY = "payload"
+_SOFT_EXPIRES_AT_KEY = "soft_expires_at"
+_HARD_EXPIRES_AT_KEY = "hard_expires_at"
+_TOMBSTONE_KEY = "not_found"
+
+
+def make_tombstone() -> dict[str, Any]:
+    """
+    Returns the cache entry recording that an artifact does not exist.
+    """
+    return {_TOMBSTONE_KEY: True}
+
+
+def is_tombstone(entry: dict[str, Any]) -> bool:
+    """
+    Checks whether a cache entry records that an artifact does not exist.
+    """
+    return entry.get(_TOMBSTONE_KEY) is True
+
+
+class CacheFreshness(StrEnum):
+    """Freshness of a cache entry at read time."""
+
+    FRESH = "fresh"
+    STALE = "stale"
+    EXPIRED = "expired"
+
+
+@final
+@dataclass(frozen=True, slots=True, kw_only=True)
+class CacheFreshnessPolicy:
+    """
+    Soft/hard TTL policy for cached entries.
+
+    Entries are stored in an envelope carrying their own soft and hard expiry
+    timestamps. Before the soft TTL an entry is fresh; between the soft and the
+    hard TTL it is stale and may be served while it is refreshed in the
+    background; past the hard TTL it is expired and only kept, for
+    ``stale_if_error_ttl`` more seconds, as a last-known-good fallback.
+
+    Fresh entries can be reported stale slightly before the soft TTL
+    (probabilistic early expiration, "XFetch"), so refreshes of entries written
+    at the same moment are spread out instead of happening all at once.
+
+    Attributes:
+        soft_ttl: Seconds after which an entry is served stale and refreshed.
+        hard_ttl: Seconds after which an entry is no longer served.
+        stale_if_error_ttl: Extra seconds an expired entry is kept for fallback.
+        xfetch_beta: Early expiration aggressiveness (0 disables it).
+        xfetch_delta: Expected time in seconds needed to recompute an entry.
+    """
+
+    soft_ttl: int
+    hard_ttl: int
+    stale_if_error_ttl: int = 0
+    xfetch_beta: float = 0.0
+    xfetch_delta: float = 1.0
+    clock: Callable[[], float] = field(default=time.time, repr=False)
+    rng: Callable[[], float] = field(default=random.random, repr=False)
+
+    @property
+    def storage_ttl(self) -> int:
+        """
+        Returns the TTL to use in the cache backend for wrapped entries.
+        """
+        return self.hard_ttl + self.stale_if_error_ttl
+
+    def wrap(self, payload: dict[str, Any]) -> dict[str, Any]:
+        """
+        Wraps a payload in an envelope carrying its expiry timestamps.
+
+        Args:
+            payload: Dictionary data to cache.
+
+        Returns:
+            The envelope to store in the cache.
+        """
+        now = self.clock()
+        return {
+            _PAYLOAD_KEY: payload,
+            _SOFT_EXPIRES_AT_KEY: now + min(self.soft_ttl, self.hard_ttl),
+            _HARD_EXPIRES_AT_KEY: now + self.hard_ttl,
+        }
+
+    def unwrap(self, entry: dict[str, Any]) -> tuple[dict[str, Any], CacheFreshness]:
+        """
+        Extracts the payload of an envelope and evaluates its freshness.
+
+        Entries written before envelopes existed are returned as they are and
+        treated as fresh; the backend TTL still bounds their lifetime.
+
+        Args:
+            entry: Dictionary read from the cache.
+
+        Returns:
+            A tuple of the payload and its freshness.
+        """
+        if _PAYLOAD_KEY not in entry:
+            return entry, CacheFreshness.FRESH
+        now = self.clock()
+        if now >= entry[_HARD_EXPIRES_AT_KEY]:
+            return entry[_PAYLOAD_KEY], CacheFreshness.EXPIRED
+        if now >= entry[_SOFT_EXPIRES_AT_KEY] or self._expires_early(
+            now, entry[_SOFT_EXPIRES_AT_KEY]
+        ):
+            return entry[_PAYLOAD_KEY], CacheFreshness.STALE
+        return entry[_PAYLOAD_KEY], CacheFreshness.FRESH
+
+    def extend(self, entry: dict[str, Any], expires_in: float) -> dict[str, Any]:
+        """
+        Pushes the hard expiry of an envelope out to its remaining backend TTL.
+
+        Backends that re-arm TTLs on reads keep hot entries resident past the
+        storage TTL they were written with. The hard expiry then follows the
+        remaining backend lifetime, less the stale-if-error window, so hot
+        entries stay servable; the soft expiry is kept, so they are still
+        refreshed on schedule.
+
+        Args:
+            entry: Dictionary read from the cache.
+            expires_in: Seconds the backend keeps the entry for.
+
+        Returns:
+            The entry, with a later hard expiry if the backend keeps it longer.
+        """
+        if _PAYLOAD_KEY not in entry:
+            return entry
+        hard_expires_at = self.clock() + expires_in - self.stale_if_error_ttl
+        if hard_expires_at <= entry[_HARD_EXPIRES_AT_KEY]:
+            return entry
+        return entry | {_HARD_EXPIRES_AT_KEY: hard_expires_at}
+
+    def _expires_early(self, now: float, soft_expires_at: float) -> bool:
+        """
+        Decides whether a fresh entry should be refreshed ahead of its soft TTL.
+        """
+        if self.xfetch_beta <= 0:
+            return False
+        # 1 - rng() lies in (0, 1], which keeps the logarithm finite.
+        gap = -self.xfetch_delta * self.xfetch_beta * math.log(1.0 - self.rng())
+        return now + gap >= soft_expires_at
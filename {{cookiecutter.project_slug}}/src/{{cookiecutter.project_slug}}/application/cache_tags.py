@@ -0,0 +1,45 @@
+from collections.abc import Iterable
+
+from {{cookiecutter.project_slug}}.application.dtos.artifact import ArtifactDTO
+
+DEPARTMENT_TAG = "department"
+ERA_TAG = "era"
+MATERIAL_TAG = "material"
+
+
+def cache_tag(name: str, value: str) -> str:
+    """
+    Returns the cache tag grouping the entries whose field ``name`` is ``value``.
+
+    Args:
+        name: Tagged field (e.g., 'department').
+        value: Value of the field (e.g., 'Antiquities').
+    """
+    return f"{name}:{value.strip().casefold()}"
+
+
+def artifact_cache_tags(artifact_dto: ArtifactDTO) -> list[str]:
+    """
+    Returns the tags of a cached artifact: its department, era and material.
+    """
+    return [
+        cache_tag(DEPARTMENT_TAG, artifact_dto.department),
+        cache_tag(ERA_TAG, artifact_dto.era.value),
+        cache_tag(MATERIAL_TAG, artifact_dto.material.value),
+    ]
+
+
+def cache_tags(
+    *,
+    departments: Iterable[str] = (),
+    eras: Iterable[str] = (),
+    materials: Iterable[str] = (),
+) -> list[str]:
+    """
+    Returns the tags selecting artifacts of any given department, era or material.
+    """
+    return [
+        *(cache_tag(DEPARTMENT_TAG, department) for department in departments),
+        *(cache_tag(ERA_TAG, era) for era in eras),
+        *(cache_tag(MATERIAL_TAG, material) for material in materials),
+    ]
@@ -0,0 +1,121 @@
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Literal, final
+
+
+@final
+@dataclass(frozen=True, slots=True, kw_only=True)
+class SingleFlightStatsDTO:
+    """Snapshot of the single-flight coordinator counters.
+
+    Attributes:
+        calls: Total number of calls made through the coordinator.
+        executions: Calls that actually ran the underlying work (leaders).
+        coalesced: Calls that joined an in-flight execution instead of running it.
+        errors: Executions that finished with an exception shared with all waiters.
+        in_flight: Keys currently being executed.
+    """
+
+    calls: int
+    executions: int
+    coalesced: int
+    errors: int
+    in_flight: int
+
+
+@final
+@dataclass(frozen=True, slots=True, kw_only=True)
+class CacheInvalidationJobDTO:
+    """Snapshot of a background cache invalidation job.
+
+    Attributes:
+        job_id: Unique identifier of the job.
+        pattern: Key pattern being invalidated.
+        status: One of "running", "completed", "failed" or "cancelled".
+        deleted: Number of keys deleted so far.
+        batches: Number of batches processed so far.
+        started_at: When the job was started (UTC).
+        finished_at: When the job finished (UTC), None while running.
+        error: Error message if the job failed.
+    """
+
+    job_id: str
+    pattern: str
+    status: Literal["running", "completed", "failed", "cancelled"]
+    deleted: int
+    batches: int
+    started_at: datetime
+    finished_at: datetime | None = None
+    error: str | None = None
+
+
+@final
+@dataclass(frozen=True, slots=True, kw_only=True)
+class HotCacheKeyDTO:
+    """A frequently read cache key seen by the hot-key tracker of a worker.
+
+    Attributes:
+        key: Cache key.
+        estimated_reads: Decayed read count estimate (an upper bound).
+        pinned: Whether the entry is currently served from the in-process L1 cache.
+    """
+
+    key: str
+    estimated_reads: int
+    pinned: bool
+
+
+@final
+@dataclass(frozen=True, slots=True, kw_only=True)
+class CacheHealthDTO:
+    """Snapshot of the cache circuit breaker of a worker.
+
+    Attributes:
+        state: "closed" while the cache is used, "open" while it is bypassed and
+            "half_open" while probe calls check whether it recovered.
+        failure_rate: Share of failed or timed-out calls in the rolling window.
+        slow_call_rate: Share of slow calls in the rolling window.
+        mean_latency_ms: Mean latency of the calls in the rolling window.
+        window_calls: Number of calls in the rolling window.
+        bypassed_calls: Calls answered without the cache since startup.
+        trips: Number of times the breaker opened since startup.
+        opened_at: When the breaker last opened (UTC), None if it never did.
+    """
+
+    state: Literal["closed", "open", "half_open"]
+    failure_rate: float
+    slow_call_rate: float
+    mean_latency_ms: float
+    window_calls: int
+    bypassed_calls: int
+    trips: int
+    opened_at: datetime | None = None
+
+
+@final
+@dataclass(frozen=True, slots=True, kw_only=True)
+class CachePrefetchStatsDTO:
+    """Counters of the co-access prefetcher of a worker.
+
+    Attributes:
+        sources: Artifacts whose successors are currently tracked.
+        clients: Clients whose last artifact is currently remembered.
+        scheduled: Prefetches started since startup.
+        dropped: Predicted prefetches dropped for lack of budget.
+        warmed: Prefetches that loaded an artifact into the cache.
+        skipped: Prefetches that found the artifact already cached or not in
+            the repository.
+        failed: Prefetches that raised an error.
+        hits: Warmed artifacts requested by a client within the hit window.
+        hit_rate: Share of warmed artifacts that were requested (hits / warmed).
+    """
+
+    sources: int
+    clients: int
+    scheduled: int
+    dropped: int
+    warmed: int
+    skipped: int
+    failed: int
+    hits: int
+    hit_rate: float
@@ -0,0 +1,29 @@
+from dataclasses import dataclass
+from typing import Literal, final
+
+
+@final
+@dataclass(frozen=True, slots=True, kw_only=True)
+class DatabasePoolStatsDTO:
+    """Connection pool counters of one database the worker reads or writes.
+
+    Attributes:
+        name: Host, port and database of the target (without credentials).
+        role: Whether the target is the primary or a read replica.
+        healthy: Whether the target passed its last health check (always True
+            for the primary, which is not health-checked).
+        reads: Repository reads routed to the target since startup.
+        pool_size: Connections the pool keeps open.
+        checked_in: Idle connections in the pool.
+        checked_out: Connections currently in use.
+        overflow: Connections open beyond ``pool_size``.
+    """
+
+    name: str
+    role: Literal["primary", "replica"]
+    healthy: bool
+    reads: int
+    pool_size: int
+    checked_in: int
+    checked_out: int
+    overflow: int
@@ -19,3 +19,8 @@ class FailedPublishArtifactMessageBrokerException(Exception):
 @final
 class FailedPublishArtifactInCatalogException(Exception):
     """Exception raised when publishing an artifact to the catalog fails."""
+
+
+@final
+class CacheInvalidationJobNotFoundError(Exception):
+    """Exception raised when a cache invalidation job is not found."""
@@ -1,6 +1,14 @@
 from abc import abstractmethod
+from collections.abc import AsyncIterator, Mapping, Sequence
 from typing import Any, Protocol, TypeVar
 
+from {{cookiecutter.project_slug}}.application.dtos.cache import (
+    CacheHealthDTO,
+    CacheInvalidationJobDTO,
+    CachePrefetchStatsDTO,
+    HotCacheKeyDTO,
+)
+
 T = TypeVar("T")
 
 
@@ -24,7 +32,9 @@ class CacheProtocol(Protocol):
         ...
 
     @abstractmethod
-    async def set(self, key: str, value: dict[str, Any], ttl: int | None = None) -> bool:
+    async def set(
+        self, key: str, value: dict[str, Any], ttl: int | None = None
+    ) -> bool:
         """Store a value in cache with optional TTL.
 
         Args:
@@ -61,6 +71,47 @@ class CacheProtocol(Protocol):
         """
         ...
 
+    @abstractmethod
+    async def get_many(self, keys: Sequence[str]) -> dict[str, dict[str, Any] | None]:
+        """Retrieve several values from cache in a single round trip.
+
+        Args:
+            keys: Cache keys to retrieve
+
+        Returns:
+            Mapping of every requested key to its cached dictionary data,
+            or None if the key is missing or could not be read
+        """
+        ...
+
+    @abstractmethod
+    async def set_many(
+        self, items: Mapping[str, dict[str, Any]], ttl: int | None = None
+    ) -> dict[str, bool]:
+        """Store several values in cache in a single round trip.
+
+        Args:
+            items: Mapping of cache keys to dictionary data to cache
+            ttl: Time-to-live in seconds applied to every key (None for default)
+
+        Returns:
+            Mapping of every key to True if it was stored, False otherwise
+        """
+        ...
+
+    @abstractmethod
+    async def delete_many(self, keys: Sequence[str]) -> dict[str, bool]:
+        """Delete several values from cache in a single round trip.
+
+        Args:
+            keys: Cache keys to delete
+
+        Returns:
+            Mapping of every key to True if it was deleted, False if it
+            didn't exist or could not be deleted
+        """
+        ...
+
     @abstractmethod
     async def clear(self, pattern: str) -> int:
         """Clear cache entries matching a pattern.
@@ -72,3 +123,179 @@ class CacheProtocol(Protocol):
             Number of keys deleted
         """
         ...
+
+    @abstractmethod
+    def iter_clear(self, pattern: str) -> AsyncIterator[int]:
+        """Clear cache entries matching a pattern, reporting progress per batch.
+
+        Args:
+            pattern: Pattern to match keys (e.g., 'user:*')
+
+        Yields:
+            Number of keys deleted by each batch
+
+        Raises:
+            Exception: If the backend fails; keys deleted so far stay deleted
+        """
+        ...
+
+
+class CacheRefresherProtocol(Protocol):
+    """Protocol for refreshing cache entries in the background.
+
+    Implementations run the refresh outside of the current request, so the
+    caller can answer immediately with the data it already has.
+    """
+
+    @abstractmethod
+    def schedule(self, key: str) -> bool:
+        """Schedule a background refresh of a cache entry.
+
+        Args:
+            key: Cache key to refresh
+
+        Returns:
+            True if a refresh was scheduled, False if one is already running
+        """
+        ...
+
+
+class CachePrefetcherProtocol(Protocol):
+    """Protocol for warming the cache with the entries clients are about to read.
+
+    Implementations learn which key tends to follow which from the keys each
+    client reads, and load the predicted ones outside of the current request.
+    """
+
+    @abstractmethod
+    def observe(self, client_id: str, key: str) -> None:
+        """Record that a client read a key and prefetch its likely successors.
+
+        Args:
+            client_id: Identity of the reading client
+            key: Key the client just read
+        """
+        ...
+
+    @abstractmethod
+    def stats(self) -> CachePrefetchStatsDTO:
+        """Return the counters of the prefetcher.
+
+        Returns:
+            Snapshot of the prefetch and hit counters
+        """
+        ...
+
+
+class CacheInvalidationJobsProtocol(Protocol):
+    """Protocol for running pattern invalidations as background jobs."""
+
+    @abstractmethod
+    def start(self, pattern: str) -> CacheInvalidationJobDTO:
+        """Start invalidating every cache key matching a pattern.
+
+        Args:
+            pattern: Pattern to match keys (e.g., 'user:*')
+
+        Returns:
+            Snapshot of the newly started job
+        """
+        ...
+
+    @abstractmethod
+    def get(self, job_id: str) -> CacheInvalidationJobDTO | None:
+        """Return the current state of a job.
+
+        Args:
+            job_id: Identifier returned when the job was started
+
+        Returns:
+            Snapshot of the job, or None if it is unknown
+        """
+        ...
+
+
+class CacheTagIndexProtocol(Protocol):
+    """Protocol for invalidating cache entries by tag (e.g., 'department:ceramics')."""
+
+    @abstractmethod
+    async def add(
+        self, tagged_keys: Mapping[str, Sequence[str]], ttl: int | None = None
+    ) -> None:
+        """Record the tags of cache entries.
+
+        Args:
+            tagged_keys: Mapping of cache keys to their tags
+            ttl: Time-to-live of the entries in seconds (None for the default)
+        """
+        ...
+
+    @abstractmethod
+    async def invalidate_tags(self, tags: Sequence[str]) -> int:
+        """Delete every cache entry carrying any of the tags.
+
+        Args:
+            tags: Tags whose entries are deleted
+
+        Returns:
+            Number of entries deleted
+        """
+        ...
+
+
+class CacheHealthProtocol(Protocol):
+    """Protocol for reporting whether the cache is used or bypassed."""
+
+    @abstractmethod
+    def health(self) -> CacheHealthDTO:
+        """Return a snapshot of the cache circuit breaker.
+
+        Returns:
+            State, rolling error and latency figures, and counters of this worker
+        """
+        ...
+
+
+class HotKeyTrackerProtocol(Protocol):
+    """Protocol for reporting the most frequently read cache keys."""
+
+    @abstractmethod
+    def hot_keys(self, limit: int) -> list[HotCacheKeyDTO]:
+        """Return the most frequently read keys, most read first.
+
+        Args:
+            limit: Maximum number of keys to return
+
+        Returns:
+            Snapshots of the hottest keys seen by this worker
+        """
+        ...
+
+
+class CacheKeyBuilderProtocol(Protocol):
+    """Protocol for building versioned cache keys for one kind of entity.
+
+    Keys embed a generation number; bumping it makes every previously
+    written key unreachable at once, leaving old entries to expire on their own.
+    """
+
+    @abstractmethod
+    async def build(self, identifier: str) -> str:
+        """Build the cache key of an entity.
+
+        Args:
+            identifier: Identifier of the entity (e.g., an inventory ID)
+
+        Returns:
+            The cache key for the current generation
+        """
+        ...
+
+    @abstractmethod
+    async def bump_generation(self) -> int:
+        """Orphan every key built so far by moving to a new generation.
+
+        Returns:
+            The new generation number
+        """
+        ...
@@ -0,0 +1,17 @@
+from abc import abstractmethod
+from typing import Protocol
+
+from {{cookiecutter.project_slug}}.application.dtos.database import DatabasePoolStatsDTO
+
+
+class DatabaseMetricsProtocol(Protocol):
+    """Protocol for reporting the connection pools of the databases in use."""
+
+    @abstractmethod
+    def pool_stats(self) -> list[DatabasePoolStatsDTO]:
+        """Return the pool counters of the primary and of every read replica.
+
+        Returns:
+            One DatabasePoolStatsDTO per database, the primary first.
+        """
+        ...
@@ -0,0 +1,45 @@
+from abc import abstractmethod
+from typing import Protocol
+
+
+class LeaseProtocol(Protocol):
+    """Protocol for short-lived, cluster-wide leases on a key.
+
+    A lease lets one process across all workers and pods load a missing cache
+    entry while the others wait for it. Leases expire on their own, so a
+    holder that dies never blocks the key for longer than the lease TTL.
+    """
+
+    @abstractmethod
+    async def acquire(self, key: str) -> str | None:
+        """Tries to take the lease on a key.
+
+        Args:
+            key: Key to lease.
+
+        Returns:
+            A token identifying this holder, or None if the lease is held elsewhere.
+        """
+        ...
+
+    @abstractmethod
+    async def release(self, key: str, token: str) -> bool:
+        """Releases a lease if it is still held with the given token.
+
+        Args:
+            key: Leased key.
+            token: Token returned by ``acquire``.
+
+        Returns:
+            True if the lease was released, False if it had already expired.
+        """
+        ...
+
+    @abstractmethod
+    async def wait(self, key: str) -> None:
+        """Waits until the lease on a key is released or expires.
+
+        Args:
+            key: Leased key.
+        """
+        ...
@@ -1,7 +1,9 @@
 from abc import abstractmethod
+from collections.abc import AsyncIterator, Sequence
 from typing import Protocol
 from uuid import UUID
 
+from {{cookiecutter.project_slug}}.application.dtos.artifact import ArtifactDTO
 from {{cookiecutter.project_slug}}.domain.entities.artifact import ArtifactEntity
 
 
@@ -26,6 +28,73 @@ class ArtifactRepositoryProtocol(Protocol):
         """
         ...
 
+    @abstractmethod
+    async def get_many_by_inventory_ids(
+        self, inventory_ids: Sequence[str | UUID]
+    ) -> dict[UUID, ArtifactEntity]:
+        """
+        Retrieves several artifacts by their inventory IDs in one operation.
+
+        Args:
+            inventory_ids: The unique identifiers of the artifacts.
+
+        Returns:
+            A mapping of inventory ID to ArtifactEntity for every artifact found.
+            IDs without an artifact are absent from the mapping.
+        """
+        ...
+
+    @abstractmethod
+    async def get_dto_by_inventory_id(
+        self, inventory_id: str | UUID
+    ) -> ArtifactDTO | None:
+        """
+        Retrieves an artifact by its inventory ID straight as a DTO.
+
+        A lean read for query use cases: no Domain entity is built or validated.
+
+        Args:
+            inventory_id: The unique identifier of the artifact.
+
+        Returns:
+            The ArtifactDTO if found, otherwise None.
+        """
+        ...
+
+    @abstractmethod
+    async def get_dtos_by_inventory_ids(
+        self, inventory_ids: Sequence[str | UUID]
+    ) -> dict[UUID, ArtifactDTO]:
+        """
+        Retrieves several artifacts by their inventory IDs straight as DTOs.
+
+        The lean counterpart of ``get_many_by_inventory_ids``.
+
+        Args:
+            inventory_ids: The unique identifiers of the artifacts.
+
+        Returns:
+            A mapping of inventory ID to ArtifactDTO for every artifact found.
+            IDs without an artifact are absent from the mapping.
+        """
+        ...
+
+    @abstractmethod
+    def stream_recent(
+        self, limit: int, batch_size: int
+    ) -> AsyncIterator[Sequence[ArtifactEntity]]:
+        """
+        Streams the most recently created artifacts, newest first, in batches.
+
+        Args:
+            limit: Maximum number of artifacts to stream.
+            batch_size: Number of artifacts per yielded batch.
+
+        Yields:
+            Batches of at most ``batch_size`` ArtifactEntity objects.
+        """
+        ...
+
     @abstractmethod
     async def save(self, artifact: ArtifactEntity) -> None:
         """
@@ -35,3 +104,13 @@ class ArtifactRepositoryProtocol(Protocol):
             artifact: The ArtifactEntity to save.
         """
         ...
+
+    @abstractmethod
+    async def save_many(self, artifacts: Sequence[ArtifactEntity]) -> None:
+        """
+        Saves new artifacts or updates existing ones in one operation.
+
+        Args:
+            artifacts: The ArtifactEntity objects to save.
+        """
+        ...
@@ -0,0 +1,34 @@
+from abc import abstractmethod
+from collections.abc import Awaitable, Callable
+from typing import Protocol, TypeVar
+
+from {{cookiecutter.project_slug}}.application.dtos.cache import SingleFlightStatsDTO
+
+T = TypeVar("T")
+
+
+class SingleFlightProtocol(Protocol):
+    """Protocol for coalescing concurrent calls that share the same key.
+
+    Only the first caller for a key runs the work; every concurrent caller
+    for the same key awaits that execution and receives the same result or
+    the same exception.
+    """
+
+    @abstractmethod
+    async def do(self, key: str, fn: Callable[[], Awaitable[T]]) -> T:
+        """Runs ``fn`` once per key for all concurrent callers.
+
+        Args:
+            key: Key identifying the work to deduplicate.
+            fn: Zero-argument coroutine factory performing the work.
+
+        Returns:
+            The result of the (possibly shared) execution.
+        """
+        ...
+
+    @abstractmethod
+    def stats(self) -> SingleFlightStatsDTO:
+        """Returns a snapshot of the coordinator counters."""
+        ...
@@ -0,0 +1,74 @@
+from abc import abstractmethod
+from typing import Protocol
+
+from {{cookiecutter.project_slug}}.application.dtos.artifact import ArtifactDTO
+
+
+class GetArtifactFromRepoProtocol(Protocol):
+    """
+    Protocol for reading an artifact from the repository.
+    """
+
+    @abstractmethod
+    async def __call__(self, inventory_id: str, /) -> ArtifactDTO | None:
+        """
+        Reads an artifact from the repository.
+
+        Args:
+            inventory_id: The ID of the artifact to read.
+
+        Returns:
+            The artifact, or None if the repository does not hold it.
+        """
+        ...
+
+
+class FetchArtifactFromMuseumAPIProtocol(Protocol):
+    """
+    Protocol for fetching an artifact from the external museum API.
+    """
+
+    @abstractmethod
+    async def __call__(self, inventory_id: str, /) -> ArtifactDTO:
+        """
+        Fetches an artifact from the external museum API.
+
+        Args:
+            inventory_id: The ID of the artifact to fetch.
+
+        Returns:
+            The fetched artifact.
+        """
+        ...
+
+
+class SaveArtifactToRepoProtocol(Protocol):
+    """
+    Protocol for saving an artifact to the repository.
+    """
+
+    @abstractmethod
+    async def __call__(self, artifact_dto: ArtifactDTO, /) -> None:
+        """
+        Saves an artifact to the repository.
+
+        Args:
+            artifact_dto: The artifact to save.
+        """
+        ...
+
+
+class PublishArtifactProtocol(Protocol):
+    """
+    Protocol for publishing an artifact, e.g. to the broker or the public catalog.
+    """
+
+    @abstractmethod
+    async def __call__(self, artifact_dto: ArtifactDTO, /) -> None:
+        """
+        Publishes an artifact.
+
+        Args:
+            artifact_dto: The artifact to publish.
+        """
+        ...
@@ -0,0 +1,32 @@
+from dataclasses import dataclass
+from typing import final
+
+import structlog
+
+from {{cookiecutter.project_slug}}.application.interfaces.cache import CacheKeyBuilderProtocol
+
+logger = structlog.get_logger(__name__)
+
+
+@final
+@dataclass(frozen=True, slots=True, kw_only=True)
+class BumpCacheGenerationUseCase:
+    """
+    Use case for invalidating every cached artifact at once.
+
+    Moving to a new generation makes all existing artifact keys unreachable;
+    the orphaned entries expire through their TTL instead of being deleted.
+    """
+
+    key_builder: CacheKeyBuilderProtocol
+
+    async def __call__(self) -> int:
+        """
+        Executes the use case to bump the artifact cache generation.
+
+        Returns:
+            The new generation number.
+        """
+        generation = await self.key_builder.bump_generation()
+        logger.info("Artifact cache invalidated", generation=generation)
+        return generation
@@ -9,6 +9,7 @@ from {{cookiecutter.project_slug}}.application.exceptions import (
     FailedFetchArtifactMuseumAPIException,
 )
 from {{cookiecutter.project_slug}}.application.interfaces.http_clients import ExternalMuseumAPIProtocol
+from {{cookiecutter.project_slug}}.application.interfaces.use_cases import FetchArtifactFromMuseumAPIProtocol
 
 if TYPE_CHECKING:
     from {{cookiecutter.project_slug}}.domain.entities.artifact import ArtifactEntity
@@ -18,7 +19,7 @@ logger = structlog.get_logger(__name__)
 
 @final
 @dataclass(frozen=True, slots=True, kw_only=True)
-class FetchArtifactFromMuseumAPIUseCase:
+class FetchArtifactFromMuseumAPIUseCase(FetchArtifactFromMuseumAPIProtocol):
     """
     Use case for fetching an artifact from an external museum API.
     """
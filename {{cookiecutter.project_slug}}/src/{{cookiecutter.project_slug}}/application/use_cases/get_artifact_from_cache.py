@@ -3,8 +3,18 @@ from typing import TYPE_CHECKING, final
 
 import structlog
 
+from {{cookiecutter.project_slug}}.application.cache_policy import (
+    CacheFreshness,
+    CacheFreshnessPolicy,
+    is_tombstone,
+)
 from {{cookiecutter.project_slug}}.application.dtos.artifact import ArtifactDTO
-from {{cookiecutter.project_slug}}.application.interfaces.cache import CacheProtocol
+from {{cookiecutter.project_slug}}.application.exceptions import ArtifactNotFoundError
+from {{cookiecutter.project_slug}}.application.interfaces.cache import (
+    CacheKeyBuilderProtocol,
+    CacheProtocol,
+    CacheRefresherProtocol,
+)
 from {{cookiecutter.project_slug}}.application.interfaces.serialization import SerializationMapperProtocol
 
 if TYPE_CHECKING:
@@ -18,10 +28,24 @@ logger = structlog.get_logger(__name__)
 class GetArtifactFromCacheUseCase:
     """
     Use case for retrieving an artifact from the cache.
+
+    With a freshness policy, entries past their soft TTL are still returned
+    (stale-while-revalidate) and a background refresh is scheduled through the
+    refresher; entries past their hard TTL are reported as misses but remain
+    available through ``get_last_known_good``.
+
+    Artifacts recently reported missing by the museum API are cached as
+    tombstones, for which ArtifactNotFoundError is raised straight away.
+
+    With a key builder, artifacts are looked up under versioned keys instead
+    of their raw inventory IDs.
     """
 
     cache_client: CacheProtocol
     serialization_mapper: SerializationMapperProtocol
+    freshness_policy: CacheFreshnessPolicy | None = None
+    refresher: CacheRefresherProtocol | None = None
+    key_builder: CacheKeyBuilderProtocol | None = None
 
     async def __call__(self, inventory_id: str) -> ArtifactDTO | None:
         """
@@ -31,11 +55,76 @@ class GetArtifactFromCacheUseCase:
             inventory_id: The ID of the artifact to retrieve.
 
         Returns:
-            An ArtifactDTO if found in cache, otherwise None.
+            An ArtifactDTO if found in cache and not expired, otherwise None.
+
+        Raises:
+            ArtifactNotFoundError: If the artifact is cached as nonexistent.
         """
-        cached_artifact_data: dict | None = await self.cache_client.get(inventory_id)
-        if cached_artifact_data:
+        cached_artifact_data: dict | None = await self.cache_client.get(
+            await self._cache_key(inventory_id)
+        )
+        if not cached_artifact_data:
+            logger.info("Artifact not found in cache", inventory_id=inventory_id)
+            return None
+        if is_tombstone(cached_artifact_data):
+            logger.info("Artifact cached as nonexistent", inventory_id=inventory_id)
+            raise ArtifactNotFoundError(f"Artifact {inventory_id} not found")
+        if self.freshness_policy is None:
             logger.info("Artifact found in cache", inventory_id=inventory_id)
             return self.serialization_mapper.from_dict(cached_artifact_data)
-        logger.info("Artifact not found in cache", inventory_id=inventory_id)
-        return None
+
+        artifact_data, freshness = self.freshness_policy.unwrap(cached_artifact_data)
+        if freshness is CacheFreshness.EXPIRED:
+            logger.info("Artifact in cache is expired", inventory_id=inventory_id)
+            return None
+        if freshness is CacheFreshness.STALE and self.refresher is not None:
+            self.refresher.schedule(inventory_id)
+        logger.info(
+            "Artifact found in cache", inventory_id=inventory_id, freshness=freshness
+        )
+        return self.serialization_mapper.from_dict(artifact_data)
+
+    async def get_last_known_good(self, inventory_id: str) -> ArtifactDTO | None:
+        """
+        Returns the cached artifact regardless of its freshness.
+
+        Used as a fallback (stale-if-error) when the artifact cannot be loaded
+        from its source. Artifacts found in the repository never get here, so
+        in practice this only serves artifacts that are cached but missing from
+        the repository, and only if the freshness policy keeps expired entries
+        (``stale_if_error_ttl`` > 0).
+
+        Args:
+            inventory_id: The ID of the artifact to retrieve.
+
+        Returns:
+            The last cached ArtifactDTO, or None if nothing is cached.
+        """
+        cached_artifact_data: dict | None = await self.cache_client.get(
+            await self._cache_key(inventory_id)
+        )
+        if not cached_artifact_data or is_tombstone(cached_artifact_data):
+            return None
+        if self.freshness_policy is not None:
+            cached_artifact_data, _ = self.freshness_policy.unwrap(cached_artifact_data)
+        return self.serialization_mapper.from_dict(cached_artifact_data)
+
+    async def is_cached(self, inventory_id: str) -> bool:
+        """
+        Checks whether the cache holds an entry for an artifact, without reading it.
+
+        Args:
+            inventory_id: The ID of the artifact to look up.
+
+        Returns:
+            True if an entry (possibly stale, or a tombstone) is cached.
+        """
+        return await self.cache_client.exists(await self._cache_key(inventory_id))
+
+    async def _cache_key(self, inventory_id: str) -> str:
+        """
+        Returns the cache key of an artifact.
+        """
+        if self.key_builder is None:
+            return inventory_id
+        return await self.key_builder.build(inventory_id)
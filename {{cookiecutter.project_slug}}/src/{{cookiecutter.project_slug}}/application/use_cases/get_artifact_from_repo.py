@@ -7,6 +7,7 @@ from {{cookiecutter.project_slug}}.application.dtos.artifact import ArtifactDTO
 from {{cookiecutter.project_slug}}.application.interfaces.mappers import DtoEntityMapperProtocol
 from {{cookiecutter.project_slug}}.application.interfaces.repositories import ArtifactRepositoryProtocol
 from {{cookiecutter.project_slug}}.application.interfaces.uow import UnitOfWorkProtocol
+from {{cookiecutter.project_slug}}.application.interfaces.use_cases import GetArtifactFromRepoProtocol
 
 if TYPE_CHECKING:
     from {{cookiecutter.project_slug}}.domain.entities.artifact import ArtifactEntity
@@ -16,13 +17,17 @@ logger = structlog.get_logger(__name__)
 
 @final
 @dataclass(frozen=True, slots=True, kw_only=True)
-class GetArtifactFromRepoUseCase:
+class GetArtifactFromRepoUseCase(GetArtifactFromRepoProtocol):
     """
     Use case for retrieving an artifact from the repository.
+
+    With ``lean_reads`` the repository maps the row straight to a DTO, skipping
+    the Domain entity and its validation.
     """
 
     uow: UnitOfWorkProtocol
     artifact_mapper: DtoEntityMapperProtocol
+    lean_reads: bool = False
 
     async def __call__(self, inventory_id: str) -> ArtifactDTO | None:
         """
@@ -35,11 +40,22 @@ class GetArtifactFromRepoUseCase:
             An ArtifactDTO if found in the repository, otherwise None.
         """
         async with self.uow:
-            artifact_entity: (
-                ArtifactEntity | None
-            ) = await self.uow.repository.get_by_inventory_id(inventory_id)
-            if artifact_entity:
+            artifact_dto: ArtifactDTO | None
+            if self.lean_reads:
+                artifact_dto = await self.uow.repository.get_dto_by_inventory_id(
+                    inventory_id
+                )
+            else:
+                artifact_entity: (
+                    ArtifactEntity | None
+                ) = await self.uow.repository.get_by_inventory_id(inventory_id)
+                artifact_dto = (
+                    self.artifact_mapper.to_dto(artifact_entity)
+                    if artifact_entity
+                    else None
+                )
+            if artifact_dto:
                 logger.info("Artifact found in repository", inventory_id=inventory_id)
-                return self.artifact_mapper.to_dto(artifact_entity)
+                return artifact_dto
             logger.info("Artifact not found in repository", inventory_id=inventory_id)
             return None
@@ -0,0 +1,82 @@
+from collections.abc import Sequence
+from dataclasses import dataclass
+from typing import final
+
+import structlog
+
+from {{cookiecutter.project_slug}}.application.cache_policy import (
+    CacheFreshness,
+    CacheFreshnessPolicy,
+    is_tombstone,
+)
+from {{cookiecutter.project_slug}}.application.dtos.artifact import ArtifactDTO
+from {{cookiecutter.project_slug}}.application.interfaces.cache import (
+    CacheKeyBuilderProtocol,
+    CacheProtocol,
+    CacheRefresherProtocol,
+)
+from {{cookiecutter.project_slug}}.application.interfaces.serialization import SerializationMapperProtocol
+
+logger = structlog.get_logger(__name__)
+
+
+@final
+@dataclass(frozen=True, slots=True, kw_only=True)
+class GetArtifactsFromCacheUseCase:
+    """
+    Use case for retrieving several artifacts from the cache in one round trip.
+
+    Freshness is handled as in GetArtifactFromCacheUseCase: stale entries are
+    returned and refreshed in the background, expired entries and tombstones
+    are left out. With a key builder, versioned keys are used as in
+    GetArtifactFromCacheUseCase.
+    """
+
+    cache_client: CacheProtocol
+    serialization_mapper: SerializationMapperProtocol
+    freshness_policy: CacheFreshnessPolicy | None = None
+    refresher: CacheRefresherProtocol | None = None
+    key_builder: CacheKeyBuilderProtocol | None = None
+
+    async def __call__(self, inventory_ids: Sequence[str]) -> dict[str, ArtifactDTO]:
+        """
+        Executes the use case to get several artifacts from the cache.
+
+        Args:
+            inventory_ids: The IDs of the artifacts to retrieve.
+
+        Returns:
+            A mapping of inventory ID to ArtifactDTO for every cache hit.
+            IDs missing from the cache are absent from the mapping.
+        """
+        keys = {
+            await self._cache_key(inventory_id): inventory_id
+            for inventory_id in inventory_ids
+        }
+        cached_artifacts_data = await self.cache_client.get_many(list(keys))
+        artifacts: dict[str, ArtifactDTO] = {}
+        for key, data in cached_artifacts_data.items():
+            inventory_id = keys[key]
+            if not data or is_tombstone(data):
+                continue
+            if self.freshness_policy is not None:
+                data, freshness = self.freshness_policy.unwrap(data)
+                if freshness is CacheFreshness.EXPIRED:
+                    continue
+                if freshness is CacheFreshness.STALE and self.refresher is not None:
+                    self.refresher.schedule(inventory_id)
+            artifacts[inventory_id] = self.serialization_mapper.from_dict(data)
+        logger.info(
+            "Artifacts looked up in cache",
+            requested=len(inventory_ids),
+            found=len(artifacts),
+        )
+        return artifacts
+
+    async def _cache_key(self, inventory_id: str) -> str:
+        """
+        Returns the cache key of an artifact.
+        """
+        if self.key_builder is None:
+            return inventory_id
+        return await self.key_builder.build(inventory_id)
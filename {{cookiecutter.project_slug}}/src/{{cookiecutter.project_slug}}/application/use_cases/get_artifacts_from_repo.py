@@ -0,0 +1,60 @@
+from collections.abc import Sequence
+from dataclasses import dataclass
+from typing import final
+from uuid import UUID
+
+import structlog
+
+from {{cookiecutter.project_slug}}.application.dtos.artifact import ArtifactDTO
+from {{cookiecutter.project_slug}}.application.interfaces.mappers import DtoEntityMapperProtocol
+from {{cookiecutter.project_slug}}.application.interfaces.uow import UnitOfWorkProtocol
+
+logger = structlog.get_logger(__name__)
+
+
+@final
+@dataclass(frozen=True, slots=True, kw_only=True)
+class GetArtifactsFromRepoUseCase:
+    """
+    Use case for retrieving several artifacts from the repository at once.
+
+    They are read in one transaction. With ``lean_reads`` the repository maps
+    the rows straight to DTOs, skipping the Domain entities and their validation.
+    """
+
+    uow: UnitOfWorkProtocol
+    artifact_mapper: DtoEntityMapperProtocol
+    lean_reads: bool = False
+
+    async def __call__(
+        self, inventory_ids: Sequence[str | UUID]
+    ) -> dict[UUID, ArtifactDTO]:
+        """
+        Executes the use case to get several artifacts from the repository.
+
+        Args:
+            inventory_ids: The IDs of the artifacts to retrieve.
+
+        Returns:
+            A mapping of inventory ID to ArtifactDTO for every artifact found.
+            IDs missing from the repository are absent from the mapping.
+        """
+        async with self.uow:
+            if self.lean_reads:
+                artifacts = await self.uow.repository.get_dtos_by_inventory_ids(
+                    inventory_ids
+                )
+            else:
+                artifact_entities = await self.uow.repository.get_many_by_inventory_ids(
+                    inventory_ids
+                )
+                artifacts = {
+                    inventory_id: self.artifact_mapper.to_dto(artifact_entity)
+                    for inventory_id, artifact_entity in artifact_entities.items()
+                }
+        logger.info(
+            "Artifacts looked up in repository",
+            requested=len(inventory_ids),
+            found=len(artifacts),
+        )
+        return artifacts
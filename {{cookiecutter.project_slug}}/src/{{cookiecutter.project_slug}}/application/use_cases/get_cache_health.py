@@ -0,0 +1,24 @@
+from dataclasses import dataclass
+from typing import final
+
+from {{cookiecutter.project_slug}}.application.dtos.cache import CacheHealthDTO
+from {{cookiecutter.project_slug}}.application.interfaces.cache import CacheHealthProtocol
+
+
+@final
+@dataclass(frozen=True, slots=True, kw_only=True)
+class GetCacheHealthUseCase:
+    """
+    Use case for reporting whether this worker uses or bypasses the cache.
+    """
+
+    cache_health: CacheHealthProtocol
+
+    async def __call__(self) -> CacheHealthDTO:
+        """
+        Executes the use case to report the cache health.
+
+        Returns:
+            A CacheHealthDTO describing the cache circuit breaker of this worker.
+        """
+        return self.cache_health.health()
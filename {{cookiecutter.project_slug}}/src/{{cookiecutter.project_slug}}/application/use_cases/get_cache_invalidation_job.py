@@ -0,0 +1,36 @@
+from dataclasses import dataclass
+from typing import final
+
+from {{cookiecutter.project_slug}}.application.dtos.cache import CacheInvalidationJobDTO
+from {{cookiecutter.project_slug}}.application.exceptions import CacheInvalidationJobNotFoundError
+from {{cookiecutter.project_slug}}.application.interfaces.cache import CacheInvalidationJobsProtocol
+
+
+@final
+@dataclass(frozen=True, slots=True, kw_only=True)
+class GetCacheInvalidationJobUseCase:
+    """
+    Use case for reporting the progress of a cache invalidation job.
+    """
+
+    invalidation_jobs: CacheInvalidationJobsProtocol
+
+    async def __call__(self, job_id: str) -> CacheInvalidationJobDTO:
+        """
+        Executes the use case to get a cache invalidation job.
+
+        Args:
+            job_id: The ID returned when the job was started.
+
+        Returns:
+            A CacheInvalidationJobDTO with the current progress of the job.
+
+        Raises:
+            CacheInvalidationJobNotFoundError: If the job is unknown to this worker.
+        """
+        job = self.invalidation_jobs.get(job_id)
+        if job is None:
+            raise CacheInvalidationJobNotFoundError(
+                f"Cache invalidation job {job_id} not found"
+            )
+        return job
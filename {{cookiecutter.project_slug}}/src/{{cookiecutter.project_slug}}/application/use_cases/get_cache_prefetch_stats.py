@@ -0,0 +1,24 @@
+from dataclasses import dataclass
+from typing import final
+
+from {{cookiecutter.project_slug}}.application.dtos.cache import CachePrefetchStatsDTO
+from {{cookiecutter.project_slug}}.application.interfaces.cache import CachePrefetcherProtocol
+
+
+@final
+@dataclass(frozen=True, slots=True, kw_only=True)
+class GetCachePrefetchStatsUseCase:
+    """
+    Use case for reporting whether the co-access prefetching of this worker pays off.
+    """
+
+    prefetcher: CachePrefetcherProtocol
+
+    async def __call__(self) -> CachePrefetchStatsDTO:
+        """
+        Executes the use case to report the prefetch counters.
+
+        Returns:
+            A CachePrefetchStatsDTO with the prefetch and hit counters of this worker.
+        """
+        return self.prefetcher.stats()
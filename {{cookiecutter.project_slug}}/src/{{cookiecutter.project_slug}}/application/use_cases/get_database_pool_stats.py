@@ -0,0 +1,24 @@
+from dataclasses import dataclass
+from typing import final
+
+from {{cookiecutter.project_slug}}.application.dtos.database import DatabasePoolStatsDTO
+from {{cookiecutter.project_slug}}.application.interfaces.database import DatabaseMetricsProtocol
+
+
+@final
+@dataclass(frozen=True, slots=True, kw_only=True)
+class GetDatabasePoolStatsUseCase:
+    """
+    Use case for reporting how the reads of this worker spread over the databases.
+    """
+
+    metrics: DatabaseMetricsProtocol
+
+    async def __call__(self) -> list[DatabasePoolStatsDTO]:
+        """
+        Executes the use case to report the connection pool counters.
+
+        Returns:
+            One DatabasePoolStatsDTO per database, the primary first.
+        """
+        return self.metrics.pool_stats()
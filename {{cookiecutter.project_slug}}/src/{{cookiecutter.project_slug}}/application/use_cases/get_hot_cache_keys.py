@@ -0,0 +1,27 @@
+from dataclasses import dataclass
+from typing import final
+
+from {{cookiecutter.project_slug}}.application.dtos.cache import HotCacheKeyDTO
+from {{cookiecutter.project_slug}}.application.interfaces.cache import HotKeyTrackerProtocol
+
+
+@final
+@dataclass(frozen=True, slots=True, kw_only=True)
+class GetHotCacheKeysUseCase:
+    """
+    Use case for reporting the most frequently read cache keys of this worker.
+    """
+
+    hot_key_tracker: HotKeyTrackerProtocol
+
+    async def __call__(self, limit: int) -> list[HotCacheKeyDTO]:
+        """
+        Executes the use case to list hot cache keys.
+
+        Args:
+            limit: Maximum number of keys to return.
+
+        Returns:
+            HotCacheKeyDTOs of the hottest keys, most read first.
+        """
+        return self.hot_key_tracker.hot_keys(limit)
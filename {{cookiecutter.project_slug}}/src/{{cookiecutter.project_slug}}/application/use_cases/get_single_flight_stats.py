@@ -0,0 +1,24 @@
+from dataclasses import dataclass
+from typing import final
+
+from {{cookiecutter.project_slug}}.application.dtos.cache import SingleFlightStatsDTO
+from {{cookiecutter.project_slug}}.application.interfaces.single_flight import SingleFlightProtocol
+
+
+@final
+@dataclass(frozen=True, slots=True, kw_only=True)
+class GetSingleFlightStatsUseCase:
+    """
+    Use case for reporting how many cache misses this worker coalesced.
+    """
+
+    single_flight: SingleFlightProtocol
+
+    async def __call__(self) -> SingleFlightStatsDTO:
+        """
+        Executes the use case to report the single-flight counters.
+
+        Returns:
+            A SingleFlightStatsDTO with the call and coalescing counters of this worker.
+        """
+        return self.single_flight.stats()
@@ -0,0 +1,36 @@
+from collections.abc import Sequence
+from dataclasses import dataclass
+from typing import final
+
+import structlog
+
+from {{cookiecutter.project_slug}}.application.interfaces.cache import CacheTagIndexProtocol
+
+logger = structlog.get_logger(__name__)
+
+
+@final
+@dataclass(frozen=True, slots=True, kw_only=True)
+class InvalidateCacheTagsUseCase:
+    """
+    Use case for invalidating the cached artifacts carrying any of some tags.
+
+    Unlike a generation bump, only the tagged entries are deleted, and unlike
+    a pattern invalidation, the keyspace is never scanned.
+    """
+
+    tag_index: CacheTagIndexProtocol
+
+    async def __call__(self, tags: Sequence[str]) -> int:
+        """
+        Executes the use case to invalidate cache tags.
+
+        Args:
+            tags: Tags whose entries are invalidated (see application.cache_tags).
+
+        Returns:
+            Number of cache entries deleted.
+        """
+        deleted = await self.tag_index.invalidate_tags(tags)
+        logger.info("Artifact cache tags invalidated", tags=list(tags), deleted=deleted)
+        return deleted
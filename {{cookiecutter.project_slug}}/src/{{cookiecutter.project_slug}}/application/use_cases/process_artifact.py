@@ -4,28 +4,25 @@ from typing import TYPE_CHECKING, final
 import structlog
 
 from {{cookiecutter.project_slug}}.application.dtos.artifact import ArtifactDTO
-from {{cookiecutter.project_slug}}.application.exceptions import ArtifactNotFoundError
-from {{cookiecutter.project_slug}}.application.use_cases.fetch_artifact_from_museum_api import (
-    FetchArtifactFromMuseumAPIUseCase,
+from {{cookiecutter.project_slug}}.application.exceptions import (
+    ArtifactNotFoundError,
+    FailedFetchArtifactMuseumAPIException,
+)
+from {{cookiecutter.project_slug}}.application.interfaces.cache import CachePrefetcherProtocol
+from {{cookiecutter.project_slug}}.application.interfaces.lease import LeaseProtocol
+from {{cookiecutter.project_slug}}.application.interfaces.single_flight import SingleFlightProtocol
+from {{cookiecutter.project_slug}}.application.interfaces.use_cases import (
+    FetchArtifactFromMuseumAPIProtocol,
+    GetArtifactFromRepoProtocol,
+    PublishArtifactProtocol,
+    SaveArtifactToRepoProtocol,
 )
 from {{cookiecutter.project_slug}}.application.use_cases.get_artifact_from_cache import (
     GetArtifactFromCacheUseCase,
 )
-from {{cookiecutter.project_slug}}.application.use_cases.get_artifact_from_repo import (
-    GetArtifactFromRepoUseCase,
-)
-from {{cookiecutter.project_slug}}.application.use_cases.publish_artifact_to_broker import (
-    PublishArtifactToBrokerUseCase,
-)
-from {{cookiecutter.project_slug}}.application.use_cases.publish_artifact_to_catalog import (
-    PublishArtifactToCatalogUseCase,
-)
 from {{cookiecutter.project_slug}}.application.use_cases.save_artifact_to_cache import (
     SaveArtifactToCacheUseCase,
 )
-from {{cookiecutter.project_slug}}.application.use_cases.save_artifact_to_repo import (
-    SaveArtifactToRepoUseCase,
-)
 
 if TYPE_CHECKING:
     from {{cookiecutter.project_slug}}.domain.entities.artifact import ArtifactEntity
@@ -39,20 +36,72 @@ class ProcessArtifactUseCase:
     """
     Use case for processing an artifact, including fetching from cache, repository,
     or external API, saving, and publishing.
+
+    When a single-flight coordinator is provided, concurrent calls for the same
+    inventory ID are coalesced: only one of them runs the cache -> repository ->
+    museum API chain and the others receive its result (or its exception).
+
+    When a lease is provided, cache misses are also coalesced across workers
+    and pods: the process taking the lease on the inventory ID loads the
+    artifact, the others wait for the lease to go away and read the artifact
+    from the cache. They load it themselves only if it is still missing then,
+    e.g. because the lease holder died and its lease expired.
+
+    If the museum API fails, the last-known-good cached copy of the artifact is
+    returned when one is still available (stale-if-error). Artifacts the museum
+    API reports as missing are cached as tombstones, so repeated lookups of
+    nonexistent IDs fail fast at the cache.
+
+    When a prefetcher is provided, every artifact served to an identified
+    client is reported to it, so the artifacts the client is likely to ask for
+    next can be loaded into the cache in the background (see ``prefetch``).
+
+    The repository, museum API and publishing steps only run on a cache miss.
+    They are typed by the protocols of their use cases rather than the use
+    cases themselves, so the container can pass stand-ins that build the
+    database session, API clients and publisher on first call instead of for
+    every request.
     """
 
     get_artifact_from_cache_use_case: GetArtifactFromCacheUseCase
-    get_artifact_from_repo_use_case: GetArtifactFromRepoUseCase
-    fetch_artifact_from_museum_api_use_case: FetchArtifactFromMuseumAPIUseCase
-    save_artifact_to_repo_use_case: SaveArtifactToRepoUseCase
+    get_artifact_from_repo_use_case: GetArtifactFromRepoProtocol
+    fetch_artifact_from_museum_api_use_case: FetchArtifactFromMuseumAPIProtocol
+    save_artifact_to_repo_use_case: SaveArtifactToRepoProtocol
     save_artifact_to_cache_use_case: SaveArtifactToCacheUseCase
-    publish_artifact_to_broker_use_case: PublishArtifactToBrokerUseCase
-    publish_artifact_to_catalog_use_case: PublishArtifactToCatalogUseCase
+    publish_artifact_to_broker_use_case: PublishArtifactProtocol
+    publish_artifact_to_catalog_use_case: PublishArtifactProtocol
+    single_flight: SingleFlightProtocol | None = None
+    lease: LeaseProtocol | None = None
+    prefetcher: CachePrefetcherProtocol | None = None
 
-    async def __call__(self, inventory_id: str) -> ArtifactDTO:
+    async def __call__(
+        self, inventory_id: str, client_id: str | None = None
+    ) -> ArtifactDTO:
         """
         Executes the artifact processing flow.
 
+        Args:
+            inventory_id: The ID of the artifact to process.
+            client_id: Identity of the requesting client, used to learn its
+                browsing sequence for prefetching.
+
+        Returns:
+            An ArtifactDTO representing the processed artifact.
+        """
+        if self.single_flight is None:
+            artifact_dto = await self._process(inventory_id)
+        else:
+            artifact_dto = await self.single_flight.do(
+                inventory_id, lambda: self._process(inventory_id)
+            )
+        if self.prefetcher is not None and client_id is not None:
+            self.prefetcher.observe(client_id, inventory_id)
+        return artifact_dto
+
+    async def _process(self, inventory_id: str) -> ArtifactDTO:
+        """
+        Runs the cache -> repository -> museum API chain for a single artifact.
+
         Args:
             inventory_id: The ID of the artifact to process.
 
@@ -61,12 +110,113 @@ class ProcessArtifactUseCase:
         """
         if artifact_dto := await self.get_artifact_from_cache_use_case(inventory_id):
             return artifact_dto
+        if self.lease is None:
+            return await self._load(inventory_id)
+        return await self._load_under_lease(self.lease, inventory_id)
+
+    async def _load_under_lease(
+        self, lease: LeaseProtocol, inventory_id: str
+    ) -> ArtifactDTO:
+        """
+        Loads an artifact once per cluster, waiting for whoever holds its lease.
+
+        Args:
+            lease: Cluster-wide lease on inventory IDs.
+            inventory_id: The ID of the artifact to load.
+
+        Returns:
+            An ArtifactDTO representing the loaded artifact.
+        """
+        token = await lease.acquire(inventory_id)
+        if token is not None:
+            try:
+                return await self._load(inventory_id)
+            finally:
+                await lease.release(inventory_id, token)
+
+        await lease.wait(inventory_id)
+        if artifact_dto := await self.get_artifact_from_cache_use_case(inventory_id):
+            return artifact_dto
+        logger.info(
+            "Artifact lease ended without a cached artifact, loading it",
+            inventory_id=inventory_id,
+        )
+        return await self._load(inventory_id)
+
+    async def refresh(self, inventory_id: str) -> ArtifactDTO:
+        """
+        Reloads an artifact from its source and rewrites its cache entry.
+
+        Used by background refreshes of stale cache entries, so the cache is
+        bypassed on the way in.
+
+        Args:
+            inventory_id: The ID of the artifact to refresh.
+
+        Returns:
+            An ArtifactDTO representing the refreshed artifact.
+        """
+        return await self._load(inventory_id)
+
+    async def prefetch(self, inventory_id: str) -> bool:
+        """
+        Loads an artifact into the cache ahead of a predicted request.
+
+        Only the repository is used: a speculative load must not call the
+        museum API nor publish anything.
+
+        Args:
+            inventory_id: The ID of the artifact to prefetch.
+
+        Returns:
+            True if the artifact was loaded, False if it was already cached or
+            is not in the repository.
+        """
+        if await self.get_artifact_from_cache_use_case.is_cached(inventory_id):
+            return False
+        artifact_dto = await self.get_artifact_from_repo_use_case(inventory_id)
+        if artifact_dto is None:
+            return False
+        await self.save_artifact_to_cache_use_case(inventory_id, artifact_dto)
+        return True
+
+    async def _load(self, inventory_id: str) -> ArtifactDTO:
+        """
+        Runs the repository -> museum API part of the chain and caches the result.
+
+        Args:
+            inventory_id: The ID of the artifact to load.
+
+        Returns:
+            An ArtifactDTO representing the loaded artifact.
 
+        Raises:
+            ArtifactNotFoundError: If the artifact does not exist.
+            FailedFetchArtifactMuseumAPIException: If the museum API fails and
+                no cached copy of the artifact is left to fall back on.
+        """
         if artifact_dto := await self.get_artifact_from_repo_use_case(inventory_id):
             await self.save_artifact_to_cache_use_case(inventory_id, artifact_dto)
             return artifact_dto
 
-        artifact_dto = await self.fetch_artifact_from_museum_api_use_case(inventory_id)
+        try:
+            artifact_dto = await self.fetch_artifact_from_museum_api_use_case(
+                inventory_id
+            )
+        except ArtifactNotFoundError:
+            await self.save_artifact_to_cache_use_case.save_not_found(inventory_id)
+            raise
+        except FailedFetchArtifactMuseumAPIException:
+            fallback = await self.get_artifact_from_cache_use_case.get_last_known_good(
+                inventory_id
+            )
+            if fallback is None:
+                raise
+            logger.warning(
+                "Museum API unavailable, serving last-known-good cached artifact",
+                inventory_id=inventory_id,
+            )
+            return fallback
         await self.save_artifact_to_repo_use_case(artifact_dto)
         await self.save_artifact_to_cache_use_case(inventory_id, artifact_dto)
 
@@ -7,6 +7,7 @@ from {{cookiecutter.project_slug}}.application.dtos.artifact import ArtifactDTO
 from {{cookiecutter.project_slug}}.application.exceptions import FailedPublishArtifactInCatalogException
 from {{cookiecutter.project_slug}}.application.interfaces.http_clients import PublicCatalogAPIProtocol
 from {{cookiecutter.project_slug}}.application.interfaces.mappers import DtoEntityMapperProtocol
+from {{cookiecutter.project_slug}}.application.interfaces.use_cases import PublishArtifactProtocol
 
 if TYPE_CHECKING:
     from {{cookiecutter.project_slug}}.domain.entities.artifact import ArtifactEntity
@@ -16,7 +17,7 @@ logger = structlog.get_logger(__name__)
 
 @final
 @dataclass(frozen=True, slots=True, kw_only=True)
-class PublishArtifactToCatalogUseCase:
+class PublishArtifactToCatalogUseCase(PublishArtifactProtocol):
     """
     Use case for publishing an artifact to a public catalog.
     """
@@ -3,8 +3,14 @@ from typing import TYPE_CHECKING, final
 
 import structlog
 
+from {{cookiecutter.project_slug}}.application.cache_policy import CacheFreshnessPolicy, make_tombstone
+from {{cookiecutter.project_slug}}.application.cache_tags import artifact_cache_tags
 from {{cookiecutter.project_slug}}.application.dtos.artifact import ArtifactDTO
-from {{cookiecutter.project_slug}}.application.interfaces.cache import CacheProtocol
+from {{cookiecutter.project_slug}}.application.interfaces.cache import (
+    CacheKeyBuilderProtocol,
+    CacheProtocol,
+    CacheTagIndexProtocol,
+)
 from {{cookiecutter.project_slug}}.application.interfaces.serialization import SerializationMapperProtocol
 
 if TYPE_CHECKING:
@@ -18,10 +24,27 @@ logger = structlog.get_logger(__name__)
 class SaveArtifactToCacheUseCase:
     """
     Use case for saving an artifact to the cache.
+
+    With a freshness policy, the artifact is stored in an envelope carrying its
+    soft and hard expiry, and kept in the cache until the stale-if-error window
+    has passed.
+
+    Artifacts that do not exist are recorded as short-lived tombstones under the
+    same key, so saving the artifact later replaces the tombstone.
+
+    With a key builder, artifacts are stored under versioned keys instead of
+    their raw inventory IDs.
+
+    With a tag index, the artifact's department, era and material are recorded
+    as tags of its entry, so the entry can be invalidated by tag.
     """
 
     cache_client: CacheProtocol
     serialization_mapper: SerializationMapperProtocol
+    freshness_policy: CacheFreshnessPolicy | None = None
+    negative_ttl: int = 60
+    key_builder: CacheKeyBuilderProtocol | None = None
+    tag_index: CacheTagIndexProtocol | None = None
 
     async def __call__(self, inventory_id: str, artifact_dto: ArtifactDTO) -> None:
         """
@@ -31,7 +54,41 @@ class SaveArtifactToCacheUseCase:
             inventory_id: The ID of the artifact to save.
             artifact_dto: The ArtifactDTO to save.
         """
+        key = await self._cache_key(inventory_id)
+        artifact_data = self.serialization_mapper.to_dict(artifact_dto)
+        ttl = self.freshness_policy.storage_ttl if self.freshness_policy else None
+        if self.freshness_policy is None:
+            saved = await self.cache_client.set(key, artifact_data)
+        else:
+            saved = await self.cache_client.set(
+                key, self.freshness_policy.wrap(artifact_data), ttl=ttl
+            )
+        if saved and self.tag_index is not None:
+            await self.tag_index.add({key: artifact_cache_tags(artifact_dto)}, ttl=ttl)
+        logger.info("Artifact saved to cache", inventory_id=inventory_id)
+
+    async def save_not_found(self, inventory_id: str) -> None:
+        """
+        Records in the cache that an artifact does not exist.
+
+        Args:
+            inventory_id: The ID of the missing artifact.
+        """
+        if self.negative_ttl <= 0:
+            return
         await self.cache_client.set(
-            inventory_id, self.serialization_mapper.to_dict(artifact_dto)
+            await self._cache_key(inventory_id), make_tombstone(), ttl=self.negative_ttl
         )
-        logger.info("Artifact saved to cache", inventory_id=inventory_id)
+        logger.info(
+            "Artifact cached as nonexistent",
+            inventory_id=inventory_id,
+            ttl=self.negative_ttl,
+        )
+
+    async def _cache_key(self, inventory_id: str) -> str:
+        """
+        Returns the cache key of an artifact.
+        """
+        if self.key_builder is None:
+            return inventory_id
+        return await self.key_builder.build(inventory_id)
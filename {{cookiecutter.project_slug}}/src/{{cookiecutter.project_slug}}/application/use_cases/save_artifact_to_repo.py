@@ -6,6 +6,7 @@ import structlog
 from {{cookiecutter.project_slug}}.application.dtos.artifact import ArtifactDTO
 from {{cookiecutter.project_slug}}.application.interfaces.mappers import DtoEntityMapperProtocol
 from {{cookiecutter.project_slug}}.application.interfaces.uow import UnitOfWorkProtocol
+from {{cookiecutter.project_slug}}.application.interfaces.use_cases import SaveArtifactToRepoProtocol
 
 if TYPE_CHECKING:
     from {{cookiecutter.project_slug}}.domain.entities.artifact import ArtifactEntity
@@ -15,7 +16,7 @@ logger = structlog.get_logger(__name__)
 
 @final
 @dataclass(frozen=True, slots=True, kw_only=True)
-class SaveArtifactToRepoUseCase:
+class SaveArtifactToRepoUseCase(SaveArtifactToRepoProtocol):
     """
     Use case for saving an artifact to the repository.
     """
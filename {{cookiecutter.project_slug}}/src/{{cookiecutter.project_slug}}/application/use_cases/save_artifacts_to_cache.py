@@ -0,0 +1,85 @@
+from collections.abc import Sequence
+from dataclasses import dataclass
+from typing import final
+
+import structlog
+
+from {{cookiecutter.project_slug}}.application.cache_policy import CacheFreshnessPolicy
+from {{cookiecutter.project_slug}}.application.cache_tags import artifact_cache_tags
+from {{cookiecutter.project_slug}}.application.dtos.artifact import ArtifactDTO
+from {{cookiecutter.project_slug}}.application.interfaces.cache import (
+    CacheKeyBuilderProtocol,
+    CacheProtocol,
+    CacheTagIndexProtocol,
+)
+from {{cookiecutter.project_slug}}.application.interfaces.serialization import SerializationMapperProtocol
+
+logger = structlog.get_logger(__name__)
+
+
+@final
+@dataclass(frozen=True, slots=True, kw_only=True)
+class SaveArtifactsToCacheUseCase:
+    """
+    Use case for saving several artifacts to the cache in one round trip.
+
+    Freshness envelopes, versioned keys and tags are applied as in
+    SaveArtifactToCacheUseCase; the tags of every saved artifact are recorded
+    in a single call to the tag index.
+    """
+
+    cache_client: CacheProtocol
+    serialization_mapper: SerializationMapperProtocol
+    freshness_policy: CacheFreshnessPolicy | None = None
+    key_builder: CacheKeyBuilderProtocol | None = None
+    tag_index: CacheTagIndexProtocol | None = None
+
+    async def __call__(self, artifact_dtos: Sequence[ArtifactDTO]) -> dict[str, bool]:
+        """
+        Executes the use case to save several artifacts to the cache.
+
+        Args:
+            artifact_dtos: The ArtifactDTOs to save, keyed by their inventory ID.
+
+        Returns:
+            A mapping of inventory ID to True if the artifact was cached,
+            False if caching it failed.
+        """
+        inventory_ids: dict[str, str] = {}
+        items: dict[str, dict] = {}
+        tags: dict[str, list[str]] = {}
+        for artifact_dto in artifact_dtos:
+            inventory_id = str(artifact_dto.inventory_id)
+            key = await self._cache_key(inventory_id)
+            inventory_ids[key] = inventory_id
+            artifact_data = self.serialization_mapper.to_dict(artifact_dto)
+            if self.freshness_policy is not None:
+                artifact_data = self.freshness_policy.wrap(artifact_data)
+            items[key] = artifact_data
+            tags[key] = artifact_cache_tags(artifact_dto)
+        ttl = self.freshness_policy.storage_ttl if self.freshness_policy else None
+        saved_by_key = await self.cache_client.set_many(items, ttl=ttl)
+        results = {inventory_ids[key]: saved for key, saved in saved_by_key.items()}
+        if self.tag_index is not None:
+            await self.tag_index.add(
+                {key: tags[key] for key, saved in saved_by_key.items() if saved},
+                ttl=ttl,
+            )
+        failed = [inventory_id for inventory_id, saved in results.items() if not saved]
+        if failed:
+            logger.warning(
+                "Some artifacts could not be saved to cache",
+                saved=len(results) - len(failed),
+                failed=failed,
+            )
+        else:
+            logger.info("Artifacts saved to cache", saved=len(results))
+        return results
+
+    async def _cache_key(self, inventory_id: str) -> str:
+        """
+        Returns the cache key of an artifact.
+        """
+        if self.key_builder is None:
+            return inventory_id
+        return await self.key_builder.build(inventory_id)
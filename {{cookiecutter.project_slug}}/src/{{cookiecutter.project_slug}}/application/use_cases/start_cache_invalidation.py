@@ -0,0 +1,33 @@
+from dataclasses import dataclass
+from typing import final
+
+import structlog
+
+from {{cookiecutter.project_slug}}.application.dtos.cache import CacheInvalidationJobDTO
+from {{cookiecutter.project_slug}}.application.interfaces.cache import CacheInvalidationJobsProtocol
+
+logger = structlog.get_logger(__name__)
+
+
+@final
+@dataclass(frozen=True, slots=True, kw_only=True)
+class StartCacheInvalidationUseCase:
+    """
+    Use case for starting a background invalidation of cache keys matching a pattern.
+    """
+
+    invalidation_jobs: CacheInvalidationJobsProtocol
+
+    async def __call__(self, pattern: str) -> CacheInvalidationJobDTO:
+        """
+        Executes the use case to start a cache invalidation job.
+
+        Args:
+            pattern: Pattern to match keys (e.g., 'user:*').
+
+        Returns:
+            A CacheInvalidationJobDTO describing the started job.
+        """
+        job = self.invalidation_jobs.start(pattern)
+        logger.info("Cache invalidation requested", job_id=job.job_id, pattern=pattern)
+        return job
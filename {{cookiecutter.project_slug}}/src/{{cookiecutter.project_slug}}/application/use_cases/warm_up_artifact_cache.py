@@ -0,0 +1,104 @@
+import asyncio
+from collections.abc import Callable
+from dataclasses import dataclass, field
+import time
+from typing import final
+
+import structlog
+
+from {{cookiecutter.project_slug}}.application.interfaces.mappers import DtoEntityMapperProtocol
+from {{cookiecutter.project_slug}}.application.interfaces.uow import UnitOfWorkProtocol
+from {{cookiecutter.project_slug}}.application.use_cases.save_artifacts_to_cache import (
+    SaveArtifactsToCacheUseCase,
+)
+
+logger = structlog.get_logger(__name__)
+
+
+@final
+@dataclass(frozen=True, slots=True, kw_only=True)
+class WarmUpArtifactCacheUseCase:
+    """
+    Use case for preloading the cache with the most recently created artifacts.
+
+    Artifacts are streamed from the repository in batches and written to the
+    cache with one bulk write per batch. Writes are paced to at most
+    ``max_rate`` artifacts per second so the warm-up does not compete with
+    live traffic for the database and the cache, and progress with an ETA is
+    logged every ``progress_interval`` seconds.
+
+    Attributes:
+        uow: Unit of work giving access to the artifact repository.
+        artifact_mapper: Mapper from entities to DTOs.
+        save_artifacts_to_cache_use_case: Bulk cache writer.
+        batch_size: Number of artifacts read and cached per batch.
+        max_rate: Maximum artifacts per second (None disables pacing).
+        progress_interval: Seconds between progress log lines.
+    """
+
+    uow: UnitOfWorkProtocol
+    artifact_mapper: DtoEntityMapperProtocol
+    save_artifacts_to_cache_use_case: SaveArtifactsToCacheUseCase
+    batch_size: int = 500
+    max_rate: float | None = None
+    progress_interval: float = 5.0
+    clock: Callable[[], float] = field(default=time.monotonic, repr=False)
+
+    async def __call__(self, limit: int) -> int:
+        """
+        Executes the use case to warm up the cache.
+
+        Args:
+            limit: Maximum number of artifacts to load into the cache.
+
+        Returns:
+            Number of artifacts written to the cache.
+        """
+        started_at = self.clock()
+        last_report_at = started_at
+        read = cached = 0
+        logger.info("Cache warm-up started", limit=limit, max_rate=self.max_rate)
+        async with self.uow:
+            async for entities in self.uow.repository.stream_recent(
+                limit, self.batch_size
+            ):
+                results = await self.save_artifacts_to_cache_use_case(
+                    [self.artifact_mapper.to_dto(entity) for entity in entities]
+                )
+                read += len(entities)
+                cached += sum(results.values())
+                await self._pace(read, started_at)
+                now = self.clock()
+                if now - last_report_at >= self.progress_interval:
+                    last_report_at = now
+                    self._report_progress(read, limit, now - started_at)
+        logger.info(
+            "Cache warm-up completed",
+            read=read,
+            cached=cached,
+            elapsed=round(self.clock() - started_at, 1),
+        )
+        return cached
+
+    async def _pace(self, read: int, started_at: float) -> None:
+        """
+        Sleeps long enough to keep the average rate at or below ``max_rate``.
+        """
+        if not self.max_rate:
+            return
+        ahead_by = read / self.max_rate - (self.clock() - started_at)
+        if ahead_by > 0:
+            await asyncio.sleep(ahead_by)
+
+    def _report_progress(self, read: int, limit: int, elapsed: float) -> None:
+        """
+        Logs the warm-up progress and the estimated time to reach ``limit``.
+        """
+        rate = read / elapsed if elapsed > 0 else 0.0
+        logger.info(
+            "Cache warm-up progress",
+            read=read,
+            limit=limit,
+            rate=round(rate, 1),
+            eta=round((limit - read) / rate, 1) if rate else None,
+        )
@@ -14,12 +14,15 @@ class AppSettings(BaseSettings):
         environment (Literal["local", "dev", "development", "prod"]): Application environment.
         log_level (Literal["DEBUG", "INFO", "WARNING", "ERROR"]): Logging level.
         debug (bool): Debug mode flag.
+        admin_api_token (str | None): Bearer token required by the /v1/admin
+            endpoints, which are disabled while it is unset.
     """
 
     app_name: str = "Antiquarium Service"
     environment: Literal["local", "dev", "development", "prod"] = "local"
     log_level: Literal["DEBUG", "INFO", "WARNING", "ERROR"] = "INFO"
     debug: bool = Field(False, alias="DEBUG")
+    admin_api_token: str | None = Field(None, alias="ADMIN_API_TOKEN")
 
     class Config:
         env_file = ".env"
@@ -0,0 +1,131 @@
+from typing import Literal, final
+
+from pydantic import Field
+from pydantic_settings import BaseSettings
+
+
+@final
+class CacheSettings(BaseSettings):
+    """
+    Backend-independent cache behaviour settings.
+
+    The hard TTL of cached artifacts is the cache backend TTL
+    (``REDIS_CACHE_TTL`` or ``TARANTOOL_CACHE_TTL``).
+
+    Attributes:
+        cache_backend (Literal["redis", "tarantool", "shared_memory"]): Store
+            backing CacheProtocol.
+        cache_soft_ttl (int): Seconds after which cached artifacts are served
+            stale and refreshed in the background.
+        cache_stale_if_error_ttl (int): Seconds past the hard TTL during which
+            the last-known-good copy is served if the museum API fails (0, the
+            default, keeps entries no longer than the hard TTL).
+        cache_xfetch_beta (float): Aggressiveness of probabilistic early
+            refreshes (0, the default, disables them).
+        cache_xfetch_delta (float): Expected time in seconds to reload an artifact.
+        cache_refresh_concurrency (int): Maximum number of concurrent
+            background refreshes per worker.
+        cache_negative_ttl (int): Seconds an artifact reported missing by the
+            museum API is remembered as nonexistent (0 disables negative caching).
+        cache_warmup_on_startup (bool): Warms up the cache in the background when
+            the application starts.
+        cache_warmup_limit (int): Number of most recent artifacts loaded by a warm-up.
+        cache_warmup_batch_size (int): Artifacts read and cached per warm-up batch.
+        cache_warmup_max_rate (float): Maximum artifacts per second loaded by a
+            warm-up (0 disables rate limiting).
+        cache_hot_keys_enabled (bool): Promotes only hot keys into the in-process
+            L1 cache, which is added for them if the near cache is disabled.
+        cache_hot_key_threshold (int): Recent reads from which a key is hot (max 255).
+        cache_hot_key_pin_ttl (float): Seconds a hot key is served from the L1
+            cache added for hot keys.
+        cache_hot_key_max_pinned (int): Size of the L1 cache added for hot keys.
+        cache_hot_key_top_k (int): Number of hottest keys tracked for introspection.
+        cache_lease_enabled (bool): Coalesces artifact loads across workers and
+            pods through leases stored in Redis.
+        cache_lease_ttl (float): Seconds a lease is held at most; should exceed
+            the time to load an artifact from the museum API.
+        cache_lease_poll_interval (float): Seconds between two checks of a lease
+            held elsewhere.
+        cache_breaker_enabled (bool): Bypasses the cache while it is slow or failing.
+        cache_breaker_call_timeout (float): Seconds after which a cache call is
+            abandoned as failed.
+        cache_breaker_slow_call_threshold (float): Seconds from which a cache call
+            counts as slow.
+        cache_breaker_failure_rate (float): Share of failed calls opening the breaker.
+        cache_breaker_slow_call_rate (float): Share of slow calls opening the breaker.
+        cache_breaker_window_size (int): Number of recent calls the rates are
+            computed over.
+        cache_breaker_min_calls (int): Calls needed before the breaker may open.
+        cache_breaker_open_duration (float): Seconds the cache is bypassed before
+            it is probed again.
+        cache_breaker_probe_calls (int): Successful probes needed to use the
+            cache again.
+        cache_tags_enabled (bool): Records the department, era and material tags
+            of cached artifacts so they can be invalidated by tag.
+        cache_tag_batch_size (int): Tagged entries deleted per batch when a tag
+            is invalidated.
+        cache_prefetch_enabled (bool): Prefetches the artifacts clients are
+            likely to request next, learned from their browsing sequences.
+        cache_prefetch_top_k (int): Artifacts prefetched after each request.
+        cache_prefetch_min_confidence (float): Minimum share of the transitions
+            out of an artifact a successor must account for to be prefetched.
+        cache_prefetch_budget (float): Prefetches started per second at most.
+        cache_prefetch_concurrency (int): Prefetches running at the same time
+            at most.
+        cache_prefetch_max_sources (int): Artifacts whose successors are tracked.
+        cache_prefetch_hit_window (float): Seconds a prefetched artifact may wait
+            for its request to count as a hit.
+    """
+
+    cache_backend: Literal["redis", "tarantool", "shared_memory"] = Field(
+        "redis", alias="CACHE_BACKEND"
+    )
+    cache_soft_ttl: int = Field(3000, alias="CACHE_SOFT_TTL")
+    cache_stale_if_error_ttl: int = Field(0, alias="CACHE_STALE_IF_ERROR_TTL")
+    cache_xfetch_beta: float = Field(0.0, alias="CACHE_XFETCH_BETA")
+    cache_xfetch_delta: float = Field(1.0, alias="CACHE_XFETCH_DELTA")
+    cache_refresh_concurrency: int = Field(16, alias="CACHE_REFRESH_CONCURRENCY")
+    cache_negative_ttl: int = Field(60, alias="CACHE_NEGATIVE_TTL")
+    cache_warmup_on_startup: bool = Field(False, alias="CACHE_WARMUP_ON_STARTUP")
+    cache_warmup_limit: int = Field(10_000, alias="CACHE_WARMUP_LIMIT")
+    cache_warmup_batch_size: int = Field(500, alias="CACHE_WARMUP_BATCH_SIZE")
+    cache_warmup_max_rate: float = Field(2000.0, alias="CACHE_WARMUP_MAX_RATE")
+    cache_hot_keys_enabled: bool = Field(False, alias="CACHE_HOT_KEYS_ENABLED")
+    cache_hot_key_threshold: int = Field(64, alias="CACHE_HOT_KEY_THRESHOLD")
+    cache_hot_key_pin_ttl: float = Field(5.0, alias="CACHE_HOT_KEY_PIN_TTL")
+    cache_hot_key_max_pinned: int = Field(256, alias="CACHE_HOT_KEY_MAX_PINNED")
+    cache_hot_key_top_k: int = Field(32, alias="CACHE_HOT_KEY_TOP_K")
+    cache_lease_enabled: bool = Field(False, alias="CACHE_LEASE_ENABLED")
+    cache_lease_ttl: float = Field(5.0, alias="CACHE_LEASE_TTL")
+    cache_lease_poll_interval: float = Field(0.05, alias="CACHE_LEASE_POLL_INTERVAL")
+    cache_breaker_enabled: bool = Field(False, alias="CACHE_BREAKER_ENABLED")
+    cache_breaker_call_timeout: float = Field(0.5, alias="CACHE_BREAKER_CALL_TIMEOUT")
+    cache_breaker_slow_call_threshold: float = Field(
+        0.1, alias="CACHE_BREAKER_SLOW_CALL_THRESHOLD"
+    )
+    cache_breaker_failure_rate: float = Field(0.5, alias="CACHE_BREAKER_FAILURE_RATE")
+    cache_breaker_slow_call_rate: float = Field(
+        0.8, alias="CACHE_BREAKER_SLOW_CALL_RATE"
+    )
+    cache_breaker_window_size: int = Field(100, alias="CACHE_BREAKER_WINDOW_SIZE")
+    cache_breaker_min_calls: int = Field(20, alias="CACHE_BREAKER_MIN_CALLS")
+    cache_breaker_open_duration: float = Field(
+        10.0, alias="CACHE_BREAKER_OPEN_DURATION"
+    )
+    cache_breaker_probe_calls: int = Field(3, alias="CACHE_BREAKER_PROBE_CALLS")
+    cache_tags_enabled: bool = Field(False, alias="CACHE_TAGS_ENABLED")
+    cache_tag_batch_size: int = Field(500, alias="CACHE_TAG_BATCH_SIZE")
+    cache_prefetch_enabled: bool = Field(False, alias="CACHE_PREFETCH_ENABLED")
+    cache_prefetch_top_k: int = Field(3, alias="CACHE_PREFETCH_TOP_K")
+    cache_prefetch_min_confidence: float = Field(
+        0.2, alias="CACHE_PREFETCH_MIN_CONFIDENCE"
+    )
+    cache_prefetch_budget: float = Field(20.0, alias="CACHE_PREFETCH_BUDGET")
+    cache_prefetch_concurrency: int = Field(4, alias="CACHE_PREFETCH_CONCURRENCY")
+    cache_prefetch_max_sources: int = Field(10_000, alias="CACHE_PREFETCH_MAX_SOURCES")
+    cache_prefetch_hit_window: float = Field(300.0, alias="CACHE_PREFETCH_HIT_WINDOW")
+
+    class Config:
+        env_file = ".env"
+        env_file_encoding = "utf-8"
+        extra = "ignore"
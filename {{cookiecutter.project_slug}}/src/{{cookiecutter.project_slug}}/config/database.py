@@ -1,4 +1,4 @@
-from typing import cast, final
+from typing import Literal, cast, final
 
 from pydantic import Field, PostgresDsn, computed_field
 from pydantic_settings import BaseSettings
@@ -15,6 +15,18 @@ class DatabaseSettings(BaseSettings):
         postgres_server (str): PostgreSQL server host.
         postgres_port (int): PostgreSQL server port.
         postgres_db (str): PostgreSQL database name.
+        postgres_replica_urls (str): Comma-separated URLs of read replicas
+            (empty to read from the primary only).
+        postgres_read_your_writes_window (float): Seconds reads of a just
+            written artifact keep going to the primary.
+        postgres_replica_health_check_interval (float): Seconds between replica
+            health checks.
+        postgres_replica_health_check_timeout (float): Seconds a replica has to
+            answer a health check.
+        postgres_read_path (Literal["orm", "core", "asyncpg"]): How repository
+            lookups read artifacts: ORM models mapped through Domain entities,
+            or lean column-level reads mapped straight to DTOs, as SQLAlchemy
+            Core statements or as raw asyncpg statements.
     """
 
     postgres_user: str = Field(..., alias="POSTGRES_USER")
@@ -22,6 +34,19 @@ class DatabaseSettings(BaseSettings):
     postgres_server: str = Field(..., alias="POSTGRES_SERVER")
     postgres_port: int = Field(5432, alias="POSTGRES_PORT")
     postgres_db: str = Field(..., alias="POSTGRES_DB")
+    postgres_replica_urls: str = Field("", alias="POSTGRES_REPLICA_URLS")
+    postgres_read_your_writes_window: float = Field(
+        2.0, alias="POSTGRES_READ_YOUR_WRITES_WINDOW"
+    )
+    postgres_replica_health_check_interval: float = Field(
+        5.0, alias="POSTGRES_REPLICA_HEALTH_CHECK_INTERVAL"
+    )
+    postgres_replica_health_check_timeout: float = Field(
+        1.0, alias="POSTGRES_REPLICA_HEALTH_CHECK_TIMEOUT"
+    )
+    postgres_read_path: Literal["orm", "core", "asyncpg"] = Field(
+        "orm", alias="POSTGRES_READ_PATH"
+    )
 
     @computed_field
     def database_url(self) -> PostgresDsn:
@@ -50,6 +75,17 @@ class DatabaseSettings(BaseSettings):
         """
         return cast("PostgresDsn", self.database_url)
 
+    @property
+    def replica_urls(self) -> list[str]:
+        """
+        Returns the URLs of the read replicas.
+
+        Returns:
+            list[str]: The replica URLs, empty if none are configured.
+        """
+        urls = (url.strip() for url in self.postgres_replica_urls.split(","))
+        return [url for url in urls if url]
+
     class Config:
         env_file = ".env"
         env_file_encoding = "utf-8"
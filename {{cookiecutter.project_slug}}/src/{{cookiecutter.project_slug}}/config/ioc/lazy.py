@@ -0,0 +1,34 @@
+from collections.abc import Callable, Coroutine
+from typing import ParamSpec, TypeVar
+
+from dishka import AsyncContainer
+
+P = ParamSpec("P")
+R = TypeVar("R")
+
+
+def resolve_on_call(  # noqa: UP047 - the pinned mypy 1.5 cannot parse PEP 695 syntax
+    container: AsyncContainer, dependency: type[Callable[P, Coroutine[object, None, R]]]
+) -> Callable[P, Coroutine[object, None, R]]:
+    """
+    Returns a stand-in for an async callable dependency, resolved on first call.
+
+    Nothing of ``dependency`` (nor of what it depends on, e.g. a database
+    session) is built until the stand-in is awaited; the container then
+    resolves it once for its scope and every later call reuses that instance.
+    The stand-in has the signature of ``dependency``, so it satisfies the
+    protocols the dependency implements.
+
+    Args:
+        container: Container of the scope the dependency belongs to.
+        dependency: Type of the dependency, a coroutine function such as a use case.
+
+    Returns:
+        An async callable forwarding its arguments to the resolved dependency.
+    """
+
+    async def call(*args: P.args, **kwargs: P.kwargs) -> R:
+        resolved = await container.get(dependency)
+        return await resolved(*args, **kwargs)
+
+    return call
@@ -1,35 +1,74 @@
 from collections.abc import AsyncIterator
+from typing import cast
 
-from dishka import Provider, Scope, provide
+from dishka import AsyncContainer, Provider, Scope, provide
 from faststream.kafka import KafkaBroker
 from httpx import AsyncClient
-import redis.asyncio as redis
 from sqlalchemy.ext.asyncio import (
     AsyncSession,
     async_sessionmaker,
 )
 
-from {{cookiecutter.project_slug}}.application.interfaces.cache import CacheProtocol
+from {{cookiecutter.project_slug}}.application.cache_policy import CacheFreshnessPolicy
+from {{cookiecutter.project_slug}}.application.interfaces.cache import (
+    CacheHealthProtocol,
+    CacheInvalidationJobsProtocol,
+    CacheKeyBuilderProtocol,
+    CachePrefetcherProtocol,
+    CacheProtocol,
+    CacheRefresherProtocol,
+    CacheTagIndexProtocol,
+    HotKeyTrackerProtocol,
+)
+from {{cookiecutter.project_slug}}.application.interfaces.database import DatabaseMetricsProtocol
 from {{cookiecutter.project_slug}}.application.interfaces.http_clients import (
     ExternalMuseumAPIProtocol,
     PublicCatalogAPIProtocol,
 )
+from {{cookiecutter.project_slug}}.application.interfaces.lease import LeaseProtocol
 from {{cookiecutter.project_slug}}.application.interfaces.mappers import DtoEntityMapperProtocol
 from {{cookiecutter.project_slug}}.application.interfaces.message_broker import MessageBrokerPublisherProtocol
 from {{cookiecutter.project_slug}}.application.interfaces.repositories import ArtifactRepositoryProtocol
 from {{cookiecutter.project_slug}}.application.interfaces.serialization import SerializationMapperProtocol
+from {{cookiecutter.project_slug}}.application.interfaces.single_flight import SingleFlightProtocol
 from {{cookiecutter.project_slug}}.application.interfaces.uow import UnitOfWorkProtocol
 from {{cookiecutter.project_slug}}.application.mappers import ArtifactMapper
+from {{cookiecutter.project_slug}}.application.use_cases.bump_cache_generation import (
+    BumpCacheGenerationUseCase,
+)
 from {{cookiecutter.project_slug}}.application.use_cases.fetch_artifact_from_museum_api import (
     FetchArtifactFromMuseumAPIUseCase,
 )
-from {{cookiecutter.project_slug}}.application.use_cases.process_artifact import ProcessArtifactUseCase
 from {{cookiecutter.project_slug}}.application.use_cases.get_artifact_from_cache import (
     GetArtifactFromCacheUseCase,
 )
 from {{cookiecutter.project_slug}}.application.use_cases.get_artifact_from_repo import (
     GetArtifactFromRepoUseCase,
 )
+from {{cookiecutter.project_slug}}.application.use_cases.get_artifacts_from_cache import (
+    GetArtifactsFromCacheUseCase,
+)
+from {{cookiecutter.project_slug}}.application.use_cases.get_artifacts_from_repo import (
+    GetArtifactsFromRepoUseCase,
+)
+from {{cookiecutter.project_slug}}.application.use_cases.get_cache_health import GetCacheHealthUseCase
+from {{cookiecutter.project_slug}}.application.use_cases.get_cache_invalidation_job import (
+    GetCacheInvalidationJobUseCase,
+)
+from {{cookiecutter.project_slug}}.application.use_cases.get_cache_prefetch_stats import (
+    GetCachePrefetchStatsUseCase,
+)
+from {{cookiecutter.project_slug}}.application.use_cases.get_database_pool_stats import (
+    GetDatabasePoolStatsUseCase,
+)
+from {{cookiecutter.project_slug}}.application.use_cases.get_hot_cache_keys import GetHotCacheKeysUseCase
+from {{cookiecutter.project_slug}}.application.use_cases.get_single_flight_stats import (
+    GetSingleFlightStatsUseCase,
+)
+from {{cookiecutter.project_slug}}.application.use_cases.invalidate_cache_tags import (
+    InvalidateCacheTagsUseCase,
+)
+from {{cookiecutter.project_slug}}.application.use_cases.process_artifact import ProcessArtifactUseCase
 from {{cookiecutter.project_slug}}.application.use_cases.publish_artifact_to_broker import (
     PublishArtifactToBrokerUseCase,
 )
@@ -42,11 +81,55 @@ from {{cookiecutter.project_slug}}.application.use_cases.save_artifact_to_cache
 from {{cookiecutter.project_slug}}.application.use_cases.save_artifact_to_repo import (
     SaveArtifactToRepoUseCase,
 )
+from {{cookiecutter.project_slug}}.application.use_cases.save_artifacts_to_cache import (
+    SaveArtifactsToCacheUseCase,
+)
+from {{cookiecutter.project_slug}}.application.use_cases.start_cache_invalidation import (
+    StartCacheInvalidationUseCase,
+)
+from {{cookiecutter.project_slug}}.application.use_cases.warm_up_artifact_cache import (
+    WarmUpArtifactCacheUseCase,
+)
 from {{cookiecutter.project_slug}}.config.base import Settings
+from {{cookiecutter.project_slug}}.config.ioc.lazy import resolve_on_call
 from {{cookiecutter.project_slug}}.infrastructures.broker.publisher import KafkaPublisher
-from {{cookiecutter.project_slug}}.infrastructures.cache.redis_client import RedisCacheClient
+from {{cookiecutter.project_slug}}.infrastructures.cache.circuit_breaker import (
+    CacheCircuitBreaker,
+    CircuitBreakerCacheClient,
+)
+from {{cookiecutter.project_slug}}.infrastructures.cache.codec import CachePayloadSerializer, get_codec
+from {{cookiecutter.project_slug}}.infrastructures.cache.compression import get_compressor
+from {{cookiecutter.project_slug}}.infrastructures.cache.hash_layout import HashBucketLayout
+from {{cookiecutter.project_slug}}.infrastructures.cache.invalidation_jobs import AsyncioCacheInvalidationJobs
+from {{cookiecutter.project_slug}}.infrastructures.cache.keys import VersionedKeyBuilder
+from {{cookiecutter.project_slug}}.infrastructures.cache.near_cache import (
+    HotKeyTracker,
+    NearCacheClient,
+    TinyLFUCache,
+)
+from {{cookiecutter.project_slug}}.infrastructures.cache.read_expiration import ReadExpirationPolicy
+from {{cookiecutter.project_slug}}.infrastructures.cache.redis_client import RedisCacheClient, RedisClient
+from {{cookiecutter.project_slug}}.infrastructures.cache.shared_memory import (
+    SharedMemoryCacheClient,
+    SharedMemoryCounters,
+)
+from {{cookiecutter.project_slug}}.infrastructures.cache.tags import NoOpCacheTagIndex, RedisCacheTagIndex
+from {{cookiecutter.project_slug}}.infrastructures.cache.tarantool_client import (
+    TarantoolCacheClient,
+    TarantoolCounters,
+)
+from {{cookiecutter.project_slug}}.infrastructures.concurrency.background_refresher import (
+    AsyncioBackgroundRefresher,
+)
+from {{cookiecutter.project_slug}}.infrastructures.concurrency.prefetcher import (
+    AsyncioCoAccessPrefetcher,
+    CoAccessModel,
+)
+from {{cookiecutter.project_slug}}.infrastructures.concurrency.redis_lease import RedisLease
+from {{cookiecutter.project_slug}}.infrastructures.concurrency.single_flight import AsyncioSingleFlight
 from {{cookiecutter.project_slug}}.infrastructures.db.mappers.artifact_db_mapper import ArtifactDBMapper
 from {{cookiecutter.project_slug}}.infrastructures.db.repositories.artifact import ArtifactRepositorySQLAlchemy
+from {{cookiecutter.project_slug}}.infrastructures.db.routing import DatabaseRouter
 from {{cookiecutter.project_slug}}.infrastructures.db.session import create_engine, get_session_factory
 from {{cookiecutter.project_slug}}.infrastructures.db.uow import UnitOfWorkSQLAlchemy
 from {{cookiecutter.project_slug}}.infrastructures.http.clients import (
@@ -55,6 +138,12 @@ from {{cookiecutter.project_slug}}.infrastructures.http.clients import (
 )
 from {{cookiecutter.project_slug}}.infrastructures.mappers.artifact import InfrastructureArtifactMapper
 from {{cookiecutter.project_slug}}.presentation.api.rest.v1.mappers.artifact_mapper import ArtifactPresentationMapper
+from {{cookiecutter.project_slug}}.presentation.api.rest.v1.mappers.cache_admin_mapper import (
+    CacheAdminPresentationMapper,
+)
+from {{cookiecutter.project_slug}}.presentation.api.rest.v1.mappers.database_admin_mapper import (
+    DatabaseAdminPresentationMapper,
+)
 
 
 class SettingsProvider(Provider):
@@ -76,18 +165,46 @@ class DatabaseProvider(Provider):
     """
 
     @provide(scope=Scope.APP)
-    async def get_session_factory(
+    async def get_database_router(
         self, settings: Settings
-    ) -> AsyncIterator[async_sessionmaker[AsyncSession]]:
+    ) -> AsyncIterator[DatabaseRouter]:
         """
-        Provides an asynchronous session factory for SQLAlchemy.
+        Provides the per-worker router owning the primary and replica engines.
+
+        Without POSTGRES_REPLICA_URLS every read goes to the primary.
         """
-        engine = create_engine(str(settings.database_url), is_echo=settings.debug)
-        session_factory = get_session_factory(engine)
+        database = settings.database
+        router = DatabaseRouter(
+            primary=create_engine(str(settings.database_url), is_echo=settings.debug),
+            replicas=[
+                create_engine(url, is_echo=settings.debug)
+                for url in database.replica_urls
+            ],
+            read_your_writes_window=database.postgres_read_your_writes_window,
+            health_check_interval=database.postgres_replica_health_check_interval,
+            health_check_timeout=database.postgres_replica_health_check_timeout,
+        )
+        await router.start()
         try:
-            yield session_factory
+            yield router
         finally:
-            await engine.dispose()
+            await router.close()
+
+    @provide(scope=Scope.APP)
+    def get_database_metrics(self, router: DatabaseRouter) -> DatabaseMetricsProtocol:
+        """
+        Provides the pool counters of the primary and replicas.
+        """
+        return router
+
+    @provide(scope=Scope.APP)
+    def get_session_factory(
+        self, router: DatabaseRouter
+    ) -> async_sessionmaker[AsyncSession]:
+        """
+        Provides an asynchronous session factory for SQLAlchemy, bound to the primary.
+        """
+        return get_session_factory(router.primary)
 
     @provide(scope=Scope.REQUEST)
     async def get_session(
@@ -141,12 +258,23 @@ class RepositoryProvider(Provider):
 
     @provide(scope=Scope.REQUEST)
     def get_artifact_repository(
-        self, session: AsyncSession, db_mapper: ArtifactDBMapper
+        self,
+        session: AsyncSession,
+        db_mapper: ArtifactDBMapper,
+        router: DatabaseRouter,
+        settings: Settings,
     ) -> ArtifactRepositoryProtocol:
         """
         Provides an ArtifactRepositoryProtocol implementation.
+
+        Reads are routed through the router only when replicas are configured.
         """
-        return ArtifactRepositorySQLAlchemy(session=session, mapper=db_mapper)
+        return ArtifactRepositorySQLAlchemy(
+            session=session,
+            mapper=db_mapper,
+            router=router if router.replicas else None,
+            driver_statements=settings.database.postgres_read_path == "asyncpg",
+        )
 
 
 class UnitOfWorkProvider(Provider):
@@ -171,7 +299,7 @@ class ServiceProvider(Provider):
     Provides service clients for external integrations.
     """
 
-    @provide(scope=Scope.REQUEST)
+    @provide(scope=Scope.APP)
     def get_external_museum_api_client(
         self,
         client: AsyncClient,
@@ -187,7 +315,7 @@ class ServiceProvider(Provider):
             mapper=infrastructure_mapper,
         )
 
-    @provide(scope=Scope.REQUEST)
+    @provide(scope=Scope.APP)
     def get_public_catalog_api_client(
         self,
         client: AsyncClient,
@@ -203,7 +331,7 @@ class ServiceProvider(Provider):
             mapper=infrastructure_mapper,
         )
 
-    @provide(scope=Scope.REQUEST)
+    @provide(scope=Scope.APP)
     def get_message_broker(
         self,
         broker: KafkaBroker,
@@ -230,57 +358,520 @@ class MapperProvider(Provider):
         """
         return ArtifactMapper()
 
-    @provide(scope=Scope.REQUEST)
+    @provide(scope=Scope.APP)
     def get_db_mapper(self) -> ArtifactDBMapper:
         """
         Provides the Database mapper (Domain Entity <-> SQLAlchemy Model).
         """
         return ArtifactDBMapper()
 
-    @provide(scope=Scope.REQUEST)
+    @provide(scope=Scope.APP)
     def get_infrastructure_artifact_mapper(self) -> SerializationMapperProtocol:
         """
         Provides the Infrastructure mapper (Application DTO <-> Pydantic/JSON).
         """
         return InfrastructureArtifactMapper()
 
-    @provide(scope=Scope.REQUEST)
+    @provide(scope=Scope.APP)
     def get_presentation_artifact_mapper(self) -> ArtifactPresentationMapper:
         """
         Provides the Presentation mapper (Application DTO -> Response Schema).
         """
         return ArtifactPresentationMapper()
 
+    @provide(scope=Scope.APP)
+    def get_cache_admin_presentation_mapper(self) -> CacheAdminPresentationMapper:
+        """
+        Provides the Presentation mapper for cache administration responses.
+        """
+        return CacheAdminPresentationMapper()
+
+    @provide(scope=Scope.APP)
+    def get_database_admin_presentation_mapper(self) -> DatabaseAdminPresentationMapper:
+        """
+        Provides the Presentation mapper for database administration responses.
+        """
+        return DatabaseAdminPresentationMapper()
+
 
 class CacheProvider(Provider):
     """
-    Provides caching services using Redis.
+    Provides caching services for the backend selected by CACHE_BACKEND.
+
+    The backend is Redis, Tarantool or a shared-memory table.
     """
 
     @provide(scope=Scope.APP)
-    async def get_cache_service(
+    async def get_redis_client(
+        self, settings: Settings
+    ) -> AsyncIterator[RedisClient | None]:
+        """
+        Provides the shared Redis client of the worker.
+
+        With REDIS_CLUSTER_ENABLED the client is cluster-aware: REDIS_URL is
+        only a startup node and the remaining shards are discovered from it.
+        Yields None unless CACHE_BACKEND selects Redis (or KeyDB, Dragonfly),
+        so projects using another backend do not need redis-py installed.
+        """
+        if settings.cache.cache_backend != "redis":
+            yield None
+            return
+        import redis.asyncio as redis
+
+        redis_client: RedisClient
+        if settings.redis.redis_cluster_enabled:
+            # types-redis does not stub the commands of the cluster client.
+            redis_client = cast(
+                "RedisClient",
+                redis.RedisCluster.from_url(
+                    str(settings.redis_url),
+                    decode_responses=False,
+                    health_check_interval=30,
+                    max_connections=settings.redis.redis_max_connections,
+                    socket_connect_timeout=5,
+                    socket_timeout=5,
+                ),
+            )
+        else:
+            redis_client = await redis.from_url(
+                str(settings.redis_url),
+                decode_responses=False,
+                health_check_interval=30,
+                max_connections=settings.redis.redis_max_connections,
+                retry_on_timeout=True,
+                socket_connect_timeout=5,
+                socket_timeout=5,
+            )
+        try:
+            yield redis_client
+        finally:
+            await redis_client.close()
+
+    @provide(scope=Scope.APP)
+    async def get_tarantool_client(
         self, settings: Settings
+    ) -> AsyncIterator[TarantoolCacheClient | None]:
+        """
+        Provides the shared Tarantool cache client of the worker.
+
+        Yields None unless CACHE_BACKEND selects Tarantool, so projects using
+        Redis do not need asynctnt installed.
+        """
+        if settings.cache.cache_backend != "tarantool":
+            yield None
+            return
+        tarantool_client = TarantoolCacheClient.create(
+            host=settings.tarantool.tarantool_host,
+            port=settings.tarantool.tarantool_port,
+            username=settings.tarantool.tarantool_user,
+            password=settings.tarantool.tarantool_password,
+            request_timeout=settings.tarantool.tarantool_request_timeout,
+            ttl=settings.tarantool.tarantool_cache_ttl,
+            clear_batch_size=settings.tarantool.tarantool_clear_batch_size,
+        )
+        try:
+            yield tarantool_client
+        finally:
+            await tarantool_client.close()
+
+    @provide(scope=Scope.APP)
+    async def get_shared_memory_client(
+        self, settings: Settings
+    ) -> AsyncIterator[SharedMemoryCacheClient | None]:
+        """
+        Provides the shared-memory cache client of the worker.
+
+        Yields None unless CACHE_BACKEND selects the shared-memory table. Every
+        worker of the host maps the same file, so they share one cache.
+
+        Raises:
+            ValueError: If SHM_CACHE_PATH is not set.
+        """
+        if settings.cache.cache_backend != "shared_memory":
+            yield None
+            return
+        if settings.shared_memory.shm_cache_path is None:
+            raise ValueError(
+                "SHM_CACHE_PATH must be set when CACHE_BACKEND=shared_memory"
+            )
+        shared_memory_client = SharedMemoryCacheClient(
+            path=settings.shared_memory.shm_cache_path,
+            slot_count=settings.shared_memory.shm_cache_slots,
+            slot_size=settings.shared_memory.shm_cache_slot_size,
+            probe_length=settings.shared_memory.shm_cache_probe_length,
+            ttl=settings.shared_memory.shm_cache_ttl,
+            clear_batch_size=settings.shared_memory.shm_clear_batch_size,
+        )
+        try:
+            yield shared_memory_client
+        finally:
+            await shared_memory_client.close()
+
+    @staticmethod
+    def _get_cache_serializer(settings: Settings) -> CachePayloadSerializer:
+        """
+        Builds the cache payload serializer from the codec and compression settings.
+        """
+        compressor = None
+        if settings.redis.redis_cache_compression != "none":
+            dictionary_path = settings.redis.redis_cache_compression_dictionary
+            compressor = get_compressor(
+                settings.redis.redis_cache_compression,
+                dictionary_path.read_bytes() if dictionary_path else None,
+            )
+        return CachePayloadSerializer(
+            codec=get_codec(settings.redis.redis_cache_codec),
+            compressor=compressor,
+            compression_threshold=settings.redis.redis_cache_compression_threshold,
+        )
+
+    @provide(scope=Scope.APP)
+    async def get_cache_service(
+        self,
+        settings: Settings,
+        redis_client: RedisClient | None,
+        tarantool_client: TarantoolCacheClient | None,
+        shared_memory_client: SharedMemoryCacheClient | None,
+        circuit_breaker: CacheCircuitBreaker,
+        near_cache_store: TinyLFUCache | None,
+        hot_key_tracker: HotKeyTracker,
+        freshness_policy: CacheFreshnessPolicy,
     ) -> AsyncIterator[CacheProtocol]:
         """
         Provides a CacheProtocol implementation.
+
+        The Tarantool and shared-memory clients are owned by their own
+        providers; the near cache relies on Redis pub/sub and is only
+        available with the Redis backend.
+        """
+        backend_client = (
+            tarantool_client if tarantool_client is not None else shared_memory_client
+        )
+        if backend_client is not None:
+            yield self._decorate(settings, backend_client, circuit_breaker)
+            return
+        if redis_client is None:
+            raise RuntimeError(
+                f"No cache client for CACHE_BACKEND={settings.cache.cache_backend}"
+            )
+        redis_cache = RedisCacheClient(
+            client=redis_client,
+            ttl=settings.redis_cache_ttl,
+            scan_count=settings.redis.redis_scan_count,
+            unlink_batch_size=settings.redis.redis_unlink_batch_size,
+            serializer=self._get_cache_serializer(settings),
+            read_expiration=ReadExpirationPolicy(
+                mode=settings.redis.redis_cache_ttl_mode,
+                ttl=settings.redis.redis_cache_read_ttl,
+                min_ttl=settings.redis.redis_cache_min_read_ttl,
+                max_ttl=settings.redis.redis_cache_max_read_ttl,
+                hot_reads=settings.redis.redis_cache_hot_reads,
+            ),
+            freshness_policy=freshness_policy,
+            hash_layout=(
+                HashBucketLayout(
+                    prefix_length=settings.redis.redis_cache_hash_bucket_prefix_length
+                )
+                if settings.redis.redis_cache_layout == "hash"
+                else None
+            ),
+        )
+        await redis_cache.check_hash_layout()
+        if near_cache_store is None:
+            yield self._decorate(settings, redis_cache, circuit_breaker)
+            return
+        import redis.asyncio as redis
+
+        # The breaker guards the Redis calls of the near cache, not its L1 hits.
+        near_cache = NearCacheClient(
+            remote=redis_cache,
+            local=near_cache_store,
+            channel=settings.redis.redis_near_cache_channel,
+            # Cluster clients cannot subscribe; listen on the startup node instead.
+            pubsub_client=(
+                redis.from_url(str(settings.redis_url), decode_responses=False)
+                if settings.redis.redis_cluster_enabled
+                else None
+            ),
+            hot_keys=hot_key_tracker,
+            breaker=self._get_breaker(settings, circuit_breaker),
+        )
+        await near_cache.start()
+        try:
+            yield near_cache
+        finally:
+            # The Redis client itself is closed by get_redis_client.
+            await near_cache.close()
+
+    @staticmethod
+    def _decorate(
+        settings: Settings,
+        cache_service: CacheProtocol,
+        breaker: CacheCircuitBreaker,
+    ) -> CacheProtocol:
+        """
+        Puts the circuit breaker (CACHE_BREAKER_ENABLED) in front of the cache.
+        """
+        if settings.cache.cache_breaker_enabled:
+            cache_service = CircuitBreakerCacheClient(
+                remote=cache_service, breaker=breaker
+            )
+        return cache_service
+
+    @staticmethod
+    def _get_breaker(
+        settings: Settings, breaker: CacheCircuitBreaker
+    ) -> CacheCircuitBreaker | None:
+        """
+        Returns the circuit breaker if CACHE_BREAKER_ENABLED is set, else None.
+        """
+        return breaker if settings.cache.cache_breaker_enabled else None
+
+    @provide(scope=Scope.APP)
+    def get_circuit_breaker(self, settings: Settings) -> CacheCircuitBreaker:
+        """
+        Provides the per-worker cache circuit breaker.
+        """
+        return CacheCircuitBreaker(
+            call_timeout=settings.cache.cache_breaker_call_timeout,
+            slow_call_threshold=settings.cache.cache_breaker_slow_call_threshold,
+            failure_rate_threshold=settings.cache.cache_breaker_failure_rate,
+            slow_call_rate_threshold=settings.cache.cache_breaker_slow_call_rate,
+            window_size=settings.cache.cache_breaker_window_size,
+            min_calls=settings.cache.cache_breaker_min_calls,
+            open_duration=settings.cache.cache_breaker_open_duration,
+            probe_calls=settings.cache.cache_breaker_probe_calls,
+        )
+
+    @provide(scope=Scope.APP)
+    def get_cache_health(
+        self, circuit_breaker: CacheCircuitBreaker
+    ) -> CacheHealthProtocol:
+        """
+        Exposes the cache circuit breaker to the application layer.
+        """
+        return circuit_breaker
+
+    @provide(scope=Scope.APP)
+    def get_near_cache_store(self, settings: Settings) -> TinyLFUCache | None:
+        """
+        Provides the in-process L1 store of the near cache.
+
+        With REDIS_NEAR_CACHE_ENABLED the store admits keys by TinyLFU;
+        CACHE_HOT_KEYS_ENABLED restricts it to hot keys and, without the near
+        cache, adds a small store for them alone. None unless one of them is
+        enabled with the Redis backend.
+        """
+        if settings.cache.cache_backend != "redis":
+            return None
+        min_frequency = (
+            settings.cache.cache_hot_key_threshold
+            if settings.cache.cache_hot_keys_enabled
+            else 0
+        )
+        if settings.redis.redis_near_cache_enabled:
+            return TinyLFUCache(
+                max_size=settings.redis.redis_near_cache_max_size,
+                ttl=settings.redis.redis_near_cache_ttl,
+                min_frequency=min_frequency,
+            )
+        if settings.cache.cache_hot_keys_enabled:
+            return TinyLFUCache(
+                max_size=settings.cache.cache_hot_key_max_pinned,
+                ttl=settings.cache.cache_hot_key_pin_ttl,
+                min_frequency=min_frequency,
+            )
+        return None
+
+    @provide(scope=Scope.APP)
+    def get_hot_key_tracker(
+        self, settings: Settings, near_cache_store: TinyLFUCache | None
+    ) -> HotKeyTracker:
+        """
+        Provides the per-worker hot-key tracker ranking the reads of the L1 store.
+        """
+        return HotKeyTracker(
+            local=near_cache_store, top_k=settings.cache.cache_hot_key_top_k
+        )
+
+    @provide(scope=Scope.APP)
+    def get_hot_key_tracker_protocol(
+        self, hot_key_tracker: HotKeyTracker
+    ) -> HotKeyTrackerProtocol:
+        """
+        Exposes the hot-key tracker to the application layer.
+        """
+        return hot_key_tracker
+
+    @provide(scope=Scope.APP)
+    def get_single_flight(self) -> SingleFlightProtocol:
+        """
+        Provides the per-worker single-flight coordinator used to coalesce cache misses.
+        """
+        return AsyncioSingleFlight()
+
+    @provide(scope=Scope.APP)
+    def get_lease(
+        self,
+        settings: Settings,
+        redis_client: RedisClient | None,
+        circuit_breaker: CacheCircuitBreaker,
+    ) -> LeaseProtocol | None:
+        """
+        Provides the cluster-wide lease used to coalesce cache misses across pods.
+
+        Returns None unless CACHE_LEASE_ENABLED is set with the Redis backend,
+        which stores the leases.
+        """
+        if not settings.cache.cache_lease_enabled or redis_client is None:
+            return None
+        return RedisLease(
+            client=redis_client,
+            prefix=f"{settings.cache_prefix}lease:",
+            ttl=settings.cache.cache_lease_ttl,
+            poll_interval=settings.cache.cache_lease_poll_interval,
+            breaker=self._get_breaker(settings, circuit_breaker),
+        )
+
+    @provide(scope=Scope.APP)
+    def get_cache_tag_index(
+        self,
+        settings: Settings,
+        redis_client: RedisClient | None,
+        cache_client: CacheProtocol,
+        circuit_breaker: CacheCircuitBreaker,
+    ) -> CacheTagIndexProtocol:
+        """
+        Provides the index of cache entries by tag.
+
+        Tag sets are stored in Redis, so other backends get an index that
+        drops tags; entries are deleted through the cache service. They are
+        only recorded when CACHE_TAGS_ENABLED is set.
+        """
+        if redis_client is None:
+            return NoOpCacheTagIndex()
+        return RedisCacheTagIndex(
+            client=redis_client,
+            cache_client=cache_client,
+            prefix=f"{settings.cache_prefix}tag:",
+            ttl=settings.cache_ttl,
+            batch_size=settings.cache.cache_tag_batch_size,
+            breaker=self._get_breaker(settings, circuit_breaker),
+        )
+
+    @provide(scope=Scope.APP)
+    async def get_cache_invalidation_jobs(
+        self, cache_client: CacheProtocol
+    ) -> AsyncIterator[CacheInvalidationJobsProtocol]:
+        """
+        Provides the per-worker registry of background cache invalidation jobs.
+        """
+        invalidation_jobs = AsyncioCacheInvalidationJobs(cache_client=cache_client)
+        try:
+            yield invalidation_jobs
+        finally:
+            await invalidation_jobs.close()
+
+    @provide(scope=Scope.APP)
+    def get_artifact_cache_key_builder(
+        self,
+        settings: Settings,
+        redis_client: RedisClient | None,
+        tarantool_client: TarantoolCacheClient | None,
+        shared_memory_client: SharedMemoryCacheClient | None,
+        circuit_breaker: CacheCircuitBreaker,
+    ) -> CacheKeyBuilderProtocol:
+        """
+        Provides the builder of versioned artifact cache keys.
+
+        The generation counter lives in the configured cache backend.
         """
-        redis_client = await redis.from_url(
-            str(settings.redis_url),
-            encoding="utf-8",
-            decode_responses=True,
-            health_check_interval=30,
-            max_connections=10,
-            retry_on_timeout=True,
-            socket_connect_timeout=5,
-            socket_timeout=5,
+        generation_store: RedisClient | TarantoolCounters | SharedMemoryCounters
+        if tarantool_client is not None:
+            generation_store = TarantoolCounters(client=tarantool_client)
+        elif shared_memory_client is not None:
+            generation_store = SharedMemoryCounters(client=shared_memory_client)
+        elif redis_client is not None:
+            generation_store = redis_client
+        else:
+            raise RuntimeError(
+                f"No cache client for CACHE_BACKEND={settings.cache.cache_backend}"
+            )
+        return VersionedKeyBuilder(
+            client=generation_store,
+            prefix=settings.cache_prefix,
+            namespace="artifact",
+            schema_version=InfrastructureArtifactMapper.CACHE_SCHEMA_VERSION,
+            refresh_interval=settings.redis.redis_cache_generation_refresh_interval,
+            breaker=self._get_breaker(settings, circuit_breaker),
         )
-        cache_service = RedisCacheClient(
-            client=redis_client, ttl=settings.redis_cache_ttl
+
+    @provide(scope=Scope.APP)
+    def get_cache_freshness_policy(self, settings: Settings) -> CacheFreshnessPolicy:
+        """
+        Provides the soft/hard TTL policy applied to cached artifacts.
+        """
+        return CacheFreshnessPolicy(
+            soft_ttl=settings.cache.cache_soft_ttl,
+            hard_ttl=settings.cache_ttl,
+            stale_if_error_ttl=settings.cache.cache_stale_if_error_ttl,
+            xfetch_beta=settings.cache.cache_xfetch_beta,
+            xfetch_delta=settings.cache.cache_xfetch_delta,
+        )
+
+    @provide(scope=Scope.APP)
+    async def get_cache_refresher(
+        self, container: AsyncContainer, settings: Settings
+    ) -> AsyncIterator[CacheRefresherProtocol]:
+        """
+        Provides the per-worker refresher reloading stale artifacts in the background.
+
+        Each refresh runs in its own request scope, since the request that
+        found the stale entry may be finished by the time the refresh runs.
+        """
+
+        async def refresh(inventory_id: str) -> None:
+            async with container() as request_container:
+                use_case = await request_container.get(ProcessArtifactUseCase)
+                await use_case.refresh(inventory_id)
+
+        refresher = AsyncioBackgroundRefresher(
+            refresh=refresh, max_concurrency=settings.cache.cache_refresh_concurrency
         )
         try:
-            yield cache_service
+            yield refresher
         finally:
-            await cache_service.close()
+            await refresher.close()
+
+    @provide(scope=Scope.APP)
+    async def get_cache_prefetcher(
+        self, container: AsyncContainer, settings: Settings
+    ) -> AsyncIterator[CachePrefetcherProtocol]:
+        """
+        Provides the per-worker prefetcher warming the artifacts clients request next.
+
+        Like refreshes, each prefetch runs in its own request scope. Artifacts
+        are only reported to it when CACHE_PREFETCH_ENABLED is set.
+        """
+
+        async def prefetch(inventory_id: str) -> bool:
+            async with container() as request_container:
+                use_case = await request_container.get(ProcessArtifactUseCase)
+                return await use_case.prefetch(inventory_id)
+
+        prefetcher = AsyncioCoAccessPrefetcher(
+            prefetch=prefetch,
+            model=CoAccessModel(max_sources=settings.cache.cache_prefetch_max_sources),
+            top_k=settings.cache.cache_prefetch_top_k,
+            min_confidence=settings.cache.cache_prefetch_min_confidence,
+            budget=settings.cache.cache_prefetch_budget,
+            max_concurrency=settings.cache.cache_prefetch_concurrency,
+            hit_window=settings.cache.cache_prefetch_hit_window,
+        )
+        try:
+            yield prefetcher
+        finally:
+            await prefetcher.close()
 
 
 class UseCaseProvider(Provider):
@@ -293,22 +884,72 @@ class UseCaseProvider(Provider):
         self,
         cache_client: CacheProtocol,
         serialization_mapper: SerializationMapperProtocol,
+        freshness_policy: CacheFreshnessPolicy,
+        refresher: CacheRefresherProtocol,
+        key_builder: CacheKeyBuilderProtocol,
     ) -> GetArtifactFromCacheUseCase:
         """
         Provides a GetArtifactFromCacheUseCase instance.
         """
         return GetArtifactFromCacheUseCase(
-            cache_client=cache_client, serialization_mapper=serialization_mapper
+            cache_client=cache_client,
+            serialization_mapper=serialization_mapper,
+            freshness_policy=freshness_policy,
+            refresher=refresher,
+            key_builder=key_builder,
+        )
+
+    @provide(scope=Scope.REQUEST)
+    def get_get_artifacts_from_cache_use_case(
+        self,
+        cache_client: CacheProtocol,
+        serialization_mapper: SerializationMapperProtocol,
+        freshness_policy: CacheFreshnessPolicy,
+        refresher: CacheRefresherProtocol,
+        key_builder: CacheKeyBuilderProtocol,
+    ) -> GetArtifactsFromCacheUseCase:
+        """
+        Provides a GetArtifactsFromCacheUseCase instance.
+        """
+        return GetArtifactsFromCacheUseCase(
+            cache_client=cache_client,
+            serialization_mapper=serialization_mapper,
+            freshness_policy=freshness_policy,
+            refresher=refresher,
+            key_builder=key_builder,
         )
 
     @provide(scope=Scope.REQUEST)
     def get_get_artifact_from_repo_use_case(
-        self, uow: UnitOfWorkProtocol, artifact_mapper: DtoEntityMapperProtocol
+        self,
+        uow: UnitOfWorkProtocol,
+        artifact_mapper: DtoEntityMapperProtocol,
+        settings: Settings,
     ) -> GetArtifactFromRepoUseCase:
         """
         Provides a GetArtifactFromRepoUseCase instance.
         """
-        return GetArtifactFromRepoUseCase(uow=uow, artifact_mapper=artifact_mapper)
+        return GetArtifactFromRepoUseCase(
+            uow=uow,
+            artifact_mapper=artifact_mapper,
+            lean_reads=settings.database.postgres_read_path != "orm",
+        )
+
+    @provide(scope=Scope.REQUEST)
+    def get_get_artifacts_from_repo_use_case(
+        self,
+        uow: UnitOfWorkProtocol,
+        artifact_mapper: DtoEntityMapperProtocol,
+        settings: Settings,
+    ) -> GetArtifactsFromRepoUseCase:
+        """
+        Provides a GetArtifactsFromRepoUseCase instance.
+        """
+        return GetArtifactsFromRepoUseCase(
+            uow=uow,
+            artifact_mapper=artifact_mapper,
+            lean_reads=settings.database.postgres_read_path != "orm",
+        )
 
     @provide(scope=Scope.REQUEST)
     def get_fetch_artifact_from_museum_api_use_case(
@@ -334,14 +975,144 @@ class UseCaseProvider(Provider):
         self,
         cache_client: CacheProtocol,
         serialization_mapper: SerializationMapperProtocol,
+        freshness_policy: CacheFreshnessPolicy,
+        settings: Settings,
+        key_builder: CacheKeyBuilderProtocol,
+        tag_index: CacheTagIndexProtocol,
     ) -> SaveArtifactToCacheUseCase:
         """
         Provides a SaveArtifactToCacheUseCase instance.
         """
         return SaveArtifactToCacheUseCase(
-            cache_client=cache_client, serialization_mapper=serialization_mapper
+            cache_client=cache_client,
+            serialization_mapper=serialization_mapper,
+            freshness_policy=freshness_policy,
+            negative_ttl=settings.cache.cache_negative_ttl,
+            key_builder=key_builder,
+            tag_index=tag_index if settings.cache.cache_tags_enabled else None,
         )
 
+    @provide(scope=Scope.REQUEST)
+    def get_save_artifacts_to_cache_use_case(
+        self,
+        cache_client: CacheProtocol,
+        serialization_mapper: SerializationMapperProtocol,
+        freshness_policy: CacheFreshnessPolicy,
+        settings: Settings,
+        key_builder: CacheKeyBuilderProtocol,
+        tag_index: CacheTagIndexProtocol,
+    ) -> SaveArtifactsToCacheUseCase:
+        """
+        Provides a SaveArtifactsToCacheUseCase instance.
+        """
+        return SaveArtifactsToCacheUseCase(
+            cache_client=cache_client,
+            serialization_mapper=serialization_mapper,
+            freshness_policy=freshness_policy,
+            key_builder=key_builder,
+            tag_index=tag_index if settings.cache.cache_tags_enabled else None,
+        )
+
+    @provide(scope=Scope.REQUEST)
+    def get_warm_up_artifact_cache_use_case(
+        self,
+        settings: Settings,
+        uow: UnitOfWorkProtocol,
+        artifact_mapper: DtoEntityMapperProtocol,
+        save_artifacts_to_cache_use_case: SaveArtifactsToCacheUseCase,
+    ) -> WarmUpArtifactCacheUseCase:
+        """
+        Provides a WarmUpArtifactCacheUseCase instance.
+        """
+        return WarmUpArtifactCacheUseCase(
+            uow=uow,
+            artifact_mapper=artifact_mapper,
+            save_artifacts_to_cache_use_case=save_artifacts_to_cache_use_case,
+            batch_size=settings.cache.cache_warmup_batch_size,
+            max_rate=settings.cache.cache_warmup_max_rate or None,
+        )
+
+    @provide(scope=Scope.REQUEST)
+    def get_start_cache_invalidation_use_case(
+        self, invalidation_jobs: CacheInvalidationJobsProtocol
+    ) -> StartCacheInvalidationUseCase:
+        """
+        Provides a StartCacheInvalidationUseCase instance.
+        """
+        return StartCacheInvalidationUseCase(invalidation_jobs=invalidation_jobs)
+
+    @provide(scope=Scope.REQUEST)
+    def get_get_cache_invalidation_job_use_case(
+        self, invalidation_jobs: CacheInvalidationJobsProtocol
+    ) -> GetCacheInvalidationJobUseCase:
+        """
+        Provides a GetCacheInvalidationJobUseCase instance.
+        """
+        return GetCacheInvalidationJobUseCase(invalidation_jobs=invalidation_jobs)
+
+    @provide(scope=Scope.REQUEST)
+    def get_get_hot_cache_keys_use_case(
+        self, hot_key_tracker: HotKeyTrackerProtocol
+    ) -> GetHotCacheKeysUseCase:
+        """
+        Provides a GetHotCacheKeysUseCase instance.
+        """
+        return GetHotCacheKeysUseCase(hot_key_tracker=hot_key_tracker)
+
+    @provide(scope=Scope.REQUEST)
+    def get_get_cache_prefetch_stats_use_case(
+        self, prefetcher: CachePrefetcherProtocol
+    ) -> GetCachePrefetchStatsUseCase:
+        """
+        Provides a GetCachePrefetchStatsUseCase instance.
+        """
+        return GetCachePrefetchStatsUseCase(prefetcher=prefetcher)
+
+    @provide(scope=Scope.REQUEST)
+    def get_get_single_flight_stats_use_case(
+        self, single_flight: SingleFlightProtocol
+    ) -> GetSingleFlightStatsUseCase:
+        """
+        Provides a GetSingleFlightStatsUseCase instance.
+        """
+        return GetSingleFlightStatsUseCase(single_flight=single_flight)
+
+    @provide(scope=Scope.REQUEST)
+    def get_get_database_pool_stats_use_case(
+        self, metrics: DatabaseMetricsProtocol
+    ) -> GetDatabasePoolStatsUseCase:
+        """
+        Provides a GetDatabasePoolStatsUseCase instance.
+        """
+        return GetDatabasePoolStatsUseCase(metrics=metrics)
+
+    @provide(scope=Scope.REQUEST)
+    def get_get_cache_health_use_case(
+        self, cache_health: CacheHealthProtocol
+    ) -> GetCacheHealthUseCase:
+        """
+        Provides a GetCacheHealthUseCase instance.
+        """
+        return GetCacheHealthUseCase(cache_health=cache_health)
+
+    @provide(scope=Scope.REQUEST)
+    def get_invalidate_cache_tags_use_case(
+        self, tag_index: CacheTagIndexProtocol
+    ) -> InvalidateCacheTagsUseCase:
+        """
+        Provides an InvalidateCacheTagsUseCase instance.
+        """
+        return InvalidateCacheTagsUseCase(tag_index=tag_index)
+
+    @provide(scope=Scope.REQUEST)
+    def get_bump_cache_generation_use_case(
+        self, key_builder: CacheKeyBuilderProtocol
+    ) -> BumpCacheGenerationUseCase:
+        """
+        Provides a BumpCacheGenerationUseCase instance.
+        """
+        return BumpCacheGenerationUseCase(key_builder=key_builder)
+
     @provide(scope=Scope.REQUEST)
     def get_publish_artifact_to_broker_use_case(
         self,
@@ -371,23 +1142,40 @@ class UseCaseProvider(Provider):
     @provide(scope=Scope.REQUEST)
     def get_register_artifact_use_case(
         self,
+        container: AsyncContainer,
         get_artifact_from_cache_use_case: GetArtifactFromCacheUseCase,
-        get_artifact_from_repo_use_case: GetArtifactFromRepoUseCase,
-        fetch_artifact_from_museum_api_use_case: FetchArtifactFromMuseumAPIUseCase,
-        save_artifact_to_repo_use_case: SaveArtifactToRepoUseCase,
         save_artifact_to_cache_use_case: SaveArtifactToCacheUseCase,
-        publish_artifact_to_broker_use_case: PublishArtifactToBrokerUseCase,
-        publish_artifact_to_catalog_use_case: PublishArtifactToCatalogUseCase,
+        single_flight: SingleFlightProtocol,
+        lease: LeaseProtocol | None,
+        prefetcher: CachePrefetcherProtocol,
+        settings: Settings,
     ) -> ProcessArtifactUseCase:
         """
         Provides a ProcessArtifactUseCase instance.
+
+        The cache-miss steps are resolved from the request container on first
+        call, so a cache hit never builds the database session, unit of work,
+        API clients or broker publisher.
         """
         return ProcessArtifactUseCase(
             get_artifact_from_cache_use_case=get_artifact_from_cache_use_case,
-            get_artifact_from_repo_use_case=get_artifact_from_repo_use_case,
-            fetch_artifact_from_museum_api_use_case=fetch_artifact_from_museum_api_use_case,
-            save_artifact_to_repo_use_case=save_artifact_to_repo_use_case,
+            get_artifact_from_repo_use_case=resolve_on_call(
+                container, GetArtifactFromRepoUseCase
+            ),
+            fetch_artifact_from_museum_api_use_case=resolve_on_call(
+                container, FetchArtifactFromMuseumAPIUseCase
+            ),
+            save_artifact_to_repo_use_case=resolve_on_call(
+                container, SaveArtifactToRepoUseCase
+            ),
             save_artifact_to_cache_use_case=save_artifact_to_cache_use_case,
-            publish_artifact_to_broker_use_case=publish_artifact_to_broker_use_case,
-            publish_artifact_to_catalog_use_case=publish_artifact_to_catalog_use_case,
+            publish_artifact_to_broker_use_case=resolve_on_call(
+                container, PublishArtifactToBrokerUseCase
+            ),
+            publish_artifact_to_catalog_use_case=resolve_on_call(
+                container, PublishArtifactToCatalogUseCase
+            ),
+            single_flight=single_flight,
+            lease=lease,
+            prefetcher=prefetcher if settings.cache.cache_prefetch_enabled else None,
         )
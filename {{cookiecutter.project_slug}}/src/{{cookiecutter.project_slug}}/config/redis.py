@@ -1,4 +1,5 @@
-from typing import final
+from pathlib import Path
+from typing import Literal, final
 
 from pydantic import Field, RedisDsn
 from pydantic_settings import BaseSettings
@@ -15,8 +16,42 @@ class RedisSettings(BaseSettings):
         redis_port (int): Redis port.
         redis_host (str): Redis host.
         redis_db (int): Redis database number.
+        redis_cluster_enabled (bool): Treats ``redis_url`` as a startup node of a
+            Redis Cluster and discovers the other shards from it.
+        redis_max_connections (int): Maximum connections of the client (per node
+            on a cluster).
         redis_cache_ttl (int): Time-to-live for Redis cache entries in seconds.
         redis_cache_prefix (str): Prefix for Redis cache keys.
+        redis_cache_ttl_mode (Literal["fixed", "sliding", "adaptive"]): How reads
+            change the TTL of the entries they hit.
+        redis_cache_read_ttl (int): TTL re-armed by reads in sliding mode, and
+            given to hot entries in adaptive mode.
+        redis_cache_min_read_ttl (int): Adaptive TTL after a one-off read; entries
+            with less time left are never re-armed.
+        redis_cache_max_read_ttl (int): Longest adaptive TTL.
+        redis_cache_hot_reads (int): Reads after which an adaptive entry gets
+            ``redis_cache_read_ttl``.
+        redis_cache_layout (Literal["string", "hash"]): Stores UUID-keyed entries
+            as top-level strings, or as fields of bucketed hashes to save memory.
+        redis_cache_hash_bucket_prefix_length (int): Leading hex digits of the
+            UUID naming the bucket of an entry in the hash layout.
+        redis_cache_codec (Literal["json", "orjson", "msgpack"]): Codec used to
+            encode new cache payloads. Payloads written with any other codec stay readable.
+        redis_cache_compression (Literal["none", "zstd", "lz4"]): Compression applied
+            to large cache payloads.
+        redis_cache_compression_threshold (int): Minimum encoded payload size in
+            bytes before compression is attempted.
+        redis_cache_compression_dictionary (Path | None): Trained dictionary file
+            used by the compressor, see ``presentation.cli.train_cache_dictionary``.
+        redis_cache_generation_refresh_interval (float): Seconds a worker reuses
+            the cache generation before reading it from Redis again.
+        redis_scan_count (int): SCAN COUNT hint used by pattern invalidation.
+        redis_unlink_batch_size (int): Keys unlinked per pipelined batch during
+            pattern invalidation.
+        redis_near_cache_enabled (bool): Enables the per-worker in-process L1 cache.
+        redis_near_cache_max_size (int): Maximum number of entries kept in the L1 cache.
+        redis_near_cache_ttl (int): Local time-to-live for L1 entries in seconds.
+        redis_near_cache_channel (str): Pub/sub channel used for L1 invalidations.
     """
 
     redis_url: RedisDsn = Field(
@@ -26,8 +61,46 @@ class RedisSettings(BaseSettings):
     redis_port: int = Field(6379, alias="REDIS_PORT")
     redis_host: str = Field("redis", alias="REDIS_HOST")
     redis_db: int = Field(0, alias="REDIS_DB")
+    redis_cluster_enabled: bool = Field(False, alias="REDIS_CLUSTER_ENABLED")
+    redis_max_connections: int = Field(10, alias="REDIS_MAX_CONNECTIONS")
     redis_cache_ttl: int = Field(3600, alias="REDIS_CACHE_TTL")  # 1 hour default TTL
     redis_cache_prefix: str = Field("antiques:", alias="REDIS_CACHE_PREFIX")
+    redis_cache_ttl_mode: Literal["fixed", "sliding", "adaptive"] = Field(
+        "fixed", alias="REDIS_CACHE_TTL_MODE"
+    )
+    redis_cache_read_ttl: int = Field(86400, alias="REDIS_CACHE_READ_TTL")
+    redis_cache_min_read_ttl: int = Field(300, alias="REDIS_CACHE_MIN_READ_TTL")
+    redis_cache_max_read_ttl: int = Field(604800, alias="REDIS_CACHE_MAX_READ_TTL")
+    redis_cache_hot_reads: int = Field(8, alias="REDIS_CACHE_HOT_READS")
+    redis_cache_layout: Literal["string", "hash"] = Field(
+        "string", alias="REDIS_CACHE_LAYOUT"
+    )
+    redis_cache_hash_bucket_prefix_length: int = Field(
+        4, alias="REDIS_CACHE_HASH_BUCKET_PREFIX_LENGTH"
+    )
+    redis_cache_codec: Literal["json", "orjson", "msgpack"] = Field(
+        "json", alias="REDIS_CACHE_CODEC"
+    )
+    redis_cache_compression: Literal["none", "zstd", "lz4"] = Field(
+        "none", alias="REDIS_CACHE_COMPRESSION"
+    )
+    redis_cache_compression_threshold: int = Field(
+        512, alias="REDIS_CACHE_COMPRESSION_THRESHOLD"
+    )
+    redis_cache_compression_dictionary: Path | None = Field(
+        None, alias="REDIS_CACHE_COMPRESSION_DICTIONARY"
+    )
+    redis_cache_generation_refresh_interval: float = Field(
+        5.0, alias="REDIS_CACHE_GENERATION_REFRESH_INTERVAL"
+    )
+    redis_scan_count: int = Field(1000, alias="REDIS_SCAN_COUNT")
+    redis_unlink_batch_size: int = Field(500, alias="REDIS_UNLINK_BATCH_SIZE")
+    redis_near_cache_enabled: bool = Field(False, alias="REDIS_NEAR_CACHE_ENABLED")
+    redis_near_cache_max_size: int = Field(10_000, alias="REDIS_NEAR_CACHE_MAX_SIZE")
+    redis_near_cache_ttl: int = Field(30, alias="REDIS_NEAR_CACHE_TTL")
+    redis_near_cache_channel: str = Field(
+        "antiques:cache-invalidation", alias="REDIS_NEAR_CACHE_CHANNEL"
+    )
 
     class Config:
         env_file = ".env"
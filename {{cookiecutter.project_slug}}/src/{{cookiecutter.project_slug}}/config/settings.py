@@ -3,10 +3,13 @@ from pydantic_settings import BaseSettings
 
 from {{cookiecutter.project_slug}}.config.app import AppSettings
 from {{cookiecutter.project_slug}}.config.broker import BrokerSettings
+from {{cookiecutter.project_slug}}.config.cache import CacheSettings
 from {{cookiecutter.project_slug}}.config.cors import CORSSettings
 from {{cookiecutter.project_slug}}.config.database import DatabaseSettings
 from {{cookiecutter.project_slug}}.config.external_apis import ExternalAPISettings
 from {{cookiecutter.project_slug}}.config.redis import RedisSettings
+from {{cookiecutter.project_slug}}.config.shared_memory import SharedMemorySettings
+from {{cookiecutter.project_slug}}.config.tarantool import TarantoolSettings
 
 
 class Settings(BaseSettings):
@@ -21,6 +24,9 @@ class Settings(BaseSettings):
     app: AppSettings = Field(default_factory=AppSettings)
     database: DatabaseSettings = Field(default_factory=DatabaseSettings)
     redis: RedisSettings = Field(default_factory=RedisSettings)
+    tarantool: TarantoolSettings = Field(default_factory=TarantoolSettings)
+    shared_memory: SharedMemorySettings = Field(default_factory=SharedMemorySettings)
+    cache: CacheSettings = Field(default_factory=CacheSettings)
     external_apis: ExternalAPISettings = Field(default_factory=ExternalAPISettings)
     broker: BrokerSettings = Field(default_factory=BrokerSettings)
     cors: CORSSettings = Field(default_factory=CORSSettings)
@@ -136,6 +142,24 @@ class Settings(BaseSettings):
         """Get Redis cache prefix."""
         return self.redis.redis_cache_prefix
 
+    @property
+    def cache_ttl(self) -> int:
+        """Get the entry TTL of the configured cache backend."""
+        if self.cache.cache_backend == "tarantool":
+            return self.tarantool.tarantool_cache_ttl
+        if self.cache.cache_backend == "shared_memory":
+            return self.shared_memory.shm_cache_ttl
+        return self.redis.redis_cache_ttl
+
+    @property
+    def cache_prefix(self) -> str:
+        """Get the key prefix of the configured cache backend."""
+        if self.cache.cache_backend == "tarantool":
+            return self.tarantool.tarantool_cache_prefix
+        if self.cache.cache_backend == "shared_memory":
+            return self.shared_memory.shm_cache_prefix
+        return self.redis.redis_cache_prefix
+
     @property
     def cors_origins(self) -> list[str]:
         """Get CORS origins."""
@@ -0,0 +1,34 @@
+from typing import final
+
+from pydantic import Field
+from pydantic_settings import BaseSettings
+
+
+@final
+class SharedMemorySettings(BaseSettings):
+    """
+    Shared-memory cache settings, used when ``CACHE_BACKEND=shared_memory``.
+
+    Attributes:
+        shm_cache_path (str | None): File mapped by every worker of the host,
+            required with the shared-memory backend.
+        shm_cache_slots (int): Number of slots of the table.
+        shm_cache_slot_size (int): Size of a slot in bytes, key and value included.
+        shm_cache_probe_length (int): Slots a key may occupy.
+        shm_cache_ttl (int): Time-to-live for shared-memory cache entries in seconds.
+        shm_cache_prefix (str): Prefix for shared-memory cache keys.
+        shm_clear_batch_size (int): Slots scanned per batch during pattern invalidation.
+    """
+
+    shm_cache_path: str | None = Field(None, alias="SHM_CACHE_PATH")
+    shm_cache_slots: int = Field(16_384, alias="SHM_CACHE_SLOTS")
+    shm_cache_slot_size: int = Field(2048, alias="SHM_CACHE_SLOT_SIZE")
+    shm_cache_probe_length: int = Field(8, alias="SHM_CACHE_PROBE_LENGTH")
+    shm_cache_ttl: int = Field(3600, alias="SHM_CACHE_TTL")
+    shm_cache_prefix: str = Field("antiques:", alias="SHM_CACHE_PREFIX")
+    shm_clear_batch_size: int = Field(1024, alias="SHM_CLEAR_BATCH_SIZE")
+
+    class Config:
+        env_file = ".env"
+        env_file_encoding = "utf-8"
+        extra = "ignore"
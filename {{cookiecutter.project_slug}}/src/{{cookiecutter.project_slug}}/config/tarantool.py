@@ -0,0 +1,35 @@
+from typing import final
+
+from pydantic import Field
+from pydantic_settings import BaseSettings
+
+
+@final
+class TarantoolSettings(BaseSettings):
+    """
+    Tarantool configuration settings, used when ``CACHE_BACKEND=tarantool``.
+
+    Attributes:
+        tarantool_host (str): Tarantool host.
+        tarantool_port (int): Tarantool port.
+        tarantool_user (str | None): Tarantool user (None for guest).
+        tarantool_password (str | None): Tarantool password.
+        tarantool_cache_ttl (int): Time-to-live for Tarantool cache entries in seconds.
+        tarantool_cache_prefix (str): Prefix for Tarantool cache keys.
+        tarantool_request_timeout (float): Seconds to wait for a request (-1 for no limit).
+        tarantool_clear_batch_size (int): Keys deleted per call during pattern invalidation.
+    """
+
+    tarantool_host: str = Field("tarantool", alias="TARANTOOL_HOST")
+    tarantool_port: int = Field(3301, alias="TARANTOOL_PORT")
+    tarantool_user: str | None = Field(None, alias="TARANTOOL_USER")
+    tarantool_password: str | None = Field(None, alias="TARANTOOL_PASSWORD")
+    tarantool_cache_ttl: int = Field(3600, alias="TARANTOOL_CACHE_TTL")
+    tarantool_cache_prefix: str = Field("antiques:", alias="TARANTOOL_CACHE_PREFIX")
+    tarantool_request_timeout: float = Field(5.0, alias="TARANTOOL_REQUEST_TIMEOUT")
+    tarantool_clear_batch_size: int = Field(500, alias="TARANTOOL_CLEAR_BATCH_SIZE")
+
+    class Config:
+        env_file = ".env"
+        env_file_encoding = "utf-8"
+        extra = "ignore"
@@ -0,0 +1,355 @@
+import asyncio
+from collections import deque
+from collections.abc import AsyncIterator, Awaitable, Callable, Mapping, Sequence
+import contextlib
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+import time
+from typing import Any, Literal, TypeVar, final
+
+import structlog
+
+from {{cookiecutter.project_slug}}.application.dtos.cache import CacheHealthDTO
+from {{cookiecutter.project_slug}}.application.interfaces.cache import (
+    CacheHealthProtocol,
+    CacheProtocol,
+)
+from {{cookiecutter.project_slug}}.infrastructures.cache.failures import capture_cache_failures
+
+T = TypeVar("T")
+
+logger = structlog.get_logger(__name__)
+
+BreakerState = Literal["closed", "open", "half_open"]
+
+
+class CacheBypassedError(ConnectionError):
+    """
+    Raised by ``CacheCircuitBreaker.guard`` instead of a call to a bypassed cache.
+    """
+
+
+@final
+@dataclass(slots=True, kw_only=True)
+class CacheCircuitBreaker(CacheHealthProtocol):
+    """
+    Per-worker circuit breaker deciding whether the cache is used or bypassed.
+
+    The outcome and latency of the last ``window_size`` cache calls are kept in
+    a rolling window. Once it holds ``min_calls`` calls, the breaker opens when
+    the share of failed calls reaches ``failure_rate_threshold`` or the share
+    of calls slower than ``slow_call_threshold`` reaches
+    ``slow_call_rate_threshold``. While open, the cache is bypassed; after
+    ``open_duration`` seconds the breaker half-opens and lets ``probe_calls``
+    calls through. It closes again if they all succeed quickly and reopens
+    otherwise.
+
+    Attributes:
+        call_timeout: Seconds after which a cache call is abandoned as failed.
+        slow_call_threshold: Seconds from which a successful call counts as slow.
+        failure_rate_threshold: Share of failed calls opening the breaker.
+        slow_call_rate_threshold: Share of slow calls opening the breaker.
+        window_size: Number of recent calls the rates are computed over.
+        min_calls: Calls needed in the window before the breaker may open.
+        open_duration: Seconds the cache is bypassed before probing it.
+        probe_calls: Successful probes needed to close the breaker.
+    """
+
+    call_timeout: float = 0.5
+    slow_call_threshold: float = 0.1
+    failure_rate_threshold: float = 0.5
+    slow_call_rate_threshold: float = 0.8
+    window_size: int = 100
+    min_calls: int = 20
+    open_duration: float = 10.0
+    probe_calls: int = 3
+    clock: Callable[[], float] = field(default=time.monotonic, repr=False)
+    _state: BreakerState = field(default="closed", init=False)
+    # (latency in seconds, failed) of the most recent calls.
+    _window: deque[tuple[float, bool]] = field(init=False)
+    _opened_at: float = field(default=0.0, init=False)
+    _opened_at_utc: datetime | None = field(default=None, init=False)
+    _probes_in_flight: int = field(default=0, init=False)
+    _probe_successes: int = field(default=0, init=False)
+    _bypassed_calls: int = field(default=0, init=False)
+    _trips: int = field(default=0, init=False)
+
+    def __post_init__(self) -> None:
+        """
+        Allocates the rolling window.
+        """
+        if not 0 < self.min_calls <= self.window_size:
+            raise ValueError("min_calls must be between 1 and window_size")
+        self._window = deque(maxlen=self.window_size)
+
+    def allow(self) -> bool:
+        """
+        Checks whether the next call may use the cache.
+
+        Returns:
+            True if the call should go to the cache, False if it must bypass it.
+        """
+        if self._state == "open":
+            if self.clock() - self._opened_at < self.open_duration:
+                self._bypassed_calls += 1
+                return False
+            self._state = "half_open"
+            self._probes_in_flight = self._probe_successes = 0
+            logger.info("Cache circuit breaker half-open, probing the cache")
+        if self._state == "half_open":
+            if self._probes_in_flight + self._probe_successes >= self.probe_calls:
+                self._bypassed_calls += 1
+                return False
+            self._probes_in_flight += 1
+        return True
+
+    def record(self, latency: float, failed: bool) -> None:
+        """
+        Records the outcome of a call let through by ``allow``.
+
+        Args:
+            latency: Duration of the call in seconds.
+            failed: Whether the call failed or timed out.
+        """
+        slow = latency >= self.slow_call_threshold
+        if self._state == "half_open":
+            self._probes_in_flight = max(0, self._probes_in_flight - 1)
+            if failed or slow:
+                self._open("probe failed")
+                return
+            self._probe_successes += 1
+            if self._probe_successes >= self.probe_calls:
+                self._state = "closed"
+                self._window.clear()
+                logger.info("Cache circuit breaker closed, cache recovered")
+            return
+        if self._state == "open":
+            # Late outcome of a call started before the breaker opened.
+            return
+
+        self._window.append((latency, failed))
+        if len(self._window) < self.min_calls:
+            return
+        failure_rate, slow_call_rate, _ = self._rates()
+        if failure_rate >= self.failure_rate_threshold:
+            self._open("failure rate exceeded")
+        elif slow_call_rate >= self.slow_call_rate_threshold:
+            self._open("slow call rate exceeded")
+
+    def release(self) -> None:
+        """
+        Frees the slot of a call let through by ``allow`` that has no outcome.
+
+        A call cancelled by its caller, or failing outside the cache, says
+        nothing about the cache, but must not keep holding a probe slot: the
+        breaker would stay half-open and bypass the cache forever.
+        """
+        if self._state == "half_open":
+            self._probes_in_flight = max(0, self._probes_in_flight - 1)
+
+    @contextlib.asynccontextmanager
+    async def guard(self) -> AsyncIterator[None]:
+        """
+        Runs a direct cache backend call through the breaker.
+
+        The body is bounded by ``call_timeout`` and any error it raises counts
+        as a failed call. Meant for backend calls made outside CacheProtocol,
+        such as leases, tag sets and generation counters, so they are skipped
+        while the cache is bypassed instead of waiting for socket timeouts.
+
+        Raises:
+            CacheBypassedError: If the breaker bypasses the cache.
+            ConnectionError: If the call times out.
+        """
+        if not self.allow():
+            raise CacheBypassedError("Cache bypassed by the circuit breaker")
+        started_at = self.clock()
+        try:
+            async with asyncio.timeout(self.call_timeout):
+                yield
+        except TimeoutError as e:
+            self.record(self.clock() - started_at, failed=True)
+            raise ConnectionError(
+                f"Cache call timed out after {self.call_timeout}s"
+            ) from e
+        except Exception:
+            self.record(self.clock() - started_at, failed=True)
+            raise
+        except BaseException:
+            self.release()
+            raise
+        self.record(self.clock() - started_at, failed=False)
+
+    def health(self) -> CacheHealthDTO:
+        """
+        Returns a snapshot of the breaker state and of the rolling window.
+        """
+        failure_rate, slow_call_rate, mean_latency = self._rates()
+        return CacheHealthDTO(
+            state=self._state,
+            failure_rate=failure_rate,
+            slow_call_rate=slow_call_rate,
+            mean_latency_ms=mean_latency * 1000,
+            window_calls=len(self._window),
+            bypassed_calls=self._bypassed_calls,
+            trips=self._trips,
+            opened_at=self._opened_at_utc,
+        )
+
+    def _open(self, reason: str) -> None:
+        """
+        Starts bypassing the cache for ``open_duration`` seconds.
+        """
+        failure_rate, slow_call_rate, mean_latency = self._rates()
+        self._state = "open"
+        self._opened_at = self.clock()
+        self._opened_at_utc = datetime.now(UTC)
+        self._trips += 1
+        logger.warning(
+            "Cache circuit breaker opened, bypassing the cache",
+            reason=reason,
+            failure_rate=round(failure_rate, 3),
+            slow_call_rate=round(slow_call_rate, 3),
+            mean_latency_ms=round(mean_latency * 1000, 1),
+            open_duration=self.open_duration,
+        )
+
+    def _rates(self) -> tuple[float, float, float]:
+        """
+        Returns the failure rate, slow call rate and mean latency of the window.
+        """
+        calls = len(self._window)
+        if not calls:
+            return 0.0, 0.0, 0.0
+        failures = slow_calls = 0
+        total_latency = 0.0
+        for latency, failed in self._window:
+            failures += failed
+            slow_calls += latency >= self.slow_call_threshold
+            total_latency += latency
+        return failures / calls, slow_calls / calls, total_latency / calls
+
+
+@final
+@dataclass(frozen=True, slots=True, kw_only=True)
+class CircuitBreakerCacheClient(CacheProtocol):
+    """
+    CacheProtocol decorator bypassing a degraded cache.
+
+    Reads and writes are bounded by ``breaker.call_timeout`` and their outcome
+    is recorded by the breaker; backend errors the wrapped cache turns into
+    misses are picked up through ``capture_cache_failures``. While the breaker is open they are answered
+    without touching the cache (reads miss, writes report failure), so
+    requests go straight to the repository instead of waiting for socket
+    timeouts. Deletions and pattern invalidations always reach the cache:
+    dropping them would leave stale entries behind once it recovers.
+
+    The wrapped cache is owned, and closed, by whoever created it.
+
+    Attributes:
+        remote: Wrapped cache.
+        breaker: Circuit breaker shared by every request of the worker.
+    """
+
+    remote: CacheProtocol
+    breaker: CacheCircuitBreaker
+
+    async def get(self, key: str) -> dict[str, Any] | None:
+        """
+        Retrieves a value, or None while the cache is bypassed.
+        """
+        return await self._guarded(lambda: self.remote.get(key), None)
+
+    async def get_many(self, keys: Sequence[str]) -> dict[str, dict[str, Any] | None]:
+        """
+        Retrieves several values, all None while the cache is bypassed.
+        """
+        return await self._guarded(
+            lambda: self.remote.get_many(keys), dict.fromkeys(keys)
+        )
+
+    async def set(
+        self, key: str, value: dict[str, Any], ttl: int | None = None
+    ) -> bool:
+        """
+        Stores a value, or returns False while the cache is bypassed.
+        """
+        return await self._guarded(lambda: self.remote.set(key, value, ttl), False)
+
+    async def set_many(
+        self, items: Mapping[str, dict[str, Any]], ttl: int | None = None
+    ) -> dict[str, bool]:
+        """
+        Stores several values, all reported as failed while the cache is bypassed.
+        """
+        return await self._guarded(
+            lambda: self.remote.set_many(items, ttl), dict.fromkeys(items, False)
+        )
+
+    async def exists(self, key: str) -> bool:
+        """
+        Checks if a key exists, or returns False while the cache is bypassed.
+        """
+        return await self._guarded(lambda: self.remote.exists(key), False)
+
+    async def delete(self, key: str) -> bool:
+        """
+        Deletes a value from the wrapped cache.
+        """
+        return await self.remote.delete(key)
+
+    async def delete_many(self, keys: Sequence[str]) -> dict[str, bool]:
+        """
+        Deletes several values from the wrapped cache.
+        """
+        return await self.remote.delete_many(keys)
+
+    async def clear(self, pattern: str) -> int:
+        """
+        Clears matching entries in the wrapped cache.
+        """
+        return await self.remote.clear(pattern)
+
+    async def iter_clear(self, pattern: str) -> AsyncIterator[int]:
+        """
+        Clears matching entries in the wrapped cache batch by batch.
+        """
+        async for deleted in self.remote.iter_clear(pattern):
+            yield deleted
+
+    async def _guarded(self, call: Callable[[], Awaitable[T]], fallback: T) -> T:
+        """
+        Runs a cache call through the breaker.
+
+        Returns ``fallback`` if the call is bypassed, fails or times out.
+        """
+        if not self.breaker.allow():
+            return fallback
+        started_at = self.breaker.clock()
+        try:
+            with capture_cache_failures() as failures:
+                async with asyncio.timeout(self.breaker.call_timeout):
+                    result = await call()
+        except (TimeoutError, ConnectionError) as e:
+            self.breaker.record(self.breaker.clock() - started_at, failed=True)
+            logger.warning(
+                "Cache call failed, answering without the cache",
+                error=str(e) or type(e).__name__,
+            )
+            return fallback
+        except BaseException:
+            self.breaker.release()
+            raise
+        self.breaker.record(self.breaker.clock() - started_at, failed=bool(failures))
+        return result
+
+
+def guard_cache_call(
+    breaker: CacheCircuitBreaker | None,
+) -> contextlib.AbstractAsyncContextManager[None]:
+    """
+    Returns ``breaker.guard()``, or a no-op context manager without a breaker.
+    """
+    if breaker is None:
+        return contextlib.nullcontext()
+    return breaker.guard()
@@ -0,0 +1,351 @@
+"""Binary codecs for cache payloads.
+
+Every payload written by the cache starts with a two-byte header: the id of
+the codec that produced it and a flags byte describing payload transforms
+such as compression (see the compression module).
+Readers pick the codec from the header rather than from the configuration,
+so the configured codec can be switched while old entries are still alive.
+Payloads without a header (plain JSON written before codecs existed) are
+still readable.
+"""
+
+from dataclasses import dataclass, field
+from datetime import datetime
+import json
+import struct
+from typing import Any, ClassVar, Literal, Protocol, final
+from uuid import UUID
+
+from {{cookiecutter.project_slug}}.infrastructures.cache.compression import (
+    COMPRESSION_FLAGS,
+    DICTIONARY_ID,
+    FLAG_DICTIONARY,
+    CacheCompressor,
+    available_decompressors,
+    dictionary_id,
+)
+from {{cookiecutter.project_slug}}.infrastructures.cache.exceptions import CacheCodecError
+
+CodecName = Literal["json", "orjson", "msgpack"]
+
+HEADER = struct.Struct("!BB")
+_LEGACY_JSON_PREFIX = ord("{")
+_MSGPACK_UUID_EXT_TYPE = 1
+
+
+class CacheCodec(Protocol):
+    """Protocol for encoding cache values to bytes and back."""
+
+    codec_id: ClassVar[int]
+    name: ClassVar[CodecName]
+
+    def encode(self, value: Any) -> bytes:
+        """Encodes a value to bytes."""
+        ...
+
+    def decode(self, data: bytes | memoryview) -> Any:
+        """Decodes bytes produced by ``encode``."""
+        ...
+
+
+def _json_default(value: Any) -> str:
+    """
+    Serializes types the stdlib json module does not know about.
+    """
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return str(value)
+
+
+@final
+@dataclass(frozen=True, slots=True)
+class JsonCodec(CacheCodec):
+    """
+    Codec based on the standard library json module.
+    """
+
+    codec_id: ClassVar[int] = 1
+    name: ClassVar[CodecName] = "json"
+
+    def encode(self, value: Any) -> bytes:
+        """
+        Encodes a value as UTF-8 JSON.
+        """
+        return json.dumps(value, default=_json_default, separators=(",", ":")).encode()
+
+    def decode(self, data: bytes | memoryview) -> Any:
+        """
+        Decodes UTF-8 JSON.
+        """
+        return json.loads(bytes(data))
+
+
+@final
+@dataclass(frozen=True, slots=True)
+class OrjsonCodec(CacheCodec):
+    """
+    Codec based on orjson, which serializes datetime and UUID natively.
+    """
+
+    codec_id: ClassVar[int] = 2
+    name: ClassVar[CodecName] = "orjson"
+    _orjson: Any = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        """
+        Imports orjson lazily so it stays an optional dependency.
+        """
+        import orjson
+
+        object.__setattr__(self, "_orjson", orjson)
+
+    def encode(self, value: Any) -> bytes:
+        """
+        Encodes a value as JSON with orjson.
+        """
+        encoded: bytes = self._orjson.dumps(value, default=str)
+        return encoded
+
+    def decode(self, data: bytes | memoryview) -> Any:
+        """
+        Decodes JSON with orjson.
+        """
+        return self._orjson.loads(data)
+
+
+@final
+@dataclass(frozen=True, slots=True)
+class MsgpackCodec(CacheCodec):
+    """
+    Codec based on MessagePack.
+
+    Timezone-aware datetimes use the native MessagePack timestamp type and
+    UUIDs are stored as a 16-byte extension type, so both survive a round trip
+    without string formatting or parsing.
+    """
+
+    codec_id: ClassVar[int] = 3
+    name: ClassVar[CodecName] = "msgpack"
+    _msgpack: Any = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        """
+        Imports msgpack lazily so it stays an optional dependency.
+        """
+        import msgpack
+
+        object.__setattr__(self, "_msgpack", msgpack)
+
+    def _default(self, value: Any) -> Any:
+        """
+        Packs types MessagePack has no native representation for.
+        """
+        if isinstance(value, UUID):
+            return self._msgpack.ExtType(_MSGPACK_UUID_EXT_TYPE, value.bytes)
+        if isinstance(value, datetime):
+            # Naive datetimes cannot be mapped to a timestamp unambiguously.
+            return value.isoformat()
+        return str(value)
+
+    def _ext_hook(self, code: int, data: bytes) -> Any:
+        """
+        Unpacks the extension types produced by ``_default``.
+        """
+        if code == _MSGPACK_UUID_EXT_TYPE:
+            return UUID(bytes=data)
+        return self._msgpack.ExtType(code, data)
+
+    def encode(self, value: Any) -> bytes:
+        """
+        Encodes a value as MessagePack.
+        """
+        encoded: bytes = self._msgpack.packb(
+            value, default=self._default, datetime=True
+        )
+        return encoded
+
+    def decode(self, data: bytes | memoryview) -> Any:
+        """
+        Decodes MessagePack, restoring datetimes and UUIDs.
+        """
+        return self._msgpack.unpackb(data, timestamp=3, ext_hook=self._ext_hook)
+
+
+_CODEC_TYPES: dict[CodecName, type[JsonCodec | OrjsonCodec | MsgpackCodec]] = {
+    "json": JsonCodec,
+    "orjson": OrjsonCodec,
+    "msgpack": MsgpackCodec,
+}
+
+
+def get_codec(name: CodecName) -> CacheCodec:
+    """
+    Builds the codec registered under ``name``.
+
+    Args:
+        name: Codec name ("json", "orjson" or "msgpack").
+
+    Returns:
+        A CacheCodec instance.
+
+    Raises:
+        CacheCodecError: If the codec is unknown or its library is not installed.
+    """
+    codec_type = _CODEC_TYPES.get(name)
+    if codec_type is None:
+        raise CacheCodecError(f"Unknown cache codec '{name}'")
+    try:
+        return codec_type()
+    except ImportError as e:
+        raise CacheCodecError(
+            f"Cache codec '{name}' requires the '{name}' package to be installed"
+        ) from e
+
+
+def _available_codecs() -> dict[int, CacheCodec]:
+    """
+    Returns every codec whose library can be imported, keyed by codec id.
+    """
+    codecs: dict[int, CacheCodec] = {}
+    for name, codec_type in _CODEC_TYPES.items():
+        try:
+            codecs[codec_type.codec_id] = get_codec(name)
+        except CacheCodecError:
+            continue
+    return codecs
+
+
+@final
+@dataclass(frozen=True, slots=True, kw_only=True)
+class CachePayloadSerializer:
+    """
+    Frames cache values with a codec header and decodes them back.
+
+    Encoded payloads of at least ``compression_threshold`` bytes are compressed
+    when a compressor is configured and compression actually makes them smaller.
+    Reads decompress according to the header flags, so compressed and
+    uncompressed entries can coexist.
+
+    Attributes:
+        codec: Codec used to encode new payloads.
+        compressor: Compressor applied to large payloads, or None.
+        compression_threshold: Minimum encoded size in bytes to try compression.
+        dictionaries: Additional dictionaries older payloads may have been
+            compressed with (the compressor's own dictionary is always known).
+    """
+
+    codec: CacheCodec = field(default_factory=JsonCodec)
+    compressor: CacheCompressor | None = None
+    compression_threshold: int = 512
+    dictionaries: tuple[bytes, ...] = ()
+    _readers: dict[int, CacheCodec] = field(
+        default_factory=_available_codecs, repr=False
+    )
+    _decompressors: dict[tuple[int, int], CacheCompressor] = field(
+        init=False, repr=False
+    )
+
+    def __post_init__(self) -> None:
+        """
+        Collects the decompressors for every known algorithm and dictionary.
+        """
+        dictionaries = self.dictionaries
+        if self.compressor is not None and self.compressor.dictionary is not None:
+            dictionaries = (*dictionaries, self.compressor.dictionary)
+        object.__setattr__(
+            self, "_decompressors", available_decompressors(dictionaries)
+        )
+
+    def dumps(self, value: Any) -> bytes:
+        """
+        Encodes a value and prefixes it with the codec header.
+
+        Args:
+            value: Value to encode.
+
+        Returns:
+            The framed payload.
+
+        Raises:
+            CacheCodecError: If the value cannot be encoded.
+        """
+        try:
+            body = self.codec.encode(value)
+        except (TypeError, ValueError, OverflowError) as e:
+            raise CacheCodecError(f"Failed to encode cache value: {e}") from e
+        compressor = self.compressor
+        if compressor is None or len(body) < self.compression_threshold:
+            return HEADER.pack(self.codec.codec_id, 0) + body
+        compressed = compressor.compress(body)
+        if compressor.dictionary is None:
+            header = HEADER.pack(self.codec.codec_id, compressor.flag)
+        else:
+            header = HEADER.pack(
+                self.codec.codec_id, compressor.flag | FLAG_DICTIONARY
+            ) + DICTIONARY_ID.pack(dictionary_id(compressor.dictionary))
+        if len(header) + len(compressed) >= HEADER.size + len(body):
+            return HEADER.pack(self.codec.codec_id, 0) + body
+        return header + compressed
+
+    def loads(self, data: bytes | str) -> Any:
+        """
+        Decodes a framed payload with the codec named in its header.
+
+        Args:
+            data: Payload read from the cache.
+
+        Returns:
+            The decoded value.
+
+        Raises:
+            CacheCodecError: If the payload is corrupt or its codec is unavailable.
+        """
+        if isinstance(data, str):
+            data = data.encode()
+        if not data:
+            raise CacheCodecError("Empty cache payload")
+        codec: CacheCodec | None
+        body: bytes | memoryview
+        if data[0] == _LEGACY_JSON_PREFIX:
+            codec, body = self._readers[JsonCodec.codec_id], memoryview(data)
+        else:
+            if len(data) < HEADER.size:
+                raise CacheCodecError("Truncated cache payload header")
+            codec_id, flags = HEADER.unpack_from(data)
+            codec = self._readers.get(codec_id)
+            if codec is None:
+                raise CacheCodecError(f"No codec available for codec id {codec_id}")
+            body = memoryview(data)[HEADER.size :]
+            if flags & COMPRESSION_FLAGS:
+                body = self._decompress(flags, body)
+        try:
+            return codec.decode(body)
+        except (TypeError, ValueError) as e:
+            raise CacheCodecError(f"Failed to decode cache value: {e}") from e
+
+    def _decompress(self, flags: int, body: memoryview) -> bytes:
+        """
+        Decompresses a payload body according to its header flags.
+
+        Raises:
+            CacheCodecError: If the algorithm or dictionary is unavailable or
+                the body is corrupt.
+        """
+        used_dictionary_id = 0
+        if flags & FLAG_DICTIONARY:
+            if len(body) < DICTIONARY_ID.size:
+                raise CacheCodecError("Truncated cache payload dictionary id")
+            (used_dictionary_id,) = DICTIONARY_ID.unpack_from(body)
+            body = body[DICTIONARY_ID.size :]
+        decompressor = self._decompressors.get(
+            (flags & COMPRESSION_FLAGS, used_dictionary_id)
+        )
+        if decompressor is None:
+            raise CacheCodecError(
+                f"No decompressor available for flags {flags:#04x} "
+                f"and dictionary id {used_dictionary_id}"
+            )
+        try:
+            return decompressor.decompress(body)
+        except Exception as e:
+            raise CacheCodecError(f"Failed to decompress cache value: {e}") from e
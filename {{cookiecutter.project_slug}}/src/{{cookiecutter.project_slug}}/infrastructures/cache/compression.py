@@ -0,0 +1,237 @@
+"""Compression of encoded cache payloads.
+
+Compressed payloads are marked in the flags byte of the codec header with the
+algorithm that produced them. When a trained dictionary was used, the
+dictionary flag is set as well and the header is followed by the 4-byte
+dictionary id, so readers can pick the matching dictionary.
+"""
+
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+import struct
+from typing import Any, ClassVar, Literal, Protocol, final
+import zlib
+
+from {{cookiecutter.project_slug}}.infrastructures.cache.exceptions import CacheCodecError
+
+CompressionName = Literal["zstd", "lz4"]
+
+FLAG_ZSTD = 0x01
+FLAG_LZ4 = 0x02
+FLAG_DICTIONARY = 0x80
+COMPRESSION_FLAGS = FLAG_ZSTD | FLAG_LZ4
+DICTIONARY_ID = struct.Struct("!I")
+
+
+def dictionary_id(dictionary: bytes) -> int:
+    """
+    Returns the id recorded in payloads compressed with ``dictionary``.
+    """
+    return zlib.crc32(dictionary)
+
+
+class CacheCompressor(Protocol):
+    """Protocol for compressing encoded cache payloads."""
+
+    flag: ClassVar[int]
+    name: ClassVar[CompressionName]
+    dictionary: bytes | None
+
+    def compress(self, data: bytes) -> bytes:
+        """Compresses encoded payload bytes."""
+        ...
+
+    def decompress(self, data: bytes | memoryview) -> bytes:
+        """Decompresses bytes produced by ``compress``."""
+        ...
+
+
+@final
+@dataclass(frozen=True, slots=True, kw_only=True)
+class ZstdCompressor(CacheCompressor):
+    """
+    Compressor based on zstandard, optionally primed with a trained dictionary.
+
+    Attributes:
+        level: Compression level.
+        dictionary: Trained dictionary content, or None.
+    """
+
+    flag: ClassVar[int] = FLAG_ZSTD
+    name: ClassVar[CompressionName] = "zstd"
+    level: int = 3
+    dictionary: bytes | None = None
+    _compressor: Any = field(init=False, repr=False)
+    _decompressor: Any = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        """
+        Imports zstandard lazily and prepares the (de)compression contexts.
+
+        Raises:
+            ImportError: If zstandard is not installed.
+        """
+        import zstandard
+
+        dict_data = (
+            zstandard.ZstdCompressionDict(self.dictionary)
+            if self.dictionary is not None
+            else None
+        )
+        object.__setattr__(
+            self,
+            "_compressor",
+            zstandard.ZstdCompressor(level=self.level, dict_data=dict_data),
+        )
+        object.__setattr__(
+            self, "_decompressor", zstandard.ZstdDecompressor(dict_data=dict_data)
+        )
+
+    def compress(self, data: bytes) -> bytes:
+        """
+        Compresses payload bytes into a zstd frame.
+        """
+        compressed: bytes = self._compressor.compress(data)
+        return compressed
+
+    def decompress(self, data: bytes | memoryview) -> bytes:
+        """
+        Decompresses a zstd frame.
+        """
+        decompressed: bytes = self._decompressor.decompress(data)
+        return decompressed
+
+
+@final
+@dataclass(frozen=True, slots=True, kw_only=True)
+class Lz4Compressor(CacheCompressor):
+    """
+    Compressor based on LZ4 blocks, optionally primed with a dictionary.
+
+    LZ4 compresses less than zstd but is considerably cheaper on CPU.
+
+    Attributes:
+        dictionary: Dictionary content (the last 64 KiB are used), or None.
+    """
+
+    flag: ClassVar[int] = FLAG_LZ4
+    name: ClassVar[CompressionName] = "lz4"
+    dictionary: bytes | None = None
+    _block: Any = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        """
+        Imports lz4 lazily.
+
+        Raises:
+            ImportError: If lz4 is not installed.
+        """
+        import lz4.block
+
+        object.__setattr__(self, "_block", lz4.block)
+
+    def compress(self, data: bytes) -> bytes:
+        """
+        Compresses payload bytes into a size-prefixed LZ4 block.
+        """
+        compressed: bytes
+        if self.dictionary is None:
+            compressed = self._block.compress(data)
+        else:
+            compressed = self._block.compress(data, dict=self.dictionary)
+        return compressed
+
+    def decompress(self, data: bytes | memoryview) -> bytes:
+        """
+        Decompresses a size-prefixed LZ4 block.
+        """
+        decompressed: bytes
+        if self.dictionary is None:
+            decompressed = self._block.decompress(data)
+        else:
+            decompressed = self._block.decompress(data, dict=self.dictionary)
+        return decompressed
+
+
+_COMPRESSOR_TYPES: dict[CompressionName, type[ZstdCompressor | Lz4Compressor]] = {
+    "zstd": ZstdCompressor,
+    "lz4": Lz4Compressor,
+}
+
+
+def get_compressor(
+    name: CompressionName, dictionary: bytes | None = None
+) -> CacheCompressor:
+    """
+    Builds the compressor registered under ``name``.
+
+    Args:
+        name: Compression algorithm ("zstd" or "lz4").
+        dictionary: Trained dictionary content, or None.
+
+    Returns:
+        A CacheCompressor instance.
+
+    Raises:
+        CacheCodecError: If the algorithm is unknown or its library is not installed.
+    """
+    compressor_type = _COMPRESSOR_TYPES.get(name)
+    if compressor_type is None:
+        raise CacheCodecError(f"Unknown cache compression '{name}'")
+    try:
+        return compressor_type(dictionary=dictionary)
+    except ImportError as e:
+        raise CacheCodecError(
+            f"Cache compression '{name}' requires the '{name}' package to be installed"
+        ) from e
+
+
+def available_decompressors(
+    dictionaries: Sequence[bytes] = (),
+) -> dict[tuple[int, int], CacheCompressor]:
+    """
+    Returns every usable compressor keyed by (algorithm flag, dictionary id).
+
+    Entries with dictionary id 0 decompress payloads written without a dictionary.
+
+    Args:
+        dictionaries: Dictionaries payloads may have been compressed with.
+    """
+    decompressors: dict[tuple[int, int], CacheCompressor] = {}
+    for name, compressor_type in _COMPRESSOR_TYPES.items():
+        for dictionary in (None, *dictionaries):
+            try:
+                compressor = get_compressor(name, dictionary)
+            except CacheCodecError:
+                continue
+            key_id = dictionary_id(dictionary) if dictionary is not None else 0
+            decompressors[compressor_type.flag, key_id] = compressor
+    return decompressors
+
+
+def train_dictionary(samples: Sequence[bytes], size: int = 16 * 1024) -> bytes:
+    """
+    Trains a zstd dictionary from encoded sample payloads.
+
+    The dictionary is also usable by the LZ4 compressor.
+
+    Args:
+        samples: Encoded payloads representative of the cached data.
+        size: Maximum dictionary size in bytes.
+
+    Returns:
+        The dictionary content.
+
+    Raises:
+        CacheCodecError: If zstandard is missing or training fails.
+    """
+    try:
+        import zstandard
+    except ImportError as e:
+        raise CacheCodecError(
+            "Training a dictionary requires the 'zstandard' package"
+        ) from e
+    try:
+        return zstandard.train_dictionary(size, list(samples)).as_bytes()
+    except zstandard.ZstdError as e:
+        raise CacheCodecError(f"Failed to train compression dictionary: {e}") from e
@@ -0,0 +1,6 @@
+from typing import final
+
+
+@final
+class CacheCodecError(Exception):
+    """Exception raised when a cache payload cannot be encoded or decoded."""
@@ -0,0 +1,45 @@
+"""Reporting of cache backend failures that clients turn into misses.
+
+Cache clients log backend errors and answer as if the entry were missing, so
+a failing backend looks like an empty one to their callers. Clients also
+report these errors through ``report_cache_failure``; code that needs to tell
+the two apart, such as the circuit breaker, wraps its calls in
+``capture_cache_failures``. The failures are collected per task context, so
+concurrent requests never see each other's failures.
+"""
+
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+_captured_failures: ContextVar[list[BaseException] | None] = ContextVar(
+    "captured_cache_failures", default=None
+)
+
+
+def report_cache_failure(error: BaseException) -> None:
+    """
+    Reports a backend error hidden behind a cache miss or a failed write.
+
+    Args:
+        error: Error raised by the cache backend.
+    """
+    failures = _captured_failures.get()
+    if failures is not None:
+        failures.append(error)
+
+
+@contextmanager
+def capture_cache_failures() -> Iterator[list[BaseException]]:
+    """
+    Collects the failures reported by cache calls made inside the block.
+
+    Yields:
+        The list the failures are appended to.
+    """
+    failures: list[BaseException] = []
+    token = _captured_failures.set(failures)
+    try:
+        yield failures
+    finally:
+        _captured_failures.reset(token)
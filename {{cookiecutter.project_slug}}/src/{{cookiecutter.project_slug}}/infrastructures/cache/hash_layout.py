@@ -0,0 +1,116 @@
+"""Memory-compact layout of UUID-keyed cache entries in bucketed Redis hashes.
+
+Each top-level Redis key costs several dozen bytes of overhead (dictionary
+entry, key object, expiry entry) on top of its name and value. With tens of
+millions of artifacts, that overhead dominates. In the hashed layout, entries
+whose key ends with a canonical UUID are stored as fields of small hashes:
+
+- the bucket key is the key stem followed by ``#`` and the first
+  ``prefix_length`` hex digits of the UUID, e.g.
+  ``antiques:artifact:v1:g0:#3f2a``;
+- the field is the 16-byte binary UUID instead of its 36-character text form.
+
+Small hashes use Redis' compact listpack encoding as long as they hold at most
+``hash-max-listpack-entries`` fields of at most ``hash-max-listpack-value``
+bytes. Pick ``prefix_length`` to keep buckets below the former (with the
+default of 128, 16^4 = 65,536 buckets fit about 8 million entries) and raise
+the latter above the size of typical payloads.
+
+Entry TTLs are hash-field TTLs (HEXPIRE, Redis 7.4 or later). A field and its
+TTL are written by one script, so an entry is never left without a TTL. Keys
+that do not end with a canonical UUID keep the plain string layout.
+"""
+
+from dataclasses import dataclass
+import hashlib
+from typing import final
+from uuid import UUID
+
+# Length of the canonical text form of a UUID.
+_UUID_LENGTH = 36
+_BUCKET_SEPARATOR = "#"
+
+# KEYS[1]: bucket, ARGV: field, value, ttl. Scripts run atomically, and a
+# field whose TTL cannot be set is removed again instead of living forever.
+HASH_SET_SCRIPT = """
+redis.call('HSET', KEYS[1], ARGV[1], ARGV[2])
+local expired = redis.pcall('HEXPIRE', KEYS[1], ARGV[3], 'FIELDS', 1, ARGV[1])
+if type(expired) == 'table' and expired.err then
+    redis.call('HDEL', KEYS[1], ARGV[1])
+end
+return expired
+"""
+HASH_SET_SCRIPT_SHA = hashlib.sha1(
+    HASH_SET_SCRIPT.encode(), usedforsecurity=False
+).hexdigest()
+
+
+@final
+@dataclass(frozen=True, slots=True, kw_only=True)
+class HashBucketLayout:
+    """
+    Maps UUID-keyed cache keys to a hash bucket and a binary field.
+
+    Attributes:
+        prefix_length: Number of leading hex digits of the UUID naming its bucket.
+    """
+
+    prefix_length: int = 4
+
+    def __post_init__(self) -> None:
+        if not 1 <= self.prefix_length <= 8:
+            raise ValueError("prefix_length must be between 1 and 8")
+
+    def locate(self, key: str) -> tuple[str, bytes] | None:
+        """
+        Returns the bucket key and the field storing a cache key.
+
+        Args:
+            key: Cache key.
+
+        Returns:
+            The bucket key and the binary field, or None if the key does not end
+            with a canonical UUID and is stored as a plain string.
+        """
+        stem, text = key[:-_UUID_LENGTH], key[-_UUID_LENGTH:]
+        if not stem or _BUCKET_SEPARATOR in stem:
+            return None
+        try:
+            uuid = UUID(text)
+        except ValueError:
+            return None
+        # Only the canonical form maps back to the same key.
+        if str(uuid) != text:
+            return None
+        return f"{stem}{_BUCKET_SEPARATOR}{text[: self.prefix_length]}", uuid.bytes
+
+    @staticmethod
+    def key_of(bucket_key: str | bytes, field: bytes) -> str:
+        """
+        Returns the cache key stored in a field of a bucket.
+
+        Args:
+            bucket_key: Key of the bucket.
+            field: Binary UUID field.
+        """
+        if isinstance(bucket_key, bytes):
+            bucket_key = bucket_key.decode()
+        stem = bucket_key.rpartition(_BUCKET_SEPARATOR)[0]
+        return f"{stem}{UUID(bytes=field)}"
+
+    @staticmethod
+    def bucket_pattern(pattern: str) -> str:
+        """
+        Returns a SCAN pattern matching every bucket that may hold keys matching ``pattern``.
+
+        Args:
+            pattern: Glob-style pattern of cache keys.
+        """
+        literal_end = min(
+            (i for i, char in enumerate(pattern) if char in "*?[\\"),
+            default=len(pattern),
+        )
+        # UUIDs contain no colon, so the pattern up to its last literal colon is
+        # a prefix of the stem of every matching key.
+        stem_prefix = pattern[: pattern.rfind(":", 0, literal_end) + 1]
+        return f"{stem_prefix}*{_BUCKET_SEPARATOR}*"
@@ -0,0 +1,124 @@
+import asyncio
+from dataclasses import dataclass, field, replace
+from datetime import UTC, datetime
+from typing import final
+from uuid import uuid4
+
+import structlog
+
+from {{cookiecutter.project_slug}}.application.dtos.cache import CacheInvalidationJobDTO
+from {{cookiecutter.project_slug}}.application.interfaces.cache import (
+    CacheInvalidationJobsProtocol,
+    CacheProtocol,
+)
+
+logger = structlog.get_logger(__name__)
+
+
+@final
+@dataclass(slots=True, kw_only=True)
+class AsyncioCacheInvalidationJobs(CacheInvalidationJobsProtocol):
+    """
+    In-process implementation of the CacheInvalidationJobsProtocol.
+
+    Every job streams ``CacheProtocol.iter_clear`` in an asyncio task and
+    updates its progress after each batch. The instance is meant to live for
+    the whole worker (APP scope); job state is per worker and only the most
+    recent ``max_finished_jobs`` finished jobs are remembered.
+
+    Attributes:
+        cache_client: Cache whose keys are invalidated.
+        max_finished_jobs: Number of finished jobs kept for status queries.
+    """
+
+    cache_client: CacheProtocol
+    max_finished_jobs: int = 100
+    _jobs: dict[str, CacheInvalidationJobDTO] = field(default_factory=dict, init=False)
+    _tasks: dict[str, asyncio.Task[None]] = field(default_factory=dict, init=False)
+
+    def start(self, pattern: str) -> CacheInvalidationJobDTO:
+        """
+        Starts invalidating every cache key matching ``pattern``.
+
+        Args:
+            pattern: Pattern to match keys (e.g., 'user:*').
+
+        Returns:
+            Snapshot of the newly started job.
+        """
+        job = CacheInvalidationJobDTO(
+            job_id=uuid4().hex,
+            pattern=pattern,
+            status="running",
+            deleted=0,
+            batches=0,
+            started_at=datetime.now(UTC),
+        )
+        self._jobs[job.job_id] = job
+        task = asyncio.create_task(self._run(job.job_id))
+        self._tasks[job.job_id] = task
+        task.add_done_callback(lambda _: self._tasks.pop(job.job_id, None))
+        logger.info(
+            "Cache invalidation job started", job_id=job.job_id, pattern=pattern
+        )
+        self._forget_finished()
+        return job
+
+    def get(self, job_id: str) -> CacheInvalidationJobDTO | None:
+        """
+        Returns the current state of a job, or None if it is unknown.
+        """
+        return self._jobs.get(job_id)
+
+    async def close(self) -> None:
+        """
+        Cancels running jobs and waits for them to stop.
+        """
+        tasks = list(self._tasks.values())
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def _run(self, job_id: str) -> None:
+        """
+        Streams the invalidation and records its progress.
+        """
+        job = self._jobs[job_id]
+        try:
+            async for deleted in self.cache_client.iter_clear(job.pattern):
+                job = replace(
+                    job, deleted=job.deleted + deleted, batches=job.batches + 1
+                )
+                self._jobs[job_id] = job
+        except asyncio.CancelledError:
+            self._jobs[job_id] = replace(
+                job, status="cancelled", finished_at=datetime.now(UTC)
+            )
+            raise
+        except Exception as e:
+            logger.exception(
+                "Cache invalidation job failed", job_id=job_id, pattern=job.pattern
+            )
+            self._jobs[job_id] = replace(
+                job, status="failed", finished_at=datetime.now(UTC), error=str(e)
+            )
+        else:
+            self._jobs[job_id] = replace(
+                job, status="completed", finished_at=datetime.now(UTC)
+            )
+            logger.info(
+                "Cache invalidation job completed",
+                job_id=job_id,
+                pattern=job.pattern,
+                deleted=job.deleted,
+            )
+
+    def _forget_finished(self) -> None:
+        """
+        Drops the oldest finished jobs beyond ``max_finished_jobs``.
+        """
+        finished = [
+            job_id for job_id, job in self._jobs.items() if job.status != "running"
+        ]
+        for job_id in finished[: max(len(finished) - self.max_finished_jobs, 0)]:
+            del self._jobs[job_id]
@@ -0,0 +1,153 @@
+import asyncio
+from dataclasses import dataclass, field
+import time
+from typing import Protocol, final
+
+import structlog
+
+from {{cookiecutter.project_slug}}.application.interfaces.cache import CacheKeyBuilderProtocol
+from {{cookiecutter.project_slug}}.infrastructures.cache.circuit_breaker import (
+    CacheBypassedError,
+    CacheCircuitBreaker,
+    guard_cache_call,
+)
+
+try:
+    import redis.exceptions
+except ImportError:  # redis-py is only installed with the Redis-family cache backends
+    _ERRORS: tuple[type[Exception], ...] = (ConnectionError,)
+else:
+    _ERRORS = (ConnectionError, redis.exceptions.RedisError)
+
+logger = structlog.get_logger(__name__)
+
+
+class GenerationStoreProtocol(Protocol):
+    """
+    Store of integer counters, satisfied by Redis clients and TarantoolCounters.
+    """
+
+    async def get(self, name: str) -> bytes | int | None: ...
+
+    async def incr(self, name: str) -> int: ...
+
+
+@final
+@dataclass(slots=True, kw_only=True)
+class VersionedKeyBuilder(CacheKeyBuilderProtocol):
+    """
+    Builds cache keys of the form ``{prefix}{namespace}:v{schema}:g{generation}:{id}``.
+
+    The schema version is bumped in code whenever the cached representation
+    changes; the generation is a counter stored in the cache backend and bumped at runtime
+    to invalidate the whole namespace with a single increment. Each worker caches
+    the generation for ``refresh_interval`` seconds, so other workers switch
+    to a new generation within that interval.
+
+    With ``breaker``, generation fetches go through the cache circuit breaker:
+    they are bounded by its call timeout and skipped while the cache is
+    bypassed, keeping the last known generation. Bumps are never skipped.
+
+    Attributes:
+        client: Counter store holding the generation counter.
+        prefix: Prefix shared by every key of the application (e.g., 'antiques:').
+        namespace: Kind of entity the keys belong to (e.g., 'artifact').
+        schema_version: Version of the cached representation.
+        refresh_interval: Seconds a fetched generation is reused locally.
+        breaker: Cache circuit breaker guarding the generation fetches.
+    """
+
+    client: GenerationStoreProtocol
+    prefix: str
+    namespace: str
+    schema_version: int
+    refresh_interval: float = 5.0
+    breaker: CacheCircuitBreaker | None = None
+    _generation: int = field(default=0, init=False)
+    _fetched_at: float | None = field(default=None, init=False)
+    _lock: asyncio.Lock = field(default_factory=asyncio.Lock, init=False)
+
+    @property
+    def generation_key(self) -> str:
+        """
+        Returns the key of the namespace generation counter.
+        """
+        return f"{self.prefix}{self.namespace}:generation"
+
+    async def build(self, identifier: str) -> str:
+        """
+        Builds the cache key of an entity for the current generation.
+
+        Args:
+            identifier: Identifier of the entity (e.g., an inventory ID).
+
+        Returns:
+            The versioned cache key.
+        """
+        generation = await self._current_generation()
+        return (
+            f"{self.prefix}{self.namespace}:v{self.schema_version}"
+            f":g{generation}:{identifier}"
+        )
+
+    async def bump_generation(self) -> int:
+        """
+        Atomically increments the generation counter.
+
+        Returns:
+            The new generation number.
+
+        Raises:
+            redis.exceptions.RedisError: If the counter cannot be incremented in Redis.
+            ConnectionError: If the counter cannot be incremented in Tarantool.
+        """
+        generation = await self.client.incr(self.generation_key)
+        self._generation = generation
+        self._fetched_at = time.monotonic()
+        logger.info(
+            "Cache generation bumped",
+            namespace=self.namespace,
+            generation=generation,
+        )
+        return generation
+
+    async def _current_generation(self) -> int:
+        """
+        Returns the locally cached generation, refreshing it when outdated.
+        """
+        if not self._is_outdated():
+            return self._generation
+        async with self._lock:
+            # Another coroutine may have refreshed it while we were waiting.
+            if self._is_outdated():
+                await self._refresh()
+        return self._generation
+
+    def _is_outdated(self) -> bool:
+        """
+        Checks whether the cached generation must be fetched again.
+        """
+        return (
+            self._fetched_at is None
+            or time.monotonic() - self._fetched_at >= self.refresh_interval
+        )
+
+    async def _refresh(self) -> None:
+        """
+        Fetches the generation from the store, keeping the last known one on errors.
+        """
+        try:
+            async with guard_cache_call(self.breaker):
+                value = await self.client.get(self.generation_key)
+        except CacheBypassedError:
+            pass
+        except _ERRORS as e:
+            logger.error(
+                "Failed to fetch cache generation, keeping the last known one",
+                namespace=self.namespace,
+                generation=self._generation,
+                error=str(e),
+            )
+        else:
+            self._generation = int(value) if value is not None else 0
+        self._fetched_at = time.monotonic()
@@ -0,0 +1,549 @@
+import asyncio
+from collections import OrderedDict
+from collections.abc import AsyncIterator, Mapping, Sequence
+import contextlib
+from dataclasses import dataclass, field
+from fnmatch import fnmatchcase
+import json
+import time
+from typing import Any, final
+from uuid import uuid4
+
+import structlog
+
+from {{cookiecutter.project_slug}}.application.dtos.cache import HotCacheKeyDTO
+from {{cookiecutter.project_slug}}.application.interfaces.cache import (
+    CacheProtocol,
+    HotKeyTrackerProtocol,
+)
+from {{cookiecutter.project_slug}}.infrastructures.cache.circuit_breaker import (
+    CacheCircuitBreaker,
+    CircuitBreakerCacheClient,
+)
+from {{cookiecutter.project_slug}}.infrastructures.cache.redis_client import RedisCacheClient, RedisClient
+from {{cookiecutter.project_slug}}.infrastructures.cache.sketch import CountMinSketch
+
+try:
+    import redis.exceptions
+except ImportError:  # redis-py is only installed with the Redis-family cache backends
+    _ERRORS: tuple[type[Exception], ...] = (ConnectionError,)
+else:
+    _ERRORS = (ConnectionError, redis.exceptions.RedisError)
+
+logger = structlog.get_logger(__name__)
+
+# Counters of the count-min sketch saturate at this value.
+_MAX_FREQUENCY = 255
+
+
+@final
+@dataclass(slots=True, kw_only=True)
+class TinyLFUCache:
+    """
+    Bounded in-process LRU store guarded by a TinyLFU admission policy.
+
+    When the store is full, a new key only replaces the least recently used
+    entry if the frequency sketch has seen it more often than the victim.
+    This keeps one-off lookups from flushing genuinely hot entries. With a
+    ``min_frequency``, only keys read at least that often are admitted at all,
+    which turns the store into a small cache of hot keys.
+
+    Attributes:
+        max_size: Maximum number of entries kept in memory.
+        ttl: Local time-to-live in seconds (None keeps entries until evicted).
+        min_frequency: Recent reads a key needs to be admitted (at most 255).
+    """
+
+    max_size: int
+    ttl: float | None = None
+    min_frequency: int = 0
+    _entries: OrderedDict[str, tuple[float, Any]] = field(
+        default_factory=OrderedDict, init=False
+    )
+    _sketch: CountMinSketch = field(init=False)
+
+    def __post_init__(self) -> None:
+        """
+        Validates the admission threshold and sizes the sketch after the capacity.
+        """
+        if not 0 <= self.min_frequency <= _MAX_FREQUENCY:
+            raise ValueError(f"min_frequency must be between 0 and {_MAX_FREQUENCY}")
+        self._sketch = CountMinSketch(
+            width=max(self.max_size, 16), sample_size=10 * max(self.max_size, 16)
+        )
+
+    def __len__(self) -> int:
+        """
+        Returns the number of entries currently stored.
+        """
+        return len(self._entries)
+
+    def __contains__(self, key: object) -> bool:
+        """
+        Checks whether ``key`` is stored and unexpired, without recording an access.
+        """
+        entry = self._entries.get(key) if isinstance(key, str) else None
+        return entry is not None and not 0 < entry[0] <= time.monotonic()
+
+    def frequency(self, key: str) -> int:
+        """
+        Returns the recent read count of ``key`` estimated by the admission sketch.
+        """
+        return self._sketch.estimate(key)
+
+    def get(self, key: str) -> Any | None:
+        """
+        Returns the stored value for ``key`` and records the access.
+
+        Args:
+            key: Key to look up.
+
+        Returns:
+            The stored value, or None if absent or expired.
+        """
+        self._sketch.add(key)
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at and expires_at <= time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    def put(self, key: str, value: Any) -> bool:
+        """
+        Stores ``value`` under ``key`` if the admission policy accepts it.
+
+        Args:
+            key: Key to store under.
+            value: Value to keep in memory.
+
+        Returns:
+            True if the value was stored, False if admission was rejected.
+        """
+        if self._sketch.estimate(key) < self.min_frequency:
+            return False
+        expires_at = time.monotonic() + self.ttl if self.ttl else 0.0
+        if key in self._entries or len(self._entries) < self.max_size:
+            self._entries[key] = (expires_at, value)
+            self._entries.move_to_end(key)
+            return True
+        victim = next(iter(self._entries))
+        if self._sketch.estimate(key) <= self._sketch.estimate(victim):
+            return False
+        del self._entries[victim]
+        self._entries[key] = (expires_at, value)
+        return True
+
+    def discard(self, key: str) -> None:
+        """
+        Removes ``key`` from the store if present.
+        """
+        self._entries.pop(key, None)
+
+    def discard_matching(self, pattern: str) -> int:
+        """
+        Removes every key matching a glob-style pattern.
+
+        Args:
+            pattern: Redis-style glob pattern (e.g., 'user:*').
+
+        Returns:
+            Number of entries removed.
+        """
+        matching = [key for key in self._entries if fnmatchcase(key, pattern)]
+        for key in matching:
+            del self._entries[key]
+        return len(matching)
+
+    def clear(self) -> None:
+        """
+        Removes every entry from the store.
+        """
+        self._entries.clear()
+
+
+@final
+@dataclass(slots=True, kw_only=True)
+class HotKeyTracker(HotKeyTrackerProtocol):
+    """
+    Per-worker ranking of the most read keys of a near cache.
+
+    Reads are counted by the admission sketch of the L1 store, which ages
+    with the traffic it sees; the tracker only remembers the ``top_k`` keys
+    with the highest estimates for introspection.
+
+    Attributes:
+        local: L1 store counting the reads, or None without a near cache, in
+            which case no key is ever reported.
+        top_k: Number of hottest keys remembered for introspection.
+    """
+
+    local: TinyLFUCache | None = None
+    top_k: int = 32
+    _top: dict[str, int] = field(default_factory=dict, init=False)
+
+    def record(self, key: str) -> None:
+        """
+        Ranks ``key`` after a read counted by the L1 store.
+
+        Args:
+            key: Cache key that was read.
+        """
+        if self.local is None:
+            return
+        estimate = self.local.frequency(key)
+        top = self._top
+        if key in top or len(top) < self.top_k:
+            top[key] = estimate
+        else:
+            coldest = min(top, key=top.__getitem__)
+            if estimate > top[coldest]:
+                del top[coldest]
+                top[key] = estimate
+
+    def hot_keys(self, limit: int) -> list[HotCacheKeyDTO]:
+        """
+        Returns the most frequently read keys, most read first.
+
+        Args:
+            limit: Maximum number of keys to return.
+
+        Returns:
+            Snapshots of the hottest keys seen by this worker.
+        """
+        local = self.local
+        if local is None:
+            return []
+        # The sketch ages with traffic, so estimates are re-read before ranking.
+        self._top = {
+            key: estimate for key in self._top if (estimate := local.frequency(key)) > 0
+        }
+        ranked = sorted(self._top.items(), key=lambda item: item[1], reverse=True)
+        return [
+            HotCacheKeyDTO(key=key, estimated_reads=estimate, pinned=key in local)
+            for key, estimate in ranked[:limit]
+        ]
+
+
+@final
+@dataclass(slots=True, kw_only=True)
+class NearCacheClient(CacheProtocol):
+    """
+    Two-tier CacheProtocol implementation: an in-process L1 in front of Redis.
+
+    Reads are served from the local TinyLFU store whenever possible, so hot
+    entries cost neither a network round trip nor payload decoding. Writes go
+    to Redis first and are then announced on a pub/sub channel; every worker
+    subscribed to the channel drops the affected keys from its own L1.
+    If the subscription is lost, the L1 is flushed because invalidations may
+    have been missed while disconnected.
+
+    A Redis Cluster client cannot subscribe, so ``pubsub_client`` then holds a
+    plain connection to one cluster node; cluster PUBLISH reaches every node.
+
+    L1 hits never reach Redis, so with read expiration on the remote cache the
+    L1 TTL must be shorter than its ``min_ttl``: hot entries are then re-read
+    from Redis, which re-arms their TTL, before they could drop out of the
+    re-arm window. Adaptive TTLs count these re-reads rather than L1 hits.
+
+    With ``hot_keys``, every read is also ranked for hot-key introspection.
+
+    With ``breaker``, the calls to Redis go through the circuit breaker, which
+    thus sits between the two tiers: L1 hits are neither recorded as Redis
+    calls nor lost while Redis is bypassed.
+    """
+
+    remote: RedisCacheClient
+    local: TinyLFUCache
+    channel: str
+    pubsub_client: RedisClient | None = None
+    hot_keys: HotKeyTracker | None = None
+    breaker: CacheCircuitBreaker | None = None
+    reconnect_delay: float = 1.0
+    instance_id: str = field(default_factory=lambda: uuid4().hex)
+    _epoch: int = field(default=0, init=False)
+    _listener: asyncio.Task[None] | None = field(default=None, init=False)
+    _remote: CacheProtocol = field(init=False)
+
+    def __post_init__(self) -> None:
+        read_expiration = self.remote.read_expiration
+        if read_expiration.enabled and (
+            self.local.ttl is None or self.local.ttl >= read_expiration.min_ttl
+        ):
+            raise ValueError(
+                "With read expiration the near cache TTL must be below min_ttl"
+            )
+        self._remote = (
+            CircuitBreakerCacheClient(remote=self.remote, breaker=self.breaker)
+            if self.breaker is not None
+            else self.remote
+        )
+
+    async def start(self) -> None:
+        """
+        Starts the background task listening for invalidation messages.
+        """
+        if self._listener is None:
+            self._listener = asyncio.create_task(self._listen())
+
+    async def get(self, key: str) -> dict[str, Any] | None:
+        """
+        Retrieves a value from the L1 store, falling back to Redis.
+
+        Args:
+            key: Cache key to retrieve.
+
+        Returns:
+            Cached dictionary data or None if not found. The returned
+            dictionary is shared with the L1 store and must not be mutated.
+        """
+        value: dict[str, Any] | None = self.local.get(key)
+        if self.hot_keys is not None:
+            self.hot_keys.record(key)
+        if value is not None:
+            return value
+        epoch = self._epoch
+        value = await self._remote.get(key)
+        # Skip the fill if an invalidation arrived while Redis was answering.
+        if value is not None and epoch == self._epoch:
+            self.local.put(key, value)
+        return value
+
+    async def set(
+        self, key: str, value: dict[str, Any], ttl: int | None = None
+    ) -> bool:
+        """
+        Stores a value in Redis, keeps it locally and invalidates other workers.
+
+        Args:
+            key: Cache key to store under.
+            value: Dictionary data to cache.
+            ttl: Time-to-live in seconds (None for default).
+
+        Returns:
+            True if successful, False otherwise.
+        """
+        stored = await self._remote.set(key, value, ttl)
+        self.local.discard(key)
+        if stored:
+            self.local.put(key, value)
+            await self._publish({"keys": [key]})
+        return stored
+
+    async def delete(self, key: str) -> bool:
+        """
+        Deletes a value from both tiers and invalidates other workers.
+
+        Args:
+            key: Cache key to delete.
+
+        Returns:
+            True if key was deleted from Redis, False otherwise.
+        """
+        self.local.discard(key)
+        deleted = await self._remote.delete(key)
+        await self._publish({"keys": [key]})
+        return deleted
+
+    async def exists(self, key: str) -> bool:
+        """
+        Checks if a key exists in the L1 store or in Redis.
+
+        Args:
+            key: Cache key to check.
+
+        Returns:
+            True if key exists, False otherwise.
+        """
+        if self.local.get(key) is not None:
+            return True
+        return await self._remote.exists(key)
+
+    async def get_many(self, keys: Sequence[str]) -> dict[str, dict[str, Any] | None]:
+        """
+        Retrieves several values, reading only L1 misses from Redis.
+
+        Args:
+            keys: Cache keys to retrieve.
+
+        Returns:
+            Mapping of every requested key to its cached dictionary data or None.
+        """
+        results: dict[str, dict[str, Any] | None] = {}
+        missing: list[str] = []
+        for key in keys:
+            value = self.local.get(key)
+            if self.hot_keys is not None:
+                self.hot_keys.record(key)
+            results[key] = value
+            if value is None:
+                missing.append(key)
+        if missing:
+            epoch = self._epoch
+            remote_values = await self._remote.get_many(missing)
+            for key, value in remote_values.items():
+                results[key] = value
+                if value is not None and epoch == self._epoch:
+                    self.local.put(key, value)
+        return results
+
+    async def set_many(
+        self, items: Mapping[str, dict[str, Any]], ttl: int | None = None
+    ) -> dict[str, bool]:
+        """
+        Stores several values in Redis and invalidates them on other workers.
+
+        Args:
+            items: Mapping of cache keys to dictionary data to cache.
+            ttl: Time-to-live in seconds applied to every key (None for default).
+
+        Returns:
+            Mapping of every key to True if it was stored, False otherwise.
+        """
+        results = await self._remote.set_many(items, ttl)
+        for key, stored in results.items():
+            self.local.discard(key)
+            if stored:
+                self.local.put(key, items[key])
+        if stored_keys := [key for key, stored in results.items() if stored]:
+            await self._publish({"keys": stored_keys})
+        return results
+
+    async def delete_many(self, keys: Sequence[str]) -> dict[str, bool]:
+        """
+        Deletes several values from both tiers and invalidates other workers.
+
+        Args:
+            keys: Cache keys to delete.
+
+        Returns:
+            Mapping of every key to True if it was deleted from Redis.
+        """
+        for key in keys:
+            self.local.discard(key)
+        results = await self._remote.delete_many(keys)
+        if keys:
+            await self._publish({"keys": list(keys)})
+        return results
+
+    async def clear(self, pattern: str) -> int:
+        """
+        Clears matching entries in both tiers and invalidates other workers.
+
+        Args:
+            pattern: Pattern to match keys (e.g., 'user:*').
+
+        Returns:
+            Number of keys deleted from Redis.
+        """
+        self.local.discard_matching(pattern)
+        deleted = await self._remote.clear(pattern)
+        await self._publish({"pattern": pattern})
+        return deleted
+
+    async def iter_clear(self, pattern: str) -> AsyncIterator[int]:
+        """
+        Clears matching entries batch by batch and invalidates other workers.
+
+        Other workers are notified even if Redis fails midway, since some of
+        the keys may already be gone.
+
+        Args:
+            pattern: Pattern to match keys (e.g., 'user:*').
+
+        Yields:
+            Number of keys deleted from Redis by each batch.
+        """
+        self.local.discard_matching(pattern)
+        try:
+            async for deleted in self._remote.iter_clear(pattern):
+                yield deleted
+        finally:
+            self.local.discard_matching(pattern)
+            await self._publish({"pattern": pattern})
+
+    def handle_invalidation(self, data: str | bytes) -> None:
+        """
+        Applies an invalidation message received from the pub/sub channel.
+
+        Messages published by this instance are ignored, since the local
+        store was already updated when the write happened.
+
+        Args:
+            data: JSON-encoded invalidation message.
+        """
+        try:
+            message = json.loads(data)
+        except (json.JSONDecodeError, TypeError) as e:
+            logger.warning("Malformed cache invalidation message", error=str(e))
+            return
+        if message.get("origin") == self.instance_id:
+            return
+        self._epoch += 1
+        for key in message.get("keys", ()):
+            self.local.discard(key)
+        if pattern := message.get("pattern"):
+            self.local.discard_matching(pattern)
+
+    async def close(self) -> None:
+        """
+        Stops the invalidation listener and closes the pub/sub client.
+
+        The remote cache and its Redis client are owned, and closed, by
+        whoever created them.
+        """
+        if self._listener is not None:
+            self._listener.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._listener
+            self._listener = None
+        self.local.clear()
+        if self.pubsub_client is not None:
+            await self.pubsub_client.close()
+
+    async def _publish(self, message: dict[str, Any]) -> None:
+        """
+        Publishes an invalidation message for other workers.
+        """
+        message["origin"] = self.instance_id
+        try:
+            await self.remote.client.publish(self.channel, json.dumps(message))
+        except _ERRORS as e:
+            logger.error(
+                "Failed to publish cache invalidation",
+                channel=self.channel,
+                error=str(e),
+            )
+
+    async def _listen(self) -> None:
+        """
+        Consumes invalidation messages, resubscribing after connection errors.
+        """
+        while True:
+            subscriber = self.pubsub_client or self.remote.client
+            pubsub = subscriber.pubsub(ignore_subscribe_messages=True)
+            try:
+                await pubsub.subscribe(self.channel)
+                # Anything cached before (re)subscribing may have missed invalidations.
+                self._epoch += 1
+                self.local.clear()
+                logger.info(
+                    "Subscribed to cache invalidation channel", channel=self.channel
+                )
+                async for message in pubsub.listen():
+                    if message and message.get("type") == "message":
+                        self.handle_invalidation(message["data"])
+            except _ERRORS as e:
+                logger.error(
+                    "Cache invalidation subscription lost",
+                    channel=self.channel,
+                    error=str(e),
+                )
+                self._epoch += 1
+                self.local.clear()
+                await asyncio.sleep(self.reconnect_delay)
+            finally:
+                await pubsub.close()
@@ -0,0 +1,129 @@
+"""Read-driven expiration of Redis cache entries.
+
+With a ReadExpirationPolicy, reads also re-arm the TTL of the entry they hit,
+so the TTL set at write time only bounds entries that are never read again:
+
+- ``sliding``: every read re-arms the TTL to ``ttl`` (GETEX), so entries expire
+  after ``ttl`` seconds without reads.
+- ``adaptive``: every read also increments a per-entry read counter and the
+  TTL is set from it, from ``min_ttl`` after a one-off read up to ``max_ttl``
+  for hot entries. Entries read once are thus evicted sooner than they were
+  written for, and lose the stale-if-error window of their envelope.
+
+The read, the counter update and the TTL change run in one Lua script, so
+they cost a single round trip and stay atomic.
+
+A sliding read never shortens a TTL: the re-armed TTL is at least what the
+entry had left, so the stale-if-error window of the freshness envelope is
+kept. The script also returns the remaining TTL, from which the Redis client
+pushes out the hard expiry of the envelope (see ``CacheFreshnessPolicy.extend``),
+so hot entries stay servable as long as they stay resident. Entries written
+with less than ``min_ttl`` seconds left, such as negative-cache tombstones,
+and entries without a TTL are never re-armed; in adaptive mode, entries
+shortened by an earlier read are told apart from them by their read counter.
+"""
+
+from dataclasses import dataclass
+import hashlib
+from typing import Literal, final
+
+ReadExpirationMode = Literal["fixed", "sliding", "adaptive"]
+
+READ_EXPIRATION_SCRIPT = """
+-- KEYS[1]: cache entry, KEYS[2]: read counter of the entry
+-- ARGV: mode, ttl, min_ttl, max_ttl, hot_reads
+-- Returns the entry and its remaining TTL in milliseconds, or false if missing.
+local remaining = redis.call('PTTL', KEYS[1])
+if remaining == -2 then
+    return false
+end
+local adaptive = ARGV[1] == 'adaptive'
+local ttl, min_ttl = tonumber(ARGV[2]), tonumber(ARGV[3])
+if remaining == -1 or (remaining <= min_ttl * 1000
+        and not (adaptive and redis.call('EXISTS', KEYS[2]) == 1)) then
+    return {redis.call('GET', KEYS[1]), remaining}
+end
+if adaptive then
+    -- min_ttl after the first read, ttl after hot_reads reads, then up to max_ttl.
+    local reads, hot_reads = redis.call('INCR', KEYS[2]), tonumber(ARGV[5])
+    if hot_reads > 1 then
+        ttl = min_ttl + math.floor((ttl - min_ttl) * (reads - 1) / (hot_reads - 1))
+    end
+    ttl = math.min(tonumber(ARGV[4]), ttl)
+    redis.call('EXPIRE', KEYS[2], ttl)
+    remaining = ttl * 1000
+else
+    -- A sliding read never shortens the lifetime the entry was written with.
+    remaining = math.max(ttl * 1000, remaining)
+end
+return {redis.call('GETEX', KEYS[1], 'PX', remaining), remaining}
+"""
+
+READ_EXPIRATION_SCRIPT_SHA = hashlib.sha1(
+    READ_EXPIRATION_SCRIPT.encode(), usedforsecurity=False
+).hexdigest()
+
+
+def read_counter_key(key: str) -> str:
+    """
+    Returns the key of the read counter of a cache entry.
+
+    The counter hashes to the same cluster slot as the entry, so the script
+    touching both can run on a Redis Cluster.
+
+    Args:
+        key: Cache key of the entry.
+    """
+    if "{" in key:
+        # The entry already has a hash tag; appending keeps it.
+        return f"{key}:reads"
+    return "{" + key + "}:reads"
+
+
+@final
+@dataclass(frozen=True, slots=True, kw_only=True)
+class ReadExpirationPolicy:
+    """
+    TTL applied to Redis cache entries when they are read.
+
+    In adaptive mode an entry read ``n`` times gets
+    ``min(min_ttl + (ttl - min_ttl) * (n - 1) / (hot_reads - 1), max_ttl)``
+    seconds, so one-off reads get ``min_ttl``, entries read ``hot_reads``
+    times get ``ttl`` and the TTL keeps growing up to ``max_ttl`` after that.
+
+    Attributes:
+        mode: ``fixed`` leaves TTLs as written, ``sliding`` re-arms them to
+            ``ttl`` and ``adaptive`` derives them from the number of reads.
+        ttl: Sliding window in seconds, and the adaptive TTL of a hot entry.
+        min_ttl: Adaptive TTL after a one-off read; entries written with less
+            left are never re-armed.
+        max_ttl: Longest adaptive TTL.
+        hot_reads: Number of reads after which an entry gets ``ttl``.
+    """
+
+    mode: ReadExpirationMode = "fixed"
+    ttl: int = 86400
+    min_ttl: int = 300
+    max_ttl: int = 604800
+    hot_reads: int = 8
+
+    def __post_init__(self) -> None:
+        if not 0 < self.min_ttl <= self.ttl <= self.max_ttl:
+            raise ValueError(
+                "Read expiration TTLs must satisfy 0 < min_ttl <= ttl <= max_ttl"
+            )
+        if self.hot_reads < 1:
+            raise ValueError("hot_reads must be at least 1")
+
+    @property
+    def enabled(self) -> bool:
+        """
+        Checks whether reads change TTLs at all.
+        """
+        return self.mode != "fixed"
+
+    def script_args(self) -> tuple[str, int, int, int, int]:
+        """
+        Returns the ARGV of READ_EXPIRATION_SCRIPT for this policy.
+        """
+        return self.mode, self.ttl, self.min_ttl, self.max_ttl, self.hot_reads
@@ -1,24 +1,200 @@
-from dataclasses import dataclass
-import json
-from typing import Any, final
+from collections.abc import AsyncIterator, Mapping, Sequence
+from dataclasses import dataclass, field
+from fnmatch import fnmatchcase
+from types import TracebackType
+from typing import TYPE_CHECKING, Any, Protocol, Self, final
 
 import structlog
-from redis.asyncio import Redis
-import redis.exceptions
 
+from {{cookiecutter.project_slug}}.application.cache_policy import CacheFreshnessPolicy
 from {{cookiecutter.project_slug}}.application.interfaces.cache import CacheProtocol
+from {{cookiecutter.project_slug}}.infrastructures.cache.codec import CachePayloadSerializer
+from {{cookiecutter.project_slug}}.infrastructures.cache.exceptions import CacheCodecError
+from {{cookiecutter.project_slug}}.infrastructures.cache.failures import report_cache_failure
+from {{cookiecutter.project_slug}}.infrastructures.cache.hash_layout import (
+    HASH_SET_SCRIPT,
+    HASH_SET_SCRIPT_SHA,
+    HashBucketLayout,
+)
+from {{cookiecutter.project_slug}}.infrastructures.cache.read_expiration import (
+    READ_EXPIRATION_SCRIPT,
+    READ_EXPIRATION_SCRIPT_SHA,
+    ReadExpirationPolicy,
+    read_counter_key,
+)
+
+if TYPE_CHECKING:
+    from redis.asyncio.client import PubSub
+
+try:
+    from redis.asyncio import RedisCluster
+    import redis.exceptions
+except ImportError:  # redis-py is only installed with the Redis-family cache backends
+    _ERRORS: tuple[type[Exception], ...] = (ConnectionError,)
+else:
+    _ERRORS = (ConnectionError, redis.exceptions.RedisError)
 
 logger = structlog.get_logger(__name__)
 
+_HASH_LAYOUT_PROBE_KEY = "cache:hash-layout:probe"
+
+
+class RedisPipeline(Protocol):
+    """
+    The Redis commands queued on a pipeline by the cache components.
+
+    Queued commands only buffer the call; their replies are returned by
+    ``execute`` in the order the commands were queued.
+    """
+
+    async def __aenter__(self) -> Self: ...
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+        /,
+    ) -> None: ...
+
+    async def execute(self, raise_on_error: bool = True) -> list[Any]: ...
+
+    def set(self, name: str, value: bytes, /) -> object: ...
+
+    def setex(self, name: str, time: int, value: bytes, /) -> object: ...
+
+    def hset(self, name: str, key: bytes, value: bytes, /) -> object: ...
+
+    def hmget(self, name: str, keys: list[bytes], /) -> object: ...
+
+    def hkeys(self, name: bytes, /) -> object: ...
+
+    def hdel(self, name: str | bytes, /, *keys: bytes) -> object: ...
+
+    def unlink(self, *names: str | bytes) -> object: ...
+
+    def evalsha(
+        self, sha: str, numkeys: int, /, *keys_and_args: str | bytes | int
+    ) -> object: ...
+
+    def sadd(self, name: str, /, *values: str) -> object: ...
+
+    def expire(
+        self, name: str, time: int, /, *, nx: bool = False, gt: bool = False
+    ) -> object: ...
+
+
+class RedisClient(Protocol):
+    """
+    The Redis commands used by the cache components.
+
+    Both a standalone Redis client and a Redis Cluster client serve them; the
+    cluster client routes each command to the shard owning its key.
+    """
+
+    async def get(self, name: str, /) -> bytes | None: ...
+
+    async def set(
+        self,
+        name: str,
+        value: bytes | str,
+        /,
+        *,
+        nx: bool = False,
+        px: int | None = None,
+    ) -> bool | None: ...
+
+    async def setex(self, name: str, time: int, value: bytes, /) -> bool: ...
+
+    async def delete(self, *names: str) -> int: ...
+
+    async def exists(self, *names: str) -> int: ...
+
+    async def incr(self, name: str, /) -> int: ...
+
+    async def pttl(self, name: str, /) -> int: ...
+
+    async def mget(self, keys: Sequence[str], /) -> list[bytes | None]: ...
+
+    async def hget(self, name: str, key: bytes, /) -> bytes | None: ...
+
+    async def hexists(self, name: str, key: bytes, /) -> bool: ...
+
+    async def hdel(self, name: str, /, *keys: bytes) -> int: ...
+
+    async def srem(self, name: str, /, *values: bytes) -> int: ...
+
+    async def eval(
+        self, script: str, numkeys: int, /, *keys_and_args: str
+    ) -> object: ...
+
+    async def script_load(self, script: str, /) -> object: ...
+
+    async def execute_command(self, *args: str | int) -> object: ...
+
+    async def publish(self, channel: str, message: str, /) -> int: ...
+
+    async def close(self) -> None: ...
+
+    def pipeline(self, transaction: bool = True) -> RedisPipeline: ...
+
+    def pubsub(self, *, ignore_subscribe_messages: bool = False) -> "PubSub": ...
+
+    def scan_iter(
+        self,
+        match: str | None = None,
+        count: int | None = None,
+        _type: str | None = None,
+    ) -> AsyncIterator[bytes]: ...
+
+    def sscan_iter(
+        self, name: str, match: str | None = None, count: int | None = None
+    ) -> AsyncIterator[bytes]: ...
+
 
 @final
 @dataclass(frozen=True, slots=True, kw_only=True)
 class RedisCacheClient(CacheProtocol):
     """
     Redis implementation of the CacheProtocol for caching operations.
+
+    Values are framed by a CachePayloadSerializer, so the client is expected
+    to work with raw bytes (``decode_responses=False``).
+
+    Pattern invalidation streams over the keyspace: keys are scanned with
+    ``scan_count`` as the SCAN COUNT hint and unlinked in pipelined batches of
+    ``unlink_batch_size``, so memory use and Redis blocking stay bounded.
+
+    The client may also be a RedisCluster: bulk reads are then split into one
+    MGET per hash slot, pipelines are routed per shard by the cluster client,
+    and pattern invalidation scans every primary.
+
+    With a sliding or adaptive ``read_expiration`` policy, reads also re-arm
+    the TTL of the entries they hit through a Lua script (one EVALSHA per key,
+    pipelined for bulk reads). The ``freshness_policy`` then pushes the hard
+    expiry of the envelopes read out to their re-armed TTL.
+
+    With a ``hash_layout``, entries whose key ends with a UUID are stored as
+    fields of small bucketed hashes instead of top-level strings, which cuts
+    the per-entry memory overhead (see ``hash_layout``). Bulk reads then issue
+    one HMGET per bucket and pattern invalidation also scans the buckets.
+
+    The client is shared with other components and is owned, and closed, by
+    whoever created it.
     """
-    client: Redis
+
+    client: RedisClient
     ttl: int | None = None
+    scan_count: int = 1000
+    unlink_batch_size: int = 500
+    serializer: CachePayloadSerializer = field(default_factory=CachePayloadSerializer)
+    read_expiration: ReadExpirationPolicy = field(default_factory=ReadExpirationPolicy)
+    freshness_policy: CacheFreshnessPolicy | None = None
+    hash_layout: HashBucketLayout | None = None
+
+    def __post_init__(self) -> None:
+        if self.hash_layout is not None and self.read_expiration.enabled:
+            raise ValueError("Read expiration is not supported with the hash layout")
 
     async def get(self, key: str) -> dict[str, Any] | None:
         """
@@ -30,23 +206,23 @@ class RedisCacheClient(CacheProtocol):
         Returns:
             Cached dictionary data or None if not found or an error occurs.
         """
+        if self.read_expiration.enabled:
+            return (await self.get_many([key]))[key]
+        location = self._locate(key)
         try:
-            value = await self.client.get(key)
-            if value is None:
-                return None
-            return json.loads(value)
-        except (ConnectionError, redis.exceptions.RedisError) as e:
-            logger.error(
-                "Redis get operation failed", key=key, error=str(e)
-            )
-            return None
-        except (json.JSONDecodeError, TypeError) as e:
-            logger.warning(
-                "Failed to decode cached value", key=key, error=str(e)
-            )
+            if location is None:
+                value = await self.client.get(key)
+            else:
+                value = await self.client.hget(*location)
+        except _ERRORS as e:
+            report_cache_failure(e)
+            logger.error("Redis get operation failed", key=key, error=str(e))
             return None
+        return self._decode(key, value)
 
-    async def set(self, key: str, value: dict[str, Any], ttl: int | None = None) -> bool:
+    async def set(
+        self, key: str, value: dict[str, Any], ttl: int | None = None
+    ) -> bool:
         """
         Stores a value in Redis cache with an optional TTL.
 
@@ -58,26 +234,21 @@ class RedisCacheClient(CacheProtocol):
         Returns:
             True if successful, False otherwise.
         """
+        if self._locate(key) is not None:
+            return (await self.set_many({key: value}, ttl))[key]
+        serialized_value = self._encode(key, value)
+        if serialized_value is None:
+            return False
+        ttl = ttl if ttl is not None else self.ttl
         try:
-            serialized_value = json.dumps(value, default=str)
             if ttl is not None:
                 await self.client.setex(key, ttl, serialized_value)
-            elif self.ttl is not None:
-                await self.client.setex(key, self.ttl, serialized_value)
             else:
                 await self.client.set(key, serialized_value)
             return True
-        except (ConnectionError, redis.exceptions.RedisError) as e:
-            logger.error(
-                "Redis set operation failed", key=key, error=str(e)
-            )
-            return False
-        except (TypeError, ValueError) as e:
-            logger.error(
-                "Failed to serialize value for cache",
-                key=key,
-                error=str(e),
-            )
+        except _ERRORS as e:
+            report_cache_failure(e)
+            logger.error("Redis set operation failed", key=key, error=str(e))
             return False
 
     async def delete(self, key: str) -> bool:
@@ -90,13 +261,16 @@ class RedisCacheClient(CacheProtocol):
         Returns:
             True if key was deleted, False if key didn't exist or an error occurs.
         """
+        location = self._locate(key)
         try:
-            result = await self.client.delete(key)
+            if location is None:
+                result = await self.client.delete(key)
+            else:
+                result = await self.client.hdel(*location)
             return result > 0
-        except (ConnectionError, redis.exceptions.RedisError) as e:
-            logger.error(
-                "Redis delete operation failed", key=key, error=str(e)
-            )
+        except _ERRORS as e:
+            report_cache_failure(e)
+            logger.error("Redis delete operation failed", key=key, error=str(e))
             return False
 
     async def exists(self, key: str) -> bool:
@@ -109,13 +283,287 @@ class RedisCacheClient(CacheProtocol):
         Returns:
             True if key exists, False otherwise or if an error occurs.
         """
+        location = self._locate(key)
+        try:
+            if location is None:
+                return bool(await self.client.exists(key))
+            return bool(await self.client.hexists(*location))
+        except _ERRORS as e:
+            report_cache_failure(e)
+            logger.error("Redis exists operation failed", key=key, error=str(e))
+            return False
+
+    async def get_many(self, keys: Sequence[str]) -> dict[str, dict[str, Any] | None]:
+        """
+        Retrieves several values from Redis with a single MGET.
+
+        On a cluster, one MGET is sent per hash slot.
+
+        Args:
+            keys: Cache keys to retrieve.
+
+        Returns:
+            Mapping of every requested key to its cached dictionary data, or None
+            if the key is missing, cannot be decoded or an error occurs.
+        """
+        if not keys:
+            return {}
+        if self.read_expiration.enabled:
+            return await self._get_many_with_read_expiration(keys)
+        if self.hash_layout is None:
+            return await self._mget(keys)
+        plain_keys: list[str] = []
+        located: dict[str, tuple[str, bytes]] = {}
+        for key in keys:
+            if (location := self.hash_layout.locate(key)) is None:
+                plain_keys.append(key)
+            else:
+                located[key] = location
+        results = await self._mget(plain_keys) if plain_keys else {}
+        if located:
+            results |= await self._hmget(located)
+        return {key: results[key] for key in keys}
+
+    async def _mget(self, keys: Sequence[str]) -> dict[str, dict[str, Any] | None]:
+        """
+        Reads string entries with a single MGET (one per hash slot on a cluster).
+        """
+        # types-redis does not stub the commands of the cluster client.
+        client: object = self.client
+        try:
+            if isinstance(client, RedisCluster):
+                values = await client.mget_nonatomic(keys)  # type: ignore[attr-defined]
+            else:
+                values = await self.client.mget(keys)
+        except _ERRORS as e:
+            report_cache_failure(e)
+            logger.error("Redis mget operation failed", count=len(keys), error=str(e))
+            return dict.fromkeys(keys)
+        return {
+            key: self._decode(key, value)
+            for key, value in zip(keys, values, strict=True)
+        }
+
+    async def _hmget(
+        self, located: Mapping[str, tuple[str, bytes]]
+    ) -> dict[str, dict[str, Any] | None]:
+        """
+        Reads hashed entries with one pipelined HMGET per bucket.
+        """
+        buckets: dict[str, list[str]] = {}
+        for key, (bucket_key, _) in located.items():
+            buckets.setdefault(bucket_key, []).append(key)
         try:
-            return bool(await self.client.exists(key))
-        except (ConnectionError, redis.exceptions.RedisError) as e:
+            async with self.client.pipeline(transaction=False) as pipe:
+                for bucket_key, bucket_keys in buckets.items():
+                    pipe.hmget(bucket_key, [located[key][1] for key in bucket_keys])
+                responses = await pipe.execute(raise_on_error=False)
+        except _ERRORS as e:
+            report_cache_failure(e)
             logger.error(
-                "Redis exists operation failed", key=key, error=str(e)
+                "Redis hmget operation failed", count=len(located), error=str(e)
             )
-            return False
+            return dict.fromkeys(located)
+        results: dict[str, dict[str, Any] | None] = {}
+        for bucket_keys, values in zip(buckets.values(), responses, strict=True):
+            if isinstance(values, Exception):
+                report_cache_failure(values)
+                logger.error(
+                    "Redis hmget operation failed", keys=bucket_keys, error=str(values)
+                )
+                values = [None] * len(bucket_keys)
+            for key, value in zip(bucket_keys, values, strict=True):
+                results[key] = self._decode(key, value)
+        return results
+
+    async def _get_many_with_read_expiration(
+        self, keys: Sequence[str]
+    ) -> dict[str, dict[str, Any] | None]:
+        """
+        Reads keys through the read expiration script, loading it on NOSCRIPT.
+        """
+        try:
+            responses = await self._eval_read_expiration(keys)
+            if any(isinstance(r, redis.exceptions.NoScriptError) for r in responses):
+                await self.client.script_load(READ_EXPIRATION_SCRIPT)
+                responses = await self._eval_read_expiration(keys)
+        except _ERRORS as e:
+            report_cache_failure(e)
+            logger.error(
+                "Redis read expiration operation failed", count=len(keys), error=str(e)
+            )
+            return dict.fromkeys(keys)
+        results: dict[str, dict[str, Any] | None] = {}
+        for key, response in zip(keys, responses, strict=True):
+            if isinstance(response, Exception):
+                report_cache_failure(response)
+                logger.error("Redis get operation failed", key=key, error=str(response))
+                response = None
+            if not response:
+                results[key] = None
+                continue
+            value, remaining = response
+            entry = self._decode(key, value)
+            if (
+                entry is not None
+                and self.freshness_policy is not None
+                and remaining > 0
+            ):
+                entry = self.freshness_policy.extend(entry, remaining / 1000)
+            results[key] = entry
+        return results
+
+    async def _eval_read_expiration(self, keys: Sequence[str]) -> list[Any]:
+        """
+        Runs the read expiration script for every key in one pipeline round trip.
+        """
+        args = self.read_expiration.script_args()
+        async with self.client.pipeline(transaction=False) as pipe:
+            for key in keys:
+                pipe.evalsha(
+                    READ_EXPIRATION_SCRIPT_SHA, 2, key, read_counter_key(key), *args
+                )
+            return await pipe.execute(raise_on_error=False)
+
+    async def set_many(
+        self, items: Mapping[str, dict[str, Any]], ttl: int | None = None
+    ) -> dict[str, bool]:
+        """
+        Stores several values in Redis with one pipelined SETEX per key.
+
+        Hashed entries are written by the hash set script instead, which runs
+        HSET and HEXPIRE in one atomic call. The pipeline is not transactional:
+        each key succeeds or fails on its own and failures are reported per key.
+
+        Args:
+            items: Mapping of cache keys to dictionary data to cache.
+            ttl: Time-to-live in seconds (None for default or no expiration).
+
+        Returns:
+            Mapping of every key to True if it was stored, False otherwise.
+        """
+        results: dict[str, bool] = {}
+        serialized_items: dict[str, bytes] = {}
+        for key, value in items.items():
+            serialized_value = self._encode(key, value)
+            if serialized_value is None:
+                results[key] = False
+            else:
+                serialized_items[key] = serialized_value
+        if not serialized_items:
+            return results
+
+        ttl = ttl if ttl is not None else self.ttl
+        try:
+            responses = await self._pipeline_set(serialized_items, ttl)
+            if any(isinstance(r, redis.exceptions.NoScriptError) for r in responses):
+                await self.client.script_load(HASH_SET_SCRIPT)
+                responses = await self._pipeline_set(serialized_items, ttl)
+        except _ERRORS as e:
+            report_cache_failure(e)
+            logger.error(
+                "Redis pipelined set operation failed",
+                count=len(serialized_items),
+                error=str(e),
+            )
+            return results | dict.fromkeys(serialized_items, False)
+
+        for key, response in zip(serialized_items, responses, strict=True):
+            if isinstance(response, Exception):
+                report_cache_failure(response)
+                logger.error("Redis set operation failed", key=key, error=str(response))
+            results[key] = not isinstance(response, Exception)
+        return results
+
+    async def _pipeline_set(
+        self, items: Mapping[str, bytes], ttl: int | None
+    ) -> list[Any]:
+        """
+        Stores serialized entries with one command per entry in one pipeline round trip.
+        """
+        async with self.client.pipeline(transaction=False) as pipe:
+            for key, value in items.items():
+                self._queue_set(pipe, key, value, ttl)
+            return await pipe.execute(raise_on_error=False)
+
+    def _queue_set(
+        self, pipe: RedisPipeline, key: str, value: bytes, ttl: int | None
+    ) -> None:
+        """
+        Queues the command storing one entry.
+        """
+        location = self._locate(key)
+        if location is None:
+            if ttl is not None:
+                pipe.setex(key, ttl, value)
+            else:
+                pipe.set(key, value)
+            return
+        bucket_key, hash_field = location
+        if ttl is None:
+            pipe.hset(bucket_key, hash_field, value)
+        else:
+            pipe.evalsha(HASH_SET_SCRIPT_SHA, 1, bucket_key, hash_field, value, ttl)
+
+    async def check_hash_layout(self) -> None:
+        """
+        Checks at startup that the server supports the TTLs of the hash layout.
+
+        Hash-field TTLs need HEXPIRE (Redis 7.4 or later); without it every
+        hashed write would fail. The check is skipped without a hash layout, and
+        an unreachable server is only logged, as the cache tolerates outages.
+
+        Raises:
+            RuntimeError: If the server rejects HEXPIRE.
+        """
+        if self.hash_layout is None:
+            return
+        try:
+            # HEXPIRE on a missing key changes nothing and replies [-2].
+            await self.client.execute_command(
+                "HEXPIRE", _HASH_LAYOUT_PROBE_KEY, 1, "FIELDS", 1, "probe"
+            )
+        except redis.exceptions.ResponseError as e:
+            raise RuntimeError(
+                "The hash cache layout requires HEXPIRE (Redis 7.4 or later)"
+            ) from e
+        except _ERRORS as e:
+            logger.warning("Could not check Redis for HEXPIRE", error=str(e))
+
+    async def delete_many(self, keys: Sequence[str]) -> dict[str, bool]:
+        """
+        Deletes several values from Redis with one pipelined UNLINK per key.
+
+        Hashed entries are deleted with HDEL instead. UNLINK reclaims memory in
+        a background thread, so large batches do not block the Redis event loop.
+
+        Args:
+            keys: Cache keys to delete.
+
+        Returns:
+            Mapping of every key to True if it was deleted, False if it didn't
+            exist or an error occurs.
+        """
+        if not keys:
+            return {}
+        try:
+            async with self.client.pipeline(transaction=False) as pipe:
+                for key in keys:
+                    if (location := self._locate(key)) is None:
+                        pipe.unlink(key)
+                    else:
+                        pipe.hdel(*location)
+                responses = await pipe.execute(raise_on_error=False)
+        except _ERRORS as e:
+            report_cache_failure(e)
+            logger.error(
+                "Redis pipelined delete operation failed", count=len(keys), error=str(e)
+            )
+            return dict.fromkeys(keys, False)
+        return {
+            key: not isinstance(response, Exception) and response > 0
+            for key, response in zip(keys, responses, strict=True)
+        }
 
     async def clear(self, pattern: str) -> int:
         """
@@ -125,35 +573,139 @@ class RedisCacheClient(CacheProtocol):
             pattern: Pattern to match keys (e.g., 'user:*').
 
         Returns:
-            Number of keys deleted.
+            Number of keys deleted before completion or the first error.
         """
+        deleted_count = 0
         try:
-            keys = []
-            async for key in self.client.scan_iter(match=pattern):
-                keys.append(key)
-            if keys:
-                deleted_count = await self.client.delete(*keys)
-                logger.info(
-                    "Cleared cache keys matching pattern",
-                    pattern=pattern,
-                    count=deleted_count,
-                )
-                return deleted_count
-            return 0
-        except (ConnectionError, redis.exceptions.RedisError) as e:
+            async for batch_deleted in self.iter_clear(pattern):
+                deleted_count += batch_deleted
+        except _ERRORS as e:
             logger.error(
                 "Redis clear pattern operation failed",
                 pattern=pattern,
+                deleted=deleted_count,
                 error=str(e),
             )
+            return deleted_count
+        logger.info(
+            "Cleared cache keys matching pattern",
+            pattern=pattern,
+            count=deleted_count,
+        )
+        return deleted_count
+
+    async def iter_clear(self, pattern: str) -> AsyncIterator[int]:
+        """
+        Deletes keys matching a pattern batch by batch.
+
+        On a cluster every primary is scanned in turn and each batch is
+        unlinked through a pipeline routed per shard. With the hash layout,
+        the buckets that may hold matching entries are scanned as well and the
+        matching fields are removed from them.
+
+        Args:
+            pattern: Pattern to match keys (e.g., 'user:*').
+
+        Yields:
+            Number of keys deleted by each batch.
+
+        Raises:
+            redis.exceptions.RedisError: If scanning or deleting fails.
+        """
+        batch: list[bytes] = []
+        scan_kwargs: dict[str, Any] = {"match": pattern, "count": self.scan_count}
+        if self.hash_layout is not None:
+            # Buckets are cleared field by field below, never unlinked whole.
+            scan_kwargs["_type"] = "string"
+        async for key in self.client.scan_iter(**scan_kwargs):
+            batch.append(key)
+            if len(batch) >= self.unlink_batch_size:
+                yield await self._unlink(batch)
+                batch = []
+        if batch:
+            yield await self._unlink(batch)
+        if self.hash_layout is None:
+            return
+
+        bucket_pattern = self.hash_layout.bucket_pattern(pattern)
+        async for key in self.client.scan_iter(
+            match=bucket_pattern, count=self.scan_count, _type="hash"
+        ):
+            batch.append(key)
+            if len(batch) >= self.unlink_batch_size:
+                yield await self._hdel_matching(batch, pattern)
+                batch = []
+        if batch:
+            yield await self._hdel_matching(batch, pattern)
+
+    async def _unlink(self, keys: Sequence[bytes]) -> int:
+        """
+        Unlinks a batch of keys in one pipeline round trip.
+        """
+        async with self.client.pipeline(transaction=False) as pipe:
+            for key in keys:
+                pipe.unlink(key)
+            responses = await pipe.execute()
+        return sum(responses)
+
+    async def _hdel_matching(self, bucket_keys: Sequence[bytes], pattern: str) -> int:
+        """
+        Removes the fields matching a pattern from a batch of buckets.
+        """
+        async with self.client.pipeline(transaction=False) as pipe:
+            for bucket_key in bucket_keys:
+                pipe.hkeys(bucket_key)
+            bucket_fields = await pipe.execute()
+        deletions: dict[bytes, list[bytes]] = {}
+        for bucket_key, hash_fields in zip(bucket_keys, bucket_fields, strict=True):
+            matching = [
+                hash_field
+                for hash_field in hash_fields
+                if len(hash_field) == 16
+                and fnmatchcase(
+                    HashBucketLayout.key_of(bucket_key, hash_field), pattern
+                )
+            ]
+            if matching:
+                deletions[bucket_key] = matching
+        if not deletions:
             return 0
+        async with self.client.pipeline(transaction=False) as pipe:
+            for bucket_key, matching in deletions.items():
+                pipe.hdel(bucket_key, *matching)
+            responses = await pipe.execute()
+        return sum(responses)
+
+    def _locate(self, key: str) -> tuple[str, bytes] | None:
+        """
+        Returns the bucket and field of a hashed entry, or None for a string entry.
+        """
+        if self.hash_layout is None:
+            return None
+        return self.hash_layout.locate(key)
+
+    def _encode(self, key: str, value: dict[str, Any]) -> bytes | None:
+        """
+        Serializes a value for storage, returning None if it cannot be encoded.
+        """
+        try:
+            return self.serializer.dumps(value)
+        except CacheCodecError as e:
+            logger.error(
+                "Failed to serialize value for cache",
+                key=key,
+                error=str(e),
+            )
+            return None
 
-    async def close(self) -> None:
+    def _decode(self, key: str, value: str | bytes | None) -> dict[str, Any] | None:
         """
-        Closes the Redis client connection.
+        Deserializes a stored value, returning None if it is missing or corrupt.
         """
+        if value is None:
+            return None
         try:
-            await self.client.close()
-            logger.info("Redis connection closed")
-        except (ConnectionError, redis.exceptions.RedisError) as e:
-            logger.error("Failed to close Redis connection", error=str(e))
+            return self.serializer.loads(value)
+        except CacheCodecError as e:
+            logger.warning("Failed to decode cached value", key=key, error=str(e))
+            return None
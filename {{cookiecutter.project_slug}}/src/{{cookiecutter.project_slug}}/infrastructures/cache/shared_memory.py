@@ -0,0 +1,547 @@
+"""Shared-memory implementation of the CacheProtocol.
+
+The cache is a fixed-slot hash table in a memory-mapped file (typically under
+``/dev/shm``) mapped by every worker process of the host, so all workers share
+one warm cache without any external service.
+
+File layout (little-endian)::
+
+    header   magic, slot count, slot size, clock hand, counter table
+    slots    slot_count * slot_size bytes
+
+    slot     version u64 | key hash u64 | expires_at f64 | key length u16
+             | value length u32 | reference bit u8 | pad | key | value
+
+A key lives in one of the ``probe_length`` slots following its hash. Writers
+serialize on an exclusive ``flock`` of the file, polled without blocking so a
+worker waiting for another one keeps serving its event loop. Readers take no lock: each
+slot carries a sequence counter (seqlock) the writer makes odd while it
+rewrites the slot, and a reader retries, then reports a miss, whenever the
+counter was odd or changed while it copied the slot. When every slot of a
+window is live, the victim is chosen by CLOCK: readers set the reference bit
+of the slots they hit, and the writer skips (and clears) referenced slots
+starting from a hand shared by all processes.
+"""
+
+import asyncio
+from collections.abc import AsyncIterator, Callable, Iterator, Mapping, Sequence
+from contextlib import asynccontextmanager, contextmanager
+from dataclasses import dataclass, field
+import fcntl
+from fnmatch import fnmatchcase
+import hashlib
+import mmap
+import os
+import struct
+import time
+from typing import Any, final
+
+import structlog
+
+from {{cookiecutter.project_slug}}.application.interfaces.cache import CacheProtocol
+from {{cookiecutter.project_slug}}.infrastructures.cache.codec import CachePayloadSerializer
+from {{cookiecutter.project_slug}}.infrastructures.cache.exceptions import CacheCodecError
+
+logger = structlog.get_logger(__name__)
+
+_MAGIC = b"SHMCACH1"
+# magic, slot count, slot size, clock hand.
+_HEADER = struct.Struct("<8sQQQ")
+_COUNTER = struct.Struct("<Qq")
+_COUNTERS_OFFSET = 64
+_COUNTER_SLOTS = 64
+_HEADER_SIZE = mmap.PAGESIZE
+_VERSION = struct.Struct("<Q")
+# version, key hash, expires_at, key length, value length, reference bit.
+_SLOT = struct.Struct("<QQdHIB")
+_REF_OFFSET = 30
+_SLOT_DATA_OFFSET = 32
+_HAND_OFFSET = 24
+_READ_ATTEMPTS = 3
+# Seconds between attempts to take the file lock held by another worker.
+_LOCK_RETRY_DELAY = 0.0005
+_LOCK_MAX_RETRY_DELAY = 0.01
+
+
+def _hash(key: bytes) -> int:
+    """
+    Returns the non-zero 64-bit hash of a key (zero marks an empty slot).
+    """
+    return int.from_bytes(hashlib.blake2b(key, digest_size=8).digest(), "little") or 1
+
+
+@final
+@dataclass(slots=True, kw_only=True)
+class SharedMemoryCacheClient(CacheProtocol):
+    """
+    Shared-memory implementation of the CacheProtocol for caching operations.
+
+    Once the file lock is taken, an operation runs synchronously within a
+    single event-loop step, so tasks of one worker never interleave inside
+    it; other workers are kept out by the file lock (writes) and the slot
+    seqlocks (reads).
+    Values larger than a slot are not cached. Expired entries are reported
+    as misses and their slots reused by later writes.
+
+    Attributes:
+        path: File the table is mapped from, shared by every worker.
+        slot_count: Number of slots of the table.
+        slot_size: Size of a slot in bytes, key and value included.
+        probe_length: Slots a key may occupy, starting from its hash.
+        ttl: Default time-to-live in seconds (None for no expiration).
+        clear_batch_size: Slots scanned per batch during pattern invalidation.
+        serializer: Codec framing of the cached values.
+    """
+
+    path: str
+    slot_count: int = 16_384
+    slot_size: int = 2048
+    probe_length: int = 8
+    ttl: int | None = None
+    clear_batch_size: int = 1024
+    serializer: CachePayloadSerializer = field(default_factory=CachePayloadSerializer)
+    clock: Callable[[], float] = field(default=time.time, repr=False)
+    _fd: int = field(default=-1, init=False, repr=False)
+    _map: mmap.mmap = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        """
+        Maps the table, creating and formatting the file if it does not exist.
+
+        Raises:
+            ValueError: If the existing file was formatted with another geometry.
+        """
+        if self.slot_size <= _SLOT_DATA_OFFSET or self.probe_length <= 0:
+            raise ValueError("slot_size and probe_length are too small")
+        size = _HEADER_SIZE + self.slot_count * self.slot_size
+        # Never follow a symlink planted at the path by another user.
+        self._fd = os.open(self.path, os.O_RDWR | os.O_CREAT | os.O_NOFOLLOW, 0o600)
+        try:
+            with self._locked_at_startup():
+                if os.fstat(self._fd).st_size == 0:
+                    os.ftruncate(self._fd, size)
+                    os.pwrite(
+                        self._fd,
+                        _HEADER.pack(_MAGIC, self.slot_count, self.slot_size, 0),
+                        0,
+                    )
+                    logger.info(
+                        "Shared-memory cache created",
+                        path=self.path,
+                        size=size,
+                    )
+                magic, slot_count, slot_size, _ = _HEADER.unpack(
+                    os.pread(self._fd, _HEADER.size, 0)
+                )
+                if (magic, slot_count, slot_size) != (
+                    _MAGIC,
+                    self.slot_count,
+                    self.slot_size,
+                ):
+                    raise ValueError(
+                        f"Shared-memory cache {self.path} has another layout; "
+                        "remove it once no worker uses it"
+                    )
+            self._map = mmap.mmap(self._fd, size)
+        except BaseException:
+            os.close(self._fd)
+            raise
+
+    async def get(self, key: str) -> dict[str, Any] | None:
+        """
+        Retrieves a value from the shared table by key.
+
+        Args:
+            key: Cache key to retrieve.
+
+        Returns:
+            Cached dictionary data or None if not found, expired or unreadable.
+        """
+        payload = self._read(key.encode())
+        if payload is None:
+            return None
+        try:
+            value: dict[str, Any] = self.serializer.loads(payload)
+        except CacheCodecError as e:
+            logger.warning("Failed to decode cached value", key=key, error=str(e))
+            return None
+        return value
+
+    async def get_many(self, keys: Sequence[str]) -> dict[str, dict[str, Any] | None]:
+        """
+        Retrieves several values from the shared table.
+
+        Args:
+            keys: Cache keys to retrieve.
+
+        Returns:
+            Mapping of every requested key to its cached dictionary data, or None.
+        """
+        return {key: await self.get(key) for key in keys}
+
+    async def set(
+        self, key: str, value: dict[str, Any], ttl: int | None = None
+    ) -> bool:
+        """
+        Stores a value in the shared table with an optional TTL.
+
+        Args:
+            key: Cache key to store under.
+            value: Dictionary data to cache.
+            ttl: Time-to-live in seconds (None for default or no expiration).
+
+        Returns:
+            True if successful, False if the value cannot be encoded or does not
+            fit in a slot.
+        """
+        return (await self.set_many({key: value}, ttl))[key]
+
+    async def set_many(
+        self, items: Mapping[str, dict[str, Any]], ttl: int | None = None
+    ) -> dict[str, bool]:
+        """
+        Stores several values in the shared table under a single lock.
+
+        Args:
+            items: Mapping of cache keys to the dictionary data to cache.
+            ttl: Time-to-live in seconds (None for default or no expiration).
+
+        Returns:
+            Mapping of every key to True if it was stored, False otherwise.
+        """
+        ttl = ttl if ttl is not None else self.ttl
+        expires_at = self.clock() + ttl if ttl else 0.0
+        records: dict[str, tuple[bytes, bytes]] = {}
+        results = dict.fromkeys(items, False)
+        for key, value in items.items():
+            try:
+                payload = self.serializer.dumps(value)
+            except CacheCodecError as e:
+                logger.error(
+                    "Failed to serialize value for cache", key=key, error=str(e)
+                )
+                continue
+            key_bytes = key.encode()
+            if _SLOT_DATA_OFFSET + len(key_bytes) + len(payload) > self.slot_size:
+                logger.warning(
+                    "Value too large for a shared-memory cache slot",
+                    key=key,
+                    size=len(payload),
+                )
+                continue
+            records[key] = (key_bytes, payload)
+        if not records:
+            return results
+        async with self._locked():
+            for key, (key_bytes, payload) in records.items():
+                self._write(self._victim(key_bytes), key_bytes, payload, expires_at)
+                results[key] = True
+        return results
+
+    async def delete(self, key: str) -> bool:
+        """
+        Deletes a value from the shared table.
+
+        Args:
+            key: Cache key to delete.
+
+        Returns:
+            True if a live entry was deleted, False otherwise.
+        """
+        return (await self.delete_many([key]))[key]
+
+    async def delete_many(self, keys: Sequence[str]) -> dict[str, bool]:
+        """
+        Deletes several values from the shared table under a single lock.
+
+        Args:
+            keys: Cache keys to delete.
+
+        Returns:
+            Mapping of every key to True if a live entry was deleted.
+        """
+        results = dict.fromkeys(keys, False)
+        async with self._locked():
+            for key in keys:
+                offset = self._find(key.encode())
+                if offset is not None:
+                    results[key] = not self._expired(offset)
+                    self._clear_slot(offset)
+        return results
+
+    async def exists(self, key: str) -> bool:
+        """
+        Checks if a live entry exists in the shared table.
+
+        Args:
+            key: Cache key to check.
+
+        Returns:
+            True if key exists, False otherwise.
+        """
+        return self._read(key.encode()) is not None
+
+    async def clear(self, pattern: str) -> int:
+        """
+        Clears entries matching a glob pattern.
+
+        Args:
+            pattern: Pattern to match keys (e.g., 'user:*').
+
+        Returns:
+            Number of entries deleted.
+        """
+        deleted_count = 0
+        async for deleted in self.iter_clear(pattern):
+            deleted_count += deleted
+        logger.info(
+            "Cleared shared-memory cache keys", pattern=pattern, count=deleted_count
+        )
+        return deleted_count
+
+    async def iter_clear(self, pattern: str) -> AsyncIterator[int]:
+        """
+        Clears entries matching a glob pattern, ``clear_batch_size`` slots at a time.
+
+        The lock is released between batches, so writers of other workers are
+        never blocked for a whole scan of the table.
+
+        Args:
+            pattern: Pattern to match keys (e.g., 'user:*').
+
+        Yields:
+            Number of entries deleted by each batch.
+        """
+        for start in range(0, self.slot_count, self.clear_batch_size):
+            deleted = 0
+            async with self._locked():
+                for index in range(
+                    start, min(start + self.clear_batch_size, self.slot_count)
+                ):
+                    offset = self._offset(index)
+                    _, slot_hash, _, key_length, _, _ = _SLOT.unpack_from(
+                        self._map, offset
+                    )
+                    if not slot_hash:
+                        continue
+                    data_offset = offset + _SLOT_DATA_OFFSET
+                    key = self._map[data_offset : data_offset + key_length].decode()
+                    if fnmatchcase(key, pattern):
+                        deleted += not self._expired(offset)
+                        self._clear_slot(offset)
+            yield deleted
+
+    async def get_counter(self, name: str) -> int | None:
+        """
+        Returns the value of a counter, or None if it was never incremented.
+
+        Counters live in a table of the file header, out of reach of eviction.
+        """
+        name_hash = _hash(name.encode())
+        async with self._locked():
+            for index in range(_COUNTER_SLOTS):
+                counter_hash, value = _COUNTER.unpack_from(
+                    self._map, _COUNTERS_OFFSET + index * _COUNTER.size
+                )
+                if counter_hash == name_hash:
+                    return int(value)
+        return None
+
+    async def incr(self, name: str) -> int:
+        """
+        Atomically increments a counter and returns its new value.
+
+        Raises:
+            OverflowError: If the counter table is full.
+        """
+        name_hash = _hash(name.encode())
+        async with self._locked():
+            for index in range(_COUNTER_SLOTS):
+                offset = _COUNTERS_OFFSET + index * _COUNTER.size
+                counter_hash, value = _COUNTER.unpack_from(self._map, offset)
+                if counter_hash in (name_hash, 0):
+                    incremented = int(value) + 1
+                    _COUNTER.pack_into(self._map, offset, name_hash, incremented)
+                    return incremented
+        raise OverflowError("Shared-memory cache counter table is full")
+
+    async def close(self) -> None:
+        """
+        Unmaps the table; the file is kept for the other workers.
+        """
+        self._map.close()
+        os.close(self._fd)
+        logger.info("Shared-memory cache closed", path=self.path)
+
+    @asynccontextmanager
+    async def _locked(self) -> AsyncIterator[None]:
+        """
+        Holds the writer lock shared by every process mapping the file.
+
+        The lock is polled without blocking, with a growing pause handing the
+        event loop back between attempts. The body must not await: the lock
+        belongs to the file description, so it does not exclude other tasks
+        of the worker.
+        """
+        delay = _LOCK_RETRY_DELAY
+        while True:
+            try:
+                fcntl.flock(self._fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                break
+            except BlockingIOError:
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, _LOCK_MAX_RETRY_DELAY)
+        try:
+            yield
+        finally:
+            fcntl.flock(self._fd, fcntl.LOCK_UN)
+
+    @contextmanager
+    def _locked_at_startup(self) -> Iterator[None]:
+        """
+        Holds the writer lock, blocking; only for formatting the file on creation.
+        """
+        fcntl.flock(self._fd, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(self._fd, fcntl.LOCK_UN)
+
+    def _offset(self, index: int) -> int:
+        """
+        Returns the offset of a slot in the file.
+        """
+        return _HEADER_SIZE + index * self.slot_size
+
+    def _window(self, key_hash: int) -> Iterator[int]:
+        """
+        Yields the offsets of the slots a key may occupy.
+        """
+        start = key_hash % self.slot_count
+        for step in range(min(self.probe_length, self.slot_count)):
+            yield self._offset((start + step) % self.slot_count)
+
+    def _read(self, key: bytes) -> bytes | None:
+        """
+        Copies the live encoded value of a key without locking.
+        """
+        key_hash = _hash(key)
+        for offset in self._window(key_hash):
+            for _ in range(_READ_ATTEMPTS):
+                version, slot_hash, expires_at, key_length, value_length, _ = (
+                    _SLOT.unpack_from(self._map, offset)
+                )
+                if version & 1:
+                    continue
+                if slot_hash != key_hash:
+                    break
+                data_offset = offset + _SLOT_DATA_OFFSET
+                data = self._map[data_offset : data_offset + key_length + value_length]
+                if _VERSION.unpack_from(self._map, offset)[0] != version:
+                    continue
+                if data[:key_length] != key:
+                    break
+                if expires_at and expires_at <= self.clock():
+                    return None
+                self._map[offset + _REF_OFFSET] = 1
+                return data[key_length:]
+        return None
+
+    def _find(self, key: bytes) -> int | None:
+        """
+        Returns the offset of the slot holding a key; the lock must be held.
+        """
+        key_hash = _hash(key)
+        for offset in self._window(key_hash):
+            _, slot_hash, _, key_length, _, _ = _SLOT.unpack_from(self._map, offset)
+            data_offset = offset + _SLOT_DATA_OFFSET
+            if (
+                slot_hash == key_hash
+                and self._map[data_offset : data_offset + key_length] == key
+            ):
+                return offset
+        return None
+
+    def _victim(self, key: bytes) -> int:
+        """
+        Returns the slot a key is written to; the lock must be held.
+
+        The slot already holding the key wins, then an empty or expired slot,
+        then the first unreferenced slot from the clock hand on.
+        """
+        if (offset := self._find(key)) is not None:
+            return offset
+        window = list(self._window(_hash(key)))
+        for offset in window:
+            if not _SLOT.unpack_from(self._map, offset)[1] or self._expired(offset):
+                return offset
+        (hand,) = _VERSION.unpack_from(self._map, _HAND_OFFSET)
+        _VERSION.pack_into(self._map, _HAND_OFFSET, hand + 1)
+        start = hand % len(window)
+        candidates = window[start:] + window[:start]
+        for offset in candidates:
+            if not self._map[offset + _REF_OFFSET]:
+                return offset
+            self._map[offset + _REF_OFFSET] = 0
+        return candidates[0]
+
+    def _expired(self, offset: int) -> bool:
+        """
+        Checks whether the entry of a slot is past its expiry.
+        """
+        expires_at = _SLOT.unpack_from(self._map, offset)[2]
+        return bool(expires_at) and expires_at <= self.clock()
+
+    def _write(self, offset: int, key: bytes, value: bytes, expires_at: float) -> None:
+        """
+        Rewrites a slot under its seqlock; the lock must be held.
+        """
+        (version,) = _VERSION.unpack_from(self._map, offset)
+        _VERSION.pack_into(self._map, offset, version + 1)
+        data_offset = offset + _SLOT_DATA_OFFSET
+        self._map[data_offset : data_offset + len(key) + len(value)] = key + value
+        _SLOT.pack_into(
+            self._map,
+            offset,
+            version + 1,
+            _hash(key),
+            expires_at,
+            len(key),
+            len(value),
+            0,
+        )
+        _VERSION.pack_into(self._map, offset, version + 2)
+
+    def _clear_slot(self, offset: int) -> None:
+        """
+        Empties a slot under its seqlock; the lock must be held.
+        """
+        (version,) = _VERSION.unpack_from(self._map, offset)
+        _VERSION.pack_into(self._map, offset, version + 1)
+        _SLOT.pack_into(self._map, offset, version + 1, 0, 0.0, 0, 0, 0)
+        _VERSION.pack_into(self._map, offset, version + 2)
+
+
+@final
+@dataclass(frozen=True, slots=True, kw_only=True)
+class SharedMemoryCounters:
+    """
+    Counter store over a SharedMemoryCacheClient, used for cache key generations.
+
+    Attributes:
+        client: Shared-memory cache client holding the counters.
+    """
+
+    client: SharedMemoryCacheClient
+
+    async def get(self, name: str) -> int | None:
+        """
+        Returns the value of a counter, or None if it was never incremented.
+        """
+        return await self.client.get_counter(name)
+
+    async def incr(self, name: str) -> int:
+        """
+        Atomically increments a counter and returns its new value.
+        """
+        return await self.client.incr(name)
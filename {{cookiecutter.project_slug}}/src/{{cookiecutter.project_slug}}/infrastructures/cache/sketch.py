@@ -0,0 +1,95 @@
+from dataclasses import dataclass, field
+from typing import final
+
+# Lookup table used to halve every counter of the sketch in a single pass.
+_HALVE_TABLE = bytes(i >> 1 for i in range(256))
+_MAX_COUNTER = 255
+
+
+@final
+@dataclass(slots=True, kw_only=True)
+class CountMinSketch:
+    """
+    Count-min sketch of key frequencies with periodic aging.
+
+    Counters are stored as saturating bytes. Each key maps to one counter per
+    row via double hashing; the estimate is the minimum of those counters.
+    Once ``sample_size`` increments have been recorded, every counter is halved
+    so the sketch follows recent popularity instead of all-time totals.
+
+    Attributes:
+        width: Number of counters per row (rounded up to a power of two).
+        depth: Number of rows (independent hash functions).
+        sample_size: Increments after which counters are halved (0 disables).
+    """
+
+    width: int
+    depth: int = 4
+    sample_size: int = 0
+    _mask: int = field(init=False)
+    _table: bytearray = field(init=False)
+    _additions: int = field(default=0, init=False)
+
+    def __post_init__(self) -> None:
+        """
+        Rounds the width up to a power of two and allocates the counter table.
+        """
+        self.width = 1 << max(self.width - 1, 1).bit_length()
+        self._mask = self.width - 1
+        self._table = bytearray(self.width * self.depth)
+
+    def _indexes(self, key: str) -> list[int]:
+        """
+        Returns the counter position of ``key`` in every row.
+        """
+        hashed = hash(key)
+        h1 = hashed & 0xFFFFFFFF
+        h2 = ((hashed >> 32) & 0xFFFFFFFF) | 1
+        return [
+            row * self.width + ((h1 + row * h2) & self._mask)
+            for row in range(self.depth)
+        ]
+
+    def add(self, key: str) -> int:
+        """
+        Records one occurrence of ``key``.
+
+        Args:
+            key: Key to count.
+
+        Returns:
+            The updated frequency estimate of the key.
+        """
+        table = self._table
+        estimate = _MAX_COUNTER
+        for index in self._indexes(key):
+            value = table[index]
+            if value < _MAX_COUNTER:
+                value += 1
+                table[index] = value
+            estimate = min(estimate, value)
+        self._additions += 1
+        if self.sample_size and self._additions >= self.sample_size:
+            self.halve()
+        return estimate
+
+    def estimate(self, key: str) -> int:
+        """
+        Returns the estimated frequency of ``key``.
+        """
+        table = self._table
+        return min(table[index] for index in self._indexes(key))
+
+    def halve(self) -> None:
+        """
+        Ages the sketch by halving every counter.
+        """
+        self._table = bytearray(self._table.translate(_HALVE_TABLE))
+        self._additions //= 2
+
+    def clear(self) -> None:
+        """
+        Resets every counter to zero.
+        """
+        self._table = bytearray(len(self._table))
+        self._additions = 0
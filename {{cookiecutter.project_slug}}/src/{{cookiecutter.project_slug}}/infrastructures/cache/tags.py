@@ -0,0 +1,184 @@
+from collections.abc import Mapping, Sequence
+from dataclasses import dataclass
+from typing import final
+
+import structlog
+
+from {{cookiecutter.project_slug}}.application.interfaces.cache import (
+    CacheProtocol,
+    CacheTagIndexProtocol,
+)
+from {{cookiecutter.project_slug}}.infrastructures.cache.circuit_breaker import (
+    CacheBypassedError,
+    CacheCircuitBreaker,
+    guard_cache_call,
+)
+from {{cookiecutter.project_slug}}.infrastructures.cache.redis_client import RedisClient
+
+try:
+    import redis.exceptions
+except ImportError:  # redis-py is only installed with the Redis-family cache backends
+    _ERRORS: tuple[type[Exception], ...] = (ConnectionError,)
+else:
+    _ERRORS = (ConnectionError, redis.exceptions.RedisError)
+
+logger = structlog.get_logger(__name__)
+
+
+@final
+@dataclass(frozen=True, slots=True, kw_only=True)
+class RedisCacheTagIndex(CacheTagIndexProtocol):
+    """
+    Redis implementation of the CacheTagIndexProtocol.
+
+    Every tag is a Redis set, under ``prefix + tag``, holding the keys of the
+    entries tagged with it. Invalidation walks the sets of the requested tags
+    with SSCAN and deletes their members through the cache client in batches
+    of ``batch_size`` (pipelined by the client), so it never scans the
+    keyspace, and entries held by in-process layers in front of Redis are
+    dropped as well.
+
+    A set expires with its longest-lived member. Members whose entry already
+    expired stay in the set until it expires or the tag is invalidated; they
+    only cost a no-op delete.
+
+    With ``breaker``, tag updates go through the cache circuit breaker: they
+    are bounded by its call timeout and skipped while the cache is bypassed,
+    like the cache writes they accompany. Invalidations are never skipped.
+
+    Attributes:
+        client: Redis client storing the tag sets.
+        cache_client: Cache the tagged entries are deleted from.
+        prefix: Prefix of the tag set keys.
+        ttl: Time-to-live of the tag memberships when the entries have none.
+        batch_size: Keys read from a tag set and deleted per batch.
+        breaker: Cache circuit breaker guarding the tag updates.
+    """
+
+    client: RedisClient
+    cache_client: CacheProtocol
+    prefix: str = "tag:"
+    ttl: int | None = None
+    batch_size: int = 500
+    breaker: CacheCircuitBreaker | None = None
+
+    async def add(
+        self, tagged_keys: Mapping[str, Sequence[str]], ttl: int | None = None
+    ) -> None:
+        """
+        Records the tags of cache entries in one pipeline round trip.
+
+        Args:
+            tagged_keys: Mapping of cache keys to their tags.
+            ttl: Time-to-live of the entries in seconds (None for the default).
+        """
+        members: dict[str, list[str]] = {}
+        for key, tags in tagged_keys.items():
+            for tag in tags:
+                members.setdefault(self._tag_key(tag), []).append(key)
+        if not members:
+            return
+        ttl = ttl if ttl is not None else self.ttl
+        try:
+            async with (
+                guard_cache_call(self.breaker),
+                self.client.pipeline(transaction=False) as pipe,
+            ):
+                for tag_key, keys in members.items():
+                    pipe.sadd(tag_key, *keys)
+                    if ttl is not None:
+                        # NX arms the TTL of a new set, GT only ever extends it.
+                        pipe.expire(tag_key, ttl, nx=True)
+                        pipe.expire(tag_key, ttl, gt=True)
+                responses = await pipe.execute(raise_on_error=False)
+        except CacheBypassedError:
+            return
+        except _ERRORS as e:
+            logger.error(
+                "Redis cache tag update failed", tags=list(members), error=str(e)
+            )
+            return
+        errors = [result for result in responses if isinstance(result, Exception)]
+        if errors:
+            logger.error(
+                "Redis cache tag update failed",
+                tags=list(members),
+                error=str(errors[0]),
+            )
+
+    async def invalidate_tags(self, tags: Sequence[str]) -> int:
+        """
+        Deletes every cache entry carrying any of the tags.
+
+        Args:
+            tags: Tags whose entries are deleted.
+
+        Returns:
+            Number of entries deleted before completion or the first error.
+        """
+        deleted_count = 0
+        for tag in tags:
+            tag_key = self._tag_key(tag)
+            batch: list[bytes] = []
+            try:
+                async for member in self.client.sscan_iter(
+                    tag_key, count=self.batch_size
+                ):
+                    batch.append(member)
+                    if len(batch) >= self.batch_size:
+                        deleted_count += await self._invalidate_batch(tag_key, batch)
+                        batch = []
+                if batch:
+                    deleted_count += await self._invalidate_batch(tag_key, batch)
+            except _ERRORS as e:
+                logger.error(
+                    "Redis cache tag invalidation failed",
+                    tag=tag,
+                    deleted=deleted_count,
+                    error=str(e),
+                )
+                return deleted_count
+        logger.info("Invalidated cache tags", tags=list(tags), count=deleted_count)
+        return deleted_count
+
+    async def _invalidate_batch(self, tag_key: str, members: Sequence[bytes]) -> int:
+        """
+        Deletes a batch of tagged entries and removes them from their tag set.
+        """
+        results = await self.cache_client.delete_many(
+            [member.decode() for member in members]
+        )
+        # Members are removed only once deleted; members added meanwhile stay.
+        await self.client.srem(tag_key, *members)
+        return sum(results.values())
+
+    def _tag_key(self, tag: str) -> str:
+        """
+        Returns the key of the set holding the entries of a tag.
+        """
+        return f"{self.prefix}{tag}"
+
+
+@final
+@dataclass(frozen=True, slots=True)
+class NoOpCacheTagIndex(CacheTagIndexProtocol):
+    """
+    CacheTagIndexProtocol implementation for cache backends without tag sets.
+
+    Tags are dropped and invalidations delete nothing, as with
+    CACHE_TAGS_ENABLED unset on Redis.
+    """
+
+    async def add(
+        self, tagged_keys: Mapping[str, Sequence[str]], ttl: int | None = None
+    ) -> None:
+        """
+        Drops the tags of cache entries.
+        """
+
+    async def invalidate_tags(self, tags: Sequence[str]) -> int:
+        """
+        Deletes nothing, since no entry was ever tagged.
+        """
+        logger.warning("Cache tags require CACHE_BACKEND=redis", tags=list(tags))
+        return 0
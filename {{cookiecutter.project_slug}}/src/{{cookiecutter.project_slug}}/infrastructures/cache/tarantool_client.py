@@ -0,0 +1,400 @@
+"""Tarantool implementation of the CacheProtocol.
+
+Entries live in the memtx ``cache`` space created by ``scripts/tarantool-init.lua``
+as ``(key, value, expires_at)`` tuples. Values are sent as plain dictionaries and
+stored as native MessagePack maps, so no extra payload framing is involved. Bulk
+operations and pattern invalidation run as stored Lua functions, one round trip
+per call.
+"""
+
+from collections.abc import AsyncIterator, Mapping, Sequence
+from dataclasses import dataclass
+from typing import Any, final
+
+import structlog
+
+from {{cookiecutter.project_slug}}.application.interfaces.cache import CacheProtocol
+from {{cookiecutter.project_slug}}.infrastructures.cache.failures import report_cache_failure
+
+try:
+    import asynctnt
+    from asynctnt.exceptions import TarantoolError
+except ImportError:  # asynctnt is only installed for the Tarantool cache backend
+    asynctnt = None
+    TarantoolError = OSError
+
+logger = structlog.get_logger(__name__)
+
+_ERRORS = (OSError, TimeoutError, TarantoolError)
+_LUA_MAGIC = set("^$()%.[]*+-?")
+
+
+def glob_to_lua(pattern: str) -> tuple[str, str]:
+    """
+    Translates a Redis-style glob into a literal prefix and an anchored Lua pattern.
+
+    Args:
+        pattern: Glob supporting ``*``, ``?``, ``[...]`` and backslash escapes.
+
+    Returns:
+        A tuple of the literal prefix preceding the first wildcard and the
+        equivalent Lua pattern.
+    """
+    prefix: list[str] = []
+    lua: list[str] = ["^"]
+    literal = True
+    chars = iter(pattern)
+    for char in chars:
+        if char == "\\":
+            char = next(chars, "\\")
+        elif char in "*?[":
+            literal = False
+            if char == "*":
+                lua.append(".*")
+            elif char == "?":
+                lua.append(".")
+            else:
+                lua.append("[")
+                for class_char in chars:
+                    lua.append(f"%{class_char}" if class_char == "%" else class_char)
+                    if class_char == "]":
+                        break
+            continue
+        if literal:
+            prefix.append(char)
+        lua.append(f"%{char}" if char in _LUA_MAGIC else char)
+    lua.append("$")
+    return "".join(prefix), "".join(lua)
+
+
+@final
+@dataclass(frozen=True, slots=True, kw_only=True)
+class TarantoolCacheClient(CacheProtocol):
+    """
+    Tarantool implementation of the CacheProtocol for caching operations.
+
+    Expiration is enforced twice: reads ignore entries past their
+    ``expires_at``, and a fiber in the instance deletes them in the background.
+    Pattern invalidation scans the key index from the literal prefix of the
+    pattern and deletes ``clear_batch_size`` keys per call. The connection is
+    opened on first use and re-opened by the first call after it is lost.
+
+    Attributes:
+        connection: ``asynctnt.Connection`` to the instance.
+        ttl: Default time-to-live in seconds (None for no expiration).
+        clear_batch_size: Keys deleted per call during pattern invalidation.
+    """
+
+    connection: Any
+    ttl: int | None = None
+    clear_batch_size: int = 500
+
+    @classmethod
+    def create(
+        cls,
+        *,
+        host: str,
+        port: int,
+        username: str | None = None,
+        password: str | None = None,
+        request_timeout: float = -1.0,
+        **kwargs: Any,
+    ) -> "TarantoolCacheClient":
+        """
+        Returns a client for a Tarantool instance without connecting to it yet.
+
+        Args:
+            host: Tarantool host.
+            port: Tarantool port.
+            username: User name (None for guest).
+            password: User password.
+            request_timeout: Seconds to wait for a request (-1 for no limit).
+            **kwargs: Remaining TarantoolCacheClient fields.
+
+        Raises:
+            RuntimeError: If asynctnt is not installed.
+        """
+        if asynctnt is None:
+            raise RuntimeError(
+                "The Tarantool cache backend requires the 'asynctnt' package"
+            )
+        connection = asynctnt.Connection(
+            host=host,
+            port=port,
+            username=username,
+            password=password,
+            request_timeout=request_timeout,
+            # Fail fast while Tarantool is down; the next call connects again.
+            reconnect_timeout=0,
+        )
+        return cls(connection=connection, **kwargs)
+
+    async def _call(self, function: str, args: list[Any]) -> Any:
+        """
+        Calls a stored function, connecting first if needed.
+        """
+        if not self.connection.is_connected:
+            await self.connection.connect()
+        return await self.connection.call(function, args)
+
+    async def get(self, key: str) -> dict[str, Any] | None:
+        """
+        Retrieves a value from Tarantool by key.
+
+        Args:
+            key: Cache key to retrieve.
+
+        Returns:
+            Cached dictionary data or None if not found, expired or an error occurs.
+        """
+        return (await self.get_many([key]))[key]
+
+    async def set(
+        self, key: str, value: dict[str, Any], ttl: int | None = None
+    ) -> bool:
+        """
+        Stores a value in Tarantool with an optional TTL.
+
+        Args:
+            key: Cache key to store under.
+            value: Dictionary data to cache.
+            ttl: Time-to-live in seconds (None for default or no expiration).
+
+        Returns:
+            True if successful, False otherwise.
+        """
+        return (await self.set_many({key: value}, ttl))[key]
+
+    async def delete(self, key: str) -> bool:
+        """
+        Deletes a value from Tarantool.
+
+        Args:
+            key: Cache key to delete.
+
+        Returns:
+            True if a live entry was deleted, False otherwise or if an error occurs.
+        """
+        return (await self.delete_many([key]))[key]
+
+    async def exists(self, key: str) -> bool:
+        """
+        Checks if a live entry exists in Tarantool.
+
+        Args:
+            key: Cache key to check.
+
+        Returns:
+            True if key exists, False otherwise or if an error occurs.
+        """
+        return await self.get(key) is not None
+
+    async def get_many(self, keys: Sequence[str]) -> dict[str, dict[str, Any] | None]:
+        """
+        Retrieves several values from Tarantool with one stored-function call.
+
+        Args:
+            keys: Cache keys to retrieve.
+
+        Returns:
+            Mapping of every requested key to its cached dictionary data, or None
+            if the key is missing, expired or an error occurs.
+        """
+        if not keys:
+            return {}
+        try:
+            response = await self._call("cache_get_many", [list(keys)])
+        except _ERRORS as e:
+            report_cache_failure(e)
+            logger.error(
+                "Tarantool get operation failed", count=len(keys), error=str(e)
+            )
+            return dict.fromkeys(keys)
+        return dict(zip(keys, response[0], strict=True))
+
+    async def set_many(
+        self, items: Mapping[str, dict[str, Any]], ttl: int | None = None
+    ) -> dict[str, bool]:
+        """
+        Stores several values in Tarantool in one transaction.
+
+        Args:
+            items: Mapping of cache keys to dictionary data to cache.
+            ttl: Time-to-live in seconds (None for default or no expiration).
+
+        Returns:
+            Mapping of every key to True if it was stored, False otherwise.
+        """
+        if not items:
+            return {}
+        ttl = ttl if ttl is not None else self.ttl
+        try:
+            await self._call(
+                "cache_set_many", [[[key, value] for key, value in items.items()], ttl]
+            )
+        except _ERRORS as e:
+            report_cache_failure(e)
+            logger.error(
+                "Tarantool set operation failed", count=len(items), error=str(e)
+            )
+            return dict.fromkeys(items, False)
+        return dict.fromkeys(items, True)
+
+    async def delete_many(self, keys: Sequence[str]) -> dict[str, bool]:
+        """
+        Deletes several values from Tarantool with one stored-function call.
+
+        Args:
+            keys: Cache keys to delete.
+
+        Returns:
+            Mapping of every key to True if a live entry was deleted, False if it
+            didn't exist or an error occurs.
+        """
+        if not keys:
+            return {}
+        try:
+            response = await self._call("cache_delete_many", [list(keys)])
+        except _ERRORS as e:
+            report_cache_failure(e)
+            logger.error(
+                "Tarantool delete operation failed", count=len(keys), error=str(e)
+            )
+            return dict.fromkeys(keys, False)
+        return dict(zip(keys, response[0], strict=True))
+
+    async def clear(self, pattern: str) -> int:
+        """
+        Clears cache entries matching a pattern in Tarantool.
+
+        Args:
+            pattern: Pattern to match keys (e.g., 'user:*').
+
+        Returns:
+            Number of keys deleted before completion or the first error.
+        """
+        deleted_count = 0
+        try:
+            async for batch_deleted in self.iter_clear(pattern):
+                deleted_count += batch_deleted
+        except _ERRORS as e:
+            logger.error(
+                "Tarantool clear pattern operation failed",
+                pattern=pattern,
+                deleted=deleted_count,
+                error=str(e),
+            )
+            return deleted_count
+        logger.info(
+            "Cleared cache keys matching pattern", pattern=pattern, count=deleted_count
+        )
+        return deleted_count
+
+    async def iter_clear(self, pattern: str) -> AsyncIterator[int]:
+        """
+        Deletes keys matching a pattern batch by batch.
+
+        Args:
+            pattern: Pattern to match keys (e.g., 'user:*').
+
+        Yields:
+            Number of keys deleted by each batch.
+
+        Raises:
+            asynctnt.exceptions.TarantoolError: If a batch fails.
+        """
+        prefix, lua_pattern = glob_to_lua(pattern)
+        cursor = None
+        while True:
+            response = await self._call(
+                "cache_clear_batch",
+                [prefix, lua_pattern, cursor, self.clear_batch_size],
+            )
+            deleted, cursor = response[0], response[1]
+            if deleted:
+                yield deleted
+            if cursor is None:
+                return
+
+    async def incr(self, key: str) -> int:
+        """
+        Atomically increments an integer counter stored without TTL.
+
+        Args:
+            key: Counter key.
+
+        Returns:
+            The new counter value.
+
+        Raises:
+            asynctnt.exceptions.TarantoolError: If the counter cannot be incremented.
+        """
+        response = await self._call("cache_incr", [key])
+        return int(response[0])
+
+    async def get_counter(self, key: str) -> int | None:
+        """
+        Returns the value of a counter stored by ``incr``.
+
+        Args:
+            key: Counter key.
+
+        Returns:
+            The counter value, or None if it was never incremented.
+
+        Raises:
+            asynctnt.exceptions.TarantoolError: If the counter cannot be read.
+        """
+        response = await self._call("cache_get_many", [[key]])
+        value = response[0][0]
+        return None if value is None else int(value)
+
+    async def close(self) -> None:
+        """
+        Closes the Tarantool connection.
+        """
+        try:
+            await self.connection.disconnect()
+            logger.info("Tarantool connection closed")
+        except _ERRORS as e:
+            logger.error("Failed to close Tarantool connection", error=str(e))
+
+
+@final
+@dataclass(frozen=True, slots=True, kw_only=True)
+class TarantoolCounters:
+    """
+    Counter store over a TarantoolCacheClient, used for cache key generations.
+
+    Tarantool errors are re-raised as ConnectionError so callers can handle
+    both cache backends the same way.
+
+    Attributes:
+        client: Tarantool cache client holding the counters.
+    """
+
+    client: TarantoolCacheClient
+
+    async def get(self, name: str) -> int | None:
+        """
+        Returns the value of a counter, or None if it was never incremented.
+
+        Raises:
+            ConnectionError: If the counter cannot be read.
+        """
+        try:
+            return await self.client.get_counter(name)
+        except _ERRORS as e:
+            raise ConnectionError(str(e)) from e
+
+    async def incr(self, name: str) -> int:
+        """
+        Atomically increments a counter and returns its new value.
+
+        Raises:
+            ConnectionError: If the counter cannot be incremented.
+        """
+        try:
+            return await self.client.incr(name)
+        except _ERRORS as e:
+            raise ConnectionError(str(e)) from e
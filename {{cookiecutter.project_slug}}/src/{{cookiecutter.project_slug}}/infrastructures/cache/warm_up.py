@@ -0,0 +1,31 @@
+from dataclasses import replace
+
+from dishka import AsyncContainer
+
+from {{cookiecutter.project_slug}}.application.use_cases.warm_up_artifact_cache import (
+    WarmUpArtifactCacheUseCase,
+)
+
+
+async def warm_up_cache(
+    container: AsyncContainer, limit: int, max_rate: float | None = None
+) -> int:
+    """
+    Runs a cache warm-up in its own request scope.
+
+    Shared by the application lifespan (CACHE_WARMUP_ON_STARTUP) and the
+    warm-up command.
+
+    Args:
+        container: Application DI container.
+        limit: Maximum number of artifacts to load.
+        max_rate: Overrides the configured rate limit in artifacts per second.
+
+    Returns:
+        Number of artifacts written to the cache.
+    """
+    async with container() as request_container:
+        use_case = await request_container.get(WarmUpArtifactCacheUseCase)
+        if max_rate is not None:
+            use_case = replace(use_case, max_rate=max_rate or None)
+        return await use_case(limit)
@@ -0,0 +1,76 @@
+import asyncio
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+from typing import final
+
+import structlog
+
+from {{cookiecutter.project_slug}}.application.interfaces.cache import CacheRefresherProtocol
+
+logger = structlog.get_logger(__name__)
+
+
+@final
+@dataclass(slots=True, kw_only=True)
+class AsyncioBackgroundRefresher(CacheRefresherProtocol):
+    """
+    In-process implementation of the CacheRefresherProtocol based on asyncio tasks.
+
+    The instance is meant to live for the whole worker (APP scope). At most one
+    refresh per key runs at a time, and at most ``max_concurrency`` refreshes
+    run concurrently; failures are logged and never reach the request that
+    triggered the refresh.
+
+    Attributes:
+        refresh: Coroutine factory performing the refresh of one key.
+        max_concurrency: Maximum number of refreshes running at the same time.
+    """
+
+    refresh: Callable[[str], Awaitable[None]]
+    max_concurrency: int = 16
+    _tasks: dict[str, asyncio.Task[None]] = field(default_factory=dict, init=False)
+    _semaphore: asyncio.Semaphore = field(init=False)
+
+    def __post_init__(self) -> None:
+        """
+        Creates the semaphore bounding concurrent refreshes.
+        """
+        self._semaphore = asyncio.Semaphore(self.max_concurrency)
+
+    def schedule(self, key: str) -> bool:
+        """
+        Schedules a background refresh of ``key`` unless one is already running.
+
+        Args:
+            key: Cache key to refresh.
+
+        Returns:
+            True if a refresh was scheduled, False if one is already running.
+        """
+        if key in self._tasks:
+            return False
+        task = asyncio.create_task(self._run(key))
+        self._tasks[key] = task
+        task.add_done_callback(lambda _: self._tasks.pop(key, None))
+        return True
+
+    async def close(self) -> None:
+        """
+        Cancels pending refreshes and waits for them to finish.
+        """
+        tasks = list(self._tasks.values())
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._tasks.clear()
+
+    async def _run(self, key: str) -> None:
+        """
+        Runs one refresh, logging instead of propagating failures.
+        """
+        async with self._semaphore:
+            try:
+                await self.refresh(key)
+                logger.info("Cache entry refreshed in background", key=key)
+            except Exception as e:
+                logger.warning("Background cache refresh failed", key=key, error=str(e))
@@ -0,0 +1,258 @@
+import asyncio
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+import heapq
+from operator import itemgetter
+import time
+from typing import final
+
+import structlog
+
+from {{cookiecutter.project_slug}}.application.dtos.cache import CachePrefetchStatsDTO
+from {{cookiecutter.project_slug}}.application.interfaces.cache import CachePrefetcherProtocol
+
+logger = structlog.get_logger(__name__)
+
+# Successor counts of a key are halved once they add up to this, so the model
+# follows changing browsing patterns instead of its whole history.
+_MAX_SOURCE_COUNT = 1024
+
+
+@final
+@dataclass(slots=True, kw_only=True)
+class CoAccessModel:
+    """
+    Bounded first-order model of which key a client reads after which.
+
+    For each of the ``max_sources`` most recently read keys, at most
+    ``max_successors`` successors are counted (space-saving: a new successor
+    replaces the least counted one and inherits its count), so memory stays
+    bounded whatever the number of keys and clients.
+
+    Attributes:
+        max_sources: Keys whose successors are tracked.
+        max_successors: Successors counted per key.
+        max_clients: Clients whose last key is remembered.
+    """
+
+    max_sources: int = 10_000
+    max_successors: int = 8
+    max_clients: int = 10_000
+    _successors: OrderedDict[str, dict[str, int]] = field(
+        default_factory=OrderedDict, init=False
+    )
+    _last_keys: OrderedDict[str, str] = field(default_factory=OrderedDict, init=False)
+
+    @property
+    def sources(self) -> int:
+        """
+        Number of keys whose successors are tracked.
+        """
+        return len(self._successors)
+
+    @property
+    def clients(self) -> int:
+        """
+        Number of clients whose last key is remembered.
+        """
+        return len(self._last_keys)
+
+    def observe(self, client_id: str, key: str) -> None:
+        """
+        Counts the transition from the previous key of a client to ``key``.
+        """
+        previous = self._last_keys.pop(client_id, None)
+        self._last_keys[client_id] = key
+        if len(self._last_keys) > self.max_clients:
+            self._last_keys.popitem(last=False)
+        if previous is None or previous == key:
+            return
+
+        successors = self._successors.pop(previous, None) or {}
+        self._successors[previous] = successors
+        if len(self._successors) > self.max_sources:
+            self._successors.popitem(last=False)
+        if key in successors:
+            successors[key] += 1
+        elif len(successors) < self.max_successors:
+            successors[key] = 1
+        else:
+            evicted = min(successors, key=successors.__getitem__)
+            successors[key] = successors.pop(evicted) + 1
+        if sum(successors.values()) >= _MAX_SOURCE_COUNT:
+            for successor, count in list(successors.items()):
+                if count > 1:
+                    successors[successor] = count // 2
+                else:
+                    del successors[successor]
+
+    def predict(self, key: str, top_k: int, min_confidence: float) -> list[str]:
+        """
+        Returns up to ``top_k`` likely successors of ``key``, most likely first.
+
+        Args:
+            key: Key just read.
+            top_k: Maximum number of successors.
+            min_confidence: Minimum share of the transitions out of ``key`` a
+                successor must account for.
+        """
+        successors = self._successors.get(key)
+        if not successors:
+            return []
+        total = sum(successors.values())
+        return [
+            successor
+            for successor, count in heapq.nlargest(
+                top_k, successors.items(), key=itemgetter(1)
+            )
+            if count / total >= min_confidence
+        ]
+
+
+@final
+@dataclass(slots=True, kw_only=True)
+class AsyncioCoAccessPrefetcher(CachePrefetcherProtocol):
+    """
+    In-process implementation of the CachePrefetcherProtocol based on asyncio tasks.
+
+    The instance is meant to live for the whole worker (APP scope). Every read
+    is fed to a CoAccessModel; the likely successors of the key just read are
+    then prefetched in background tasks, which never delay the request.
+
+    Prefetches are speculative, so they are dropped rather than queued when
+    the budget is spent: at most ``max_concurrency`` run at a time, and at most
+    ``budget`` start per second. A warmed key counts as a hit when a client
+    reads it within ``hit_window`` seconds; the hit rate tells whether the
+    extra loads pay off.
+
+    Attributes:
+        prefetch: Coroutine factory loading one key into the cache, returning
+            False if there was nothing to load.
+        model: Co-access model the predictions come from.
+        top_k: Successors prefetched after each read.
+        min_confidence: Minimum share of the transitions out of a key a
+            successor must account for to be prefetched.
+        budget: Prefetches started per second at most.
+        max_concurrency: Prefetches running at the same time at most.
+        hit_window: Seconds a warmed key may wait for its read to count as a hit.
+    """
+
+    prefetch: Callable[[str], Awaitable[bool]]
+    model: CoAccessModel = field(default_factory=CoAccessModel)
+    top_k: int = 3
+    min_confidence: float = 0.2
+    budget: float = 20.0
+    max_concurrency: int = 4
+    hit_window: float = 300.0
+    clock: Callable[[], float] = field(default=time.monotonic, repr=False)
+    _tasks: dict[str, asyncio.Task[None]] = field(default_factory=dict, init=False)
+    # Warmed keys not read yet, with the time they were warmed.
+    _warmed_at: OrderedDict[str, float] = field(default_factory=OrderedDict, init=False)
+    _tokens: float = field(default=0.0, init=False)
+    _refilled_at: float = field(default=0.0, init=False)
+    _scheduled: int = field(default=0, init=False)
+    _dropped: int = field(default=0, init=False)
+    _warmed: int = field(default=0, init=False)
+    _skipped: int = field(default=0, init=False)
+    _failed: int = field(default=0, init=False)
+    _hits: int = field(default=0, init=False)
+
+    def __post_init__(self) -> None:
+        """
+        Starts with a full budget.
+        """
+        self._tokens = self.budget
+        self._refilled_at = self.clock()
+
+    def observe(self, client_id: str, key: str) -> None:
+        """
+        Records a read and prefetches the likely successors of ``key``.
+
+        Args:
+            client_id: Identity of the reading client.
+            key: Key the client just read.
+        """
+        warmed_at = self._warmed_at.pop(key, None)
+        if warmed_at is not None and self.clock() - warmed_at <= self.hit_window:
+            self._hits += 1
+        self.model.observe(client_id, key)
+        for successor in self.model.predict(key, self.top_k, self.min_confidence):
+            self._schedule(successor)
+
+    def stats(self) -> CachePrefetchStatsDTO:
+        """
+        Returns the prefetch and hit counters of this worker.
+        """
+        return CachePrefetchStatsDTO(
+            sources=self.model.sources,
+            clients=self.model.clients,
+            scheduled=self._scheduled,
+            dropped=self._dropped,
+            warmed=self._warmed,
+            skipped=self._skipped,
+            failed=self._failed,
+            hits=self._hits,
+            hit_rate=self._hits / self._warmed if self._warmed else 0.0,
+        )
+
+    async def close(self) -> None:
+        """
+        Cancels running prefetches and waits for them to finish.
+        """
+        tasks = list(self._tasks.values())
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._tasks.clear()
+
+    def _schedule(self, key: str) -> None:
+        """
+        Starts a prefetch of ``key`` if it is not already warm and the budget allows.
+        """
+        if key in self._tasks or key in self._warmed_at:
+            return
+        if len(self._tasks) >= self.max_concurrency or not self._take_token():
+            self._dropped += 1
+            return
+        self._scheduled += 1
+        task = asyncio.create_task(self._run(key))
+        self._tasks[key] = task
+        task.add_done_callback(lambda _: self._tasks.pop(key, None))
+
+    def _take_token(self) -> bool:
+        """
+        Spends one unit of the per-second budget, refilled continuously.
+        """
+        now = self.clock()
+        self._tokens = min(
+            self.budget, self._tokens + (now - self._refilled_at) * self.budget
+        )
+        self._refilled_at = now
+        if self._tokens < 1:
+            return False
+        self._tokens -= 1
+        return True
+
+    async def _run(self, key: str) -> None:
+        """
+        Runs one prefetch, logging instead of propagating failures.
+        """
+        try:
+            warmed = await self.prefetch(key)
+        except Exception as e:
+            self._failed += 1
+            logger.warning("Cache prefetch failed", key=key, error=str(e))
+            return
+        if not warmed:
+            self._skipped += 1
+            return
+        self._warmed += 1
+        now = self.clock()
+        self._warmed_at[key] = now
+        # Keys never read after being warmed are forgotten oldest first.
+        while self._warmed_at and (
+            len(self._warmed_at) > self.model.max_sources
+            or now - next(iter(self._warmed_at.values())) > self.hit_window
+        ):
+            self._warmed_at.popitem(last=False)
@@ -0,0 +1,141 @@
+import asyncio
+from dataclasses import dataclass
+import secrets
+from typing import final
+
+import structlog
+
+from {{cookiecutter.project_slug}}.application.interfaces.lease import LeaseProtocol
+from {{cookiecutter.project_slug}}.infrastructures.cache.circuit_breaker import (
+    CacheBypassedError,
+    CacheCircuitBreaker,
+    guard_cache_call,
+)
+from {{cookiecutter.project_slug}}.infrastructures.cache.redis_client import RedisClient
+
+try:
+    import redis.exceptions
+except ImportError:  # redis-py is only installed with the Redis-family cache backends
+    _ERRORS: tuple[type[Exception], ...] = (ConnectionError,)
+else:
+    _ERRORS = (ConnectionError, redis.exceptions.RedisError)
+
+logger = structlog.get_logger(__name__)
+
+# Deletes the lease only if it still holds the caller's token, so a holder whose
+# lease expired cannot release the lease taken over by someone else.
+RELEASE_SCRIPT = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+    return redis.call('DEL', KEYS[1])
+end
+return 0
+"""
+
+
+@final
+@dataclass(frozen=True, slots=True, kw_only=True)
+class RedisLease(LeaseProtocol):
+    """
+    Redis implementation of the LeaseProtocol.
+
+    A lease is a ``SET NX PX`` of a random token under ``prefix + key``, and is
+    released by a compare-and-delete script. Waiters poll the remaining TTL of
+    the lease, so they resume as soon as the holder releases it and at the
+    latest when it expires. Polling works on any Redis deployment, unlike
+    keyspace notifications, which must be enabled on the server.
+
+    Leases fail open: when Redis is unreachable, ``acquire`` hands out a token
+    that is not stored anywhere and ``wait`` returns immediately, so callers
+    fall back to loading the value themselves. With ``breaker``, every lease
+    call goes through the cache circuit breaker, so it is bounded by its call
+    timeout and fails open without reaching Redis while the cache is bypassed.
+
+    Attributes:
+        client: Redis client storing the leases.
+        prefix: Prefix of the lease keys.
+        ttl: Lease lifetime in seconds; should exceed the time to load a value.
+        poll_interval: Seconds between two checks of a held lease.
+        breaker: Cache circuit breaker guarding the lease calls.
+    """
+
+    client: RedisClient
+    prefix: str = "lease:"
+    ttl: float = 5.0
+    poll_interval: float = 0.05
+    breaker: CacheCircuitBreaker | None = None
+
+    async def acquire(self, key: str) -> str | None:
+        """
+        Tries to take the lease on a key.
+
+        Args:
+            key: Key to lease.
+
+        Returns:
+            A token identifying this holder, or None if the lease is held elsewhere.
+        """
+        token = secrets.token_hex(16)
+        try:
+            async with guard_cache_call(self.breaker):
+                acquired = await self.client.set(
+                    self._lease_key(key), token, nx=True, px=int(self.ttl * 1000)
+                )
+        except CacheBypassedError:
+            return token
+        except _ERRORS as e:
+            logger.error("Redis lease acquisition failed", key=key, error=str(e))
+            return token
+        return token if acquired else None
+
+    async def release(self, key: str, token: str) -> bool:
+        """
+        Releases a lease if it is still held with the given token.
+
+        Args:
+            key: Leased key.
+            token: Token returned by ``acquire``.
+
+        Returns:
+            True if the lease was released, False if it had already expired.
+        """
+        try:
+            async with guard_cache_call(self.breaker):
+                released = await self.client.eval(
+                    RELEASE_SCRIPT, 1, self._lease_key(key), token
+                )
+        except CacheBypassedError:
+            return False
+        except _ERRORS as e:
+            logger.error("Redis lease release failed", key=key, error=str(e))
+            return False
+        return bool(released)
+
+    async def wait(self, key: str) -> None:
+        """
+        Waits until the lease on a key is released or expires.
+
+        Args:
+            key: Leased key.
+        """
+        lease_key = self._lease_key(key)
+        loop = asyncio.get_running_loop()
+        # A lease is never renewed, so nobody holds one for longer than its TTL.
+        deadline = loop.time() + self.ttl
+        while (remaining := deadline - loop.time()) > 0:
+            try:
+                async with guard_cache_call(self.breaker):
+                    pttl = await self.client.pttl(lease_key)
+            except CacheBypassedError:
+                return
+            except _ERRORS as e:
+                logger.error("Redis lease check failed", key=key, error=str(e))
+                return
+            if pttl < 0:
+                return
+            await asyncio.sleep(min(self.poll_interval, pttl / 1000, remaining))
+
+    def _lease_key(self, key: str) -> str:
+        """
+        Returns the Redis key holding the lease on a key.
+        """
+        return f"{self.prefix}{key}"
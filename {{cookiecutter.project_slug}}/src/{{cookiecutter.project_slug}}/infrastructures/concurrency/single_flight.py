@@ -0,0 +1,96 @@
+import asyncio
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+from typing import Any, TypeVar, final
+
+import structlog
+
+from {{cookiecutter.project_slug}}.application.dtos.cache import SingleFlightStatsDTO
+from {{cookiecutter.project_slug}}.application.interfaces.single_flight import SingleFlightProtocol
+
+T = TypeVar("T")
+
+logger = structlog.get_logger(__name__)
+
+
+class _LeaderCancelledError(Exception):
+    """Signals waiters that the leading call was cancelled and must be retried."""
+
+
+@final
+@dataclass(slots=True, kw_only=True)
+class AsyncioSingleFlight(SingleFlightProtocol):
+    """
+    In-process implementation of the SingleFlightProtocol based on asyncio futures.
+
+    The instance is meant to live for the whole worker (APP scope): the first
+    coroutine for a key becomes the leader and runs the work, concurrent
+    coroutines await the leader's future. Waiters are shielded, so cancelling
+    a waiter never cancels the shared execution. If the leader itself is
+    cancelled, one of the waiters takes over as the new leader.
+    """
+
+    _in_flight: dict[str, asyncio.Future[Any]] = field(default_factory=dict, init=False)
+    _calls: int = field(default=0, init=False)
+    _executions: int = field(default=0, init=False)
+    _coalesced: int = field(default=0, init=False)
+    _errors: int = field(default=0, init=False)
+
+    async def do(self, key: str, fn: Callable[[], Awaitable[T]]) -> T:
+        """
+        Runs ``fn`` once per key for all concurrent callers.
+
+        Args:
+            key: Key identifying the work to deduplicate.
+            fn: Zero-argument coroutine factory performing the work.
+
+        Returns:
+            The result of the (possibly shared) execution.
+
+        Raises:
+            Exception: Whatever the leading execution raised.
+        """
+        self._calls += 1
+        joined = False
+        while (future := self._in_flight.get(key)) is not None:
+            if not joined:
+                self._coalesced += 1
+                joined = True
+            try:
+                return await asyncio.shield(future)
+            except _LeaderCancelledError:
+                logger.debug("Single-flight leader cancelled, retrying", key=key)
+
+        future = asyncio.get_running_loop().create_future()
+        self._in_flight[key] = future
+        self._executions += 1
+        try:
+            result = await fn()
+        except asyncio.CancelledError:
+            future.set_exception(_LeaderCancelledError())
+            raise
+        except Exception as e:
+            self._errors += 1
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            if self._in_flight.get(key) is future:
+                del self._in_flight[key]
+            # Mark the exception as retrieved when nobody was waiting for it.
+            if future.done() and not future.cancelled():
+                future.exception()
+
+    def stats(self) -> SingleFlightStatsDTO:
+        """
+        Returns a snapshot of the coordinator counters.
+        """
+        return SingleFlightStatsDTO(
+            calls=self._calls,
+            executions=self._executions,
+            coalesced=self._coalesced,
+            errors=self._errors,
+            in_flight=len(self._in_flight),
+        )
@@ -4,15 +4,28 @@ This mapper is responsible for the conversion logic between the domain layer
 and the database persistence layer, following the Single Responsibility Principle.
 """
 
+from collections.abc import Sequence
 from dataclasses import dataclass
-from typing import final
+from datetime import UTC, datetime
+from typing import Any, ClassVar, final
 
+from {{cookiecutter.project_slug}}.application.dtos.artifact import ArtifactDTO, EraDTO, MaterialDTO
 from {{cookiecutter.project_slug}}.domain.entities.artifact import ArtifactEntity
 from {{cookiecutter.project_slug}}.domain.value_objects.era import Era
 from {{cookiecutter.project_slug}}.domain.value_objects.material import Material
 from {{cookiecutter.project_slug}}.infrastructures.db.models.artifact import ArtifactModel
 
 
+def _as_utc(value: datetime) -> datetime:
+    """
+    Returns a timestamp read from the database as an aware UTC datetime.
+
+    Drivers without time zone support (SQLite) return the stored UTC wall time
+    as a naive datetime.
+    """
+    return value if value.tzinfo is not None else value.replace(tzinfo=UTC)
+
+
 @final
 @dataclass(frozen=True, slots=True)
 class ArtifactDBMapper:
@@ -23,6 +36,28 @@ class ArtifactDBMapper:
     between the domain logic and database persistence.
     """
 
+    # Columns an upsert overwrites on an existing row; the inventory ID is the
+    # conflict target and the creation time is kept.
+    UPDATE_COLUMNS: ClassVar[tuple[str, ...]] = (
+        "name",
+        "era",
+        "material",
+        "description",
+        "acquisition_date",
+        "department",
+    )
+    # Columns a lean read selects, in the order ``row_to_dto`` unpacks them.
+    READ_COLUMNS: ClassVar[tuple[str, ...]] = (
+        "inventory_id",
+        "created_at",
+        "acquisition_date",
+        "name",
+        "department",
+        "era",
+        "material",
+        "description",
+    )
+
     def to_entity(self, model: ArtifactModel) -> ArtifactEntity:
         """
         Converts an SQLAlchemy ArtifactModel to a Domain ArtifactEntity.
@@ -35,8 +70,8 @@ class ArtifactDBMapper:
         """
         return ArtifactEntity(
             inventory_id=model.inventory_id,
-            created_at=model.created_at,
-            acquisition_date=model.acquisition_date,
+            created_at=_as_utc(model.created_at),
+            acquisition_date=_as_utc(model.acquisition_date),
             name=model.name,
             department=model.department,
             era=Era(value=model.era),
@@ -44,6 +79,42 @@ class ArtifactDBMapper:
             description=model.description,
         )
 
+    def row_to_dto(self, row: Sequence[Any]) -> ArtifactDTO:
+        """
+        Converts a row of ``READ_COLUMNS`` straight to an Application ArtifactDTO.
+
+        Used by lean reads, which skip the ORM model and the Domain entity: the
+        row was validated as an entity when it was saved, so it is not
+        validated again.
+
+        Args:
+            row: The column values, in ``READ_COLUMNS`` order (a SQLAlchemy Row
+                or a driver record).
+
+        Returns:
+            An ArtifactDTO instance.
+        """
+        (
+            inventory_id,
+            created_at,
+            acquisition_date,
+            name,
+            department,
+            era,
+            material,
+            description,
+        ) = row
+        return ArtifactDTO(
+            inventory_id=inventory_id,
+            created_at=_as_utc(created_at),
+            acquisition_date=_as_utc(acquisition_date),
+            name=name,
+            department=department,
+            era=EraDTO(value=era),
+            material=MaterialDTO(value=material),
+            description=description,
+        )
+
     def to_model(self, entity: ArtifactEntity) -> ArtifactModel:
         """
         Converts a Domain ArtifactEntity to an SQLAlchemy ArtifactModel.
@@ -65,6 +136,29 @@ class ArtifactDBMapper:
             description=entity.description,
         )
 
+    def to_row(self, entity: ArtifactEntity) -> dict[str, Any]:
+        """
+        Converts a Domain ArtifactEntity to the column values of its table row.
+
+        Used by statements that bypass the ORM unit of work, such as upserts.
+
+        Args:
+            entity: The Domain ArtifactEntity instance.
+
+        Returns:
+            A mapping of ArtifactModel column names to values.
+        """
+        return {
+            "inventory_id": entity.inventory_id,
+            "created_at": entity.created_at,
+            "acquisition_date": entity.acquisition_date,
+            "name": entity.name,
+            "department": entity.department,
+            "era": str(entity.era),
+            "material": str(entity.material),
+            "description": entity.description,
+        }
+
     def update_model_from_entity(
         self, model: ArtifactModel, entity: ArtifactEntity
     ) -> None:
@@ -0,0 +1,26 @@
+"""Add index on artifacts.created_at
+
+Revision ID: 5b1e7f2a9c4d
+Revises: c3cca8a62218
+Create Date: 2026-10-18 09:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "5b1e7f2a9c4d"
+down_revision: str | None = "c3cca8a62218"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    # Supports streaming the most recent artifacts (cache warm-up)
+    op.create_index("ix_artifacts_created_at", "artifacts", ["created_at"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_artifacts_created_at", table_name="artifacts")
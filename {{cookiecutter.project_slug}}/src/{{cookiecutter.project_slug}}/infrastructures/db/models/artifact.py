@@ -19,6 +19,7 @@ class ArtifactModel:
     __table_args__ = (
         Index("ix_artifacts_name", "name"),
         Index("ix_artifacts_department", "department"),
+        Index("ix_artifacts_created_at", "created_at"),
     )
 
     def __init__(
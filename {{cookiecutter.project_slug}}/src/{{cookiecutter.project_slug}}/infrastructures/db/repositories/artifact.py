@@ -1,11 +1,16 @@
+from collections.abc import AsyncIterator, Iterable, Iterator, Sequence
 from dataclasses import dataclass
-from typing import final
+from typing import Any, final
 from uuid import UUID
 
+from sqlalchemy import Table, any_, bindparam
+from sqlalchemy.dialects import mysql, postgresql, sqlite
 from sqlalchemy.exc import IntegrityError, SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
+from sqlalchemy.sql.expression import ColumnElement, Executable
 
+from {{cookiecutter.project_slug}}.application.dtos.artifact import ArtifactDTO
 from {{cookiecutter.project_slug}}.application.interfaces.repositories import ArtifactRepositoryProtocol
 from {{cookiecutter.project_slug}}.domain.entities.artifact import ArtifactEntity
 from {{cookiecutter.project_slug}}.infrastructures.db.exceptions import (
@@ -13,7 +18,40 @@ from {{cookiecutter.project_slug}}.infrastructures.db.exceptions import (
     RepositorySaveError,
 )
 from {{cookiecutter.project_slug}}.infrastructures.db.mappers.artifact_db_mapper import ArtifactDBMapper
-from {{cookiecutter.project_slug}}.infrastructures.db.models.artifact import ArtifactModel
+from {{cookiecutter.project_slug}}.infrastructures.db.models.artifact import ArtifactModel, mapper_registry
+from {{cookiecutter.project_slug}}.infrastructures.db.routing import DatabaseRouter
+
+_UUID_ARRAY = postgresql.ARRAY(postgresql.UUID(as_uuid=True))
+
+_TABLE: Table = mapper_registry.metadata.tables[ArtifactModel.__tablename__]
+# Lean reads select the mapped columns only, so rows skip the ORM entirely.
+_LEAN_SELECT = select(*(_TABLE.c[name] for name in ArtifactDBMapper.READ_COLUMNS))
+_LEAN_SELECT_ONE = _LEAN_SELECT.where(
+    _TABLE.c.inventory_id == bindparam("inventory_id")
+)
+# The same reads compiled to asyncpg statements ($1 parameters), prepared once
+# per connection by the driver.
+_DRIVER_DIALECT = postgresql.asyncpg.dialect()
+_DRIVER_SELECT_ONE = str(_LEAN_SELECT_ONE.compile(dialect=_DRIVER_DIALECT))
+_DRIVER_SELECT_MANY = str(
+    _LEAN_SELECT.where(
+        _TABLE.c.inventory_id == any_(bindparam("inventory_ids", type_=_UUID_ARRAY))
+    ).compile(dialect=_DRIVER_DIALECT)
+)
+
+
+def _to_uuids(inventory_ids: Iterable[str | UUID]) -> Iterator[UUID]:
+    """
+    Yields the inventory IDs that are UUIDs, parsing strings.
+    """
+    for inventory_id in inventory_ids:
+        if isinstance(inventory_id, UUID):
+            yield inventory_id
+            continue
+        try:
+            yield UUID(inventory_id)
+        except ValueError:
+            continue
 
 
 @final
@@ -23,10 +61,35 @@ class ArtifactRepositorySQLAlchemy(ArtifactRepositoryProtocol):
 
     This repository is responsible for database operations (CRUD) only.
     Mapping logic is delegated to ArtifactDBMapper following SRP.
+
+    Writes go to the database the session is bound to (the primary). With a
+    router, reads are sent to a read replica unless they look up an artifact
+    written within the read-your-writes window.
+
+    ``get_dto_by_inventory_id`` and ``get_dtos_by_inventory_ids`` are lean
+    reads for query use cases: a column-level Core SELECT whose rows are mapped
+    straight to DTOs, without ORM models, identity map, Domain entities or
+    their validation. With ``driver_statements`` on asyncpg they run as raw
+    driver statements, which also skips SQLAlchemy's statement compilation and
+    result processing.
+
+    Attributes:
+        session: Session the statements run in.
+        mapper: Mapper between entities and rows.
+        batch_size: Rows written per upsert statement and IDs per IN list,
+            keeping the bound parameters of a statement within the limits of
+            every driver.
+        router: Router choosing the database of each read (None to read from
+            the session database).
+        driver_statements: Whether lean reads run as raw asyncpg statements
+            (ignored with any other driver).
     """
 
     session: AsyncSession
     mapper: ArtifactDBMapper
+    batch_size: int = 500
+    router: DatabaseRouter | None = None
+    driver_statements: bool = False
 
     async def get_by_inventory_id(
         self, inventory_id: str | UUID
@@ -47,7 +110,9 @@ class ArtifactRepositorySQLAlchemy(ArtifactRepositoryProtocol):
             stmt = select(ArtifactModel).where(
                 ArtifactModel.inventory_id == inventory_id
             )
-            result = await self.session.execute(stmt)
+            result = await self.session.execute(
+                stmt, bind_arguments=self._read_bind(_to_uuids([inventory_id]))
+            )
             artifact_model = result.scalar_one_or_none()
             if artifact_model is None:
                 return None
@@ -57,10 +122,165 @@ class ArtifactRepositorySQLAlchemy(ArtifactRepositoryProtocol):
                 f"Failed to retrieve artifact by inventory_id '{inventory_id}': {e}"
             ) from e
 
+    async def get_many_by_inventory_ids(
+        self, inventory_ids: Sequence[str | UUID]
+    ) -> dict[UUID, ArtifactEntity]:
+        """
+        Retrieves several artifacts by their inventory IDs from the database.
+
+        On PostgreSQL the IDs are bound as one array parameter
+        (``inventory_id = ANY(:inventory_ids)``), so the statement text and its
+        plan do not depend on the number of IDs; elsewhere they are sent as IN
+        lists of at most ``batch_size`` IDs. IDs that are not UUIDs cannot
+        match a row and are skipped.
+
+        Args:
+            inventory_ids: The unique identifiers of the artifacts.
+
+        Returns:
+            A mapping of inventory ID to ArtifactEntity for every artifact found.
+
+        Raises:
+            RepositorySaveError: If a database error occurs during retrieval.
+        """
+        uuids = list(dict.fromkeys(_to_uuids(inventory_ids)))
+        if not uuids:
+            return {}
+        try:
+            bind_arguments = self._read_bind(uuids)
+            artifacts: dict[UUID, ArtifactEntity] = {}
+            for condition in self._inventory_id_conditions(uuids):
+                models = await self.session.scalars(
+                    select(ArtifactModel).where(condition),
+                    bind_arguments=bind_arguments,
+                )
+                for model in models:
+                    artifacts[model.inventory_id] = self.mapper.to_entity(model)
+            return artifacts
+        except SQLAlchemyError as e:
+            raise RepositorySaveError(
+                f"Failed to retrieve {len(uuids)} artifacts by inventory_id: {e}"
+            ) from e
+
+    async def get_dto_by_inventory_id(
+        self, inventory_id: str | UUID
+    ) -> ArtifactDTO | None:
+        """
+        Retrieves an artifact by its inventory ID straight as a DTO.
+
+        Args:
+            inventory_id: The unique identifier of the artifact.
+
+        Returns:
+            The ArtifactDTO if found, otherwise None.
+
+        Raises:
+            RepositorySaveError: If a database error occurs during retrieval.
+        """
+        uuids = list(_to_uuids([inventory_id]))
+        if not uuids:
+            return None
+        try:
+            bind_arguments = self._read_bind(uuids)
+            driver_connection = await self._driver_connection(bind_arguments)
+            if driver_connection is not None:
+                row = await driver_connection.fetchrow(_DRIVER_SELECT_ONE, uuids[0])
+            else:
+                result = await self.session.execute(
+                    _LEAN_SELECT_ONE,
+                    {"inventory_id": uuids[0]},
+                    bind_arguments=bind_arguments,
+                )
+                row = result.one_or_none()
+        except Exception as e:
+            # Raw statements raise the driver's own errors, not SQLAlchemyError.
+            raise RepositorySaveError(
+                f"Failed to retrieve artifact by inventory_id '{inventory_id}': {e}"
+            ) from e
+        return None if row is None else self.mapper.row_to_dto(row)
+
+    async def get_dtos_by_inventory_ids(
+        self, inventory_ids: Sequence[str | UUID]
+    ) -> dict[UUID, ArtifactDTO]:
+        """
+        Retrieves several artifacts by their inventory IDs straight as DTOs.
+
+        The IDs are bound as in ``get_many_by_inventory_ids``.
+
+        Args:
+            inventory_ids: The unique identifiers of the artifacts.
+
+        Returns:
+            A mapping of inventory ID to ArtifactDTO for every artifact found.
+
+        Raises:
+            RepositorySaveError: If a database error occurs during retrieval.
+        """
+        uuids = list(dict.fromkeys(_to_uuids(inventory_ids)))
+        if not uuids:
+            return {}
+        try:
+            bind_arguments = self._read_bind(uuids)
+            driver_connection = await self._driver_connection(bind_arguments)
+            if driver_connection is not None:
+                rows: Iterable[Sequence[Any]] = await driver_connection.fetch(
+                    _DRIVER_SELECT_MANY, uuids
+                )
+            else:
+                rows = []
+                for condition in self._inventory_id_conditions(uuids):
+                    result = await self.session.execute(
+                        _LEAN_SELECT.where(condition), bind_arguments=bind_arguments
+                    )
+                    rows.extend(result.all())
+        except Exception as e:
+            # Raw statements raise the driver's own errors, not SQLAlchemyError.
+            raise RepositorySaveError(
+                f"Failed to retrieve {len(uuids)} artifacts by inventory_id: {e}"
+            ) from e
+        artifacts = (self.mapper.row_to_dto(row) for row in rows)
+        return {artifact.inventory_id: artifact for artifact in artifacts}
+
+    async def stream_recent(
+        self, limit: int, batch_size: int
+    ) -> AsyncIterator[Sequence[ArtifactEntity]]:
+        """
+        Streams the most recently created artifacts from the database.
+
+        Rows are fetched through a server-side cursor ``batch_size`` at a time,
+        so memory use does not grow with ``limit``.
+
+        Args:
+            limit: Maximum number of artifacts to stream.
+            batch_size: Number of artifacts per yielded batch.
+
+        Yields:
+            Batches of at most ``batch_size`` ArtifactEntity objects, newest first.
+
+        Raises:
+            RepositorySaveError: If a database error occurs during retrieval.
+        """
+        stmt = (
+            select(ArtifactModel)
+            .order_by(ArtifactModel.created_at.desc())
+            .limit(limit)
+            .execution_options(yield_per=batch_size)
+        )
+        try:
+            result = await self.session.stream_scalars(
+                stmt, bind_arguments=self._read_bind()
+            )
+            async for models in result.partitions():
+                yield [self.mapper.to_entity(model) for model in models]
+        except SQLAlchemyError as e:
+            raise RepositorySaveError(f"Failed to stream recent artifacts: {e}") from e
+
     async def save(self, artifact: ArtifactEntity) -> None:
         """
         Saves a new artifact or updates an existing one in the database.
 
+        Issues a single native upsert, see ``save_many``.
+
         Args:
             artifact: The ArtifactEntity to persist.
 
@@ -68,30 +288,132 @@ class ArtifactRepositorySQLAlchemy(ArtifactRepositoryProtocol):
             RepositoryConflictError: If a unique constraint is violated during save.
             RepositorySaveError: If a database error occurs during save.
         """
-        try:
-            stmt = select(ArtifactModel).where(
-                ArtifactModel.inventory_id == artifact.inventory_id
-            )
-            result = await self.session.execute(stmt)
-            model = result.scalar_one_or_none()
+        await self.save_many([artifact])
 
-            if model:
-                # Update existing model using mapper
-                self.mapper.update_model_from_entity(model, artifact)
-            else:
-                # Create new model using mapper
-                model = self.mapper.to_model(artifact)
+    async def save_many(self, artifacts: Sequence[ArtifactEntity]) -> None:
+        """
+        Saves new artifacts or updates existing ones in the database.
+
+        Rows are written with the native upsert of the dialect (``INSERT ...
+        ON CONFLICT DO UPDATE`` on PostgreSQL and SQLite, ``INSERT ... ON
+        DUPLICATE KEY UPDATE`` on MySQL), ``batch_size`` rows per statement.
+        The ORM unit of work is bypassed: there is no SELECT beforehand and no
+        flush, and concurrent saves of the same artifact cannot race into a
+        primary key conflict. When an artifact occurs more than once, the last
+        occurrence wins.
+
+        Args:
+            artifacts: The ArtifactEntity objects to persist.
 
-            self.session.add(model)
+        Raises:
+            RepositoryConflictError: If a unique constraint is violated during save.
+            RepositorySaveError: If a database error occurs during save.
+        """
+        rows = list(
+            {
+                artifact.inventory_id: self.mapper.to_row(artifact)
+                for artifact in artifacts
+            }.values()
+        )
+        if not rows:
+            return
+        target = (
+            f"artifact '{rows[0]['inventory_id']}'"
+            if len(rows) == 1
+            else f"{len(rows)} artifacts"
+        )
+        try:
+            dialect = self.session.get_bind().dialect.name
+            for start in range(0, len(rows), self.batch_size):
+                await self.session.execute(
+                    self._upsert(dialect, rows[start : start + self.batch_size])
+                )
+            if self.router is not None:
+                self.router.record_writes(str(row["inventory_id"]) for row in rows)
         except IntegrityError as e:
-            raise RepositoryConflictError(
-                f"Conflict while saving artifact '{artifact.inventory_id}': {e}"
-            ) from e
+            raise RepositoryConflictError(f"Conflict while saving {target}: {e}") from e
         except SQLAlchemyError as e:
-            raise RepositorySaveError(
-                f"Failed to save artifact '{artifact.inventory_id}': {e}"
-            ) from e
+            raise RepositorySaveError(f"Failed to save {target}: {e}") from e
+        except RepositorySaveError:
+            raise
         except Exception as e:
             raise RepositorySaveError(
-                f"Unexpected error while saving artifact '{artifact.inventory_id}': {e}"
+                f"Unexpected error while saving {target}: {e}"
             ) from e
+
+    def _read_bind(self, inventory_ids: Iterable[UUID] = ()) -> dict[str, Any] | None:
+        """
+        Returns the bind arguments routing a read of ``inventory_ids``.
+
+        The read goes to the database chosen by the router.
+        """
+        if self.router is None:
+            return None
+        engine = self.router.read_engine(map(str, inventory_ids))
+        return {"bind": engine.sync_engine}
+
+    def _inventory_id_conditions(
+        self, uuids: Sequence[UUID]
+    ) -> list[ColumnElement[bool]]:
+        """
+        Returns the WHERE conditions matching ``uuids``, one per statement.
+
+        One array parameter (``= ANY(:inventory_ids)``) on PostgreSQL, IN lists
+        of at most ``batch_size`` IDs elsewhere.
+        """
+        column = _TABLE.c.inventory_id
+        if self.session.get_bind().dialect.name == "postgresql":
+            return [
+                column == any_(bindparam("inventory_ids", uuids, type_=_UUID_ARRAY))
+            ]
+        return [
+            column.in_(uuids[start : start + self.batch_size])
+            for start in range(0, len(uuids), self.batch_size)
+        ]
+
+    async def _driver_connection(
+        self, bind_arguments: dict[str, Any] | None
+    ) -> Any | None:
+        """
+        Returns the asyncpg connection lean reads run on.
+
+        Returns None when they go through SQLAlchemy instead.
+        """
+        if not self.driver_statements:
+            return None
+        connection = await self.session.connection(bind_arguments=bind_arguments)
+        if connection.dialect.driver != "asyncpg":
+            return None
+        raw_connection = await connection.get_raw_connection()
+        return raw_connection.driver_connection
+
+    def _upsert(self, dialect: str, rows: Sequence[dict[str, Any]]) -> Executable:
+        """
+        Builds the native upsert of ``rows`` for a dialect.
+
+        Raises:
+            RepositorySaveError: If the dialect has no supported upsert.
+        """
+        if dialect in ("mysql", "mariadb"):
+            mysql_stmt = mysql.insert(_TABLE).values(rows)
+            return mysql_stmt.on_duplicate_key_update(
+                {
+                    column: mysql_stmt.inserted[column]
+                    for column in self.mapper.UPDATE_COLUMNS
+                }
+            )
+        stmt: postgresql.Insert | sqlite.Insert
+        if dialect == "postgresql":
+            stmt = postgresql.insert(_TABLE).values(rows)
+        elif dialect == "sqlite":
+            stmt = sqlite.insert(_TABLE).values(rows)
+        else:
+            raise RepositorySaveError(
+                f"Upsert is not supported on the '{dialect}' dialect"
+            )
+        return stmt.on_conflict_do_update(
+            index_elements=[_TABLE.c.inventory_id],
+            set_={
+                column: stmt.excluded[column] for column in self.mapper.UPDATE_COLUMNS
+            },
+        )
@@ -0,0 +1,203 @@
+import asyncio
+from collections import OrderedDict
+from collections.abc import Callable, Iterable, Sequence
+import contextlib
+from dataclasses import dataclass, field
+import time
+from typing import Literal, final
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.pool import QueuePool
+import structlog
+
+from {{cookiecutter.project_slug}}.application.dtos.database import DatabasePoolStatsDTO
+from {{cookiecutter.project_slug}}.application.interfaces.database import DatabaseMetricsProtocol
+
+logger = structlog.get_logger(__name__)
+
+
+@final
+@dataclass(slots=True, kw_only=True)
+class DatabaseRouter(DatabaseMetricsProtocol):
+    """
+    Routes repository reads to read replicas, with read-your-writes per key.
+
+    The instance is meant to live for the whole worker (APP scope) and owns
+    the engines. Sessions are bound to the primary, so writes and anything not
+    explicitly routed go there; repositories ask ``read_engine`` where to send
+    a read. Reads go round-robin to the replicas that passed their last health
+    check, and to the primary when none did.
+
+    Replicas lag behind the primary, so the keys written through
+    ``record_writes`` are read from the primary for ``read_your_writes_window``
+    seconds: a client reading an artifact right after it was stored sees it
+    even if the replicas have not replayed the write yet. The window should
+    exceed the usual replication lag. Keys are tracked per worker, at most
+    ``max_written_keys`` of them.
+
+    Attributes:
+        primary: Engine of the primary, used for writes.
+        replicas: Engines of the read replicas.
+        read_your_writes_window: Seconds a written key is read from the primary.
+        max_written_keys: Written keys tracked at most; the oldest are forgotten.
+        health_check_interval: Seconds between replica health checks.
+        health_check_timeout: Seconds a replica has to answer a health check.
+    """
+
+    primary: AsyncEngine
+    replicas: Sequence[AsyncEngine] = ()
+    read_your_writes_window: float = 2.0
+    max_written_keys: int = 100_000
+    health_check_interval: float = 5.0
+    health_check_timeout: float = 1.0
+    clock: Callable[[], float] = field(default=time.monotonic, repr=False)
+    _healthy: list[bool] = field(default_factory=list, init=False)
+    # Reads per target: the primary first, then the replicas in order.
+    _reads: list[int] = field(default_factory=list, init=False)
+    _next_replica: int = field(default=0, init=False)
+    # Recently written keys with the time of their last write, oldest first.
+    _written_at: OrderedDict[str, float] = field(
+        default_factory=OrderedDict, init=False
+    )
+    _health_checker: asyncio.Task[None] | None = field(default=None, init=False)
+
+    def __post_init__(self) -> None:
+        """
+        Considers every replica healthy until its first health check.
+        """
+        self._healthy = [True] * len(self.replicas)
+        self._reads = [0] * (len(self.replicas) + 1)
+
+    async def start(self) -> None:
+        """
+        Starts the background task health-checking the replicas.
+        """
+        if self.replicas and self._health_checker is None:
+            self._health_checker = asyncio.create_task(self._check_health())
+
+    def read_engine(self, keys: Iterable[str] = ()) -> AsyncEngine:
+        """
+        Returns the engine a read of ``keys`` should run on.
+
+        Args:
+            keys: Keys the read looks up; reads of a key written within the
+                read-your-writes window go to the primary.
+        """
+        if self.replicas and not self._recently_written(keys):
+            for _ in range(len(self.replicas)):
+                index = self._next_replica
+                self._next_replica = (index + 1) % len(self.replicas)
+                if self._healthy[index]:
+                    self._reads[index + 1] += 1
+                    return self.replicas[index]
+        self._reads[0] += 1
+        return self.primary
+
+    def record_writes(self, keys: Iterable[str]) -> None:
+        """
+        Sends the reads of ``keys`` to the primary for the read-your-writes window.
+
+        Args:
+            keys: Keys just written.
+        """
+        if not self.replicas:
+            return
+        now = self.clock()
+        for key in keys:
+            self._written_at.pop(key, None)
+            self._written_at[key] = now
+        while len(self._written_at) > self.max_written_keys:
+            self._written_at.popitem(last=False)
+
+    def pool_stats(self) -> list[DatabasePoolStatsDTO]:
+        """
+        Returns the pool counters of the primary and of every replica.
+        """
+        targets: list[tuple[AsyncEngine, Literal["primary", "replica"], bool]] = [
+            (self.primary, "primary", True),
+            *(
+                (replica, "replica", healthy)
+                for replica, healthy in zip(self.replicas, self._healthy, strict=True)
+            ),
+        ]
+        stats = []
+        for (engine, role, healthy), reads in zip(targets, self._reads, strict=True):
+            pool = engine.pool
+            if isinstance(pool, QueuePool):
+                pool_size, checked_in = pool.size(), pool.checkedin()
+                checked_out, overflow = pool.checkedout(), max(pool.overflow(), 0)
+            else:
+                pool_size = checked_in = checked_out = overflow = 0
+            url = engine.url
+            stats.append(
+                DatabasePoolStatsDTO(
+                    name=f"{url.host}:{url.port}/{url.database}"
+                    if url.host
+                    else str(url.database),
+                    role=role,
+                    healthy=healthy,
+                    reads=reads,
+                    pool_size=pool_size,
+                    checked_in=checked_in,
+                    checked_out=checked_out,
+                    overflow=overflow,
+                )
+            )
+        return stats
+
+    async def close(self) -> None:
+        """
+        Stops the health checks and disposes of every engine.
+        """
+        if self._health_checker is not None:
+            self._health_checker.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._health_checker
+            self._health_checker = None
+        for engine in (self.primary, *self.replicas):
+            await engine.dispose()
+
+    def _recently_written(self, keys: Iterable[str]) -> bool:
+        """
+        Tells whether any of ``keys`` was written within the window.
+        """
+        if not self._written_at:
+            return False
+        expired_before = self.clock() - self.read_your_writes_window
+        written_at = self._written_at
+        while written_at and next(iter(written_at.values())) < expired_before:
+            written_at.popitem(last=False)
+        return any(key in self._written_at for key in keys)
+
+    async def _check_health(self) -> None:
+        """
+        Health-checks every replica each ``health_check_interval`` seconds.
+        """
+        while True:
+            await asyncio.gather(
+                *(self._check_replica(index) for index in range(len(self.replicas)))
+            )
+            await asyncio.sleep(self.health_check_interval)
+
+    async def _check_replica(self, index: int) -> None:
+        """
+        Runs ``SELECT 1`` on a replica and records whether it answered in time.
+        """
+        replica = self.replicas[index]
+        try:
+            async with asyncio.timeout(self.health_check_timeout):
+                async with replica.connect() as connection:
+                    await connection.execute(text("SELECT 1"))
+        except Exception as e:
+            if self._healthy[index]:
+                logger.warning(
+                    "Database replica failed its health check",
+                    replica=replica.url.host,
+                    error=str(e) or type(e).__name__,
+                )
+            self._healthy[index] = False
+            return
+        if not self._healthy[index]:
+            logger.info("Database replica recovered", replica=replica.url.host)
+        self._healthy[index] = True
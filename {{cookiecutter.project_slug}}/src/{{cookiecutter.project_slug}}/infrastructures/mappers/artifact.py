@@ -1,6 +1,6 @@
 from dataclasses import dataclass
 from datetime import datetime
-from typing import final
+from typing import ClassVar, final
 from uuid import UUID
 
 from {{cookiecutter.project_slug}}.application.dtos.artifact import (
@@ -22,8 +22,14 @@ class InfrastructureArtifactMapper(SerializationMapperProtocol):
     This mapper implements:
     - SerializationMapperProtocol: JSON serialization/deserialization
     for caching and external APIs
+
+    CACHE_SCHEMA_VERSION is part of every artifact cache key and must be
+    bumped whenever the output of ``to_dict`` changes, so entries written by
+    older releases are never read back.
     """
 
+    CACHE_SCHEMA_VERSION: ClassVar[int] = 1
+
     def to_dict(self, dto: ArtifactDTO) -> dict:
         """
         Converts an Application ArtifactDTO to a dictionary for JSON serialization
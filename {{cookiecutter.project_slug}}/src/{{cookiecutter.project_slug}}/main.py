@@ -1,3 +1,4 @@
+import asyncio
 from collections.abc import AsyncIterator
 from contextlib import asynccontextmanager
 
@@ -7,8 +8,10 @@ from dishka.integrations.fastapi import setup_dishka
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
+from {{cookiecutter.project_slug}}.config.base import Settings
 from {{cookiecutter.project_slug}}.config.ioc.di import get_providers
 from {{cookiecutter.project_slug}}.config.logging import setup_logging
+from {{cookiecutter.project_slug}}.infrastructures.cache.warm_up import warm_up_cache
 from {{cookiecutter.project_slug}}.presentation.api.rest.error_handling import setup_exception_handlers
 from {{cookiecutter.project_slug}}.presentation.api.rest.v1.routers import api_v1_router
 
@@ -17,19 +20,42 @@ logger = structlog.get_logger(__name__)
 
 
 @asynccontextmanager
-async def lifespan(_: FastAPI) -> AsyncIterator[None]:
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
     """
     Asynchronous context manager for managing the lifespan of the FastAPI application.
 
+    With CACHE_WARMUP_ON_STARTUP the cache is warmed up in the background, so
+    the application starts serving requests immediately.
+
     Args:
-        _: The FastAPI application instance.
+        app: The FastAPI application instance.
 
     Yields:
         None
     """
     logger.info("Starting application...")
+    container: AsyncContainer = app.state.dishka_container
+    settings = await container.get(Settings)
+    warm_up: asyncio.Task[int] | None = None
+    if settings.cache.cache_warmup_on_startup:
+        warm_up = asyncio.create_task(
+            warm_up_cache(container, settings.cache.cache_warmup_limit)
+        )
+        warm_up.add_done_callback(_log_warm_up_failure)
     yield
     logger.info("Shutting down application...")
+    if warm_up is not None and not warm_up.done():
+        warm_up.cancel()
+        await asyncio.gather(warm_up, return_exceptions=True)
+    await container.close()
+
+
+def _log_warm_up_failure(task: "asyncio.Task[int]") -> None:
+    """
+    Logs a failed startup cache warm-up instead of leaving it unretrieved.
+    """
+    if not task.cancelled() and (error := task.exception()) is not None:
+        logger.error("Startup cache warm-up failed", error=str(error))
 
 
 def create_app() -> FastAPI:
@@ -3,6 +3,7 @@ from fastapi.responses import JSONResponse
 
 from {{cookiecutter.project_slug}}.application.exceptions import (
     ArtifactNotFoundError,
+    CacheInvalidationJobNotFoundError,
     FailedFetchArtifactMuseumAPIException,
     FailedPublishArtifactInCatalogException,
     FailedPublishArtifactMessageBrokerException,
@@ -25,6 +26,16 @@ def setup_exception_handlers(app: FastAPI) -> None:
             content={"message": str(exc)},
         )
 
+    @app.exception_handler(CacheInvalidationJobNotFoundError)
+    async def cache_invalidation_job_not_found_exception_handler(
+        _request: Request,
+        exc: CacheInvalidationJobNotFoundError,
+    ) -> JSONResponse:
+        return JSONResponse(
+            status_code=status.HTTP_404_NOT_FOUND,
+            content={"message": str(exc)},
+        )
+
     @app.exception_handler(FailedFetchArtifactMuseumAPIException)
     async def failed_fetch_artifact_museum_api_exception_handler(
         request: Request,
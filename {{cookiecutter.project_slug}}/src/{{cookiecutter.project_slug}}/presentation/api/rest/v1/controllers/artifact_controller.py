@@ -1,7 +1,7 @@
 from uuid import UUID
 
 from dishka.integrations.fastapi import FromDishka, inject
-from fastapi import APIRouter, Path
+from fastapi import APIRouter, Header, Path, Request
 
 from {{cookiecutter.project_slug}}.application.use_cases.process_artifact import ProcessArtifactUseCase
 from {{cookiecutter.project_slug}}.presentation.api.rest.v1.mappers.artifact_mapper import ArtifactPresentationMapper
@@ -24,9 +24,16 @@ router = APIRouter(prefix="/v1/artifacts", tags=["Artifacts"])
 )
 @inject
 async def get_artifact(
+    request: Request,
     inventory_id: UUID = Path(..., description="Artifact UUID"),
+    x_client_id: str | None = Header(
+        None,
+        description="Client identity used to learn browsing sequences "
+        "(defaults to the client address)",
+    ),
     use_case: FromDishka[ProcessArtifactUseCase] = None,
     presentation_mapper: FromDishka[ArtifactPresentationMapper] = None,
 ) -> ArtifactResponseSchema:
-    artifact_dto = await use_case(str(inventory_id))
+    client_id = x_client_id or (request.client.host if request.client else None)
+    artifact_dto = await use_case(str(inventory_id), client_id=client_id)
     return presentation_mapper.to_response(artifact_dto)
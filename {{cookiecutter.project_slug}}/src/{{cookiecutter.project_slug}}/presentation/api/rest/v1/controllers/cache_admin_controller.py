@@ -0,0 +1,189 @@
+from dishka.integrations.fastapi import FromDishka, inject
+from fastapi import APIRouter, Depends, Path, Query, status
+
+from {{cookiecutter.project_slug}}.application.use_cases.bump_cache_generation import (
+    BumpCacheGenerationUseCase,
+)
+from {{cookiecutter.project_slug}}.application.use_cases.get_cache_health import GetCacheHealthUseCase
+from {{cookiecutter.project_slug}}.application.use_cases.get_cache_invalidation_job import (
+    GetCacheInvalidationJobUseCase,
+)
+from {{cookiecutter.project_slug}}.application.use_cases.get_cache_prefetch_stats import (
+    GetCachePrefetchStatsUseCase,
+)
+from {{cookiecutter.project_slug}}.application.use_cases.get_hot_cache_keys import GetHotCacheKeysUseCase
+from {{cookiecutter.project_slug}}.application.use_cases.get_single_flight_stats import (
+    GetSingleFlightStatsUseCase,
+)
+from {{cookiecutter.project_slug}}.application.use_cases.invalidate_cache_tags import (
+    InvalidateCacheTagsUseCase,
+)
+from {{cookiecutter.project_slug}}.application.use_cases.start_cache_invalidation import (
+    StartCacheInvalidationUseCase,
+)
+from {{cookiecutter.project_slug}}.presentation.api.rest.v1.dependencies import require_admin_token
+from {{cookiecutter.project_slug}}.presentation.api.rest.v1.mappers.cache_admin_mapper import (
+    CacheAdminPresentationMapper,
+)
+from {{cookiecutter.project_slug}}.presentation.api.rest.v1.schemas import (
+    CacheGenerationResponseSchema,
+    CacheHealthResponseSchema,
+    CacheInvalidationJobResponseSchema,
+    CacheInvalidationRequestSchema,
+    CachePrefetchStatsResponseSchema,
+    CacheTagInvalidationRequestSchema,
+    CacheTagInvalidationResponseSchema,
+    HotCacheKeysResponseSchema,
+    SingleFlightStatsResponseSchema,
+)
+
+router = APIRouter(
+    prefix="/v1/admin/cache",
+    tags=["Cache administration"],
+    dependencies=[Depends(require_admin_token)],
+    responses={401: {"description": "Missing or invalid admin token"}},
+)
+
+
+@router.post(
+    "/invalidations",
+    response_model=CacheInvalidationJobResponseSchema,
+    status_code=status.HTTP_202_ACCEPTED,
+    summary="Invalidate cache keys matching a pattern",
+    responses={
+        202: {"description": "Invalidation job started"},
+        422: {"description": "Invalid request body"},
+    },
+)
+@inject
+async def start_cache_invalidation(
+    request: CacheInvalidationRequestSchema,
+    use_case: FromDishka[StartCacheInvalidationUseCase],
+    presentation_mapper: FromDishka[CacheAdminPresentationMapper],
+) -> CacheInvalidationJobResponseSchema:
+    job_dto = await use_case(request.pattern)
+    return presentation_mapper.to_job_response(job_dto)
+
+
+@router.get(
+    "/invalidations/{job_id}",
+    response_model=CacheInvalidationJobResponseSchema,
+    summary="Get the progress of a cache invalidation job",
+    responses={
+        200: {"description": "Job progress retrieved successfully"},
+        404: {"description": "Job not found on this worker"},
+    },
+)
+@inject
+async def get_cache_invalidation_job(
+    use_case: FromDishka[GetCacheInvalidationJobUseCase],
+    presentation_mapper: FromDishka[CacheAdminPresentationMapper],
+    job_id: str = Path(..., description="Invalidation job ID"),
+) -> CacheInvalidationJobResponseSchema:
+    job_dto = await use_case(job_id)
+    return presentation_mapper.to_job_response(job_dto)
+
+
+@router.post(
+    "/tag-invalidations",
+    response_model=CacheTagInvalidationResponseSchema,
+    summary="Invalidate cached artifacts by department, era or material",
+    responses={
+        200: {"description": "Tagged entries deleted"},
+        422: {"description": "Invalid request body"},
+    },
+)
+@inject
+async def invalidate_cache_tags(
+    request: CacheTagInvalidationRequestSchema,
+    use_case: FromDishka[InvalidateCacheTagsUseCase],
+    presentation_mapper: FromDishka[CacheAdminPresentationMapper],
+) -> CacheTagInvalidationResponseSchema:
+    tags = presentation_mapper.to_cache_tags(request)
+    deleted = await use_case(tags)
+    return CacheTagInvalidationResponseSchema(tags=tags, deleted=deleted)
+
+
+@router.post(
+    "/generation",
+    response_model=CacheGenerationResponseSchema,
+    summary="Invalidate every cached artifact by moving to a new key generation",
+    responses={
+        200: {"description": "Generation bumped, old entries are orphaned"},
+    },
+)
+@inject
+async def bump_cache_generation(
+    use_case: FromDishka[BumpCacheGenerationUseCase],
+) -> CacheGenerationResponseSchema:
+    generation = await use_case()
+    return CacheGenerationResponseSchema(generation=generation)
+
+
+@router.get(
+    "/hot-keys",
+    response_model=HotCacheKeysResponseSchema,
+    summary="List the most frequently read cache keys of the answering worker",
+    responses={
+        200: {"description": "Hot keys retrieved successfully"},
+    },
+)
+@inject
+async def get_hot_cache_keys(
+    use_case: FromDishka[GetHotCacheKeysUseCase],
+    presentation_mapper: FromDishka[CacheAdminPresentationMapper],
+    limit: int = Query(20, ge=1, le=1000, description="Maximum number of keys"),
+) -> HotCacheKeysResponseSchema:
+    hot_keys = await use_case(limit)
+    return presentation_mapper.to_hot_keys_response(hot_keys)
+
+
+@router.get(
+    "/health",
+    response_model=CacheHealthResponseSchema,
+    summary="Report whether the answering worker uses or bypasses the cache",
+    responses={
+        200: {"description": "Cache circuit breaker state retrieved successfully"},
+    },
+)
+@inject
+async def get_cache_health(
+    use_case: FromDishka[GetCacheHealthUseCase],
+    presentation_mapper: FromDishka[CacheAdminPresentationMapper],
+) -> CacheHealthResponseSchema:
+    health = await use_case()
+    return presentation_mapper.to_health_response(health)
+
+
+@router.get(
+    "/prefetch",
+    response_model=CachePrefetchStatsResponseSchema,
+    summary="Report whether co-access prefetching pays off on the answering worker",
+    responses={
+        200: {"description": "Prefetch counters retrieved successfully"},
+    },
+)
+@inject
+async def get_cache_prefetch_stats(
+    use_case: FromDishka[GetCachePrefetchStatsUseCase],
+    presentation_mapper: FromDishka[CacheAdminPresentationMapper],
+) -> CachePrefetchStatsResponseSchema:
+    stats = await use_case()
+    return presentation_mapper.to_prefetch_stats_response(stats)
+
+
+@router.get(
+    "/single-flight",
+    response_model=SingleFlightStatsResponseSchema,
+    summary="Report how many artifact loads the answering worker coalesced",
+    responses={
+        200: {"description": "Single-flight counters retrieved successfully"},
+    },
+)
+@inject
+async def get_single_flight_stats(
+    use_case: FromDishka[GetSingleFlightStatsUseCase],
+    presentation_mapper: FromDishka[CacheAdminPresentationMapper],
+) -> SingleFlightStatsResponseSchema:
+    stats = await use_case()
+    return presentation_mapper.to_single_flight_stats_response(stats)
@@ -0,0 +1,35 @@
+from dishka.integrations.fastapi import FromDishka, inject
+from fastapi import APIRouter, Depends
+
+from {{cookiecutter.project_slug}}.application.use_cases.get_database_pool_stats import (
+    GetDatabasePoolStatsUseCase,
+)
+from {{cookiecutter.project_slug}}.presentation.api.rest.v1.dependencies import require_admin_token
+from {{cookiecutter.project_slug}}.presentation.api.rest.v1.mappers.database_admin_mapper import (
+    DatabaseAdminPresentationMapper,
+)
+from {{cookiecutter.project_slug}}.presentation.api.rest.v1.schemas import DatabasePoolsResponseSchema
+
+router = APIRouter(
+    prefix="/v1/admin/database",
+    tags=["Database administration"],
+    dependencies=[Depends(require_admin_token)],
+    responses={401: {"description": "Missing or invalid admin token"}},
+)
+
+
+@router.get(
+    "/pools",
+    response_model=DatabasePoolsResponseSchema,
+    summary="Report the primary and replica connection pools of the answering worker",
+    responses={
+        200: {"description": "Pool counters retrieved successfully"},
+    },
+)
+@inject
+async def get_database_pools(
+    use_case: FromDishka[GetDatabasePoolStatsUseCase],
+    presentation_mapper: FromDishka[DatabaseAdminPresentationMapper],
+) -> DatabasePoolsResponseSchema:
+    pools = await use_case()
+    return presentation_mapper.to_pools_response(pools)
@@ -0,0 +1,35 @@
+import secrets
+from typing import Annotated
+
+from dishka.integrations.fastapi import FromDishka, inject
+from fastapi import Depends, HTTPException, status
+from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
+
+from {{cookiecutter.project_slug}}.config.base import Settings
+
+admin_bearer = HTTPBearer(auto_error=False, description="ADMIN_API_TOKEN")
+
+
+@inject
+async def require_admin_token(
+    settings: FromDishka[Settings],
+    credentials: Annotated[HTTPAuthorizationCredentials | None, Depends(admin_bearer)],
+) -> None:
+    """
+    Guards the administration endpoints with the ADMIN_API_TOKEN bearer token.
+
+    Raises:
+        HTTPException: 404 while ADMIN_API_TOKEN is unset, so the endpoints are
+            disabled by default, and 401 if the bearer token is missing or wrong.
+    """
+    token = settings.app.admin_api_token
+    if not token:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND)
+    if credentials is None or not secrets.compare_digest(
+        credentials.credentials.encode(), token.encode()
+    ):
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid admin token",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
@@ -1,3 +1,6 @@
 from {{cookiecutter.project_slug}}.presentation.api.rest.v1.mappers.artifact_mapper import ArtifactPresentationMapper
+from {{cookiecutter.project_slug}}.presentation.api.rest.v1.mappers.cache_admin_mapper import (
+    CacheAdminPresentationMapper,
+)
 
-__all__ = ["ArtifactPresentationMapper"]
+__all__ = ["ArtifactPresentationMapper", "CacheAdminPresentationMapper"]
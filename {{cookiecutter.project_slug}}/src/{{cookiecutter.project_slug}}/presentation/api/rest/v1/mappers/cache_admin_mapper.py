@@ -0,0 +1,105 @@
+from dataclasses import dataclass
+from typing import final
+
+from {{cookiecutter.project_slug}}.application.cache_tags import cache_tags
+from {{cookiecutter.project_slug}}.application.dtos.cache import (
+    CacheHealthDTO,
+    CacheInvalidationJobDTO,
+    CachePrefetchStatsDTO,
+    HotCacheKeyDTO,
+    SingleFlightStatsDTO,
+)
+from {{cookiecutter.project_slug}}.presentation.api.rest.v1.schemas.requests import (
+    CacheTagInvalidationRequestSchema,
+)
+from {{cookiecutter.project_slug}}.presentation.api.rest.v1.schemas.responses import (
+    CacheHealthResponseSchema,
+    CacheInvalidationJobResponseSchema,
+    CachePrefetchStatsResponseSchema,
+    HotCacheKeyResponseSchema,
+    HotCacheKeysResponseSchema,
+    SingleFlightStatsResponseSchema,
+)
+
+
+@final
+@dataclass(frozen=True, slots=True)
+class CacheAdminPresentationMapper:
+    """Mapper for converting cache administration DTOs to Presentation Response models."""
+
+    def to_job_response(
+        self, dto: CacheInvalidationJobDTO
+    ) -> CacheInvalidationJobResponseSchema:
+        """Convert a cache invalidation job DTO to an API Response model."""
+        return CacheInvalidationJobResponseSchema(
+            job_id=dto.job_id,
+            pattern=dto.pattern,
+            status=dto.status,
+            deleted=dto.deleted,
+            batches=dto.batches,
+            started_at=dto.started_at,
+            finished_at=dto.finished_at,
+            error=dto.error,
+        )
+
+    def to_hot_keys_response(
+        self, dtos: list[HotCacheKeyDTO]
+    ) -> HotCacheKeysResponseSchema:
+        """Convert hot cache key DTOs to an API Response model."""
+        return HotCacheKeysResponseSchema(
+            keys=[
+                HotCacheKeyResponseSchema(
+                    key=dto.key, estimated_reads=dto.estimated_reads, pinned=dto.pinned
+                )
+                for dto in dtos
+            ]
+        )
+
+    def to_health_response(self, dto: CacheHealthDTO) -> CacheHealthResponseSchema:
+        """Convert a cache health DTO to an API Response model."""
+        return CacheHealthResponseSchema(
+            state=dto.state,
+            failure_rate=dto.failure_rate,
+            slow_call_rate=dto.slow_call_rate,
+            mean_latency_ms=dto.mean_latency_ms,
+            window_calls=dto.window_calls,
+            bypassed_calls=dto.bypassed_calls,
+            trips=dto.trips,
+            opened_at=dto.opened_at,
+        )
+
+    def to_prefetch_stats_response(
+        self, dto: CachePrefetchStatsDTO
+    ) -> CachePrefetchStatsResponseSchema:
+        """Convert cache prefetch counters to an API Response model."""
+        return CachePrefetchStatsResponseSchema(
+            sources=dto.sources,
+            clients=dto.clients,
+            scheduled=dto.scheduled,
+            dropped=dto.dropped,
+            warmed=dto.warmed,
+            skipped=dto.skipped,
+            failed=dto.failed,
+            hits=dto.hits,
+            hit_rate=dto.hit_rate,
+        )
+
+    def to_single_flight_stats_response(
+        self, dto: SingleFlightStatsDTO
+    ) -> SingleFlightStatsResponseSchema:
+        """Convert single-flight counters to an API Response model."""
+        return SingleFlightStatsResponseSchema(
+            calls=dto.calls,
+            executions=dto.executions,
+            coalesced=dto.coalesced,
+            errors=dto.errors,
+            in_flight=dto.in_flight,
+        )
+
+    def to_cache_tags(self, request: CacheTagInvalidationRequestSchema) -> list[str]:
+        """Convert a tag invalidation request to the cache tags it selects."""
+        return cache_tags(
+            departments=request.departments,
+            eras=request.eras,
+            materials=request.materials,
+        )
@@ -0,0 +1,34 @@
+from dataclasses import dataclass
+from typing import final
+
+from {{cookiecutter.project_slug}}.application.dtos.database import DatabasePoolStatsDTO
+from {{cookiecutter.project_slug}}.presentation.api.rest.v1.schemas.responses import (
+    DatabasePoolResponseSchema,
+    DatabasePoolsResponseSchema,
+)
+
+
+@final
+@dataclass(frozen=True, slots=True)
+class DatabaseAdminPresentationMapper:
+    """Mapper for converting database administration DTOs to API Response models."""
+
+    def to_pools_response(
+        self, dtos: list[DatabasePoolStatsDTO]
+    ) -> DatabasePoolsResponseSchema:
+        """Convert database pool DTOs to an API Response model."""
+        return DatabasePoolsResponseSchema(
+            pools=[
+                DatabasePoolResponseSchema(
+                    name=dto.name,
+                    role=dto.role,
+                    healthy=dto.healthy,
+                    reads=dto.reads,
+                    pool_size=dto.pool_size,
+                    checked_in=dto.checked_in,
+                    checked_out=dto.checked_out,
+                    overflow=dto.overflow,
+                )
+                for dto in dtos
+            ]
+        )
@@ -3,6 +3,14 @@ from fastapi import APIRouter
 from {{cookiecutter.project_slug}}.presentation.api.rest.v1.controllers.artifact_controller import (
     router as artifact_router,
 )
+from {{cookiecutter.project_slug}}.presentation.api.rest.v1.controllers.cache_admin_controller import (
+    router as cache_admin_router,
+)
+from {{cookiecutter.project_slug}}.presentation.api.rest.v1.controllers.database_admin_controller import (
+    router as database_admin_router,
+)
 
 api_v1_router = APIRouter()
 api_v1_router.include_router(artifact_router)
+api_v1_router.include_router(cache_admin_router)
+api_v1_router.include_router(database_admin_router)
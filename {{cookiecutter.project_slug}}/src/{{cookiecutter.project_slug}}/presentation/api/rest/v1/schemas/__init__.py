@@ -1,3 +1,30 @@
-from .responses import ArtifactResponseSchema
+from .requests import CacheInvalidationRequestSchema, CacheTagInvalidationRequestSchema
+from .responses import (
+    ArtifactResponseSchema,
+    CacheGenerationResponseSchema,
+    CacheHealthResponseSchema,
+    CacheInvalidationJobResponseSchema,
+    CachePrefetchStatsResponseSchema,
+    CacheTagInvalidationResponseSchema,
+    DatabasePoolResponseSchema,
+    DatabasePoolsResponseSchema,
+    HotCacheKeyResponseSchema,
+    HotCacheKeysResponseSchema,
+    SingleFlightStatsResponseSchema,
+)
 
-__all__ = ["ArtifactResponseSchema"]
+__all__ = [
+    "ArtifactResponseSchema",
+    "CacheGenerationResponseSchema",
+    "CacheHealthResponseSchema",
+    "CacheInvalidationJobResponseSchema",
+    "CacheInvalidationRequestSchema",
+    "CachePrefetchStatsResponseSchema",
+    "CacheTagInvalidationRequestSchema",
+    "CacheTagInvalidationResponseSchema",
+    "DatabasePoolResponseSchema",
+    "DatabasePoolsResponseSchema",
+    "HotCacheKeyResponseSchema",
+    "HotCacheKeysResponseSchema",
+    "SingleFlightStatsResponseSchema",
+]
@@ -0,0 +1,46 @@
+from typing import Self
+
+from pydantic import BaseModel, ConfigDict, Field, model_validator
+
+
+class CacheInvalidationRequestSchema(BaseModel):
+    model_config = ConfigDict(
+        frozen=True,
+        extra="forbid",
+    )
+
+    pattern: str = Field(
+        ...,
+        min_length=1,
+        description=(
+            "Glob pattern of the keys to invalidate, e.g. 'antiques:artifact:v*' for "
+            "every artifact or 'antiques:artifact:v1:g3:*' for one key generation"
+        ),
+        examples=["antiques:artifact:v*"],
+    )
+
+
+class CacheTagInvalidationRequestSchema(BaseModel):
+    model_config = ConfigDict(
+        frozen=True,
+        extra="forbid",
+    )
+
+    departments: list[str] = Field(
+        default_factory=list,
+        description="Departments whose cached artifacts are invalidated",
+    )
+    eras: list[str] = Field(
+        default_factory=list,
+        description="Eras whose cached artifacts are invalidated",
+    )
+    materials: list[str] = Field(
+        default_factory=list,
+        description="Materials whose cached artifacts are invalidated",
+    )
+
+    @model_validator(mode="after")
+    def check_not_empty(self) -> Self:
+        if not (self.departments or self.eras or self.materials):
+            raise ValueError("At least one department, era or material is required")
+        return self
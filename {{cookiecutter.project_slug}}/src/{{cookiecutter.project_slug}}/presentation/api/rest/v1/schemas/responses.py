@@ -1,4 +1,5 @@
 from datetime import datetime
+from typing import Literal
 from uuid import UUID
 
 from pydantic import BaseModel, ConfigDict, Field
@@ -40,7 +41,181 @@ class ArtifactResponseSchema(BaseModel):
         description="Department responsible for the artifact",
     )
     era: EraResponseSchema = Field(..., description="Historical era of the artifact")
-    material: MaterialResponseSchema = Field(..., description="Material of the artifact")
+    material: MaterialResponseSchema = Field(
+        ..., description="Material of the artifact"
+    )
     description: str | None = Field(
         None, description="Optional description of the artifact"
     )
+
+
+class CacheInvalidationJobResponseSchema(BaseModel):
+    model_config = ConfigDict(
+        frozen=True,
+        extra="forbid",
+    )
+
+    job_id: str = Field(..., description="Identifier of the invalidation job")
+    pattern: str = Field(..., description="Key pattern being invalidated")
+    status: Literal["running", "completed", "failed", "cancelled"] = Field(
+        ..., description="Current state of the job"
+    )
+    deleted: int = Field(..., description="Number of keys deleted so far")
+    batches: int = Field(..., description="Number of batches processed so far")
+    started_at: datetime = Field(..., description="When the job was started (UTC)")
+    finished_at: datetime | None = Field(
+        None, description="When the job finished (UTC)"
+    )
+    error: str | None = Field(None, description="Error message if the job failed")
+
+
+class CacheGenerationResponseSchema(BaseModel):
+    model_config = ConfigDict(
+        frozen=True,
+        extra="forbid",
+    )
+
+    generation: int = Field(..., description="Current artifact cache generation")
+
+
+class CacheTagInvalidationResponseSchema(BaseModel):
+    model_config = ConfigDict(
+        frozen=True,
+        extra="forbid",
+    )
+
+    tags: list[str] = Field(..., description="Invalidated cache tags")
+    deleted: int = Field(..., description="Number of cache entries deleted")
+
+
+class HotCacheKeyResponseSchema(BaseModel):
+    model_config = ConfigDict(
+        frozen=True,
+        extra="forbid",
+    )
+
+    key: str = Field(..., description="Cache key")
+    estimated_reads: int = Field(
+        ..., description="Recent read count estimate (decayed, an upper bound)"
+    )
+    pinned: bool = Field(
+        ..., description="Whether the entry is served from the in-process L1 cache"
+    )
+
+
+class HotCacheKeysResponseSchema(BaseModel):
+    model_config = ConfigDict(
+        frozen=True,
+        extra="forbid",
+    )
+
+    keys: list[HotCacheKeyResponseSchema] = Field(
+        ..., description="Hottest keys seen by the answering worker, most read first"
+    )
+
+
+class CacheHealthResponseSchema(BaseModel):
+    model_config = ConfigDict(
+        frozen=True,
+        extra="forbid",
+    )
+
+    state: Literal["closed", "open", "half_open"] = Field(
+        ...,
+        description=(
+            "closed: the cache is used, open: it is bypassed, "
+            "half_open: probe calls check whether it recovered"
+        ),
+    )
+    failure_rate: float = Field(
+        ...,
+        description="Share of failed or timed-out cache calls in the rolling window",
+    )
+    slow_call_rate: float = Field(
+        ..., description="Share of slow cache calls in the rolling window"
+    )
+    mean_latency_ms: float = Field(
+        ..., description="Mean latency of the cache calls in the rolling window"
+    )
+    window_calls: int = Field(..., description="Number of calls in the rolling window")
+    bypassed_calls: int = Field(
+        ..., description="Calls answered without the cache since the worker started"
+    )
+    trips: int = Field(
+        ...,
+        description="Number of times the cache was bypassed since the worker started",
+    )
+    opened_at: datetime | None = Field(
+        None, description="When the cache was last bypassed (UTC)"
+    )
+
+
+class CachePrefetchStatsResponseSchema(BaseModel):
+    model_config = ConfigDict(
+        frozen=True,
+        extra="forbid",
+    )
+
+    sources: int = Field(..., description="Artifacts whose successors are tracked")
+    clients: int = Field(
+        ..., description="Clients whose last requested artifact is remembered"
+    )
+    scheduled: int = Field(..., description="Prefetches started since startup")
+    dropped: int = Field(
+        ..., description="Predicted prefetches dropped for lack of budget"
+    )
+    warmed: int = Field(..., description="Prefetches that loaded an artifact")
+    skipped: int = Field(
+        ..., description="Prefetches finding the artifact cached or not in the database"
+    )
+    failed: int = Field(..., description="Prefetches that raised an error")
+    hits: int = Field(
+        ..., description="Prefetched artifacts requested within the hit window"
+    )
+    hit_rate: float = Field(
+        ..., description="Share of prefetched artifacts that were requested"
+    )
+
+
+class SingleFlightStatsResponseSchema(BaseModel):
+    model_config = ConfigDict(
+        frozen=True,
+        extra="forbid",
+    )
+
+    calls: int = Field(..., description="Artifact loads made through the coordinator")
+    executions: int = Field(..., description="Loads that ran the cache-miss path")
+    coalesced: int = Field(
+        ..., description="Loads that joined an in-flight load of the same artifact"
+    )
+    errors: int = Field(
+        ..., description="Executions that failed, with the error shared by all callers"
+    )
+    in_flight: int = Field(..., description="Artifacts currently being loaded")
+
+
+class DatabasePoolResponseSchema(BaseModel):
+    model_config = ConfigDict(
+        frozen=True,
+        extra="forbid",
+    )
+
+    name: str = Field(..., description="Host, port and database of the target")
+    role: Literal["primary", "replica"] = Field(..., description="Role of the target")
+    healthy: bool = Field(..., description="Whether the last health check passed")
+    reads: int = Field(..., description="Repository reads routed to the target")
+    pool_size: int = Field(..., description="Connections the pool keeps open")
+    checked_in: int = Field(..., description="Idle connections in the pool")
+    checked_out: int = Field(..., description="Connections currently in use")
+    overflow: int = Field(..., description="Connections open beyond the pool size")
+
+
+class DatabasePoolsResponseSchema(BaseModel):
+    model_config = ConfigDict(
+        frozen=True,
+        extra="forbid",
+    )
+
+    pools: list[DatabasePoolResponseSchema] = Field(
+        ..., description="Pools of the answering worker, the primary first"
+    )
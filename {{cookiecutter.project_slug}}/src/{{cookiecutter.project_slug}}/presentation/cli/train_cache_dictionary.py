@@ -0,0 +1,97 @@
+r"""Train a compression dictionary for cached artifact payloads.
+
+Samples the most recently stored artifacts from the database, encodes them
+exactly as the cache stores them (freshness envelope, configured codec, no
+compression) and trains a zstd dictionary from the result. Point
+``REDIS_CACHE_COMPRESSION_DICTIONARY`` at the written file to use it.
+
+Usage:
+    poetry run python -m {{cookiecutter.project_slug}}.presentation.cli.train_cache_dictionary \
+        --output cache.dict [--samples 5000] [--size 16384]
+"""
+
+import argparse
+import asyncio
+from pathlib import Path
+
+from sqlalchemy import select
+import structlog
+
+from {{cookiecutter.project_slug}}.application.cache_policy import CacheFreshnessPolicy
+from {{cookiecutter.project_slug}}.application.mappers import ArtifactMapper
+from {{cookiecutter.project_slug}}.config.base import Settings
+from {{cookiecutter.project_slug}}.infrastructures.cache.codec import CachePayloadSerializer, get_codec
+from {{cookiecutter.project_slug}}.infrastructures.cache.compression import train_dictionary
+from {{cookiecutter.project_slug}}.infrastructures.db.mappers.artifact_db_mapper import ArtifactDBMapper
+from {{cookiecutter.project_slug}}.infrastructures.db.models.artifact import ArtifactModel
+from {{cookiecutter.project_slug}}.infrastructures.db.session import create_engine, get_session_factory
+from {{cookiecutter.project_slug}}.infrastructures.mappers.artifact import InfrastructureArtifactMapper
+
+logger = structlog.get_logger(__name__)
+
+
+async def sample_cache_payloads(settings: Settings, limit: int) -> list[bytes]:
+    """
+    Encodes the most recently stored artifacts as uncompressed cache payloads.
+
+    Args:
+        settings: Application settings (database URL, codec and TTLs).
+        limit: Maximum number of artifacts to sample.
+
+    Returns:
+        The encoded payloads.
+    """
+    engine = create_engine(settings.sqlalchemy_database_uri, is_echo=False)
+    try:
+        async with get_session_factory(engine)() as session:
+            result = await session.execute(
+                select(ArtifactModel)
+                .order_by(ArtifactModel.created_at.desc())
+                .limit(limit)
+            )
+            models = result.scalars().all()
+    finally:
+        await engine.dispose()
+
+    db_mapper = ArtifactDBMapper()
+    dto_mapper = ArtifactMapper()
+    cache_mapper = InfrastructureArtifactMapper()
+    policy = CacheFreshnessPolicy(
+        soft_ttl=settings.cache.cache_soft_ttl, hard_ttl=settings.cache_ttl
+    )
+    serializer = CachePayloadSerializer(
+        codec=get_codec(settings.redis.redis_cache_codec)
+    )
+    return [
+        serializer.dumps(
+            policy.wrap(
+                cache_mapper.to_dict(dto_mapper.to_dto(db_mapper.to_entity(model)))
+            )
+        )
+        for model in models
+    ]
+
+
+def main() -> None:
+    """
+    Trains the dictionary and writes it to ``--output``.
+    """
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--output", type=Path, required=True)
+    parser.add_argument("--samples", type=int, default=5000)
+    parser.add_argument("--size", type=int, default=16 * 1024)
+    args = parser.parse_args()
+
+    samples = asyncio.run(sample_cache_payloads(Settings(), args.samples))
+    dictionary = train_dictionary(samples, args.size)
+    args.output.write_bytes(dictionary)
+    logger.info(
+        "Cache compression dictionary written",
+        path=str(args.output),
+        samples=len(samples),
+        size=len(dictionary),
+    )
+
+
+if __name__ == "__main__":
+    main()
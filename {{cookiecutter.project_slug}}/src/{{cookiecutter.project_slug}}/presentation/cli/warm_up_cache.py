@@ -0,0 +1,57 @@
+r"""Warm up the artifact cache from the artifacts table.
+
+Loads the most recently created artifacts into the cache, e.g. after a cache
+flush or before routing traffic to a fresh deployment.
+
+Usage:
+    poetry run python -m {{cookiecutter.project_slug}}.presentation.cli.warm_up_cache \
+        [--limit 10000] [--max-rate 2000]
+"""
+
+import argparse
+import asyncio
+
+from dishka import make_async_container
+
+from {{cookiecutter.project_slug}}.config.base import Settings
+from {{cookiecutter.project_slug}}.config.ioc.di import get_providers
+from {{cookiecutter.project_slug}}.config.logging import setup_logging
+from {{cookiecutter.project_slug}}.infrastructures.cache.warm_up import warm_up_cache
+
+
+async def _run(limit: int | None, max_rate: float | None) -> None:
+    """
+    Builds a standalone container and runs the warm-up.
+    """
+    container = make_async_container(*get_providers())
+    try:
+        settings = await container.get(Settings)
+        await warm_up_cache(
+            container,
+            limit if limit is not None else settings.cache.cache_warmup_limit,
+            max_rate,
+        )
+    finally:
+        await container.close()
+
+
+def main() -> None:
+    """
+    Parses the command line and runs the warm-up.
+    """
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--limit", type=int, default=None)
+    parser.add_argument(
+        "--max-rate",
+        type=float,
+        default=None,
+        help="artifacts per second, 0 = unlimited",
+    )
+    args = parser.parse_args()
+
+    setup_logging()
+    asyncio.run(_run(args.limit, args.max_rate))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+from unittest.mock import AsyncMock
+
+import pytest
+
+from {{cookiecutter.project_slug}}.application.use_cases.get_artifacts_from_cache import (
+    GetArtifactsFromCacheUseCase,
+)
+from {{cookiecutter.project_slug}}.application.use_cases.save_artifacts_to_cache import (
+    SaveArtifactsToCacheUseCase,
+)
+from {{cookiecutter.project_slug}}.infrastructures.mappers.artifact import InfrastructureArtifactMapper
+from tests.factories import ArtifactDTOFactory
+
+
+class TestGetArtifactsFromCacheUseCase:
+    @pytest.mark.asyncio
+    async def test_returns_only_hits(self, mock_cache_client: AsyncMock):
+        """Test that missing IDs are left out of the result"""
+        mapper = InfrastructureArtifactMapper()
+        artifact_dto = ArtifactDTOFactory.build()
+        hit_id = str(artifact_dto.inventory_id)
+        mock_cache_client.get_many.return_value = {
+            hit_id: mapper.to_dict(artifact_dto),
+            "missing": None,
+        }
+        use_case = GetArtifactsFromCacheUseCase(
+            cache_client=mock_cache_client, serialization_mapper=mapper
+        )
+
+        result = await use_case([hit_id, "missing"])
+
+        assert list(result) == [hit_id]
+        assert result[hit_id].inventory_id == artifact_dto.inventory_id
+        mock_cache_client.get_many.assert_awaited_once_with([hit_id, "missing"])
+
+
+class TestSaveArtifactsToCacheUseCase:
+    @pytest.mark.asyncio
+    async def test_reports_failures_per_key(self, mock_cache_client: AsyncMock):
+        """Test that per-key results from the cache are passed through"""
+        mapper = InfrastructureArtifactMapper()
+        first, second = ArtifactDTOFactory.build(), ArtifactDTOFactory.build()
+        first_id, second_id = str(first.inventory_id), str(second.inventory_id)
+        mock_cache_client.set_many.return_value = {first_id: True, second_id: False}
+        use_case = SaveArtifactsToCacheUseCase(
+            cache_client=mock_cache_client, serialization_mapper=mapper
+        )
+
+        result = await use_case([first, second])
+
+        assert result == {first_id: True, second_id: False}
+        (items,) = mock_cache_client.set_many.await_args.args
+        assert items == {
+            first_id: mapper.to_dict(first),
+            second_id: mapper.to_dict(second),
+        }
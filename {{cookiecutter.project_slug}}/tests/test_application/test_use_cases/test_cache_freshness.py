@@ -0,0 +1,108 @@
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from {{cookiecutter.project_slug}}.application.cache_policy import CacheFreshness, CacheFreshnessPolicy
+from {{cookiecutter.project_slug}}.application.exceptions import FailedFetchArtifactMuseumAPIException
+from {{cookiecutter.project_slug}}.application.use_cases.get_artifact_from_cache import (
+    GetArtifactFromCacheUseCase,
+)
+from {{cookiecutter.project_slug}}.application.use_cases.process_artifact import ProcessArtifactUseCase
+from {{cookiecutter.project_slug}}.infrastructures.mappers.artifact import InfrastructureArtifactMapper
+from tests.factories import ArtifactDTOFactory
+
+
+class Clock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestCacheFreshnessPolicy:
+    def test_entry_ages_from_fresh_to_expired(self):
+        """Test that freshness follows the soft and hard TTLs"""
+        clock = Clock()
+        policy = CacheFreshnessPolicy(soft_ttl=10, hard_ttl=20, clock=clock)
+        entry = policy.wrap({"name": "vase"})
+
+        assert policy.unwrap(entry) == ({"name": "vase"}, CacheFreshness.FRESH)
+        clock.now += 10
+        assert policy.unwrap(entry)[1] is CacheFreshness.STALE
+        clock.now += 10
+        assert policy.unwrap(entry)[1] is CacheFreshness.EXPIRED
+
+    def test_xfetch_can_expire_entry_early(self):
+        """Test that probabilistic early expiration marks fresh entries stale"""
+        clock = Clock()
+        policy = CacheFreshnessPolicy(
+            soft_ttl=10,
+            hard_ttl=20,
+            xfetch_beta=1.0,
+            xfetch_delta=5.0,
+            clock=clock,
+            rng=lambda: 0.99,
+        )
+        entry = policy.wrap({"name": "vase"})
+        clock.now += 9
+
+        assert policy.unwrap(entry)[1] is CacheFreshness.STALE
+
+    def test_legacy_entry_is_fresh(self):
+        """Test that entries written without an envelope are served as they are"""
+        policy = CacheFreshnessPolicy(soft_ttl=10, hard_ttl=20)
+
+        assert policy.unwrap({"name": "vase"}) == (
+            {"name": "vase"},
+            CacheFreshness.FRESH,
+        )
+
+
+class TestStaleWhileRevalidate:
+    @pytest.mark.asyncio
+    async def test_stale_entry_is_served_and_refreshed(
+        self, mock_cache_client: AsyncMock
+    ):
+        """Test that a stale hit returns immediately and schedules one refresh"""
+        clock = Clock()
+        mapper = InfrastructureArtifactMapper()
+        policy = CacheFreshnessPolicy(soft_ttl=10, hard_ttl=20, clock=clock)
+        artifact_dto = ArtifactDTOFactory.build()
+        inventory_id = str(artifact_dto.inventory_id)
+        mock_cache_client.get.return_value = policy.wrap(mapper.to_dict(artifact_dto))
+        refresher = MagicMock()
+        use_case = GetArtifactFromCacheUseCase(
+            cache_client=mock_cache_client,
+            serialization_mapper=mapper,
+            freshness_policy=policy,
+            refresher=refresher,
+        )
+        clock.now += 15
+
+        result = await use_case(inventory_id)
+
+        assert result is not None
+        assert result.inventory_id == artifact_dto.inventory_id
+        refresher.schedule.assert_called_once_with(inventory_id)
+
+    @pytest.mark.asyncio
+    async def test_museum_failure_falls_back_to_last_known_good(self):
+        """Test that an expired copy is served when the museum API is down"""
+        artifact_dto = ArtifactDTOFactory.build()
+        get_from_cache = AsyncMock(return_value=None)
+        get_from_cache.get_last_known_good.return_value = artifact_dto
+        use_case = ProcessArtifactUseCase(
+            get_artifact_from_cache_use_case=get_from_cache,
+            get_artifact_from_repo_use_case=AsyncMock(return_value=None),
+            fetch_artifact_from_museum_api_use_case=AsyncMock(
+                side_effect=FailedFetchArtifactMuseumAPIException("down")
+            ),
+            save_artifact_to_repo_use_case=AsyncMock(),
+            save_artifact_to_cache_use_case=AsyncMock(),
+            publish_artifact_to_broker_use_case=AsyncMock(),
+            publish_artifact_to_catalog_use_case=AsyncMock(),
+        )
+
+        assert await use_case(str(artifact_dto.inventory_id)) is artifact_dto
+        use_case.save_artifact_to_cache_use_case.assert_not_called()
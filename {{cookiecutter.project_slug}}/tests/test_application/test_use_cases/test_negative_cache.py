@@ -0,0 +1,68 @@
+from unittest.mock import AsyncMock
+
+import pytest
+
+from {{cookiecutter.project_slug}}.application.cache_policy import make_tombstone
+from {{cookiecutter.project_slug}}.application.exceptions import ArtifactNotFoundError
+from {{cookiecutter.project_slug}}.application.use_cases.get_artifact_from_cache import (
+    GetArtifactFromCacheUseCase,
+)
+from {{cookiecutter.project_slug}}.application.use_cases.process_artifact import ProcessArtifactUseCase
+from {{cookiecutter.project_slug}}.application.use_cases.save_artifact_to_cache import (
+    SaveArtifactToCacheUseCase,
+)
+from {{cookiecutter.project_slug}}.infrastructures.mappers.artifact import InfrastructureArtifactMapper
+
+
+class TestNegativeCaching:
+    @pytest.mark.asyncio
+    async def test_museum_404_is_cached_as_tombstone(
+        self, mock_cache_client: AsyncMock
+    ):
+        """Test that a missing artifact is remembered with the negative TTL"""
+        save_to_cache = SaveArtifactToCacheUseCase(
+            cache_client=mock_cache_client,
+            serialization_mapper=InfrastructureArtifactMapper(),
+            negative_ttl=30,
+        )
+        use_case = ProcessArtifactUseCase(
+            get_artifact_from_cache_use_case=AsyncMock(return_value=None),
+            get_artifact_from_repo_use_case=AsyncMock(return_value=None),
+            fetch_artifact_from_museum_api_use_case=AsyncMock(
+                side_effect=ArtifactNotFoundError
+            ),
+            save_artifact_to_repo_use_case=AsyncMock(),
+            save_artifact_to_cache_use_case=save_to_cache,
+            publish_artifact_to_broker_use_case=AsyncMock(),
+            publish_artifact_to_catalog_use_case=AsyncMock(),
+        )
+
+        with pytest.raises(ArtifactNotFoundError):
+            await use_case("missing")
+
+        mock_cache_client.set.assert_awaited_once_with(
+            "missing", make_tombstone(), ttl=30
+        )
+
+    @pytest.mark.asyncio
+    async def test_tombstone_fails_fast(self, mock_cache_client: AsyncMock):
+        """Test that a cached tombstone raises before the repository is touched"""
+        mock_cache_client.get.return_value = make_tombstone()
+        get_repo = AsyncMock()
+        use_case = ProcessArtifactUseCase(
+            get_artifact_from_cache_use_case=GetArtifactFromCacheUseCase(
+                cache_client=mock_cache_client,
+                serialization_mapper=InfrastructureArtifactMapper(),
+            ),
+            get_artifact_from_repo_use_case=get_repo,
+            fetch_artifact_from_museum_api_use_case=AsyncMock(),
+            save_artifact_to_repo_use_case=AsyncMock(),
+            save_artifact_to_cache_use_case=AsyncMock(),
+            publish_artifact_to_broker_use_case=AsyncMock(),
+            publish_artifact_to_catalog_use_case=AsyncMock(),
+        )
+
+        with pytest.raises(ArtifactNotFoundError):
+            await use_case("missing")
+
+        get_repo.assert_not_called()
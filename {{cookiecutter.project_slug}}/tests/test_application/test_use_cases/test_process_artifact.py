@@ -1,3 +1,5 @@
+import asyncio
+from dataclasses import replace
 from unittest.mock import AsyncMock
 
 import pytest
@@ -13,8 +15,10 @@ from {{cookiecutter.project_slug}}.application.exceptions import (
     FailedPublishArtifactInCatalogException,
     FailedPublishArtifactMessageBrokerException,
 )
+from {{cookiecutter.project_slug}}.application.interfaces.lease import LeaseProtocol
 from {{cookiecutter.project_slug}}.application.use_cases.process_artifact import ProcessArtifactUseCase
 from {{cookiecutter.project_slug}}.domain.entities.artifact import ArtifactEntity
+from {{cookiecutter.project_slug}}.infrastructures.concurrency.single_flight import AsyncioSingleFlight
 
 
 class TestProcessArtifactUseCase:
@@ -136,13 +140,19 @@ class TestProcessArtifactUseCase:
         assert result == sample_artifact_dto
         mock_get_artifact_from_cache_use_case.assert_called_once_with(inventory_id)
         mock_get_artifact_from_repo_use_case.assert_called_once_with(inventory_id)
-        mock_fetch_artifact_from_museum_api_use_case.assert_called_once_with(inventory_id)
+        mock_fetch_artifact_from_museum_api_use_case.assert_called_once_with(
+            inventory_id
+        )
         mock_save_artifact_to_repo_use_case.assert_called_once_with(sample_artifact_dto)
         mock_save_artifact_to_cache_use_case.assert_called_once_with(
             inventory_id, sample_artifact_dto
         )
-        mock_publish_artifact_to_broker_use_case.assert_called_once_with(sample_artifact_dto)
-        mock_publish_artifact_to_catalog_use_case.assert_called_once_with(sample_artifact_dto)
+        mock_publish_artifact_to_broker_use_case.assert_called_once_with(
+            sample_artifact_dto
+        )
+        mock_publish_artifact_to_catalog_use_case.assert_called_once_with(
+            sample_artifact_dto
+        )
 
     @pytest.mark.asyncio
     async def test_execute_artifact_not_found_in_museum_api(
@@ -164,7 +174,9 @@ class TestProcessArtifactUseCase:
 
         mock_get_artifact_from_cache_use_case.assert_called_once_with(inventory_id)
         mock_get_artifact_from_repo_use_case.assert_called_once_with(inventory_id)
-        mock_fetch_artifact_from_museum_api_use_case.assert_called_once_with(inventory_id)
+        mock_fetch_artifact_from_museum_api_use_case.assert_called_once_with(
+            inventory_id
+        )
         get_artifact_use_case.save_artifact_to_repo_use_case.assert_not_called()
         get_artifact_use_case.save_artifact_to_cache_use_case.assert_not_called()
         get_artifact_use_case.publish_artifact_to_broker_use_case.assert_not_called()
@@ -177,8 +189,6 @@ class TestProcessArtifactUseCase:
         mock_get_artifact_from_cache_use_case: AsyncMock,
         mock_get_artifact_from_repo_use_case: AsyncMock,
         mock_fetch_artifact_from_museum_api_use_case: AsyncMock,
-        mock_save_artifact_to_repo_use_case: AsyncMock,
-        mock_save_artifact_to_cache_use_case: AsyncMock,
         mock_publish_artifact_to_broker_use_case: AsyncMock,
         mock_publish_artifact_to_catalog_use_case: AsyncMock,
         sample_artifact_dto: ArtifactDTO,
@@ -188,13 +198,19 @@ class TestProcessArtifactUseCase:
         mock_get_artifact_from_cache_use_case.return_value = None
         mock_get_artifact_from_repo_use_case.return_value = None
         mock_fetch_artifact_from_museum_api_use_case.return_value = sample_artifact_dto
-        mock_publish_artifact_to_broker_use_case.side_effect = FailedPublishArtifactMessageBrokerException
+        mock_publish_artifact_to_broker_use_case.side_effect = (
+            FailedPublishArtifactMessageBrokerException
+        )
 
         result = await get_artifact_use_case(inventory_id)
 
         assert result == sample_artifact_dto
-        mock_publish_artifact_to_broker_use_case.assert_called_once_with(sample_artifact_dto)
-        mock_publish_artifact_to_catalog_use_case.assert_called_once_with(sample_artifact_dto)
+        mock_publish_artifact_to_broker_use_case.assert_called_once_with(
+            sample_artifact_dto
+        )
+        mock_publish_artifact_to_catalog_use_case.assert_called_once_with(
+            sample_artifact_dto
+        )
 
     @pytest.mark.asyncio
     async def test_execute_publish_to_catalog_fails_but_continues(
@@ -203,8 +219,6 @@ class TestProcessArtifactUseCase:
         mock_get_artifact_from_cache_use_case: AsyncMock,
         mock_get_artifact_from_repo_use_case: AsyncMock,
         mock_fetch_artifact_from_museum_api_use_case: AsyncMock,
-        mock_save_artifact_to_repo_use_case: AsyncMock,
-        mock_save_artifact_to_cache_use_case: AsyncMock,
         mock_publish_artifact_to_broker_use_case: AsyncMock,
         mock_publish_artifact_to_catalog_use_case: AsyncMock,
         sample_artifact_dto: ArtifactDTO,
@@ -214,10 +228,77 @@ class TestProcessArtifactUseCase:
         mock_get_artifact_from_cache_use_case.return_value = None
         mock_get_artifact_from_repo_use_case.return_value = None
         mock_fetch_artifact_from_museum_api_use_case.return_value = sample_artifact_dto
-        mock_publish_artifact_to_catalog_use_case.side_effect = FailedPublishArtifactInCatalogException
+        mock_publish_artifact_to_catalog_use_case.side_effect = (
+            FailedPublishArtifactInCatalogException
+        )
 
         result = await get_artifact_use_case(inventory_id)
 
         assert result == sample_artifact_dto
-        mock_publish_artifact_to_broker_use_case.assert_called_once_with(sample_artifact_dto)
-        mock_publish_artifact_to_catalog_use_case.assert_called_once_with(sample_artifact_dto)
+        mock_publish_artifact_to_broker_use_case.assert_called_once_with(
+            sample_artifact_dto
+        )
+        mock_publish_artifact_to_catalog_use_case.assert_called_once_with(
+            sample_artifact_dto
+        )
+
+    @pytest.mark.asyncio
+    async def test_execute_concurrent_misses_are_coalesced(
+        self,
+        get_artifact_use_case: ProcessArtifactUseCase,
+        mock_get_artifact_from_cache_use_case: AsyncMock,
+        mock_get_artifact_from_repo_use_case: AsyncMock,
+        mock_fetch_artifact_from_museum_api_use_case: AsyncMock,
+        mock_save_artifact_to_repo_use_case: AsyncMock,
+        sample_artifact_dto: ArtifactDTO,
+    ):
+        """Test that concurrent misses for one inventory ID hit the museum API once"""
+        inventory_id = str(sample_artifact_dto.inventory_id)
+        single_flight = AsyncioSingleFlight()
+        use_case = ProcessArtifactUseCase(
+            get_artifact_from_cache_use_case=mock_get_artifact_from_cache_use_case,
+            get_artifact_from_repo_use_case=mock_get_artifact_from_repo_use_case,
+            fetch_artifact_from_museum_api_use_case=mock_fetch_artifact_from_museum_api_use_case,
+            save_artifact_to_repo_use_case=mock_save_artifact_to_repo_use_case,
+            save_artifact_to_cache_use_case=get_artifact_use_case.save_artifact_to_cache_use_case,
+            publish_artifact_to_broker_use_case=get_artifact_use_case.publish_artifact_to_broker_use_case,
+            publish_artifact_to_catalog_use_case=get_artifact_use_case.publish_artifact_to_catalog_use_case,
+            single_flight=single_flight,
+        )
+
+        async def slow_cache_miss(_: str) -> None:
+            await asyncio.sleep(0.01)
+
+        mock_get_artifact_from_cache_use_case.side_effect = slow_cache_miss
+        mock_get_artifact_from_repo_use_case.return_value = None
+        mock_fetch_artifact_from_museum_api_use_case.return_value = sample_artifact_dto
+
+        results = await asyncio.gather(*(use_case(inventory_id) for _ in range(5)))
+
+        assert results == [sample_artifact_dto] * 5
+        mock_fetch_artifact_from_museum_api_use_case.assert_called_once_with(
+            inventory_id
+        )
+        mock_save_artifact_to_repo_use_case.assert_called_once_with(sample_artifact_dto)
+        assert single_flight.stats().coalesced == 4
+
+    @pytest.mark.asyncio
+    async def test_execute_waits_for_lease_held_elsewhere(
+        self,
+        get_artifact_use_case: ProcessArtifactUseCase,
+        mock_get_artifact_from_cache_use_case: AsyncMock,
+        sample_artifact_dto: ArtifactDTO,
+    ):
+        """Test that a miss leased by another pod is read from the cache afterwards"""
+        inventory_id = str(sample_artifact_dto.inventory_id)
+        lease = AsyncMock(spec=LeaseProtocol)
+        lease.acquire.return_value = None
+        use_case = replace(get_artifact_use_case, lease=lease)
+        mock_get_artifact_from_cache_use_case.side_effect = [None, sample_artifact_dto]
+
+        result = await use_case(inventory_id)
+
+        assert result == sample_artifact_dto
+        lease.wait.assert_awaited_once_with(inventory_id)
+        lease.release.assert_not_called()
+        use_case.fetch_artifact_from_museum_api_use_case.assert_not_called()
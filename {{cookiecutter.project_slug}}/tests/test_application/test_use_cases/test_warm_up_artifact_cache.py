@@ -0,0 +1,46 @@
+from collections.abc import AsyncIterator, Sequence
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from {{cookiecutter.project_slug}}.application.interfaces.mappers import DtoEntityMapperProtocol
+from {{cookiecutter.project_slug}}.application.interfaces.uow import UnitOfWorkProtocol
+from {{cookiecutter.project_slug}}.application.use_cases.save_artifacts_to_cache import (
+    SaveArtifactsToCacheUseCase,
+)
+from {{cookiecutter.project_slug}}.application.use_cases.warm_up_artifact_cache import (
+    WarmUpArtifactCacheUseCase,
+)
+from {{cookiecutter.project_slug}}.domain.entities.artifact import ArtifactEntity
+
+
+class TestWarmUpArtifactCacheUseCase:
+    @pytest.mark.asyncio
+    async def test_caches_every_streamed_batch(self):
+        """Test that each streamed batch is written with one bulk cache write"""
+        batches = [[MagicMock(), MagicMock()], [MagicMock()]]
+        mapper = MagicMock(spec=DtoEntityMapperProtocol)
+
+        async def stream_recent(
+            limit: int, batch_size: int
+        ) -> AsyncIterator[Sequence[ArtifactEntity]]:
+            assert (limit, batch_size) == (10, 2)
+            for batch in batches:
+                yield batch
+
+        uow = AsyncMock(spec=UnitOfWorkProtocol)
+        uow.repository = MagicMock()
+        uow.repository.stream_recent = stream_recent
+        save_many = AsyncMock(spec=SaveArtifactsToCacheUseCase)
+        save_many.side_effect = lambda dtos: dict.fromkeys(
+            map(str, range(len(dtos))), True
+        )
+        use_case = WarmUpArtifactCacheUseCase(
+            uow=uow,
+            artifact_mapper=mapper,
+            save_artifacts_to_cache_use_case=save_many,
+            batch_size=2,
+        )
+
+        assert await use_case(limit=10) == 3
+        assert [len(call.args[0]) for call in save_many.await_args_list] == [2, 1]
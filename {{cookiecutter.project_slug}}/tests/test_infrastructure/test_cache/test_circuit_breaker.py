@@ -0,0 +1,126 @@
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from {{cookiecutter.project_slug}}.infrastructures.cache.circuit_breaker import (
+    CacheBypassedError,
+    CacheCircuitBreaker,
+    CircuitBreakerCacheClient,
+)
+from {{cookiecutter.project_slug}}.infrastructures.cache.failures import report_cache_failure
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestCacheCircuitBreaker:
+    def test_opens_on_slow_calls_and_closes_after_probes(self):
+        """Test that slow calls open the breaker and quick probes close it again"""
+        clock = FakeClock()
+        breaker = CacheCircuitBreaker(
+            window_size=4, min_calls=4, open_duration=10.0, probe_calls=2, clock=clock
+        )
+        for _ in range(4):
+            assert breaker.allow() is True
+            breaker.record(0.2, failed=False)
+
+        assert breaker.health().state == "open"
+        assert breaker.allow() is False
+
+        clock.now = 10.0
+        assert breaker.allow() is True
+        assert breaker.allow() is True
+        assert breaker.allow() is False
+        breaker.record(0.01, failed=False)
+        breaker.record(0.01, failed=False)
+
+        health = breaker.health()
+        assert (health.state, health.trips, health.bypassed_calls) == ("closed", 1, 2)
+
+    @pytest.mark.asyncio
+    async def test_guard_times_out_direct_calls_and_skips_them_once_open(self):
+        """Test that guarded backend calls are bounded and skipped while open"""
+        breaker = CacheCircuitBreaker(call_timeout=0.01, window_size=2, min_calls=2)
+
+        for _ in range(2):
+            with pytest.raises(ConnectionError, match="timed out"):
+                async with breaker.guard():
+                    await asyncio.sleep(1)
+        with pytest.raises(CacheBypassedError):
+            async with breaker.guard():
+                pytest.fail("a bypassed call must not run")
+
+        health = breaker.health()
+        assert (health.state, health.failure_rate) == ("open", 1.0)
+
+
+class TestCircuitBreakerCacheClient:
+    @pytest.mark.asyncio
+    async def test_bypasses_the_cache_after_timeouts(self):
+        """Test that timed-out reads become misses and then skip the cache"""
+
+        async def hanging_get(_: str) -> None:
+            await asyncio.sleep(1)
+
+        remote = MagicMock()
+        remote.get = AsyncMock(side_effect=hanging_get)
+        breaker = CacheCircuitBreaker(call_timeout=0.01, window_size=2, min_calls=2)
+        cache = CircuitBreakerCacheClient(remote=remote, breaker=breaker)
+
+        assert [await cache.get("k") for _ in range(4)] == [None] * 4
+        assert remote.get.await_count == 2
+        assert breaker.health().failure_rate == 1.0
+
+    @pytest.mark.asyncio
+    async def test_counts_errors_hidden_behind_misses(self):
+        """Test that backend errors reported by the wrapped cache count as failures"""
+
+        async def failing_get(_: str) -> None:
+            report_cache_failure(ConnectionError("refused"))
+
+        remote = MagicMock()
+        remote.get = AsyncMock(side_effect=failing_get)
+        breaker = CacheCircuitBreaker(window_size=2, min_calls=2)
+        cache = CircuitBreakerCacheClient(remote=remote, breaker=breaker)
+
+        await cache.get("k")
+        await cache.get("k")
+
+        assert breaker.health().state == "open"
+
+    @pytest.mark.asyncio
+    async def test_cancelled_probe_frees_its_slot(self):
+        """Test that a cancelled probe does not leave the breaker half-open forever"""
+        clock = FakeClock()
+        started = asyncio.Event()
+
+        async def hanging_get(_: str) -> None:
+            started.set()
+            await asyncio.sleep(1)
+
+        remote = MagicMock()
+        remote.get = AsyncMock(side_effect=hanging_get)
+        breaker = CacheCircuitBreaker(
+            window_size=2, min_calls=2, probe_calls=1, clock=clock
+        )
+        cache = CircuitBreakerCacheClient(remote=remote, breaker=breaker)
+        for _ in range(2):
+            breaker.allow()
+            breaker.record(0.01, failed=True)
+        clock.now = breaker.open_duration
+
+        probe = asyncio.create_task(cache.get("k"))
+        await started.wait()
+        probe.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await probe
+
+        remote.get = AsyncMock(return_value={"a": 1})
+        assert await cache.get("k") == {"a": 1}
+        assert breaker.health().state == "closed"
@@ -0,0 +1,77 @@
+from datetime import UTC, datetime
+import json
+from uuid import uuid4
+
+import pytest
+
+from {{cookiecutter.project_slug}}.infrastructures.cache.codec import CachePayloadSerializer, get_codec
+from {{cookiecutter.project_slug}}.infrastructures.cache.compression import get_compressor
+from {{cookiecutter.project_slug}}.infrastructures.cache.exceptions import CacheCodecError
+
+
+class TestCachePayloadSerializer:
+    @pytest.mark.parametrize("codec_name", ["json", "orjson", "msgpack"])
+    def test_round_trip(self, codec_name: str):
+        """Test that every codec decodes what it encoded"""
+        pytest.importorskip(codec_name)
+        serializer = CachePayloadSerializer(codec=get_codec(codec_name))
+        value = {
+            "inventory_id": str(uuid4()),
+            "created_at": datetime.now(UTC).isoformat(),
+            "era": {"value": "antiquity"},
+            "description": None,
+        }
+
+        assert serializer.loads(serializer.dumps(value)) == value
+
+    def test_reads_payloads_of_other_codecs(self):
+        """Test that switching codecs keeps existing entries readable"""
+        pytest.importorskip("msgpack")
+        written = CachePayloadSerializer(codec=get_codec("msgpack")).dumps({"a": 1})
+
+        assert CachePayloadSerializer().loads(written) == {"a": 1}
+
+    def test_reads_legacy_json_without_header(self):
+        """Test that plain JSON written before codecs existed is still decoded"""
+        assert CachePayloadSerializer().loads(json.dumps({"a": 1})) == {"a": 1}
+
+    def test_corrupt_payload_raises_codec_error(self):
+        """Test that undecodable payloads surface as CacheCodecError"""
+        with pytest.raises(CacheCodecError):
+            CachePayloadSerializer().loads(b"\x01\x00not json")
+
+    @pytest.mark.parametrize(
+        ("compression", "module"), [("zstd", "zstandard"), ("lz4", "lz4")]
+    )
+    def test_compressed_round_trip(self, compression: str, module: str):
+        """Test that large payloads are compressed and still decoded by any reader"""
+        pytest.importorskip(module)
+        serializer = CachePayloadSerializer(
+            compressor=get_compressor(compression), compression_threshold=64
+        )
+        value = {"description": "bronze votive fibula " * 20}
+
+        data = serializer.dumps(value)
+
+        assert len(data) < len(CachePayloadSerializer().dumps(value))
+        assert CachePayloadSerializer().loads(data) == value
+
+    def test_small_payloads_are_not_compressed(self):
+        """Test that payloads below the threshold are stored as they are"""
+        pytest.importorskip("zstandard")
+        serializer = CachePayloadSerializer(
+            compressor=get_compressor("zstd"), compression_threshold=1024
+        )
+
+        assert serializer.dumps({"a": 1}) == CachePayloadSerializer().dumps({"a": 1})
+
+    def test_unknown_dictionary_raises_codec_error(self):
+        """Test that entries compressed with an unknown dictionary are rejected"""
+        pytest.importorskip("zstandard")
+        dictionary = b"bronze votive fibula amphora " * 100
+        written = CachePayloadSerializer(
+            compressor=get_compressor("zstd", dictionary), compression_threshold=0
+        ).dumps({"description": "bronze votive fibula " * 20})
+
+        with pytest.raises(CacheCodecError):
+            CachePayloadSerializer().loads(written)
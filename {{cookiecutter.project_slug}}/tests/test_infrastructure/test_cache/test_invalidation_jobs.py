@@ -0,0 +1,62 @@
+import asyncio
+from collections.abc import AsyncIterator
+from unittest.mock import MagicMock
+
+import pytest
+
+from {{cookiecutter.project_slug}}.infrastructures.cache.invalidation_jobs import AsyncioCacheInvalidationJobs
+
+
+class TestAsyncioCacheInvalidationJobs:
+    @pytest.mark.asyncio
+    async def test_job_reports_progress_until_completed(self):
+        """Test that per-batch deletions are accumulated into the job state"""
+        release = asyncio.Event()
+
+        async def iter_clear(pattern: str) -> AsyncIterator[int]:
+            assert pattern == "artifact:*"
+            yield 500
+            await release.wait()
+            yield 120
+
+        cache_client = MagicMock()
+        cache_client.iter_clear = iter_clear
+        jobs = AsyncioCacheInvalidationJobs(cache_client=cache_client)
+
+        job = jobs.start("artifact:*")
+        await asyncio.sleep(0)
+        running = jobs.get(job.job_id)
+        release.set()
+        await asyncio.sleep(0.01)
+        finished = jobs.get(job.job_id)
+
+        assert (running.status, running.deleted, running.batches) == ("running", 500, 1)
+        assert (finished.status, finished.deleted, finished.batches) == (
+            "completed",
+            620,
+            2,
+        )
+        assert finished.finished_at is not None
+
+    @pytest.mark.asyncio
+    async def test_backend_failure_marks_job_failed(self):
+        """Test that an error while clearing is recorded instead of lost"""
+
+        async def iter_clear(pattern: str) -> AsyncIterator[int]:
+            assert pattern == "artifact:*"
+            yield 10
+            raise ConnectionError("redis down")
+
+        cache_client = MagicMock()
+        cache_client.iter_clear = iter_clear
+        jobs = AsyncioCacheInvalidationJobs(cache_client=cache_client)
+
+        job = jobs.start("artifact:*")
+        await asyncio.sleep(0.01)
+        failed = jobs.get(job.job_id)
+
+        assert (failed.status, failed.deleted, failed.error) == (
+            "failed",
+            10,
+            "redis down",
+        )
@@ -0,0 +1,39 @@
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from {{cookiecutter.project_slug}}.infrastructures.cache.keys import VersionedKeyBuilder
+
+
+class TestVersionedKeyBuilder:
+    @pytest.fixture
+    def client(self) -> MagicMock:
+        client = MagicMock()
+        client.get = AsyncMock(return_value=b"3")
+        client.incr = AsyncMock(return_value=4)
+        return client
+
+    @pytest.fixture
+    def key_builder(self, client: MagicMock) -> VersionedKeyBuilder:
+        return VersionedKeyBuilder(
+            client=client, prefix="antiques:", namespace="artifact", schema_version=2
+        )
+
+    @pytest.mark.asyncio
+    async def test_key_combines_prefix_namespace_and_versions(
+        self, key_builder: VersionedKeyBuilder, client: MagicMock
+    ):
+        """Test the key layout and that the generation is read once per interval"""
+        assert await key_builder.build("42") == "antiques:artifact:v2:g3:42"
+        assert await key_builder.build("43") == "antiques:artifact:v2:g3:43"
+        client.get.assert_awaited_once_with("antiques:artifact:generation")
+
+    @pytest.mark.asyncio
+    async def test_bump_switches_to_new_keyspace(
+        self, key_builder: VersionedKeyBuilder
+    ):
+        """Test that keys built after a bump use the new generation"""
+        await key_builder.build("42")
+
+        assert await key_builder.bump_generation() == 4
+        assert await key_builder.build("42") == "antiques:artifact:v2:g4:42"
@@ -0,0 +1,222 @@
+import json
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from {{cookiecutter.project_slug}}.infrastructures.cache.circuit_breaker import CacheCircuitBreaker
+from {{cookiecutter.project_slug}}.infrastructures.cache.near_cache import (
+    HotKeyTracker,
+    NearCacheClient,
+    TinyLFUCache,
+)
+from {{cookiecutter.project_slug}}.infrastructures.cache.read_expiration import ReadExpirationPolicy
+
+
+class TestTinyLFUCache:
+    def test_rejects_cold_key_when_full(self):
+        """Test that a one-off key cannot evict a frequently read entry"""
+        cache = TinyLFUCache(max_size=1)
+        cache.put("hot", 1)
+        for _ in range(5):
+            cache.get("hot")
+
+        assert cache.put("cold", 2) is False
+        assert cache.get("hot") == 1
+
+    def test_admits_key_more_frequent_than_victim(self):
+        """Test that a key read more often than the LRU victim replaces it"""
+        cache = TinyLFUCache(max_size=1)
+        cache.put("old", 1)
+        for _ in range(3):
+            cache.get("new")
+
+        assert cache.put("new", 2) is True
+        assert cache.get("new") == 2
+        assert cache.get("old") is None
+
+    def test_discard_matching_uses_glob_patterns(self):
+        """Test that pattern discards mirror Redis glob matching"""
+        cache = TinyLFUCache(max_size=10)
+        cache.put("artifact:1", 1)
+        cache.put("artifact:2", 2)
+        cache.put("user:1", 3)
+
+        assert cache.discard_matching("artifact:*") == 2
+        assert len(cache) == 1
+
+    def test_min_frequency_admits_only_hot_keys(self):
+        """Test that a key is only admitted once it has been read often enough"""
+        cache = TinyLFUCache(max_size=10, min_frequency=3)
+        cache.get("key")
+
+        assert cache.put("key", 1) is False
+        cache.get("key")
+        cache.get("key")
+        assert cache.put("key", 1) is True
+        assert "key" in cache
+
+
+class TestHotKeyTracker:
+    def test_ranks_keys_by_reads_counted_in_l1(self):
+        """Test that hot keys are ranked from the admission sketch of the L1"""
+        # A wide sketch: string hashes are randomized per process, and in a narrow
+        # one the keys may share every counter and be over-counted.
+        local = TinyLFUCache(max_size=4096)
+        tracker = HotKeyTracker(local=local, top_k=2)
+        for key in ["hot"] * 4 + ["warm"] * 2 + ["cold"]:
+            local.get(key)
+            tracker.record(key)
+        local.put("hot", 1)
+
+        assert [
+            (dto.key, dto.estimated_reads, dto.pinned) for dto in tracker.hot_keys(5)
+        ] == [("hot", 4, True), ("warm", 2, False)]
+
+    def test_reports_nothing_without_l1(self):
+        """Test that no key is reported when no L1 cache is in use"""
+        tracker = HotKeyTracker()
+        tracker.record("key")
+
+        assert tracker.hot_keys(5) == []
+
+
+class TestNearCacheClient:
+    @pytest.fixture
+    def remote(self) -> MagicMock:
+        remote = MagicMock()
+        remote.get = AsyncMock(return_value={"name": "vase"})
+        remote.set = AsyncMock(return_value=True)
+        remote.client.publish = AsyncMock()
+        remote.read_expiration = ReadExpirationPolicy()
+        return remote
+
+    @pytest.fixture
+    def near_cache(self, remote: MagicMock) -> NearCacheClient:
+        return NearCacheClient(
+            remote=remote,
+            local=TinyLFUCache(max_size=10),
+            channel="invalidation",
+        )
+
+    @pytest.mark.asyncio
+    async def test_second_get_is_served_locally(
+        self, near_cache: NearCacheClient, remote: MagicMock
+    ):
+        """Test that a hit is kept in L1 and does not reach Redis again"""
+        assert await near_cache.get("key") == {"name": "vase"}
+        assert await near_cache.get("key") == {"name": "vase"}
+
+        remote.get.assert_awaited_once_with("key")
+
+    @pytest.mark.asyncio
+    async def test_breaker_guards_redis_but_not_the_l1(self, remote: MagicMock):
+        """Test that L1 hits are not recorded and still served while Redis is bypassed"""
+        breaker = CacheCircuitBreaker(window_size=3, min_calls=3)
+        near_cache = NearCacheClient(
+            remote=remote,
+            local=TinyLFUCache(max_size=10),
+            channel="invalidation",
+            breaker=breaker,
+        )
+        assert await near_cache.get("key") == {"name": "vase"}
+        assert await near_cache.get("key") == {"name": "vase"}
+        assert breaker.health().window_calls == 1
+
+        remote.get = AsyncMock(side_effect=ConnectionError("refused"))
+        for _ in range(2):
+            assert await near_cache.get("other") is None
+
+        assert breaker.health().state == "open"
+        assert await near_cache.get("key") == {"name": "vase"}
+        assert await near_cache.get("other") is None
+        assert remote.get.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_set_publishes_invalidation(
+        self, near_cache: NearCacheClient, remote: MagicMock
+    ):
+        """Test that writes are announced to other workers"""
+        await near_cache.set("key", {"name": "vase"})
+
+        channel, payload = remote.client.publish.await_args.args
+        assert channel == "invalidation"
+        assert json.loads(payload) == {
+            "keys": ["key"],
+            "origin": near_cache.instance_id,
+        }
+
+    @pytest.mark.asyncio
+    async def test_remote_invalidation_drops_local_entry(
+        self, near_cache: NearCacheClient, remote: MagicMock
+    ):
+        """Test that an invalidation from another worker evicts the L1 entry"""
+        await near_cache.get("key")
+
+        near_cache.handle_invalidation(json.dumps({"origin": "other", "keys": ["key"]}))
+        await near_cache.get("key")
+
+        assert remote.get.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_own_invalidation_is_ignored(
+        self, near_cache: NearCacheClient, remote: MagicMock
+    ):
+        """Test that a worker keeps entries it has just written itself"""
+        await near_cache.set("key", {"name": "vase"})
+
+        near_cache.handle_invalidation(
+            json.dumps({"origin": near_cache.instance_id, "keys": ["key"]})
+        )
+
+        assert await near_cache.get("key") == {"name": "vase"}
+        remote.get.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_close_leaves_shared_client_open(
+        self, near_cache: NearCacheClient, remote: MagicMock
+    ):
+        """Test that closing the near cache does not close the Redis client it shares"""
+        remote.client.close = AsyncMock()
+        await near_cache.get("key")
+
+        await near_cache.close()
+
+        remote.client.close.assert_not_awaited()
+        assert len(near_cache.local) == 0
+
+    def test_l1_ttl_must_stay_below_the_read_expiration_window(self, remote: MagicMock):
+        """Test that read expiration requires L1 entries to be re-read from Redis"""
+        remote.read_expiration = ReadExpirationPolicy(mode="sliding", min_ttl=300)
+
+        with pytest.raises(ValueError, match="min_ttl"):
+            NearCacheClient(
+                remote=remote, local=TinyLFUCache(max_size=10), channel="invalidation"
+            )
+        NearCacheClient(
+            remote=remote,
+            local=TinyLFUCache(max_size=10, ttl=30),
+            channel="invalidation",
+        )
+
+    @pytest.mark.asyncio
+    async def test_hot_keys_are_promoted_and_invalidated_everywhere(
+        self, remote: MagicMock
+    ):
+        """Test that only hot keys enter L1 and other workers' writes drop them"""
+        local = TinyLFUCache(max_size=10, min_frequency=2)
+        near_cache = NearCacheClient(
+            remote=remote,
+            local=local,
+            channel="invalidation",
+            hot_keys=HotKeyTracker(local=local),
+        )
+
+        for _ in range(5):
+            assert await near_cache.get("key") == {"name": "vase"}
+        assert remote.get.await_count == 2
+        assert near_cache.hot_keys is not None
+        assert near_cache.hot_keys.hot_keys(1)[0].pinned is True
+
+        near_cache.handle_invalidation(json.dumps({"origin": "other", "keys": ["key"]}))
+        await near_cache.get("key")
+        assert remote.get.await_count == 3
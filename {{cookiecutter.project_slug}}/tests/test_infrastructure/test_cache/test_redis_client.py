@@ -0,0 +1,209 @@
+from unittest.mock import AsyncMock, MagicMock
+from uuid import UUID
+
+import pytest
+from redis.asyncio import Redis, RedisCluster
+from redis.crc import key_slot
+from redis.exceptions import NoScriptError, ResponseError
+
+from {{cookiecutter.project_slug}}.application.cache_policy import CacheFreshness, CacheFreshnessPolicy
+from {{cookiecutter.project_slug}}.infrastructures.cache.codec import CachePayloadSerializer
+from {{cookiecutter.project_slug}}.infrastructures.cache.hash_layout import (
+    HASH_SET_SCRIPT,
+    HASH_SET_SCRIPT_SHA,
+    HashBucketLayout,
+)
+from {{cookiecutter.project_slug}}.infrastructures.cache.read_expiration import (
+    READ_EXPIRATION_SCRIPT,
+    READ_EXPIRATION_SCRIPT_SHA,
+    ReadExpirationPolicy,
+    read_counter_key,
+)
+from {{cookiecutter.project_slug}}.infrastructures.cache.redis_client import RedisCacheClient
+
+
+class TestRedisCacheClientOnCluster:
+    @pytest.mark.asyncio
+    async def test_get_many_reads_per_slot(self):
+        """Test that bulk reads on a cluster avoid cross-slot MGET"""
+        serializer = CachePayloadSerializer()
+        client = MagicMock(spec=RedisCluster)
+        client.mget_nonatomic = AsyncMock(
+            return_value=[serializer.dumps({"a": 1}), None]
+        )
+        cache = RedisCacheClient(client=client)
+
+        assert await cache.get_many(["k1", "k2"]) == {"k1": {"a": 1}, "k2": None}
+        client.mget_nonatomic.assert_awaited_once_with(["k1", "k2"])
+        client.mget.assert_not_called()
+
+
+class TestRedisCacheClientReadExpiration:
+    @pytest.mark.asyncio
+    async def test_adaptive_reads_run_the_script_and_load_it_on_noscript(self):
+        """Test that reads go through the read expiration script, loaded on demand"""
+        serializer = CachePayloadSerializer()
+        pipe = MagicMock()
+        pipe.execute = AsyncMock(
+            side_effect=[
+                [NoScriptError("NOSCRIPT"), NoScriptError("NOSCRIPT")],
+                [[serializer.dumps({"a": 1}), 86_400_000], None],
+            ]
+        )
+        client = MagicMock(spec=Redis)
+        client.pipeline.return_value.__aenter__.return_value = pipe
+        client.script_load = AsyncMock()
+        policy = ReadExpirationPolicy(mode="adaptive")
+        cache = RedisCacheClient(client=client, read_expiration=policy)
+
+        assert await cache.get_many(["k1", "k2"]) == {"k1": {"a": 1}, "k2": None}
+        client.script_load.assert_awaited_once_with(READ_EXPIRATION_SCRIPT)
+        pipe.evalsha.assert_any_call(
+            READ_EXPIRATION_SCRIPT_SHA, 2, "k1", "{k1}:reads", *policy.script_args()
+        )
+        client.get.assert_not_called()
+        client.mget.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_hot_entry_stays_servable_past_its_hard_ttl(self):
+        """Test that a re-armed TTL pushes out the hard expiry of the envelope"""
+        now = 1000.0
+        policy = CacheFreshnessPolicy(
+            soft_ttl=10, hard_ttl=20, stale_if_error_ttl=60, clock=lambda: now
+        )
+        serializer = CachePayloadSerializer()
+        stored = serializer.dumps(policy.wrap({"name": "vase"}))
+        pipe = MagicMock()
+        # The read at 1030 re-armed the TTL to a day.
+        pipe.execute = AsyncMock(return_value=[[stored, 86_400_000]])
+        client = MagicMock(spec=Redis)
+        client.pipeline.return_value.__aenter__.return_value = pipe
+        cache = RedisCacheClient(
+            client=client,
+            read_expiration=ReadExpirationPolicy(mode="sliding"),
+            freshness_policy=policy,
+        )
+        now += 30
+
+        entry = await cache.get("k1")
+
+        assert entry is not None
+        assert policy.unwrap(entry) == ({"name": "vase"}, CacheFreshness.STALE)
+        now += 86_400 - 60
+        assert policy.unwrap(entry)[1] is CacheFreshness.EXPIRED
+
+    @pytest.mark.asyncio
+    async def test_one_off_adaptive_read_shortens_the_ttl(self):
+        """Test that a single read lowers the TTL to min_ttl and later reads raise it"""
+        fakeredis = pytest.importorskip("fakeredis")
+        client = fakeredis.FakeAsyncRedis()
+        cache = RedisCacheClient(
+            client=client,
+            ttl=3600,
+            read_expiration=ReadExpirationPolicy(mode="adaptive", min_ttl=300),
+        )
+        await cache.set("k1", {"a": 1})
+
+        assert await cache.get("k1") == {"a": 1}
+        assert 0 < await client.pttl("k1") <= 300_000
+        assert await cache.get("k1") == {"a": 1}
+        assert await client.pttl("k1") > 3_600_000
+
+    @pytest.mark.asyncio
+    async def test_sliding_read_and_tombstones_keep_their_ttl(self):
+        """Test that sliding reads never shorten a TTL and short entries are not re-armed"""
+        fakeredis = pytest.importorskip("fakeredis")
+        client = fakeredis.FakeAsyncRedis()
+        sliding = RedisCacheClient(
+            client=client,
+            read_expiration=ReadExpirationPolicy(mode="sliding", ttl=600, min_ttl=300),
+        )
+        adaptive = RedisCacheClient(
+            client=client, read_expiration=ReadExpirationPolicy(mode="adaptive")
+        )
+        await sliding.set("entry", {"a": 1}, ttl=3600)
+        await adaptive.set("tombstone", {"missing": True}, ttl=60)
+
+        assert await sliding.get("entry") == {"a": 1}
+        assert await adaptive.get("tombstone") == {"missing": True}
+        assert await client.pttl("entry") > 3_000_000
+        assert 0 < await client.pttl("tombstone") <= 60_000
+
+    def test_read_counter_shares_the_entry_slot(self):
+        """Test that an entry and its read counter hash to the same cluster slot"""
+        for key in ("antiques:artifact:v1:g0:abc", "user:{42}:profile"):
+            assert key_slot(read_counter_key(key).encode()) == key_slot(key.encode())
+
+
+class TestRedisCacheClientHashLayout:
+    UUID_1 = UUID("3f2a0c1e-8b7d-4e6f-9a1b-2c3d4e5f6a7b")
+    UUID_2 = UUID("3f2a9d8c-7b6a-4f5e-8d4c-3b2a1f0e9d8c")
+
+    @pytest.mark.asyncio
+    async def test_uuid_keys_are_read_per_bucket(self):
+        """Test that UUID keys sharing a bucket are read with one HMGET"""
+        serializer = CachePayloadSerializer()
+        pipe = MagicMock()
+        pipe.execute = AsyncMock(return_value=[[serializer.dumps({"a": 1}), None]])
+        client = MagicMock(spec=Redis)
+        client.pipeline.return_value.__aenter__.return_value = pipe
+        client.mget = AsyncMock(return_value=[serializer.dumps({"b": 2})])
+        cache = RedisCacheClient(client=client, hash_layout=HashBucketLayout())
+        keys = [f"artifact:{self.UUID_1}", f"artifact:{self.UUID_2}", "generation"]
+
+        assert await cache.get_many(keys) == {
+            keys[0]: {"a": 1},
+            keys[1]: None,
+            "generation": {"b": 2},
+        }
+        pipe.hmget.assert_called_once_with(
+            "artifact:#3f2a", [self.UUID_1.bytes, self.UUID_2.bytes]
+        )
+        client.mget.assert_awaited_once_with(["generation"])
+
+    @pytest.mark.asyncio
+    async def test_set_expires_the_hash_field_atomically(self):
+        """Test that hashed entries and their TTL are set by one script, loaded on demand"""
+        serializer = CachePayloadSerializer()
+        pipe = MagicMock()
+        pipe.execute = AsyncMock(side_effect=[[NoScriptError("NOSCRIPT")], [[1]]])
+        client = MagicMock(spec=Redis)
+        client.pipeline.return_value.__aenter__.return_value = pipe
+        client.script_load = AsyncMock()
+        cache = RedisCacheClient(client=client, ttl=60, hash_layout=HashBucketLayout())
+
+        assert await cache.set(f"artifact:{self.UUID_1}", {"a": 1}) is True
+        client.script_load.assert_awaited_once_with(HASH_SET_SCRIPT)
+        pipe.evalsha.assert_called_with(
+            HASH_SET_SCRIPT_SHA,
+            1,
+            "artifact:#3f2a",
+            self.UUID_1.bytes,
+            serializer.dumps({"a": 1}),
+            60,
+        )
+        pipe.hset.assert_not_called()
+        client.setex.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_startup_check_rejects_servers_without_hexpire(self):
+        """Test that the hash layout fails fast on a server without HEXPIRE"""
+        client = MagicMock(spec=Redis)
+        client.execute_command = AsyncMock(
+            side_effect=ResponseError("unknown command 'HEXPIRE'")
+        )
+        cache = RedisCacheClient(client=client, hash_layout=HashBucketLayout())
+
+        with pytest.raises(RuntimeError, match="HEXPIRE"):
+            await cache.check_hash_layout()
+
+    def test_layout_maps_only_canonical_uuid_keys(self):
+        """Test that keys round-trip through buckets and other keys stay strings"""
+        layout = HashBucketLayout(prefix_length=2)
+        bucket_key, field = layout.locate(f"a:v1:{self.UUID_1}")
+
+        assert bucket_key == "a:v1:#3f"
+        assert layout.key_of(bucket_key.encode(), field) == f"a:v1:{self.UUID_1}"
+        assert layout.locate(f"a:v1:{str(self.UUID_1).upper()}") is None
+        assert layout.locate("a:generation") is None
+        assert layout.bucket_pattern("a:v1:3f*") == "a:v1:*#*"
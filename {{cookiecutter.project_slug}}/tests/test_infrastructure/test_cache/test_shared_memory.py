@@ -0,0 +1,83 @@
+import asyncio
+import fcntl
+import os
+
+import pytest
+
+from {{cookiecutter.project_slug}}.infrastructures.cache.shared_memory import SharedMemoryCacheClient
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestSharedMemoryCacheClient:
+    @pytest.mark.asyncio
+    async def test_entries_are_shared_between_mappings(self, tmp_path):
+        """Test that a value written through one mapping is read through another"""
+        path = str(tmp_path / "cache")
+        writer = SharedMemoryCacheClient(path=path, slot_count=64, slot_size=256)
+        reader = SharedMemoryCacheClient(path=path, slot_count=64, slot_size=256)
+
+        assert await writer.set("app:a", {"name": "vase"}) is True
+        assert await reader.get("app:a") == {"name": "vase"}
+        assert await reader.clear("app:*") == 1
+        assert await writer.exists("app:a") is False
+        assert await writer.incr("generation") == 1
+        assert await reader.get_counter("generation") == 1
+        await writer.close()
+        await reader.close()
+
+    @pytest.mark.asyncio
+    async def test_expires_and_evicts_within_the_probe_window(self, tmp_path):
+        """Test per-slot TTLs and that a full table keeps accepting writes"""
+        clock = FakeClock()
+        cache = SharedMemoryCacheClient(
+            path=str(tmp_path / "cache"),
+            slot_count=4,
+            slot_size=128,
+            probe_length=4,
+            clock=clock,
+        )
+        await cache.set("short", {"v": 0}, ttl=10)
+        clock.now += 11
+        assert await cache.get("short") is None
+
+        results = await cache.set_many({f"k{i}": {"v": i} for i in range(6)})
+        assert all(results.values())
+        values = await cache.get_many([f"k{i}" for i in range(6)])
+        assert sum(value is not None for value in values.values()) == 4
+        assert await cache.set("big", {"v": "x" * 200}) is False
+        await cache.close()
+
+    @pytest.mark.asyncio
+    async def test_rejects_a_file_with_another_layout(self, tmp_path):
+        """Test that a table is never mapped with a different slot geometry"""
+        path = str(tmp_path / "cache")
+        cache = SharedMemoryCacheClient(path=path, slot_count=4, slot_size=128)
+
+        with pytest.raises(ValueError, match="another layout"):
+            SharedMemoryCacheClient(path=path, slot_count=8, slot_size=128)
+        await cache.close()
+
+    @pytest.mark.asyncio
+    async def test_waits_for_the_lock_without_blocking_the_loop(self, tmp_path):
+        """Test that a writer polls the lock of another worker and yields meanwhile"""
+        path = str(tmp_path / "cache")
+        cache = SharedMemoryCacheClient(path=path, slot_count=64, slot_size=256)
+        other_worker = os.open(path, os.O_RDWR)
+        fcntl.flock(other_worker, fcntl.LOCK_EX)
+
+        write = asyncio.create_task(cache.set("app:a", {"v": 1}))
+        await asyncio.sleep(0.01)
+        assert not write.done()
+
+        fcntl.flock(other_worker, fcntl.LOCK_UN)
+        os.close(other_worker)
+        assert await write is True
+        assert await cache.get("app:a") == {"v": 1}
+        await cache.close()
@@ -0,0 +1,57 @@
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from redis.asyncio import Redis
+
+from {{cookiecutter.project_slug}}.infrastructures.cache.tags import RedisCacheTagIndex
+
+
+class TestRedisCacheTagIndex:
+    @pytest.fixture
+    def client(self) -> MagicMock:
+        client = MagicMock(spec=Redis)
+        pipe = MagicMock()
+        pipe.execute = AsyncMock(return_value=[])
+        client.pipeline.return_value.__aenter__.return_value = pipe
+        client.srem = AsyncMock(return_value=1)
+        return client
+
+    @pytest.mark.asyncio
+    async def test_add_groups_keys_by_tag_and_extends_ttl(self, client: MagicMock):
+        """Test that tags are recorded per tag set with a TTL that only grows"""
+        index = RedisCacheTagIndex(client=client, cache_client=AsyncMock())
+
+        await index.add(
+            {"a": ["era:modern"], "b": ["era:modern", "material:gold"]}, ttl=60
+        )
+
+        pipe = client.pipeline.return_value.__aenter__.return_value
+        pipe.sadd.assert_any_call("tag:era:modern", "a", "b")
+        pipe.sadd.assert_any_call("tag:material:gold", "b")
+        pipe.expire.assert_any_call("tag:era:modern", 60, nx=True)
+        pipe.expire.assert_any_call("tag:era:modern", 60, gt=True)
+        pipe.execute.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_invalidate_tags_deletes_members_in_batches(self, client: MagicMock):
+        """Test that tagged keys are deleted batch by batch, without a keyspace scan"""
+
+        async def sscan_iter(_: str, count: int):
+            assert count == 2
+            for member in (b"a", b"b", b"c"):
+                yield member
+
+        client.sscan_iter = MagicMock(side_effect=sscan_iter)
+        cache_client = AsyncMock()
+        cache_client.delete_many.side_effect = lambda keys: dict.fromkeys(keys, True)
+        index = RedisCacheTagIndex(
+            client=client, cache_client=cache_client, prefix="tag:", batch_size=2
+        )
+
+        assert await index.invalidate_tags(["era:modern"]) == 3
+        assert [call.args[0] for call in cache_client.delete_many.await_args_list] == [
+            ["a", "b"],
+            ["c"],
+        ]
+        client.srem.assert_any_await("tag:era:modern", b"a", b"b")
+        client.scan_iter.assert_not_called()
@@ -0,0 +1,50 @@
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from {{cookiecutter.project_slug}}.infrastructures.cache.tarantool_client import (
+    TarantoolCacheClient,
+    TarantoolCounters,
+    glob_to_lua,
+)
+
+
+class TestTarantoolCacheClient:
+    @pytest.mark.asyncio
+    async def test_get_many_uses_one_call(self):
+        """Test that a multi-get is a single stored-function call"""
+        connection = MagicMock(is_connected=True)
+        connection.call = AsyncMock(return_value=[[{"a": 1}, None]])
+        cache = TarantoolCacheClient(connection=connection)
+
+        assert await cache.get_many(["k1", "k2"]) == {"k1": {"a": 1}, "k2": None}
+        connection.call.assert_awaited_once_with("cache_get_many", [["k1", "k2"]])
+
+    @pytest.mark.asyncio
+    async def test_clear_follows_the_cursor(self):
+        """Test that pattern invalidation resumes from the returned cursor"""
+        connection = MagicMock(is_connected=True)
+        connection.call = AsyncMock(side_effect=[[2, "app:b"], [1, None]])
+        cache = TarantoolCacheClient(connection=connection, clear_batch_size=2)
+
+        assert await cache.clear("app:*") == 3
+        assert [call.args for call in connection.call.await_args_list] == [
+            ("cache_clear_batch", ["app:", "^app:.*$", None, 2]),
+            ("cache_clear_batch", ["app:", "^app:.*$", "app:b", 2]),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_counters_read_through_the_public_client(self):
+        """Test that generation counters are read with get_counter"""
+        connection = MagicMock(is_connected=True)
+        connection.call = AsyncMock(side_effect=[[[3]], [[None]]])
+        counters = TarantoolCounters(client=TarantoolCacheClient(connection=connection))
+
+        assert await counters.get("generation") == 3
+        assert await counters.get("missing") is None
+        connection.call.assert_awaited_with("cache_get_many", [["missing"]])
+
+    def test_glob_to_lua(self):
+        """Test that globs keep their literal prefix and escape Lua magic characters"""
+        assert glob_to_lua("a-b.c:?[xy]*") == ("a-b.c:", "^a%-b%.c:.[xy].*$")
+        assert glob_to_lua(r"a\*b") == ("a*b", "^a%*b$")
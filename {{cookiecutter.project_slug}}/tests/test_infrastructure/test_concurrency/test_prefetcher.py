@@ -0,0 +1,64 @@
+import asyncio
+from unittest.mock import AsyncMock
+
+import pytest
+
+from {{cookiecutter.project_slug}}.infrastructures.concurrency.prefetcher import (
+    AsyncioCoAccessPrefetcher,
+    CoAccessModel,
+)
+
+
+class TestCoAccessModel:
+    def test_predicts_the_most_frequent_successors(self):
+        """Test that transitions are learned per client and ranked by frequency"""
+        model = CoAccessModel(max_successors=2)
+        for client_id, sequence in (("a", "123"), ("b", "123"), ("c", "14")):
+            for key in sequence:
+                model.observe(client_id, key)
+
+        assert model.predict("1", top_k=2, min_confidence=0.0) == ["2", "4"]
+        assert model.predict("1", top_k=2, min_confidence=0.5) == ["2"]
+        assert model.predict("3", top_k=2, min_confidence=0.0) == []
+
+
+class TestAsyncioCoAccessPrefetcher:
+    @pytest.mark.asyncio
+    async def test_prefetches_successors_and_counts_hits(self):
+        """Test that predicted keys are warmed in the background and hits are counted"""
+        prefetch = AsyncMock(return_value=True)
+        prefetcher = AsyncioCoAccessPrefetcher(prefetch=prefetch, min_confidence=0.0)
+
+        prefetcher.observe("a", "1")
+        prefetcher.observe("a", "2")
+        prefetcher.observe("b", "1")
+        await asyncio.sleep(0.01)
+        prefetcher.observe("b", "2")
+
+        prefetch.assert_awaited_once_with("2")
+        stats = prefetcher.stats()
+        assert (stats.scheduled, stats.warmed, stats.hits, stats.hit_rate) == (
+            1,
+            1,
+            1,
+            1.0,
+        )
+
+    @pytest.mark.asyncio
+    async def test_drops_prefetches_beyond_the_budget(self):
+        """Test that predictions are dropped once the per-second budget is spent"""
+        prefetcher = AsyncioCoAccessPrefetcher(
+            prefetch=AsyncMock(return_value=False),
+            min_confidence=0.0,
+            budget=1.0,
+            clock=lambda: 0.0,
+        )
+        for client_id in ("a", "b"):
+            prefetcher.observe(client_id, "1")
+            prefetcher.observe(client_id, "2")
+        await asyncio.sleep(0.01)
+        prefetcher.observe("c", "1")
+
+        stats = prefetcher.stats()
+        assert (stats.scheduled, stats.skipped, stats.dropped) == (1, 1, 1)
+        await prefetcher.close()
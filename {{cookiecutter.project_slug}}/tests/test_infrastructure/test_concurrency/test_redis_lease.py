@@ -0,0 +1,54 @@
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from redis.asyncio import Redis
+
+from {{cookiecutter.project_slug}}.infrastructures.cache.circuit_breaker import CacheCircuitBreaker
+from {{cookiecutter.project_slug}}.infrastructures.concurrency.redis_lease import RELEASE_SCRIPT, RedisLease
+
+
+class TestRedisLease:
+    @pytest.mark.asyncio
+    async def test_acquire_and_release_use_the_token(self):
+        """Test that a lease is taken with SET NX PX and released by token"""
+        client = MagicMock(spec=Redis)
+        client.set = AsyncMock(side_effect=[True, None])
+        client.eval = AsyncMock(return_value=1)
+        lease = RedisLease(client=client, prefix="lease:", ttl=2.0)
+
+        token = await lease.acquire("42")
+        assert token is not None
+        assert await lease.acquire("42") is None
+        assert await lease.release("42", token) is True
+
+        client.set.assert_any_await("lease:42", token, nx=True, px=2000)
+        client.eval.assert_awaited_once_with(RELEASE_SCRIPT, 1, "lease:42", token)
+
+    @pytest.mark.asyncio
+    async def test_wait_returns_once_the_lease_is_gone(self):
+        """Test that waiters poll the lease until it is released"""
+        client = MagicMock(spec=Redis)
+        client.pttl = AsyncMock(side_effect=[1500, 1000, -2])
+        lease = RedisLease(client=client, poll_interval=0.001)
+
+        await lease.wait("42")
+
+        assert client.pttl.await_count == 3
+
+    @pytest.mark.asyncio
+    async def test_lease_fails_open_without_redis_while_the_cache_is_bypassed(self):
+        """Test that lease calls are skipped while the cache breaker is open"""
+        client = MagicMock(spec=Redis)
+        client.set = AsyncMock()
+        client.pttl = AsyncMock()
+        breaker = CacheCircuitBreaker(window_size=2, min_calls=2)
+        for _ in range(2):
+            breaker.allow()
+            breaker.record(0.01, failed=True)
+        lease = RedisLease(client=client, breaker=breaker)
+
+        assert await lease.acquire("42") is not None
+        await lease.wait("42")
+
+        client.set.assert_not_awaited()
+        client.pttl.assert_not_awaited()
@@ -0,0 +1,89 @@
+import asyncio
+
+import pytest
+
+from {{cookiecutter.project_slug}}.infrastructures.concurrency.single_flight import AsyncioSingleFlight
+
+
+class TestAsyncioSingleFlight:
+    @pytest.mark.asyncio
+    async def test_concurrent_calls_share_one_execution(self):
+        """Test that concurrent calls for the same key run the work once"""
+        single_flight = AsyncioSingleFlight()
+        release = asyncio.Event()
+        executions = 0
+
+        async def work() -> str:
+            nonlocal executions
+            executions += 1
+            await release.wait()
+            return "result"
+
+        tasks = [asyncio.create_task(single_flight.do("key", work)) for _ in range(10)]
+        await asyncio.sleep(0)
+        release.set()
+        results = await asyncio.gather(*tasks)
+
+        assert results == ["result"] * 10
+        assert executions == 1
+        stats = single_flight.stats()
+        assert stats.calls == 10
+        assert stats.executions == 1
+        assert stats.coalesced == 9
+        assert stats.in_flight == 0
+
+    @pytest.mark.asyncio
+    async def test_error_is_shared_with_waiters(self):
+        """Test that the leader's exception is raised in every waiter"""
+        single_flight = AsyncioSingleFlight()
+        release = asyncio.Event()
+
+        async def work() -> str:
+            await release.wait()
+            raise ValueError("boom")
+
+        tasks = [asyncio.create_task(single_flight.do("key", work)) for _ in range(3)]
+        await asyncio.sleep(0)
+        release.set()
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+
+        assert all(isinstance(result, ValueError) for result in results)
+        assert single_flight.stats().errors == 1
+
+    @pytest.mark.asyncio
+    async def test_waiter_takes_over_when_leader_is_cancelled(self):
+        """Test that a waiter re-runs the work if the leader gets cancelled"""
+        single_flight = AsyncioSingleFlight()
+        first_started = asyncio.Event()
+        calls = 0
+
+        async def work() -> int:
+            nonlocal calls
+            calls += 1
+            if calls == 1:
+                first_started.set()
+                await asyncio.sleep(10)
+            return calls
+
+        leader = asyncio.create_task(single_flight.do("key", work))
+        await first_started.wait()
+        waiter = asyncio.create_task(single_flight.do("key", work))
+        await asyncio.sleep(0)
+        leader.cancel()
+
+        assert await waiter == 2
+        assert single_flight.stats().executions == 2
+
+    @pytest.mark.asyncio
+    async def test_different_keys_are_not_coalesced(self):
+        """Test that distinct keys run independently"""
+        single_flight = AsyncioSingleFlight()
+
+        async def work() -> str:
+            await asyncio.sleep(0)
+            return "ok"
+
+        await asyncio.gather(single_flight.do("a", work), single_flight.do("b", work))
+
+        assert single_flight.stats().executions == 2
+        assert single_flight.stats().coalesced == 0
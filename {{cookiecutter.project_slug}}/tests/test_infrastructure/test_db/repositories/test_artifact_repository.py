@@ -0,0 +1,152 @@
+from datetime import UTC, datetime
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.dialects import mysql, postgresql, sqlite
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from {{cookiecutter.project_slug}}.application.mappers import ArtifactMapper
+from {{cookiecutter.project_slug}}.domain.entities.artifact import ArtifactEntity
+from {{cookiecutter.project_slug}}.domain.value_objects.era import Era
+from {{cookiecutter.project_slug}}.domain.value_objects.material import Material
+from {{cookiecutter.project_slug}}.infrastructures.db.mappers.artifact_db_mapper import ArtifactDBMapper
+from {{cookiecutter.project_slug}}.infrastructures.db.models.artifact import ArtifactModel, mapper_registry
+from {{cookiecutter.project_slug}}.infrastructures.db.repositories.artifact import ArtifactRepositorySQLAlchemy
+
+
+def make_artifact(inventory_id=None, name: str = "Amphora") -> ArtifactEntity:
+    return ArtifactEntity(
+        inventory_id=inventory_id or uuid4(),
+        acquisition_date=datetime(2020, 1, 1, tzinfo=UTC),
+        name=name,
+        department="Antiquities",
+        era=Era(value="antiquity"),
+        material=Material(value="ceramic"),
+    )
+
+
+class TestArtifactRepositoryUpsert:
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        ("dialect", "clause"),
+        [
+            (postgresql.dialect(), "ON CONFLICT (inventory_id) DO UPDATE"),
+            (mysql.dialect(), "ON DUPLICATE KEY UPDATE"),
+        ],
+    )
+    async def test_save_many_issues_one_native_upsert(self, dialect, clause: str):
+        """Test that a batch is written with one upsert of the session dialect"""
+        session = MagicMock(spec=AsyncSession)
+        session.get_bind.return_value.dialect = dialect
+        repository = ArtifactRepositorySQLAlchemy(
+            session=session, mapper=ArtifactDBMapper()
+        )
+
+        await repository.save_many([make_artifact(), make_artifact()])
+
+        session.execute.assert_awaited_once()
+        session.add.assert_not_called()
+        sql = str(session.execute.await_args.args[0].compile(dialect=dialect))
+        assert sql.startswith("INSERT INTO artifacts")
+        assert clause in sql
+        assert "created_at =" not in sql.split(clause)[1]
+
+    @pytest.mark.asyncio
+    async def test_save_inserts_then_updates_on_sqlite(self):
+        """Test that saving an existing artifact updates it and keeps created_at"""
+        pytest.importorskip("aiosqlite")
+        engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+        async with engine.begin() as connection:
+            await connection.run_sync(mapper_registry.metadata.create_all)
+        first = make_artifact()
+        renamed = make_artifact(inventory_id=first.inventory_id, name="Krater")
+        try:
+            async with AsyncSession(engine) as session:
+                repository = ArtifactRepositorySQLAlchemy(
+                    session=session, mapper=ArtifactDBMapper()
+                )
+                await repository.save(first)
+                await repository.save_many([make_artifact(), renamed])
+                await session.commit()
+
+                models = (await session.scalars(select(ArtifactModel))).all()
+        finally:
+            await engine.dispose()
+
+        assert len(models) == 2
+        saved = next(m for m in models if m.inventory_id == first.inventory_id)
+        assert saved.name == "Krater"
+        # SQLite drops the offset of stored datetimes.
+        assert saved.created_at.replace(tzinfo=UTC) == first.created_at
+
+
+class TestArtifactRepositoryBatchLookup:
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        ("dialect", "statements"),
+        [(postgresql.dialect(), 1), (sqlite.dialect(), 3)],
+    )
+    async def test_get_many_by_inventory_ids(self, dialect, statements: int):
+        """Test that IDs are bound as one array on PostgreSQL and chunked elsewhere"""
+        artifacts = [make_artifact() for _ in range(5)]
+        mapper = ArtifactDBMapper()
+        session = MagicMock(spec=AsyncSession)
+        session.get_bind.return_value.dialect = dialect
+        session.scalars = AsyncMock(
+            return_value=[mapper.to_model(artifact) for artifact in artifacts]
+        )
+        repository = ArtifactRepositorySQLAlchemy(
+            session=session, mapper=mapper, batch_size=2
+        )
+
+        found = await repository.get_many_by_inventory_ids(
+            [str(artifacts[0].inventory_id), "not-a-uuid"]
+            + [artifact.inventory_id for artifact in artifacts]
+        )
+
+        assert found == {artifact.inventory_id: artifact for artifact in artifacts}
+        assert session.scalars.await_count == statements
+        compiled = session.scalars.await_args.args[0].compile(dialect=dialect)
+        if statements == 1:
+            assert "= ANY (" in str(compiled)
+            assert len(compiled.params["inventory_ids"]) == 5
+        else:
+            assert " IN (" in str(compiled)
+
+
+class TestArtifactRepositoryLeanReads:
+    @pytest.mark.asyncio
+    async def test_lean_reads_match_the_orm_path_on_sqlite(self):
+        """Test that lean reads return the DTOs the ORM path maps to"""
+        pytest.importorskip("aiosqlite")
+        engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+        async with engine.begin() as connection:
+            await connection.run_sync(mapper_registry.metadata.create_all)
+        artifacts = [make_artifact() for _ in range(3)]
+        try:
+            async with AsyncSession(engine) as session:
+                repository = ArtifactRepositorySQLAlchemy(
+                    session=session, mapper=ArtifactDBMapper(), batch_size=2
+                )
+                await repository.save_many(artifacts)
+                await session.commit()
+
+                inventory_ids = [artifact.inventory_id for artifact in artifacts]
+                entity = await repository.get_by_inventory_id(inventory_ids[0])
+                dto = await repository.get_dto_by_inventory_id(str(inventory_ids[0]))
+                missing = await repository.get_dto_by_inventory_id(uuid4())
+                dtos = await repository.get_dtos_by_inventory_ids(
+                    [*inventory_ids, "not-a-uuid"]
+                )
+        finally:
+            await engine.dispose()
+
+        mapper = ArtifactMapper()
+        assert entity is not None
+        assert dto == mapper.to_dto(entity)
+        assert missing is None
+        assert dtos == {
+            artifact.inventory_id: mapper.to_dto(artifact) for artifact in artifacts
+        }
@@ -0,0 +1,55 @@
+from unittest.mock import MagicMock
+
+import pytest
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from {{cookiecutter.project_slug}}.infrastructures.db.routing import DatabaseRouter
+
+
+def make_engine(host: str) -> MagicMock:
+    engine = MagicMock(spec=AsyncEngine)
+    engine.url = make_url(f"postgresql+asyncpg://user:secret@{host}:5432/antiques")
+    return engine
+
+
+class TestDatabaseRouter:
+    @pytest.mark.asyncio
+    async def test_reads_round_robin_over_healthy_replicas(self):
+        """Test that reads skip unhealthy replicas and fall back to the primary"""
+        primary, first, second = (make_engine(h) for h in ("db", "r1", "r2"))
+        router = DatabaseRouter(primary=primary, replicas=[first, second])
+
+        assert [router.read_engine() for _ in range(3)] == [first, second, first]
+
+        first.connect.side_effect = ConnectionError("refused")
+        await router._check_replica(0)  # noqa: SLF001
+        assert [router.read_engine() for _ in range(2)] == [second, second]
+
+        second.connect.side_effect = ConnectionError("refused")
+        await router._check_replica(1)  # noqa: SLF001
+        assert router.read_engine() is primary
+        stats = router.pool_stats()
+        assert [(s.name, s.role, s.healthy, s.reads) for s in stats] == [
+            ("db:5432/antiques", "primary", True, 1),
+            ("r1:5432/antiques", "replica", False, 2),
+            ("r2:5432/antiques", "replica", False, 3),
+        ]
+
+    def test_written_keys_are_read_from_primary_within_window(self):
+        """Test that a just written key is read from the primary for the window"""
+        now = [100.0]
+        primary, replica = make_engine("db"), make_engine("r1")
+        router = DatabaseRouter(
+            primary=primary,
+            replicas=[replica],
+            read_your_writes_window=2.0,
+            clock=lambda: now[0],
+        )
+
+        router.record_writes(["written"])
+
+        assert router.read_engine(["written"]) is primary
+        assert router.read_engine(["other"]) is replica
+        now[0] += 2.5
+        assert router.read_engine(["written"]) is replica
@@ -0,0 +1,52 @@
+from collections.abc import AsyncIterator
+import os
+from uuid import uuid4
+
+import pytest
+from redis.asyncio import RedisCluster
+
+from {{cookiecutter.project_slug}}.infrastructures.cache.redis_client import RedisCacheClient
+
+CLUSTER_URL = os.environ.get("REDIS_CLUSTER_TEST_URL")
+
+pytestmark = [
+    pytest.mark.integration,
+    pytest.mark.skipif(
+        CLUSTER_URL is None,
+        reason="REDIS_CLUSTER_TEST_URL is not set (see scripts/redis-cluster.sh)",
+    ),
+]
+
+
+@pytest.fixture
+async def cache() -> AsyncIterator[RedisCacheClient]:
+    client = RedisCluster.from_url(CLUSTER_URL, decode_responses=False)
+    cache = RedisCacheClient(client=client, ttl=60, unlink_batch_size=7)
+    yield cache
+    await client.close()
+
+
+class TestRedisClusterCache:
+    @pytest.mark.asyncio
+    async def test_bulk_operations_span_shards(self, cache: RedisCacheClient):
+        """Test that bulk reads and writes work for keys hashed to many slots"""
+        prefix = f"test:{uuid4().hex}:"
+        items = {f"{prefix}{i}": {"value": i} for i in range(50)}
+        assert len({cache.client.keyslot(key) for key in items}) > 1
+
+        assert all((await cache.set_many(items)).values())
+        assert await cache.get_many([*items, f"{prefix}missing"]) == {
+            **items,
+            f"{prefix}missing": None,
+        }
+        assert all((await cache.delete_many(list(items))).values())
+
+    @pytest.mark.asyncio
+    async def test_pattern_clear_reaches_every_shard(self, cache: RedisCacheClient):
+        """Test that pattern invalidation scans all primaries"""
+        prefix = f"test:{uuid4().hex}:"
+        items = {f"{prefix}{i}": {"value": i} for i in range(50)}
+        await cache.set_many(items)
+
+        assert await cache.clear(f"{prefix}*") == len(items)
+        assert not any((await cache.get_many(list(items))).values())
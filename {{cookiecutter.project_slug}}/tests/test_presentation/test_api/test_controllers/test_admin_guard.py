@@ -0,0 +1,76 @@
+from unittest.mock import MagicMock
+
+from dishka import Provider, Scope, make_async_container, provide
+from dishka.integrations.fastapi import setup_dishka
+from fastapi import FastAPI, status
+from fastapi.testclient import TestClient
+import pytest
+
+from {{cookiecutter.project_slug}}.application.dtos.cache import CacheHealthDTO
+from {{cookiecutter.project_slug}}.application.use_cases.get_cache_health import GetCacheHealthUseCase
+from {{cookiecutter.project_slug}}.config.base import Settings
+from {{cookiecutter.project_slug}}.presentation.api.rest.v1.controllers.cache_admin_controller import (
+    router as cache_admin_router,
+)
+from {{cookiecutter.project_slug}}.presentation.api.rest.v1.mappers.cache_admin_mapper import (
+    CacheAdminPresentationMapper,
+)
+
+
+def _client(admin_api_token: str | None) -> TestClient:
+    settings = MagicMock()
+    settings.app.admin_api_token = admin_api_token
+    cache_health = MagicMock()
+    cache_health.health.return_value = CacheHealthDTO(
+        state="closed",
+        failure_rate=0.0,
+        slow_call_rate=0.0,
+        mean_latency_ms=0.0,
+        window_calls=0,
+        bypassed_calls=0,
+        trips=0,
+    )
+
+    class _Provider(Provider):
+        @provide(scope=Scope.APP)
+        def get_settings(self) -> Settings:
+            return settings
+
+        @provide(scope=Scope.REQUEST)
+        def get_use_case(self) -> GetCacheHealthUseCase:
+            return GetCacheHealthUseCase(cache_health=cache_health)
+
+        @provide(scope=Scope.APP)
+        def get_mapper(self) -> CacheAdminPresentationMapper:
+            return CacheAdminPresentationMapper()
+
+    app = FastAPI()
+    app.include_router(cache_admin_router)
+    setup_dishka(make_async_container(_Provider()), app)
+    return TestClient(app)
+
+
+class TestAdminGuard:
+    def test_admin_endpoints_are_disabled_without_token(self):
+        response = _client(None).get(
+            "/v1/admin/cache/health", headers={"Authorization": "Bearer anything"}
+        )
+
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
+    @pytest.mark.parametrize("headers", [{}, {"Authorization": "Bearer wrong"}])
+    def test_admin_endpoints_reject_missing_or_wrong_token(
+        self, headers: dict[str, str]
+    ):
+        response = _client("secret").get("/v1/admin/cache/health", headers=headers)
+
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+        assert response.headers["WWW-Authenticate"] == "Bearer"
+
+    def test_admin_endpoints_accept_the_configured_token(self):
+        response = _client("secret").get(
+            "/v1/admin/cache/health", headers={"Authorization": "Bearer secret"}
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json()["state"] == "closed"